@@ -0,0 +1,282 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Checkpoint size and latency with and without delta-encoded channels.
+
+Replays a synthetic run whose state grows like a real one — every step
+appends tool results, trace events and provenance entries and touches one
+``repo_context`` key — through each checkpoint backend twice: plain and
+with a :class:`DeltaCodec`.  Per backend and mode it reports:
+
+* ``bytes``: payload bytes stored (SQLite: checkpoint, channel and blob
+  rows; Redis and Postgres: the checkpoint records);
+* ``put_ms``: mean ``put`` latency;
+* ``get_latest_ms`` / ``get_random_ms``: mean ``get_tuple`` latency for the
+  newest checkpoint and for random older ones.
+
+Redis uses fakeredis unless ``--redis-url`` is given; Postgres runs only
+with ``--postgres-dsn``.
+
+    python eval/bench_checkpoint_delta.py --steps 200 --snapshot-every 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_py_src_on_path() -> None:
+    py_src_text = str(_repo_root() / "py" / "src")
+    if py_src_text not in sys.path:
+        sys.path.insert(0, py_src_text)
+
+
+def _run_states(steps: int, *, results_per_step: int, seed: int) -> list[dict[str, Any]]:
+    """Channel values after each step; unchanged channels keep their object."""
+    rng = random.Random(seed)
+    repo_context: dict[str, Any] = {
+        f"src/module_{i}.py": {"summary": "x" * 400, "symbols": [f"fn_{j}" for j in range(20)]}
+        for i in range(60)
+    }
+    tool_results: list[dict[str, Any]] = []
+    trace_events: list[dict[str, Any]] = []
+    provenance: dict[str, Any] = {}
+    states: list[dict[str, Any]] = []
+    for step in range(steps):
+        tool_results = [
+            *tool_results,
+            *(
+                {
+                    "tool": "exec",
+                    "ok": rng.random() > 0.2,
+                    "stdout": "".join(rng.choices("abcdef\n", k=1500)),
+                    "timing_ms": rng.randint(5, 900),
+                }
+                for _ in range(results_per_step)
+            ),
+        ]
+        trace_events = [*trace_events, {"kind": "node", "step": step, "ts": time.time()}]
+        provenance = {**provenance, f"claim-{step}": {"source": f"tool:{step}", "score": 0.5}}
+        if step % 5 == 0:
+            key = rng.choice(sorted(repo_context))
+            repo_context = {**repo_context, key: {"summary": "y" * 400, "symbols": []}}
+        states.append(
+            {
+                "tool_results": tool_results,
+                "_trace_events": trace_events,
+                "provenance": provenance,
+                "repo_context": repo_context,
+                "loop": step,
+                "intent": "code_change",
+            }
+        )
+    return states
+
+
+def _checkpoints(states: list[dict[str, Any]]) -> list[tuple[dict[str, Any], dict[str, int]]]:
+    """``(checkpoint, new_versions)`` per step, bumping only changed channels."""
+    from datetime import UTC, datetime
+
+    versions: dict[str, int] = {}
+    previous: dict[str, Any] = {}
+    out: list[tuple[dict[str, Any], dict[str, int]]] = []
+    for step, values in enumerate(states):
+        new_versions = {}
+        for channel, value in values.items():
+            if previous.get(channel) is not value:
+                versions[channel] = versions.get(channel, 0) + 1
+                new_versions[channel] = versions[channel]
+        previous = values
+        checkpoint = {
+            "v": 1,
+            "id": str(uuid.UUID(int=step + 1)),
+            "ts": datetime.now(UTC).isoformat(),
+            "channel_values": values,
+            "channel_versions": dict(versions),
+            "versions_seen": {},
+            "pending_sends": [],
+        }
+        out.append((checkpoint, new_versions))
+    return out
+
+
+def _config(checkpoint_id: str | None = None) -> dict[str, Any]:
+    configurable: dict[str, Any] = {"thread_id": "bench", "checkpoint_ns": ""}
+    if checkpoint_id is not None:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _timed_run(
+    saver: Any, checkpoints: list[tuple[dict[str, Any], dict[str, int]]], *, reads: int, seed: int
+) -> dict[str, float]:
+    put_s = 0.0
+    for checkpoint, new_versions in checkpoints:
+        started = time.perf_counter()
+        saver.put(_config(), checkpoint, {"step": 0}, new_versions)
+        put_s += time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        saver.get_tuple(_config())
+    latest_s = time.perf_counter() - started
+
+    rng = random.Random(seed)
+    ids = [c["id"] for c, _ in checkpoints]
+    started = time.perf_counter()
+    for _ in range(reads):
+        got = saver.get_tuple(_config(rng.choice(ids)))
+        assert got is not None
+    random_s = time.perf_counter() - started
+    return {
+        "put_ms": round(put_s / len(checkpoints) * 1000, 3),
+        "get_latest_ms": round(latest_s / reads * 1000, 3),
+        "get_random_ms": round(random_s / reads * 1000, 3),
+    }
+
+
+def bench_sqlite(checkpoints: list[Any], codec: Any, *, reads: int, seed: int) -> dict[str, Any]:
+    from lg_orch.backends import SqliteCheckpointSaver
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SqliteCheckpointSaver(db_path=Path(tmp) / "bench.sqlite", delta_codec=codec)
+        row = _timed_run(saver, checkpoints, reads=reads, seed=seed)
+        conn = saver._connect()
+        stored = sum(
+            int(conn.execute(query).fetchone()[0] or 0)
+            for query in (
+                "SELECT SUM(LENGTH(checkpoint_blob) + LENGTH(metadata_blob)) FROM checkpoints",
+                "SELECT SUM(LENGTH(payload)) FROM checkpoint_blobs",
+                "SELECT SUM(LENGTH(payload)) FROM blob_store",
+            )
+        )
+        saver.close()
+    return {"bytes": stored, **row}
+
+
+def bench_redis(
+    checkpoints: list[Any], codec: Any, *, reads: int, seed: int, url: str | None
+) -> dict[str, Any] | None:
+    from lg_orch.backends import RedisCheckpointSaver
+
+    prefix = f"bench:{uuid.uuid4().hex[:8]}:"
+    saver = RedisCheckpointSaver(
+        url or "redis://localhost:6379/0", key_prefix=prefix, delta_codec=codec
+    )
+    if url is None:
+        try:
+            import fakeredis
+        except ImportError:
+            return None
+        saver._sync_client = fakeredis.FakeRedis()
+    try:
+        row = _timed_run(saver, checkpoints, reads=reads, seed=seed)
+        client = saver._sync_client
+        stored = sum(
+            int(client.strlen(saver._ckpt_key("bench", "", c["id"]))) for c, _ in checkpoints
+        )
+        for key in client.scan_iter(match=f"{prefix}*"):
+            client.delete(key)
+    finally:
+        saver._sync_client.close()
+    return {"bytes": stored, **row}
+
+
+def bench_postgres(
+    checkpoints: list[Any], codec: Any, *, reads: int, seed: int, dsn: str
+) -> dict[str, Any]:
+    from lg_orch.backends import PostgresCheckpointSaver
+
+    async def scenario() -> dict[str, Any]:
+        table = f"bench_ckpt_{uuid.uuid4().hex[:8]}"
+        saver = PostgresCheckpointSaver(dsn, table_name=table, delta_codec=codec)
+        try:
+            put_s = 0.0
+            for checkpoint, new_versions in checkpoints:
+                started = time.perf_counter()
+                await saver.aput(_config(), checkpoint, {"step": 0}, new_versions)  # type: ignore[arg-type]
+                put_s += time.perf_counter() - started
+            rng = random.Random(seed)
+            ids = [c["id"] for c, _ in checkpoints]
+            started = time.perf_counter()
+            for _ in range(reads):
+                await saver.aget_tuple(_config(rng.choice(ids)))  # type: ignore[arg-type]
+            random_s = time.perf_counter() - started
+            pool = await saver._get_pool()
+            async with pool.connection() as conn:
+                cur = await conn.execute(
+                    f"SELECT SUM(LENGTH(checkpoint) + COALESCE(LENGTH(channel_values), 0))"
+                    f" FROM {table}"
+                )
+                stored = int((await cur.fetchone())[0] or 0)
+                await conn.execute(f"DROP TABLE {table}")
+                await conn.commit()
+        finally:
+            await saver.aclose()
+        return {
+            "bytes": stored,
+            "put_ms": round(put_s / len(checkpoints) * 1000, 3),
+            "get_random_ms": round(random_s / reads * 1000, 3),
+        }
+
+    return asyncio.run(scenario())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--results-per-step", type=int, default=3)
+    parser.add_argument("--snapshot-every", type=int, default=16)
+    parser.add_argument("--reads", type=int, default=50)
+    parser.add_argument("--redis-url", default=None, help="real Redis instead of fakeredis")
+    parser.add_argument("--postgres-dsn", default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per row")
+    args = parser.parse_args(argv)
+
+    _ensure_py_src_on_path()
+    from lg_orch.backends import DeltaCodec
+
+    checkpoints = _checkpoints(
+        _run_states(args.steps, results_per_step=args.results_per_step, seed=args.seed)
+    )
+    for backend in ("sqlite", "redis", "postgres"):
+        if backend == "postgres" and not args.postgres_dsn:
+            continue
+        for mode in ("plain", "delta"):
+            codec = DeltaCodec(snapshot_every=args.snapshot_every) if mode == "delta" else None
+            result: dict[str, Any] | None
+            if backend == "sqlite":
+                result = bench_sqlite(checkpoints, codec, reads=args.reads, seed=args.seed)
+            elif backend == "redis":
+                result = bench_redis(
+                    checkpoints, codec, reads=args.reads, seed=args.seed, url=args.redis_url
+                )
+            else:
+                result = bench_postgres(
+                    checkpoints, codec, reads=args.reads, seed=args.seed, dsn=args.postgres_dsn
+                )
+            if result is None:
+                continue
+            row = {"backend": backend, "mode": mode, "steps": args.steps, **result}
+            if args.json:
+                print(json.dumps(row))
+            else:
+                print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
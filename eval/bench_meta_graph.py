@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Scheduler overhead and makespan of the meta-graph scheduler on synthetic DAGs.
+
+For each size, builds a random layered DAG and reports:
+
+* ``overhead``: wall time to schedule every task with a no-op ``run_graph``
+  (pure bookkeeping cost, tasks per second);
+* ``add_edge``: mean cost of an incremental cycle-checked edge insertion;
+* ``makespan``: wall time with simulated task durations under list order
+  (``fifo``) and :class:`CriticalPathPolicy` fed the true durations.
+
+    python eval/bench_meta_graph.py --sizes 1000,5000,10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_py_src_on_path() -> None:
+    py_src_text = str(_repo_root() / "py" / "src")
+    if py_src_text not in sys.path:
+        sys.path.insert(0, py_src_text)
+
+
+def _layered_dag(n: int, *, width: int, fan_in: int, seed: int) -> list[Any]:
+    """Tasks in layers of about *width*; each depends on up to *fan_in* earlier tasks."""
+    from lg_orch.meta_graph import SubAgentTask
+
+    rng = random.Random(seed)
+    tasks: list[SubAgentTask] = []
+    for i in range(n):
+        layer_start = (i // width) * width
+        pool = range(max(0, layer_start - 4 * width), layer_start)
+        deps = rng.sample(pool, min(len(pool), rng.randint(0, fan_in))) if pool else []
+        tasks.append(
+            SubAgentTask(
+                task_id=f"t{i}",
+                description="",
+                depends_on=[f"t{d}" for d in deps],
+                input_state={"task_id": f"t{i}"},
+            )
+        )
+    # Shuffle so list order carries no topological hint for the fifo policy.
+    rng.shuffle(tasks)
+    return tasks
+
+
+async def _noop(state: dict[str, Any]) -> dict[str, Any]:
+    return {}
+
+
+def bench_size(
+    n: int, *, width: int, fan_in: int, parallel: int, unit_ms: float, seed: int
+) -> list[dict[str, Any]]:
+    from lg_orch.meta_graph import CriticalPathPolicy, DependencyGraph, run_meta_graph
+
+    rows: list[dict[str, Any]] = []
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        run_meta_graph(
+            _layered_dag(n, width=width, fan_in=fan_in, seed=seed), _noop, max_parallel=parallel
+        )
+    )
+    elapsed = time.perf_counter() - started
+    rows.append(
+        {
+            "n": n,
+            "bench": "overhead",
+            "seconds": round(elapsed, 3),
+            "tasks_per_s": round(result.succeeded / elapsed),
+        }
+    )
+
+    dag = DependencyGraph(_layered_dag(n, width=width, fan_in=fan_in, seed=seed))
+    rng = random.Random(seed)
+    ids = [f"t{i}" for i in range(n)]
+    attempts = 1000
+    started = time.perf_counter()
+    for _ in range(attempts):
+        a, b = sorted(rng.sample(range(n), 2))
+        with contextlib.suppress(ValueError):
+            dag.add_edge(ids[a], ids[b])  # forward in index order: usually acyclic
+    rows.append(
+        {
+            "n": n,
+            "bench": "add_edge",
+            "mean_us": round((time.perf_counter() - started) / attempts * 1e6, 2),
+        }
+    )
+
+    durations = {f"t{i}": random.Random(seed + i).uniform(0.2, 3.0) for i in range(n)}
+
+    async def simulated(state: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(durations[state["task_id"]] * unit_ms / 1000.0)
+        return {}
+
+    for name, policy in [
+        ("fifo", None),
+        ("critical_path", CriticalPathPolicy(durations=durations)),
+    ]:
+        started = time.perf_counter()
+        asyncio.run(
+            run_meta_graph(
+                _layered_dag(n, width=width, fan_in=fan_in, seed=seed),
+                simulated,
+                max_parallel=parallel,
+                policy=policy,
+            )
+        )
+        rows.append(
+            {
+                "n": n,
+                "bench": "makespan",
+                "policy": name,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,10000")
+    parser.add_argument("--width", type=int, default=50, help="tasks per DAG layer")
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--parallel", type=int, default=16)
+    parser.add_argument("--unit-ms", type=float, default=1.0, help="simulated ms per duration unit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per row")
+    args = parser.parse_args(argv)
+
+    _ensure_py_src_on_path()
+    import structlog
+
+    # Per-task log lines would dominate the measurement.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    for n in (int(s) for s in args.sizes.split(",") if s):
+        for row in bench_size(
+            n,
+            width=args.width,
+            fan_in=args.fan_in,
+            parallel=args.parallel,
+            unit_ms=args.unit_ms,
+            seed=args.seed,
+        ):
+            if args.json:
+                print(json.dumps(row))
+            else:
+                print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""RedisRunStore latency with pipelined writes and batched reads.
+
+Loads ``--runs`` synthetic runs into a :class:`RedisRunStore` and times the
+hot paths next to the command-per-item access pattern they replaced
+(``legacy``: three commands per upsert, one ``GET`` per listed run):
+
+* ``upsert_us``: mean ``upsert`` latency;
+* ``list_all_ms``: one ``list_runs`` call over every run;
+* ``page_ms``: mean ``list_runs_page(limit=50)`` latency over ``--pages``
+  consecutive pages;
+* ``search_hit_ms`` / ``search_miss_ms``: ``search_runs`` for a term in
+  recent runs and for one matching nothing (a full scan without
+  RediSearch);
+* ``facts_ms``: ``upsert_recovery_facts`` with ten facts.
+
+fakeredis answers in-process, so the numbers understate what the saved
+round trips are worth against a networked server; pass ``--redis-url`` to
+measure one.
+
+    python eval/bench_run_store.py --runs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_py_src_on_path() -> None:
+    py_src_text = str(_repo_root() / "py" / "src")
+    if py_src_text not in sys.path:
+        sys.path.insert(0, py_src_text)
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    words = ["deploy", "refactor", "lint", "migrate", "upgrade", "document", "profile"]
+    records = []
+    for i in range(count):
+        created = (start + timedelta(seconds=i)).isoformat().replace("+00:00", "Z")
+        records.append(
+            {
+                "run_id": f"run-{i:07d}",
+                "request": f"{words[i % len(words)]} module_{i % 997} for ticket {i}",
+                "status": "succeeded" if i % 5 else "failed",
+                "created_at": created,
+                "started_at": created,
+                "trace_out_dir": "artifacts/runs",
+                "trace_path": f"artifacts/runs/run-{i:07d}.json",
+                "final": "x" * 200,
+            }
+        )
+    return records
+
+
+def _store(url: str | None, namespace: str) -> Any:
+    from lg_orch.run_store import RedisRunStore
+
+    if url is not None:
+        return RedisRunStore(url, namespace=namespace, search_index=True)
+    import fakeredis
+
+    store = object.__new__(RedisRunStore)
+    store._namespace = namespace
+    store._ttl = 86400
+    store._search_index = None
+    store._search_ready = set()
+    store._client = fakeredis.FakeRedis(decode_responses=True)
+    return store
+
+
+def _legacy_upsert(store: Any, record: dict[str, Any]) -> None:
+    from lg_orch.run_store import _score
+
+    data = {**record, "namespace": store._namespace}
+    client = store._client
+    client.set(store._run_key(data["run_id"]), json.dumps(data), ex=store._ttl)
+    client.zadd(store._run_index_key(), {data["run_id"]: _score(data["created_at"])})
+    client.expire(store._run_index_key(), store._ttl)
+
+
+def _legacy_list(store: Any) -> list[dict[str, Any]]:
+    client = store._client
+    runs = []
+    for rid in client.zrevrange(store._run_index_key(), 0, -1):
+        raw = client.get(store._run_key(rid))
+        if raw is not None:
+            runs.append(json.loads(raw))
+    return runs
+
+
+def _legacy_search(store: Any, query: str, limit: int) -> list[dict[str, Any]]:
+    results = []
+    for run in _legacy_list(store):
+        haystack = " ".join(
+            str(run.get(f, "")) for f in ("run_id", "request", "status", "pending_approval_summary")
+        ).lower()
+        if query in haystack:
+            results.append(run)
+            if len(results) >= limit:
+                break
+    return results
+
+
+def _facts() -> list[dict[str, Any]]:
+    return [
+        {"failure_fingerprint": f"fp-{i}", "failure_class": "test", "summary": "s", "salience": i}
+        for i in range(10)
+    ]
+
+
+def _ms(started: float, count: int = 1) -> float:
+    return round((time.perf_counter() - started) / count * 1000, 3)
+
+
+def bench(mode: str, records: list[dict[str, Any]], *, url: str | None, pages: int) -> dict:
+    store = _store(url, f"bench-{uuid.uuid4().hex[:8]}")
+    legacy = mode == "legacy"
+    try:
+        started = time.perf_counter()
+        for record in records:
+            if legacy:
+                _legacy_upsert(store, record)
+            else:
+                store.upsert(record)
+        upsert_us = round(_ms(started, len(records)) * 1000, 2)
+
+        started = time.perf_counter()
+        listed = _legacy_list(store) if legacy else store.list_runs()
+        list_all_ms = _ms(started)
+        assert len(listed) == len(records)
+
+        started = time.perf_counter()
+        if legacy:
+            # No cursor: every page re-reads the index and the runs before it.
+            for page in range(pages):
+                _legacy_list(store)[page * 50 : (page + 1) * 50]
+        else:
+            cursor = None
+            for _ in range(pages):
+                _, cursor = store.list_runs_page(limit=50, cursor=cursor)
+        page_ms = _ms(started, pages)
+
+        search = _legacy_search if legacy else store.search_runs
+        started = time.perf_counter()
+        hits = search(store, "deploy", 20) if legacy else search("deploy", 20)
+        search_hit_ms = _ms(started)
+        assert len(hits) == 20
+        started = time.perf_counter()
+        misses = search(store, "xyzzy", 20) if legacy else search("xyzzy", 20)
+        search_miss_ms = _ms(started)
+        assert misses == []
+
+        started = time.perf_counter()
+        if legacy:
+            for fact in _facts():
+                key = store._recovery_key(fact["failure_fingerprint"], "run-0")
+                store._client.set(key, json.dumps(fact), ex=store._ttl)
+                store._client.zadd(store._recovery_index_key(), {key: fact["salience"]})
+                store._client.expire(store._recovery_index_key(), store._ttl)
+        else:
+            store.upsert_recovery_facts("run-0", _facts())
+        facts_ms = _ms(started)
+    finally:
+        for key in store._client.scan_iter(match=f"*{store._namespace}*", count=10_000):
+            store._client.delete(key)
+        store.close()
+    return {
+        "upsert_us": upsert_us,
+        "list_all_ms": list_all_ms,
+        "page_ms": page_ms,
+        "search_hit_ms": search_hit_ms,
+        "search_miss_ms": search_miss_ms,
+        "facts_ms": facts_ms,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--redis-url", default=None, help="real Redis instead of fakeredis")
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per row")
+    args = parser.parse_args(argv)
+
+    _ensure_py_src_on_path()
+    records = _records(args.runs)
+    for mode in ("legacy", "batched"):
+        row = {
+            "mode": mode,
+            "runs": args.runs,
+            **bench(mode, records, url=args.redis_url, pages=args.pages),
+        }
+        if args.json:
+            print(json.dumps(row))
+        else:
+            print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
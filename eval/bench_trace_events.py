@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Trace event append cost: shared :class:`TraceEventLog` versus list copies.
+
+Appends ``--events`` events to one state through :func:`append_event` and
+through the copy-per-append path it replaced (``legacy``: copy the event
+list, append, rebuild the state), keeping the best of ``--repeats`` runs:
+
+* ``append_ms``: all appends;
+* ``per_append_us``: ``append_ms`` per event;
+* ``seal_ms``: turning the result into a plain list, as the graph's node
+  wrapper does once per node (``0`` for ``legacy``, already a list).
+
+    python eval/bench_trace_events.py --events 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_py_src_on_path() -> None:
+    py_src_text = str(_repo_root() / "py" / "src")
+    if py_src_text not in sys.path:
+        sys.path.insert(0, py_src_text)
+
+
+def _legacy_append(state: dict[str, Any], *, kind: str, data: dict[str, Any]) -> dict[str, Any]:
+    from lg_orch.trace import now_ms
+
+    events = list(state.get("_trace_events", []) or [])
+    events.append({"ts_ms": now_ms(), "kind": kind, "data": data})
+    return {**state, "_trace_events": events}
+
+
+def bench(mode: str, *, events: int, repeats: int) -> dict[str, Any]:
+    from lg_orch.trace import append_event, seal_trace_events
+
+    append = _legacy_append if mode == "legacy" else append_event
+    best_append = best_seal = float("inf")
+    for _ in range(repeats):
+        state: dict[str, Any] = {"request": "bench", "_trace_events": []}
+        started = time.perf_counter()
+        for i in range(events):
+            state = append(state, kind="step", data={"i": i})
+        best_append = min(best_append, time.perf_counter() - started)
+        started = time.perf_counter()
+        sealed = seal_trace_events(state) if mode != "legacy" else state
+        best_seal = min(best_seal, time.perf_counter() - started)
+        assert len(sealed["_trace_events"]) == events
+    return {
+        "append_ms": round(best_append * 1000.0, 3),
+        "per_append_us": round(best_append * 1e6 / max(1, events), 3),
+        "seal_ms": round(best_seal * 1000.0, 3) if mode != "legacy" else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per row")
+    args = parser.parse_args(argv)
+
+    _ensure_py_src_on_path()
+    for mode in ("legacy", "shared"):
+        row = {
+            "mode": mode,
+            "events": args.events,
+            **bench(mode, events=args.events, repeats=args.repeats),
+        }
+        if args.json:
+            print(json.dumps(row))
+        else:
+            print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Recall@k versus latency for the long-term memory vector indexes.
+
+Builds a flat :class:`EmbeddingMatrix` and an :class:`IVFFlatIndex` over the
+same synthetic, clustered unit vectors, then reports build time and, per
+``n_probes`` setting, recall@k against the exact scan and query latency.
+
+    python eval/bench_vector_index.py --sizes 10000,100000,1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _ensure_py_src_on_path() -> None:
+    py_src_text = str(_repo_root() / "py" / "src")
+    if py_src_text not in sys.path:
+        sys.path.insert(0, py_src_text)
+
+
+def _clustered_vectors(n: int, dim: int, clusters: int, seed: int) -> Any:
+    """Unit vectors drawn around *clusters* random centres, like real embeddings."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centres[rng.integers(0, clusters, n)]
+    vectors += rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _fill(index: Any, vectors: Any, chunk: int = 65536) -> None:
+    for start in range(0, vectors.shape[0], chunk):
+        block = vectors[start : start + chunk]
+        index.extend([(start + i + 1, row.tobytes()) for i, row in enumerate(block)])
+
+
+def _timed_queries(index: Any, queries: Any, k: int) -> tuple[list[list[int]], float, float]:
+    """Run every query; returns (ids per query, p50 ms, p95 ms)."""
+    import numpy as np
+
+    results: list[list[int]] = []
+    latencies: list[float] = []
+    for query in queries:
+        started = time.perf_counter()
+        hits = index.top_k(query, k)
+        latencies.append((time.perf_counter() - started) * 1000.0)
+        results.append([row_id for row_id, _ in hits])
+    return results, float(np.percentile(latencies, 50)), float(np.percentile(latencies, 95))
+
+
+def bench_size(
+    n: int, *, dim: int, k: int, queries: int, probes: list[int], seed: int
+) -> list[dict[str, Any]]:
+    from lg_orch.vector_index import EmbeddingMatrix, IVFFlatIndex, recall_at_k
+
+    # Queries are held-out draws from the same clusters as the indexed rows.
+    data = _clustered_vectors(n + queries, dim, clusters=max(16, n // 500), seed=seed)
+    vectors, query_vecs = data[:n], data[n:]
+
+    flat = EmbeddingMatrix(":memory:")
+    _fill(flat, vectors)
+    exact, flat_p50, flat_p95 = _timed_queries(flat, query_vecs, k)
+    rows: list[dict[str, Any]] = [
+        {
+            "n": n,
+            "index": "flat",
+            "n_probes": None,
+            "build_s": 0.0,
+            f"recall@{k}": 1.0,
+            "p50_ms": round(flat_p50, 3),
+            "p95_ms": round(flat_p95, 3),
+        }
+    ]
+
+    started = time.perf_counter()
+    ivf = IVFFlatIndex(EmbeddingMatrix(":memory:"), min_train_rows=n, seed=seed)
+    _fill(ivf, vectors)
+    build_s = time.perf_counter() - started
+    for n_probes in probes:
+        ivf.n_probes = n_probes
+        approx, p50, p95 = _timed_queries(ivf, query_vecs, k)
+        rows.append(
+            {
+                "n": n,
+                "index": f"ivf({ivf.n_lists})",
+                "n_probes": n_probes,
+                "build_s": round(build_s, 2),
+                f"recall@{k}": round(recall_at_k(approx, exact, k), 4),
+                "p50_ms": round(p50, 3),
+                "p95_ms": round(p95, 3),
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--probes", default="1,4,8,16,32")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per row")
+    args = parser.parse_args(argv)
+
+    _ensure_py_src_on_path()
+    probes = [int(p) for p in args.probes.split(",") if p]
+    for n in (int(s) for s in args.sizes.split(",") if s):
+        for row in bench_size(
+            n, dim=args.dim, k=args.k, queries=args.queries, probes=probes, seed=args.seed
+        ):
+            if args.json:
+                print(json.dumps(row))
+            else:
+                print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
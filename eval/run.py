@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
 import math
+import multiprocessing
+import os
 import re
 import sys
+import time
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+try:
+    import resource as _resource
+except ImportError:  # Windows
+    _resource = None  # type: ignore[assignment]
+
 _log = logging.getLogger(__name__)
 
 
@@ -215,32 +225,64 @@ def load_swe_bench_tasks(
     return tasks
 
 
+_GRAPH: Any = None
+
+
+def _compiled_graph() -> Any:
+    """Return the orchestration graph, compiled once per process.
+
+    A compiled graph without a checkpointer keeps no state between runs, so
+    every task (and every ``--jobs`` worker's share of them) reuses it.
+    """
+    global _GRAPH
+    if _GRAPH is None:
+        _ensure_py_src_on_path()
+        from lg_orch.graph import build_graph
+
+        _GRAPH = build_graph()
+    return _GRAPH
+
+
 def run_task(
     task: EvalTask,
     *,
     repo_root: Path,
     runner_enabled: bool = False,
     temperature: float = 0.0,
+    node_ms: dict[str, float] | None = None,
 ) -> dict[str, Any]:
-    _ensure_py_src_on_path()
-    from lg_orch.graph import build_graph
-
-    app = build_graph()
-    output = app.invoke(
-        {
-            "request": task.request,
-            "_repo_root": str(repo_root),
-            "_runner_base_url": "http://127.0.0.1:8088",
-            "_runner_enabled": runner_enabled,
-            "_budget_max_loops": task.budget_max_loops,
-            "_temperature": temperature,
-            "_config_policy": {
-                "network_default": "deny",
-                "require_approval_for_mutations": True,
-                "allowed_write_paths": [],
-            },
-        }
-    )
+    """Run *task* through the graph and return its final state.
+
+    Args:
+        node_ms: When given, filled with the milliseconds spent per node,
+            summed over loops: the time from the previous node's update to
+            this node's.
+    """
+    app = _compiled_graph()
+    state = {
+        "request": task.request,
+        "_repo_root": str(repo_root),
+        "_runner_base_url": "http://127.0.0.1:8088",
+        "_runner_enabled": runner_enabled,
+        "_budget_max_loops": task.budget_max_loops,
+        "_temperature": temperature,
+        "_config_policy": {
+            "network_default": "deny",
+            "require_approval_for_mutations": True,
+            "allowed_write_paths": [],
+        },
+    }
+    output: dict[str, Any] = {}
+    last = time.perf_counter()
+    for mode, chunk in app.stream(state, stream_mode=["updates", "values"]):
+        if mode == "values":
+            output = chunk
+            continue
+        now = time.perf_counter()
+        if node_ms is not None:
+            for node in chunk:
+                node_ms[node] = node_ms.get(node, 0.0) + (now - last) * 1000
+        last = now
     return dict(output)
 
 
@@ -526,6 +568,215 @@ def score_task(task: EvalTask, output: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Timed, cached and parallel runs
+# ---------------------------------------------------------------------------
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of the harness so far, or ``None`` if unknown.
+
+    ``ru_maxrss`` is a high-water mark for a whole process, so this is a
+    run-level figure: the larger of this process and its largest finished
+    child (the ``--jobs`` workers once the pool has shut down).
+    """
+    if _resource is None:
+        return None
+    peak = max(
+        _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss,
+        _resource.getrusage(_resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Kilobytes on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _timed_result(task: EvalTask, produce: Callable[[dict[str, float]], dict[str, Any]]) -> dict[str, Any]:
+    """Score the output of *produce* and attach its timing figures."""
+    node_ms: dict[str, float] = {}
+    started = time.perf_counter()
+    output = produce(node_ms)
+    wall_ms = (time.perf_counter() - started) * 1000
+    result = score_task(task, output)
+    result["wall_ms"] = round(wall_ms, 1)
+    result["node_ms"] = {node: round(ms, 1) for node, ms in node_ms.items()}
+    result["cached"] = False
+    return result
+
+
+@dataclass(frozen=True)
+class _RunSettings:
+    repo_root: str
+    runner_enabled: bool
+    temperature: float
+
+
+def _run_and_score(task: EvalTask, settings: _RunSettings) -> dict[str, Any]:
+    return _timed_result(
+        task,
+        lambda node_ms: run_task(
+            task,
+            repo_root=Path(settings.repo_root),
+            runner_enabled=settings.runner_enabled,
+            temperature=settings.temperature,
+            node_ms=node_ms,
+        ),
+    )
+
+
+def _init_worker() -> None:
+    # Import and compile before the first task so its wall time excludes both.
+    _compiled_graph()
+
+
+def _digest(paths: list[Path], root: Path) -> str:
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(str(path.relative_to(root)).encode())
+        h.update(b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def code_version(repo_root: Path) -> str:
+    """Hash of everything that decides a task's result apart from its config.
+
+    Covers the orchestrator sources, this harness and the golden files, so
+    uncommitted edits count as a new version just like commits do.
+    """
+    paths = [
+        *(repo_root / "py" / "src" / "lg_orch").rglob("*.py"),
+        *(repo_root / "eval" / "golden").glob("*.json"),
+        Path(__file__).resolve(),
+    ]
+    return _digest([p for p in paths if p.is_file()], repo_root)
+
+
+def config_hash(repo_root: Path) -> str:
+    """Hash of the active runtime profile's TOML and every ``LG_*`` variable."""
+    profile = os.environ.get("LG_PROFILE", "dev").strip() or "dev"
+    h = hashlib.sha256(profile.encode())
+    cfg_path = repo_root / "configs" / f"runtime.{profile}.toml"
+    if cfg_path.is_file():
+        h.update(cfg_path.read_bytes())
+    for name in sorted(k for k in os.environ if k.startswith("LG_")):
+        h.update(f"\0{name}={os.environ[name]}".encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Scored task results on disk, one JSON file per run.
+
+    Keyed by the task definition, :func:`code_version`, :func:`config_hash`,
+    the sampling temperature, the runner switch and the sample index, so a
+    result is reused only when nothing that could change it has changed.
+    Delete the directory to start over.
+    """
+
+    def __init__(self, root: Path, *, repo_root: Path) -> None:
+        self.root = root
+        self._salt = {"code": code_version(repo_root), "config": config_hash(repo_root)}
+
+    def key(self, task: EvalTask, *, sample: int, settings: _RunSettings) -> str:
+        material = {
+            **self._salt,
+            "task": asdict(task),
+            "temperature": settings.temperature,
+            "runner_enabled": settings.runner_enabled,
+            "sample": sample,
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            result = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return result if isinstance(result, dict) else None
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(result, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def run_samples(
+    tasks: list[EvalTask],
+    *,
+    samples: int,
+    repo_root: Path,
+    runner_enabled: bool = False,
+    temperature: float = 0.0,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Run every task *samples* times and return the scored results per task.
+
+    Results found in *cache* are reused (marked ``cached``) and fresh ones
+    are stored.  With *jobs* > 1 the remaining runs are spread over a pool
+    of worker processes, each compiling the graph once; result order does
+    not depend on completion order.
+    """
+    settings = _RunSettings(str(repo_root), runner_enabled, temperature)
+    results: list[list[dict[str, Any] | None]] = [[None] * samples for _ in tasks]
+    keys: dict[tuple[int, int], str] = {}
+    pending: list[tuple[int, int]] = []
+    for ti, task in enumerate(tasks):
+        for sample in range(samples):
+            if cache is not None:
+                keys[ti, sample] = cache.key(task, sample=sample, settings=settings)
+                hit = cache.get(keys[ti, sample])
+                if hit is not None:
+                    results[ti][sample] = {**hit, "cached": True}
+                    continue
+            pending.append((ti, sample))
+
+    def finish(ti: int, sample: int, result: dict[str, Any]) -> None:
+        results[ti][sample] = result
+        if cache is not None:
+            cache.put(keys[ti, sample], result)
+
+    if jobs > 1 and len(pending) > 1:
+        # fork() after the graph's threads have started is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            futures = {
+                pool.submit(_run_and_score, tasks[ti], settings): (ti, sample)
+                for ti, sample in pending
+            }
+            for future in as_completed(futures):
+                finish(*futures[future], future.result())
+    else:
+        if pending:
+            _compiled_graph()
+        for ti, sample in pending:
+            finish(ti, sample, _run_and_score(tasks[ti], settings))
+    return [[r for r in runs if r is not None] for runs in results]
+
+
+def _timing_summary(results: list[dict[str, Any]]) -> dict[str, Any]:
+    fresh = [r for r in results if not r.get("cached")]
+    walls = [float(r.get("wall_ms", 0.0)) for r in fresh]
+    node_ms: dict[str, float] = defaultdict(float)
+    for result in fresh:
+        for node, ms in dict(result.get("node_ms") or {}).items():
+            node_ms[node] += float(ms)
+    return {
+        "cached_results": len(results) - len(fresh),
+        "total_wall_ms": round(sum(walls), 1),
+        "max_wall_ms": round(max(walls), 1) if walls else 0.0,
+        "node_ms": {node: round(ms, 1) for node, ms in sorted(node_ms.items())},
+        "peak_rss_mb": _peak_rss_mb() if fresh else None,
+    }
+
+
 def evaluate_tasks(
     tasks: list[EvalTask],
     *,
@@ -533,14 +784,32 @@ def evaluate_tasks(
     evaluator: Callable[[EvalTask], dict[str, Any]] | None = None,
     runner_enabled: bool = False,
     temperature: float = 0.0,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
 ) -> dict[str, Any]:
+    """Run and score *tasks* once each and summarise the results.
+
+    A custom *evaluator* runs in this process, uncached; otherwise tasks go
+    through :func:`run_samples` with *jobs* and *cache*.  Timing and memory
+    fields (``total_wall_ms``, ``max_wall_ms``, ``node_ms``) cover fresh
+    runs only; ``peak_rss_mb`` is the run-level peak from :func:`_peak_rss_mb`.
+    """
+    results: list[dict[str, Any]]
     if evaluator is not None:
-        run = evaluator
+        results = [_timed_result(task, lambda _: evaluator(task)) for task in tasks]
     else:
-        def run(task: EvalTask) -> dict[str, Any]:
-            return run_task(task, repo_root=repo_root, runner_enabled=runner_enabled, temperature=temperature)
-
-    results = [score_task(task, run(task)) for task in tasks]
+        results = [
+            runs[0]
+            for runs in run_samples(
+                tasks,
+                samples=1,
+                repo_root=repo_root,
+                runner_enabled=runner_enabled,
+                temperature=temperature,
+                jobs=jobs,
+                cache=cache,
+            )
+        ]
 
     total = len(results)
     passed = sum(1 for result in results if bool(result.get("passed", False)))
@@ -620,6 +889,7 @@ def evaluate_tasks(
             "pending_approval_accuracy": pending_approval_accuracy,
             "checkpoint_presence_accuracy": checkpoint_presence_accuracy,
             "approval_history_accuracy": approval_history_accuracy,
+            **_timing_summary(results),
         },
         "results": results,
     }
@@ -649,7 +919,8 @@ def _render_text_report(report: dict[str, Any]) -> str:
             f"pending_approval_acc={float(summary.get('pending_approval_accuracy', 0.0)):.2f} "
             f"checkpoint_presence_acc={float(summary.get('checkpoint_presence_accuracy', 0.0)):.2f} "
             f"approval_history_acc={float(summary.get('approval_history_accuracy', 0.0)):.2f}"
-        )
+        ),
+        _render_timing_line(summary),
     ]
 
     # Group results by benchmark_class for structured output.
@@ -669,7 +940,9 @@ def _render_text_report(report: dict[str, Any]) -> str:
             f"intent={str(result.get('actual_intent', '')) or '(missing)'} "
             f"halt={halt_reason} "
             f"acceptance_ok={bool(result.get('acceptance_ok', False))} "
-            f"tools={int(result.get('tool_results_count', 0))}"
+            f"tools={int(result.get('tool_results_count', 0))} "
+            f"wall_ms={float(result.get('wall_ms', 0.0)):.0f}"
+            f"{' (cached)' if result.get('cached') else ''}"
         )
 
     for group_name, group_results in sorted(groups.items()):
@@ -682,6 +955,21 @@ def _render_text_report(report: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _render_timing_line(summary: dict[str, Any]) -> str:
+    node_ms_raw = summary.get("node_ms", {})
+    node_ms = node_ms_raw if isinstance(node_ms_raw, dict) else {}
+    slowest = sorted(node_ms.items(), key=lambda item: float(item[1]), reverse=True)[:3]
+    peak = summary.get("peak_rss_mb")
+    return (
+        "timing: "
+        f"total_wall_ms={float(summary.get('total_wall_ms', 0.0)):.0f} "
+        f"max_wall_ms={float(summary.get('max_wall_ms', 0.0)):.0f} "
+        f"peak_rss_mb={'n/a' if peak is None else f'{float(peak):.1f}'} "
+        f"cached={int(summary.get('cached_results', 0))} "
+        f"slowest_nodes={','.join(f'{node}:{float(ms):.0f}' for node, ms in slowest) or '(none)'}"
+    )
+
+
 def _render_pass_at_k_table(rows: list[dict[str, Any]], k: int) -> str:
     """Render a structured pass@k summary table grouped by benchmark_class."""
     col_task = max((len(str(r["task"])) for r in rows), default=4)
@@ -781,6 +1069,23 @@ def main(argv: list[str] | None = None) -> int:
         metavar="N",
         help="Limit the number of SWE-bench instances loaded.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run tasks in N worker processes, each compiling the graph once.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Reuse results of unchanged tasks from PATH, keyed by task, code version, "
+            "config hash and temperature; new results are stored there."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         dest="dry_run",
@@ -814,6 +1119,12 @@ def main(argv: list[str] | None = None) -> int:
 
     k: int = int(args.pass_at_k)
     runner_enabled: bool = bool(args.runner_enabled)
+    jobs: int = max(1, int(args.jobs))
+    cache = (
+        ResultCache(Path(str(args.cache_dir)), repo_root=_repo_root())
+        if args.cache_dir
+        else None
+    )
 
     # Auto-set temperature when pass@k > 1 and user did not explicitly set it.
     if args.temperature is not None:
@@ -830,6 +1141,8 @@ def main(argv: list[str] | None = None) -> int:
             repo_root=_repo_root(),
             runner_enabled=runner_enabled,
             temperature=temperature,
+            jobs=jobs,
+            cache=cache,
         )
         summary = report.get("summary", {})
         resolved_rate = float(summary.get("resolved_rate", 0.0))
@@ -844,17 +1157,16 @@ def main(argv: list[str] | None = None) -> int:
     pak_rows: list[dict[str, Any]] = []
     all_reports: list[dict[str, Any]] = []
 
-    for task in tasks:
-        run_results: list[dict[str, Any]] = []
-        for _ in range(k):
-            output = run_task(
-                task,
-                repo_root=_repo_root(),
-                runner_enabled=runner_enabled,
-                temperature=temperature,
-            )
-            run_results.append(score_task(task, output))
-
+    samples = run_samples(
+        tasks,
+        samples=k,
+        repo_root=_repo_root(),
+        runner_enabled=runner_enabled,
+        temperature=temperature,
+        jobs=jobs,
+        cache=cache,
+    )
+    for task, run_results in zip(tasks, samples):
         n_correct = sum(1 for r in run_results if bool(r.get("passed", False)))
         pak_score = pass_at_k(k, n_correct, k)
         pak_rows.append(
@@ -880,6 +1192,7 @@ def main(argv: list[str] | None = None) -> int:
                     "pass_at_k_rows": pak_rows,
                     "results": all_reports,
                     "resolved_rate": resolved_rate_pak,
+                    "timing": _timing_summary(all_reports),
                 },
                 ensure_ascii=False,
                 indent=2,
@@ -887,6 +1200,7 @@ def main(argv: list[str] | None = None) -> int:
         )
     else:
         print(_render_pass_at_k_table(pak_rows, k))
+        print(_render_timing_line(_timing_summary(all_reports)))
         print(f"resolved_rate={resolved_rate_pak:.3f}")
 
     return 0
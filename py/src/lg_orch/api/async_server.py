@@ -0,0 +1,429 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""asyncio HTTP front end for the Remote API (``remote_api.server_mode = "asyncio"``).
+
+The threaded server spends one OS thread per connection, and an SSE client
+holds its thread for the whole stream.  Here every connection is a coroutine
+instead:
+
+* Request handling (``_api_http_dispatch`` and the blocking service calls
+  behind it) runs on a bounded :class:`~concurrent.futures.ThreadPoolExecutor`.
+* SSE streams stay on the event loop and wake on broadcast/queue pushes, so
+  an idle subscriber costs no thread.
+* ``max_connections``, ``max_sse_subscribers`` and the executor queue depth
+  are hard limits.  Going over any of them returns ``503`` with
+  ``Retry-After``, and ``lula_http_rejected_total{reason}`` is incremented.
+
+The HTTP/1.1 support is deliberately small.  It handles one request per
+connection, a ``Content-Length`` body and ``Connection: close``, which is
+what the threaded ``BaseHTTPRequestHandler`` does today.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, TypeVar
+
+from lg_orch.api.metrics import (
+    LULA_HTTP_REJECTED_TOTAL,
+    LULA_HTTP_REQUESTS_IN_FLIGHT,
+    LULA_SSE_STREAMS_OPEN,
+)
+from lg_orch.api.service import (
+    _SSE_KEEPALIVE_SECS,
+    _SSE_MAX_STREAM_SECS,
+    SSE_DONE_FRAME,
+    SSE_KEEPALIVE_FRAME,
+    sse_not_found_frame,
+    sse_state_frame,
+    sse_stream_done,
+)
+from lg_orch.api.streaming import stream_new_sse_async
+from lg_orch.logging import get_logger
+
+_T = TypeVar("_T")
+
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+_MAX_HEADER_BYTES = 64 * 1024
+_REJECT_DRAIN_SECS = 1.0
+_SUPPORTED_METHODS = frozenset({"GET", "POST"})
+
+
+@dataclass(frozen=True, slots=True)
+class ServerLimits:
+    """Concurrency limits for :class:`AsyncRemoteAPIServer`."""
+
+    max_connections: int = 256
+    max_sse_subscribers: int = 128
+    worker_threads: int = 16
+    # Requests allowed to wait for a worker beyond the ``worker_threads`` running.
+    max_queued_requests: int = 64
+    retry_after_secs: int = 1
+    max_body_bytes: int = 10 * 1024 * 1024
+    header_timeout_secs: float = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPRequest:
+    method: str
+    target: str
+    headers: Mapping[str, str]  # lower-cased names
+    body: bytes | None
+    client_address: tuple[str, int] | None
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPResponse:
+    """Result of the blocking request handler.
+
+    ``status`` follows the ``_api_http_dispatch`` contract: ``-1`` / ``-2``
+    with the run id in ``body`` ask for the ``/v1/runs/{id}/stream`` and
+    ``/runs/{id}/stream`` SSE streams respectively.
+    """
+
+    status: int
+    content_type: str
+    body: bytes
+    headers: list[tuple[str, str]] = field(default_factory=list)
+
+
+RequestHandler = Callable[[HTTPRequest], HTTPResponse]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, error: str) -> None:
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+def _json_body(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _head(status: int, headers: list[tuple[str, str]]) -> bytes:
+    try:
+        phrase = HTTPStatus(status).phrase
+    except ValueError:
+        phrase = ""
+    lines = [f"HTTP/1.1 {status} {phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+class AsyncRemoteAPIServer:
+    """Serve the Remote API routes from an asyncio event loop.
+
+    Parameters
+    ----------
+    service:
+        The :class:`~lg_orch.api.service.RemoteAPIService` backing SSE streams.
+    handler:
+        Blocking request handler run on the worker pool; it performs auth,
+        routing and access logging (see ``remote_api.serve_remote_api``).
+    limits:
+        Connection, SSE and worker-pool bounds.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        handler: RequestHandler,
+        *,
+        limits: ServerLimits | None = None,
+    ) -> None:
+        self._service = service
+        self._handler = handler
+        self._limits = limits or ServerLimits()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._limits.worker_threads, thread_name_prefix="remote-api"
+        )
+        self._server: asyncio.Server | None = None
+        self._connections = 0
+        self._in_flight = 0
+        self._busy_workers = 0
+        self._sse_streams = 0
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._log = get_logger()
+
+    # -- observability --
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def sse_streams(self) -> int:
+        return self._sse_streams
+
+    # -- lifecycle --
+
+    async def start(self, host: str, port: int) -> tuple[str, int]:
+        """Bind and start accepting; returns the bound ``(host, port)``."""
+        self._server = await asyncio.start_server(
+            self._on_connection, host, port, limit=_MAX_HEADER_BYTES
+        )
+        sockname = self._server.sockets[0].getsockname()
+        return str(sockname[0]), int(sockname[1])
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("server not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting, cancel open connections (SSE streams included) and the pool."""
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            with contextlib.suppress(Exception):
+                await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_blocking(self, fn: Callable[[], _T]) -> _T:
+        """Run *fn* on the bounded worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
+
+    # -- connection handling --
+
+    async def _on_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        if self._connections >= self._limits.max_connections:
+            # Drain the request head first: closing on unread bytes resets the
+            # socket, and the client would never see the 503.
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _REJECT_DRAIN_SECS)
+            await self._reject(writer, "connections")
+            await self._close(writer)
+            return
+        self._connections += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        try:
+            try:
+                request = await asyncio.wait_for(
+                    self._read_request(reader, writer), self._limits.header_timeout_secs
+                )
+            except TimeoutError:
+                return
+            except _HTTPError as exc:
+                await self._respond(
+                    writer, exc.status, _JSON_CONTENT_TYPE, _json_body({"error": exc.error})
+                )
+                return
+            if request is None:
+                return
+            self._in_flight += 1
+            LULA_HTTP_REQUESTS_IN_FLIGHT.inc()
+            try:
+                await self._handle(request, writer)
+            finally:
+                self._in_flight -= 1
+                LULA_HTTP_REQUESTS_IN_FLIGHT.dec()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # close() cancels open connections; nothing awaits this task.
+            pass
+        finally:
+            self._connections -= 1
+            if task is not None:
+                self._tasks.discard(task)
+            await self._close(writer)
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> HTTPRequest | None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError as exc:
+            raise _HTTPError(431, "request_header_fields_too_large") from exc
+        except asyncio.IncompleteReadError:
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split()
+        if len(parts) != 3:
+            raise _HTTPError(400, "bad_request")
+        method, target, _version = parts
+        if method not in _SUPPORTED_METHODS:
+            raise _HTTPError(501, "unsupported_method")
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise _HTTPError(400, "bad_request")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            length = 0
+        if length > self._limits.max_body_bytes:
+            raise _HTTPError(413, "request_body_too_large")
+        body = await reader.readexactly(length) if length > 0 else None
+        peer = writer.get_extra_info("peername")
+        client_address = (str(peer[0]), int(peer[1])) if isinstance(peer, tuple) else None
+        return HTTPRequest(
+            method=method,
+            target=target,
+            headers=headers,
+            body=body,
+            client_address=client_address,
+        )
+
+    async def _handle(self, request: HTTPRequest, writer: asyncio.StreamWriter) -> None:
+        limits = self._limits
+        if self._busy_workers >= limits.worker_threads + limits.max_queued_requests:
+            await self._reject(writer, "workers")
+            return
+        self._busy_workers += 1
+        try:
+            response = await self.run_blocking(lambda: self._handler(request))
+        finally:
+            self._busy_workers -= 1
+
+        if response.status not in (-1, -2):
+            await self._respond(
+                writer, response.status, response.content_type, response.body, response.headers
+            )
+            return
+
+        if self._sse_streams >= limits.max_sse_subscribers:
+            await self._reject(writer, "sse_subscribers")
+            return
+        run_id = response.body.decode("utf-8")
+        headers = [
+            ("Content-Type", "text/event-stream; charset=utf-8"),
+            ("Cache-Control", "no-store"),
+            ("X-Accel-Buffering", "no"),
+        ]
+        if response.status == -2:
+            headers.append(("Access-Control-Allow-Origin", "*"))
+        headers.extend(response.headers)
+        self._sse_streams += 1
+        LULA_SSE_STREAMS_OPEN.inc()
+        try:
+            if not await self._send(writer, _head(200, headers)):
+                return
+            if response.status == -1:
+                await self._stream_run(run_id, writer)
+            else:
+                await stream_new_sse_async(
+                    self._service,
+                    run_id,
+                    lambda data: self._send(writer, data),
+                    self.run_blocking,
+                )
+        finally:
+            self._sse_streams -= 1
+            LULA_SSE_STREAMS_OPEN.dec()
+
+    async def _stream_run(self, run_id: str, writer: asyncio.StreamWriter) -> None:
+        """Event-loop counterpart of ``RemoteAPIService.stream_run_sse``."""
+        service = self._service
+        opened = await self.run_blocking(lambda: service.open_run_stream(run_id))
+        if opened is None:
+            await self._send(writer, sse_not_found_frame(run_id))
+            return
+        state, new_lines, subscription = opened
+        log_count = len(new_lines)
+        deadline = time.monotonic() + _SSE_MAX_STREAM_SECS
+        try:
+            while True:
+                if not await self._send(writer, sse_state_frame(state, log_count, new_lines)):
+                    return
+                if sse_stream_done(state):
+                    await self._send(writer, SSE_DONE_FRAME)
+                    return
+                if subscription is None or time.monotonic() >= deadline:
+                    return
+                batch = await subscription.read_async(_SSE_KEEPALIVE_SECS)
+                while not batch.frames and not batch.closed:
+                    if time.monotonic() >= deadline:
+                        return
+                    if not await self._send(writer, SSE_KEEPALIVE_FRAME):
+                        return
+                    batch = await subscription.read_async(_SSE_KEEPALIVE_SECS)
+                state, new_lines = service.apply_stream_batch(run_id, state, batch)
+                log_count += len(new_lines)
+                if batch.closed:
+                    subscription.close()
+                    subscription = None
+        finally:
+            if subscription is not None:
+                subscription.close()
+
+    # -- writing --
+
+    async def _send(self, writer: asyncio.StreamWriter, data: bytes) -> bool:
+        """Write *data*; returns ``False`` once the client has gone away."""
+        if writer.is_closing():
+            return False
+        if not data:
+            return True
+        writer.write(data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            return False
+        return True
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        content_type: str,
+        body: bytes,
+        headers: list[tuple[str, str]] | None = None,
+    ) -> None:
+        all_headers = [
+            ("Content-Type", content_type),
+            ("Content-Length", str(len(body))),
+            ("Cache-Control", "no-store"),
+            *(headers or []),
+        ]
+        await self._send(writer, _head(status, all_headers) + body)
+
+    async def _reject(self, writer: asyncio.StreamWriter, reason: str) -> None:
+        LULA_HTTP_REJECTED_TOTAL.labels(reason=reason).inc()
+        self._log.warning("remote_api_overloaded", reason=reason)
+        await self._respond(
+            writer,
+            503,
+            _JSON_CONTENT_TYPE,
+            _json_body({"error": "overloaded", "reason": reason}),
+            [("Retry-After", str(self._limits.retry_after_secs))],
+        )
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        with contextlib.suppress(ConnectionError, OSError):
+            await writer.wait_closed()
+
+
+__all__ = [
+    "AsyncRemoteAPIServer",
+    "HTTPRequest",
+    "HTTPResponse",
+    "RequestHandler",
+    "ServerLimits",
+]
@@ -0,0 +1,239 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Per-run broadcast hub backing the ``/v1/runs/{id}/events`` SSE stream.
+
+Producers (the subprocess capture thread and run lifecycle transitions) publish
+each frame exactly once into a bounded ring buffer.  Every SSE client holds a
+:class:`Subscription` with its own cursor into that buffer and blocks on a
+condition variable until new frames arrive, so N dashboards watching one run
+cost one publish per frame instead of N trace re-reads per poll interval.
+
+A subscriber that falls more than ``capacity`` frames behind loses the oldest
+frames; the number lost is reported in :attr:`BroadcastBatch.dropped`.
+Subscribers on an asyncio event loop await :meth:`Subscription.read_async`,
+which parks on a loop-side event instead of a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+_DEFAULT_CAPACITY = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class BroadcastBatch:
+    """Frames read by one :meth:`Subscription.read` call."""
+
+    frames: list[dict[str, Any]] = field(default_factory=list)
+    dropped: int = 0
+    closed: bool = False
+
+
+class RunBroadcast:
+    """Bounded ring buffer of frames for a single run (thread-safe)."""
+
+    def __init__(self, run_id: str, *, capacity: int = _DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.run_id = run_id
+        self._frames: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._next_seq = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._cursors: dict[int, int] = {}
+        self._sub_ids = itertools.count()
+        self._waiters: set[Callable[[], None]] = set()
+        self.dropped_total = 0
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    def publish(self, frame: dict[str, Any]) -> int:
+        """Append *frame* and wake all waiting subscribers.  Returns its sequence number."""
+        with self._cond:
+            if self._closed:
+                return -1
+            seq = self._next_seq
+            self._frames.append(frame)
+            self._next_seq += 1
+            self._cond.notify_all()
+            self._wake_waiters()
+            return seq
+
+    def close(self) -> None:
+        """Mark the broadcast finished; subscribers drain what is left and stop."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        for wake in self._waiters:
+            wake()
+
+    def _add_waiter(self, wake: Callable[[], None]) -> None:
+        with self._cond:
+            self._waiters.add(wake)
+
+    def _remove_waiter(self, wake: Callable[[], None]) -> None:
+        with self._cond:
+            self._waiters.discard(wake)
+
+    def subscribe(self) -> Subscription:
+        """Return a subscription positioned after the most recent frame."""
+        with self._cond:
+            sub_id = next(self._sub_ids)
+            self._cursors[sub_id] = self._next_seq
+        return Subscription(self, sub_id)
+
+    def subscriber_count(self) -> int:
+        with self._cond:
+            return len(self._cursors)
+
+    def max_lag(self) -> int:
+        """Return the largest number of unread frames held by any subscriber."""
+        with self._cond:
+            if not self._cursors:
+                return 0
+            return self._next_seq - min(self._cursors.values())
+
+    def _read(self, sub_id: int, timeout: float | None) -> BroadcastBatch:
+        with self._cond:
+            cursor = self._cursors.get(sub_id)
+            if cursor is None:
+                return BroadcastBatch(closed=True)
+            if cursor >= self._next_seq and not self._closed:
+                self._cond.wait_for(
+                    lambda: self._closed or self._cursors.get(sub_id, cursor) < self._next_seq,
+                    timeout=timeout,
+                )
+            oldest = self._next_seq - len(self._frames)
+            dropped = max(0, oldest - cursor)
+            start = max(cursor, oldest) - oldest
+            frames = list(itertools.islice(self._frames, start, None))
+            self._cursors[sub_id] = self._next_seq
+            self.dropped_total += dropped
+            return BroadcastBatch(frames=frames, dropped=dropped, closed=self._closed)
+
+    def _unsubscribe(self, sub_id: int) -> None:
+        with self._cond:
+            self._cursors.pop(sub_id, None)
+
+
+class Subscription:
+    """Cursor into a :class:`RunBroadcast`; obtain via :meth:`RunBroadcast.subscribe`."""
+
+    def __init__(self, broadcast: RunBroadcast, sub_id: int) -> None:
+        self._broadcast = broadcast
+        self._sub_id = sub_id
+
+    def read(self, timeout: float | None = None) -> BroadcastBatch:
+        """Block until new frames are published, the run closes, or *timeout* elapses."""
+        return self._broadcast._read(self._sub_id, timeout)
+
+    async def read_async(self, timeout: float | None = None) -> BroadcastBatch:
+        """Await new frames, the run closing, or *timeout*, without blocking a thread."""
+        batch = self._broadcast._read(self._sub_id, 0)
+        if batch.frames or batch.closed:
+            return batch
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+
+        def _wake() -> None:
+            # Called from the publishing thread; the loop may already be gone.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(woken.set)
+
+        self._broadcast._add_waiter(_wake)
+        try:
+            # Re-check after registering so a publish in between is not missed.
+            batch = self._broadcast._read(self._sub_id, 0)
+            if batch.frames or batch.closed:
+                return batch
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(woken.wait(), timeout)
+        finally:
+            self._broadcast._remove_waiter(_wake)
+        return self._broadcast._read(self._sub_id, 0)
+
+    def close(self) -> None:
+        self._broadcast._unsubscribe(self._sub_id)
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class BroadcastHub:
+    """Registry of :class:`RunBroadcast` instances keyed by run id."""
+
+    def __init__(self, *, capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._capacity = capacity
+        self._broadcasts: dict[str, RunBroadcast] = {}
+        self._lock = threading.Lock()
+        self._dropped_closed = 0
+
+    def open(self, run_id: str) -> RunBroadcast:
+        """Return the live broadcast for *run_id*, creating a fresh one if needed."""
+        with self._lock:
+            broadcast = self._broadcasts.get(run_id)
+            if broadcast is None or broadcast.closed:
+                broadcast = RunBroadcast(run_id, capacity=self._capacity)
+                self._broadcasts[run_id] = broadcast
+            return broadcast
+
+    def get(self, run_id: str) -> RunBroadcast | None:
+        with self._lock:
+            return self._broadcasts.get(run_id)
+
+    def publish(self, run_id: str, frame: dict[str, Any]) -> None:
+        """Publish *frame* to *run_id*; no-op when the run has no open broadcast."""
+        broadcast = self.get(run_id)
+        if broadcast is not None:
+            broadcast.publish(frame)
+
+    def close(self, run_id: str) -> None:
+        """Close and forget the broadcast for *run_id*.  Existing subscribers drain it."""
+        with self._lock:
+            broadcast = self._broadcasts.pop(run_id, None)
+            if broadcast is not None:
+                self._dropped_closed += broadcast.dropped_total
+        if broadcast is not None:
+            broadcast.close()
+
+    def metrics(self) -> dict[str, int]:
+        """Return current metrics as a dict suitable for Prometheus exposition."""
+        with self._lock:
+            broadcasts = list(self._broadcasts.values())
+            dropped = self._dropped_closed
+        return {
+            "active_runs": len(broadcasts),
+            "subscribers": sum(b.subscriber_count() for b in broadcasts),
+            "max_lag": max((b.max_lag() for b in broadcasts), default=0),
+            "dropped_frames": dropped + sum(b.dropped_total for b in broadcasts),
+        }
+
+
+# Process-wide hub shared by RemoteAPIService instances and the /metrics route.
+run_broadcasts = BroadcastHub()
+
+
+__all__ = [
+    "BroadcastBatch",
+    "BroadcastHub",
+    "RunBroadcast",
+    "Subscription",
+    "run_broadcasts",
+]
@@ -34,11 +34,60 @@ LULA_LLM_DURATION_SECONDS: Histogram = Histogram(
     "Wall-clock duration of LLM inference calls in seconds",
     ["model"],
 )
+LULA_LLM_TTFT_SECONDS: Histogram = Histogram(
+    "lula_llm_time_to_first_token_seconds",
+    "Time from starting a streamed LLM call to its first content token",
+    ["model"],
+)
+LULA_LLM_CALL_OVERHEAD_SECONDS: Histogram = Histogram(
+    "lula_llm_call_overhead_seconds",
+    "Client-side overhead of a streamed LLM call before the HTTP request is sent",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
 LULA_TOOL_CALLS_TOTAL: Counter = Counter(
     "lula_tool_calls_total",
     "Total number of tool calls dispatched to the runner",
     ["tool_name", "status"],
 )
+LULA_RUNNER_CONNECTIONS_TOTAL: Counter = Counter(
+    "lula_runner_connections_total",
+    "Runner HTTP requests by whether they opened a new connection or reused a pooled one",
+    ["outcome"],
+)
+LULA_RUNNER_POOL_WAIT_SECONDS: Histogram = Histogram(
+    "lula_runner_pool_wait_seconds",
+    "Time a runner HTTP request waited to acquire a pooled connection",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+LULA_WORKTREE_POOL_LEASES_TOTAL: Counter = Counter(
+    "lula_worktree_pool_leases_total",
+    "Worktree pool leases by whether an idle worktree was reused (hit) or a new one created (miss)",
+    ["outcome"],
+)
+LULA_WORKTREE_POOL_WAIT_SECONDS: Histogram = Histogram(
+    "lula_worktree_pool_wait_seconds",
+    "Time a sub-agent waited for a pooled git worktree, including any checkout",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+LULA_SLA_DEGRADED_MODELS: Gauge = Gauge(
+    "lula_sla_degraded_models",
+    "1 while a model's p95 latency is over its SLA threshold and calls are routed to its fallback",
+    ["model"],
+)
+LULA_HTTP_REQUESTS_IN_FLIGHT: Gauge = Gauge(
+    "lula_http_requests_in_flight",
+    "HTTP requests currently being handled by the Remote API (open SSE streams included)",
+)
+LULA_SSE_STREAMS_OPEN: Gauge = Gauge(
+    "lula_sse_streams_open",
+    "Server-Sent Event streams currently held open by the Remote API",
+)
+LULA_HTTP_REJECTED_TOTAL: Counter = Counter(
+    "lula_http_rejected_total",
+    "Requests refused with 503 because a Remote API concurrency limit was reached",
+    ["reason"],
+)
 
 _PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
@@ -67,6 +116,28 @@ def _rate_limiter_metrics_lines() -> str:
     return "\n".join(lines) + "\n"
 
 
+def _broadcast_metrics_lines() -> str:
+    """Return Prometheus text-format lines for the per-run SSE broadcast hub."""
+    from lg_orch.api.broadcast import run_broadcasts
+
+    m = run_broadcasts.metrics()
+    lines = [
+        "# HELP lula_sse_broadcasts_active Runs with an open SSE broadcast",
+        "# TYPE lula_sse_broadcasts_active gauge",
+        f"lula_sse_broadcasts_active {m['active_runs']}",
+        "# HELP lula_sse_subscribers Connected /v1/runs/{id}/events subscribers",
+        "# TYPE lula_sse_subscribers gauge",
+        f"lula_sse_subscribers {m['subscribers']}",
+        "# HELP lula_sse_subscriber_lag_max Largest unread frame backlog of any subscriber",
+        "# TYPE lula_sse_subscriber_lag_max gauge",
+        f"lula_sse_subscriber_lag_max {m['max_lag']}",
+        "# HELP lula_sse_dropped_frames_total Frames lost by subscribers overrun by the ring",
+        "# TYPE lula_sse_dropped_frames_total counter",
+        f"lula_sse_dropped_frames_total {m['dropped_frames']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
 def handle_metrics(method: str) -> tuple[int, str, bytes]:
     """Return the Prometheus metrics page.
 
@@ -83,4 +154,5 @@ def handle_metrics(method: str) -> tuple[int, str, bytes]:
     rl_lines = _rate_limiter_metrics_lines()
     if rl_lines:
         body = body + rl_lines.encode("utf-8")
+    body = body + _broadcast_metrics_lines().encode("utf-8")
     return 200, _PROMETHEUS_CONTENT_TYPE, body
@@ -0,0 +1,413 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Pre-started worker processes that execute runs in place of one subprocess per run.
+
+``RemoteAPIService.create_run`` normally spawns ``python -m lg_orch.main run
+...`` for every request.  Each run therefore pays interpreter start-up, the
+langgraph/pydantic/opentelemetry imports and the first ``build_graph`` before
+doing any work.  A :class:`RunWorkerPool` keeps ``size`` warm interpreters
+that have already paid that cost.  Each worker takes one run spec at a time
+over a pipe and calls the module's ``pool_main(argv, cwd=..., env=...)``
+in-process.  The run's working directory and environment are arguments, not
+process state, and :func:`lg_orch.main.pool_main` reuses the graph compiled
+by its ``warm_up()`` and the loaded config across runs.  Modules without a
+``pool_main`` are never sent to the pool.
+
+Worker-side, file descriptors 1 and 2 are redirected into a pipe, so
+everything the run prints (``print``, structlog on stderr, child processes)
+is forwarded to the API line by line, as the subprocess's stdout was.
+Parent-side, each run is a :class:`PooledRun`, which implements the part of
+:class:`subprocess.Popen` the service uses (``stdout`` iteration, ``poll``,
+``wait``, ``terminate``, ``kill``, ``returncode``).  Log capture and
+cancellation therefore keep their semantics.  Cancelling terminates the
+worker, exactly as it terminated the subprocess, and the pool replaces it.
+Workers are not daemonic, so a run may start multiprocessing children of its
+own; at interpreter exit the pool stops idle workers and terminates busy ones.
+
+Workers are recycled after ``max_runs_per_worker`` runs.  They are also
+recycled once their peak RSS (``ru_maxrss``) passes ``max_rss_mb``, so leaks
+and one-off large runs do not accumulate.  When every worker is busy,
+:meth:`RunWorkerPool.try_spawn` returns ``None`` and the caller falls back to
+a cold subprocess.
+"""
+
+from __future__ import annotations
+
+import atexit
+import codecs
+import contextlib
+import importlib
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Iterator
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any
+
+from lg_orch.logging import get_logger
+
+# Marks the end of one run's output on the worker's redirected stdout.
+_RUN_END = b"\x00lg-orch-run-end\x00\n"
+_REAP_TIMEOUT_SECS = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+
+def _warm_up() -> None:
+    """Import the run path and compile the graph once; runs reuse the result."""
+    from lg_orch.main import warm_up
+
+    warm_up()
+
+
+def _execute(argv: list[str], cwd: str, env: dict[str, str]) -> int:
+    """Run ``python -m <module> <args>`` in this process and return its exit code."""
+    try:
+        module = importlib.import_module(argv[2])
+        result = module.pool_main([argv[2], *argv[3:]], cwd=Path(cwd), env=env)
+        return int(result or 0)
+    except SystemExit as exc:
+        code = exc.code
+        if code is None:
+            return 0
+        return code if isinstance(code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+def _forward_output(read_fd: int, conn: Connection, status: dict[str, Any]) -> None:
+    """Send the worker's stdout/stderr lines to the parent until the pipe closes.
+
+    The end-of-run marker is written to the same pipe after the run's output,
+    so the ``exit`` message is always sent after the last ``out`` message.
+    """
+    with os.fdopen(read_fd, "rb") as pipe:
+        for line in pipe:
+            if line.endswith(_RUN_END):
+                prefix = line[: -len(_RUN_END)]
+                if prefix:
+                    conn.send(("out", prefix))
+                conn.send(("exit", status["exit_code"], status["maxrss_kb"]))
+            else:
+                conn.send(("out", line))
+
+
+def _worker_main(conn: Connection, warm: bool) -> None:
+    if warm:
+        with contextlib.suppress(Exception):
+            _warm_up()
+
+    read_fd, write_fd = os.pipe()
+    os.dup2(write_fd, 1)
+    os.dup2(write_fd, 2)
+    os.close(write_fd)
+    with contextlib.suppress(AttributeError, ValueError):
+        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+    status: dict[str, Any] = {"exit_code": 0, "maxrss_kb": 0}
+    forwarder = threading.Thread(
+        target=_forward_output, args=(read_fd, conn, status), name="run-pool-output", daemon=True
+    )
+    forwarder.start()
+
+    import resource
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] != "run":
+            return
+        _, argv, cwd, env = message
+        exit_code = _execute(argv, cwd, env)
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(Exception):
+                stream.flush()
+        status["exit_code"] = exit_code
+        status["maxrss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        os.write(1, _RUN_END)
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+
+class _Worker:
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        self.runs = 0
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def retire(self) -> None:
+        """Ask the worker to exit, then reap it off the calling thread."""
+        with contextlib.suppress(OSError, ValueError):
+            self.conn.send(("stop",))
+        threading.Thread(target=self._reap, name="run-pool-reap", daemon=True).start()
+
+    def _reap(self) -> None:
+        self.process.join(_REAP_TIMEOUT_SECS)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        with contextlib.suppress(OSError):
+            self.conn.close()
+
+
+class _RunOutput:
+    """Line iterator over one run's output; stands in for ``Popen.stdout``."""
+
+    def __init__(self, run: PooledRun) -> None:
+        self._run = run
+        self._closed = False
+
+    def __iter__(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        pending = ""
+        conn = self._run._worker.conn
+        while not self._closed:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                self._run._worker_lost()
+                break
+            if message[0] == "out":
+                pending += decoder.decode(message[1])
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    yield line + "\n"
+            elif message[0] == "exit":
+                self._run._finished(int(message[1]), int(message[2]))
+                break
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    def close(self) -> None:
+        self._closed = True
+
+
+class PooledRun:
+    """A run executing on a pool worker, exposing the ``Popen`` subset the service uses."""
+
+    def __init__(self, pool: RunWorkerPool, worker: _Worker, argv: list[str]) -> None:
+        self.args = argv
+        self.pid = worker.process.pid
+        self.returncode: int | None = None
+        self.stdout = _RunOutput(self)
+        self._pool = pool
+        self._worker = worker
+        self._done = threading.Event()
+        self._settle_lock = threading.Lock()
+
+    def poll(self) -> int | None:
+        if self.returncode is None and not self._done.is_set() and not self._worker.alive():
+            self._worker_lost()
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self.args, timeout or 0.0)
+            self._done.wait(0.05)
+        assert self.returncode is not None
+        return self.returncode
+
+    def terminate(self) -> None:
+        if self.returncode is None:
+            self._worker.process.terminate()
+
+    def kill(self) -> None:
+        if self.returncode is None:
+            self._worker.process.kill()
+
+    # -- settlement, called once from whichever path sees the run end --
+
+    def _finished(self, exit_code: int, maxrss_kb: int) -> None:
+        with self._settle_lock:
+            if self._done.is_set():
+                return
+            self.returncode = exit_code
+            self._done.set()
+        self._pool._release(self._worker, maxrss_kb)
+
+    def _worker_lost(self) -> None:
+        with self._settle_lock:
+            if self._done.is_set():
+                return
+            self._worker.process.join(_REAP_TIMEOUT_SECS)
+            exit_code = self._worker.process.exitcode
+            self.returncode = exit_code if exit_code is not None else -9
+            self._done.set()
+        self._pool._discard(self._worker)
+
+
+class RunWorkerPool:
+    """Fixed-size pool of warm run workers.
+
+    Parameters
+    ----------
+    size:
+        Number of worker processes kept alive.
+    max_runs_per_worker:
+        Recycle a worker after this many runs.
+    max_rss_mb:
+        Recycle a worker whose peak RSS exceeds this many MiB after a run.
+    warm:
+        Import the run path and build the graph in each worker before its
+        first run.  Tests disable this to keep worker start-up cheap.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        max_runs_per_worker: int = 50,
+        max_rss_mb: int = 2048,
+        warm: bool = True,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        if max_runs_per_worker < 1:
+            raise ValueError("max_runs_per_worker must be >= 1")
+        self._size = size
+        self._max_runs = max_runs_per_worker
+        self._max_rss_kb = max_rss_mb * 1024
+        self._warm = warm
+        # fork() from a threaded server is unsafe; spawned workers start clean.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._closed = False
+        self._recycled = 0
+        self._log = get_logger()
+        for _ in range(size):
+            self._idle.append(self._start_worker())
+        # Runs before multiprocessing joins non-daemonic children at exit.
+        atexit.register(self._shutdown)
+
+    def _start_worker(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._warm),
+            name="lg-orch-run-worker",
+            daemon=False,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def try_spawn(
+        self, *, argv: list[str], cwd: Path, env: dict[str, str] | None = None
+    ) -> PooledRun | None:
+        """Start *argv* (``python -m <module> ...``) on an idle worker.
+
+        Returns ``None`` when the pool is closed, every worker is busy, or
+        *argv* is not a ``-m`` invocation of a module with a ``pool_main``; the
+        caller then spawns a subprocess as before.
+        """
+        if len(argv) < 3 or argv[1] != "-m" or not _has_pool_main(argv[2]):
+            return None
+        with self._lock:
+            if self._closed:
+                return None
+            worker: _Worker | None = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.alive():
+                    worker = candidate
+                    break
+                candidate.retire()
+            if worker is None:
+                if len(self._busy) >= self._size:
+                    return None
+                worker = self._start_worker()
+            self._busy.add(worker)
+            worker.runs += 1
+        run = PooledRun(self, worker, list(argv))
+        spec = ("run", list(argv), str(cwd), dict(env if env is not None else os.environ))
+        try:
+            worker.conn.send(spec)
+        except (OSError, ValueError):
+            self._discard(worker)
+            return None
+        return run
+
+    def _release(self, worker: _Worker, maxrss_kb: int) -> None:
+        with self._lock:
+            self._busy.discard(worker)
+            recycle = self._closed or worker.runs >= self._max_runs or maxrss_kb > self._max_rss_kb
+            if not recycle:
+                self._idle.append(worker)
+                return
+        self._log.info(
+            "run_pool_worker_recycled",
+            pid=worker.process.pid,
+            runs=worker.runs,
+            maxrss_kb=maxrss_kb,
+        )
+        self._discard(worker)
+
+    def _discard(self, worker: _Worker) -> None:
+        """Retire *worker* and start a replacement so the pool stays warm."""
+        worker.retire()
+        with self._lock:
+            self._busy.discard(worker)
+            self._recycled += 1
+            if self._closed or len(self._idle) + len(self._busy) >= self._size:
+                return
+            self._idle.append(self._start_worker())
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "recycled": self._recycled,
+            }
+
+    def close(self) -> None:
+        """Stop idle workers; busy workers exit after their current run."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for worker in idle:
+            worker.retire()
+
+    def _shutdown(self) -> None:
+        """Stop idle workers and terminate busy ones; registered with :mod:`atexit`."""
+        self.close()
+        with self._lock:
+            busy = list(self._busy)
+        for worker in busy:
+            with contextlib.suppress(OSError, ValueError):
+                worker.process.terminate()
+
+
+def _has_pool_main(module_name: str) -> bool:
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return False
+    return callable(getattr(module, "pool_main", None))
+
+
+__all__ = ["PooledRun", "RunWorkerPool"]
@@ -10,7 +10,9 @@ continues to work.  Methods that need to call them do so via a lazy import:
     process = _m._spawn_run_subprocess(argv=argv, cwd=cwd, env=env)
 
 This indirection means pytest's ``monkeypatch.setattr(remote_api, "_spawn_run_subprocess",
-fake)`` is seen by the service class at call time.
+fake)`` is seen by the service class at call time.  With a
+:class:`~lg_orch.api.run_pool.RunWorkerPool` configured, runs start on a warm
+worker first and fall back to the subprocess only when every worker is busy.
 """
 
 from __future__ import annotations
@@ -25,6 +27,7 @@ import tempfile
 import threading
 import time
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -39,7 +42,9 @@ from lg_orch.api.approvals import (
 from lg_orch.api.approvals import (
     tool_name_for_approval as _tool_name_for_approval,
 )
+from lg_orch.api.broadcast import BroadcastBatch, BroadcastHub, Subscription, run_broadcasts
 from lg_orch.api.metrics import LULA_ACTIVE_RUNS, LULA_RUN_DURATION_SECONDS, LULA_RUNS_TOTAL
+from lg_orch.api.run_pool import PooledRun, RunWorkerPool
 from lg_orch.approval_policy import (
     ApprovalDecision,
     ApprovalEngine,
@@ -48,7 +53,22 @@ from lg_orch.approval_policy import (
 )
 from lg_orch.logging import get_logger
 from lg_orch.procedure_cache import ProcedureCache, _canonical_procedure_name
-from lg_orch.run_store import RedisRunStore, RunStore
+from lg_orch.run_store import (
+    RedisRunStore,
+    RunPage,
+    RunStore,
+    decode_run_cursor,
+    encode_run_cursor,
+    page_fields,
+    to_page,
+)
+from lg_orch.trace import (
+    TRACE_APPEND_MARKER,
+    TraceJournal,
+    TraceJournalTail,
+    load_trace_payload,
+    trace_journal_path,
+)
 
 # ---------------------------------------------------------------------------
 # Constants and helpers
@@ -61,6 +81,29 @@ _RUN_TIMEOUT_SECS = int(os.environ.get("LG_RUN_TIMEOUT_SECS", "600"))
 _DEFAULT_TRACE_OUT_DIR = Path("artifacts/remote-api")
 _ALLOWED_VIEWS = {"classic", "console"}
 
+# /v1/runs/{id}/events stream limits.
+_SSE_KEEPALIVE_SECS = 30.0
+_SSE_MAX_STREAM_SECS = 1800.0
+# A stream ends with ``event: done`` only once the run reaches one of these.
+_TERMINAL_RUN_STATUSES = frozenset({"succeeded", "failed", "cancelled", "rejected"})
+SSE_DONE_FRAME = b"event: done\ndata: {}\n\n"
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+
+def sse_state_frame(state: dict[str, Any], log_count: int, new_lines: list[str]) -> bytes:
+    """Encode one ``/v1/runs/{id}/stream`` summary frame."""
+    frame = {**state, "log_lines": log_count, "new_log_lines": new_lines}
+    return f"data: {json.dumps(frame, ensure_ascii=False)}\n\n".encode()
+
+
+def sse_stream_done(state: dict[str, Any]) -> bool:
+    """Whether a ``/v1/runs/{id}/stream`` client has seen the run's last state."""
+    return str(state.get("status", "")) in _TERMINAL_RUN_STATUSES
+
+
+def sse_not_found_frame(run_id: str) -> bytes:
+    return f"data: {json.dumps({'error': 'not_found', 'run_id': run_id})}\n\n".encode()
+
 
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat().replace("+00:00", "Z")
@@ -231,7 +274,16 @@ def _write_trace_approval_state(
     history: list[dict[str, Any]],
     last_decision: dict[str, Any] | None,
 ) -> None:
+    journal_path = trace_journal_path(trace_path)
     if not trace_path.is_file():
+        if journal_path.is_file():
+            _write_journal_approval_state(
+                journal_path,
+                pending=pending,
+                pending_details=pending_details,
+                history=history,
+                last_decision=last_decision,
+            )
         return
     try:
         payload_raw = json.loads(trace_path.read_text(encoding="utf-8"))
@@ -240,7 +292,52 @@ def _write_trace_approval_state(
     if not isinstance(payload_raw, dict):
         return
 
-    approval_raw = payload_raw.get("approval", {})
+    payload_raw["approval"] = _updated_approval_section(
+        payload_raw.get("approval", {}),
+        pending=pending,
+        pending_details=pending_details,
+        history=history,
+        last_decision=last_decision,
+    )
+    try:
+        trace_path.write_text(
+            json.dumps(payload_raw, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    except OSError:
+        return
+
+
+def _write_journal_approval_state(
+    journal_path: Path,
+    *,
+    pending: bool,
+    pending_details: dict[str, Any] | None,
+    history: list[dict[str, Any]],
+    last_decision: dict[str, Any] | None,
+) -> None:
+    """Append an updated ``approval`` section to a journal trace."""
+    try:
+        journal = TraceJournal(journal_path, run_id=journal_path.stem.removeprefix("run-"))
+        approval = _updated_approval_section(
+            journal.read_section("approval"),
+            pending=pending,
+            pending_details=pending_details,
+            history=history,
+            last_decision=last_decision,
+        )
+        journal.write_sections({"approval": approval})
+    except (OSError, json.JSONDecodeError):
+        return
+
+
+def _updated_approval_section(
+    approval_raw: object,
+    *,
+    pending: bool,
+    pending_details: dict[str, Any] | None,
+    history: list[dict[str, Any]],
+    last_decision: dict[str, Any] | None,
+) -> dict[str, Any]:
     approval = dict(approval_raw) if isinstance(approval_raw, dict) else {}
     approval["pending"] = pending
     approval["history"] = history
@@ -252,13 +349,7 @@ def _write_trace_approval_state(
         approval["summary"] = ""
     if last_decision is not None:
         approval["last_decision"] = last_decision
-    payload_raw["approval"] = approval
-    try:
-        trace_path.write_text(
-            json.dumps(payload_raw, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-    except OSError:
-        return
+    return approval
 
 
 def _resume_argv(record: RunRecord) -> list[str]:
@@ -392,7 +483,7 @@ class RunRecord:
     argv: list[str]
     trace_out_dir: Path
     trace_path: Path
-    process: subprocess.Popen[str] | None
+    process: subprocess.Popen[str] | PooledRun | None
     created_at: str
     started_at: str
     status: str = "running"
@@ -410,6 +501,8 @@ class RunRecord:
     pending_approval_details: dict[str, Any] = field(default_factory=dict)
     approval_history: list[dict[str, Any]] = field(default_factory=list)
     final: str = ""
+    # Set once _mark_finished has taken over the exited process.
+    settled: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -426,6 +519,8 @@ class RemoteAPIService:
         rate_limiter: _RateLimiter | None = None,
         procedure_cache: ProcedureCache | None = None,
         namespace: str = "",
+        broadcast_hub: BroadcastHub | None = None,
+        run_pool: RunWorkerPool | None = None,
     ) -> None:
         self._repo_root = repo_root.resolve()
         self._lock = threading.Lock()
@@ -439,6 +534,21 @@ class RemoteAPIService:
         self._healing_tasks: dict[str, asyncio.Task[None]] = {}
         self._healing_loops: dict[str, Any] = {}
         self._run_start_times: dict[str, float] = {}
+        self._broadcasts = broadcast_hub if broadcast_hub is not None else run_broadcasts
+        self._run_pool = run_pool
+
+    def _spawn_run_process(
+        self, argv: list[str], env: dict[str, str] | None
+    ) -> subprocess.Popen[str] | PooledRun:
+        """Start a run on a warm pool worker, or as a subprocess when none is free."""
+        if self._run_pool is not None:
+            pooled = self._run_pool.try_spawn(argv=argv, cwd=self._repo_root, env=env)
+            if pooled is not None:
+                return pooled
+        # Lazy import so tests can monkeypatch remote_api._spawn_run_subprocess
+        import lg_orch.remote_api as _m
+
+        return _m._spawn_run_subprocess(argv=argv, cwd=self._repo_root, env=env)
 
     def create_run(
         self,
@@ -482,6 +592,7 @@ class RemoteAPIService:
             "--repo-root",
             str(self._repo_root),
             "--trace",
+            "--trace-notify",
             "--run-id",
             run_id,
             "--trace-out-dir",
@@ -517,13 +628,10 @@ class RemoteAPIService:
         with self._lock:
             if run_id in self._runs:
                 raise ValueError("duplicate_run_id")
-            # Lazy import so tests can monkeypatch remote_api._spawn_run_subprocess
-            import lg_orch.remote_api as _m
 
             # CRITICAL FIX 3: Insert run record BEFORE spawning subprocess to
             # prevent TOCTOU race where _mark_finished fires before the record
             # exists in the store.
-            _placeholder_process: subprocess.Popen[str] | None = None
             record = RunRecord(
                 run_id=run_id,
                 request=request,
@@ -540,12 +648,12 @@ class RemoteAPIService:
                 checkpoint_id=_non_empty_str(payload.get("checkpoint_id")) or "",
             )
             self._runs[run_id] = record
+            self._broadcasts.open(run_id)
 
             if self._run_store is not None:
                 self._run_store.upsert(self._summary_payload_locked(record))
 
-            process = _m._spawn_run_subprocess(argv=argv, cwd=self._repo_root, env=run_env)
-            record.process = process
+            record.process = self._spawn_run_process(argv, run_env)
         LULA_ACTIVE_RUNS.inc()
         with self._lock:
             self._run_start_times[run_id] = time.monotonic()
@@ -569,10 +677,86 @@ class RemoteAPIService:
             raise RuntimeError("run_not_found")
         return detail
 
-    def search_runs(self, query: str, limit: int = 50) -> list[dict[str, Any]]:
+    def search_runs(
+        self, query: str, limit: int = 50, fields: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
         if self._run_store is None:
             return []
-        return self._run_store.search_runs(query, limit=limit)
+        return self._run_store.search_runs(query, limit=limit, fields=fields)
+
+    def list_runs_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        status: str | Iterable[str] | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> RunPage:
+        """One page of runs with the semantics of :meth:`RunStore.list_runs_page`.
+
+        This replica's live records replace their persisted rows, or join
+        the page when not persisted yet; the store is asked for one page only.
+        Without *fields* live records keep their extra summary keys
+        (``log_lines``, ``cancellable``, ...) but never ``final``.
+        Raises ``ValueError`` for a malformed cursor or unknown fields.
+        """
+        limit = max(1, limit)
+        columns = page_fields(fields)
+        after = decode_run_cursor(cursor) if cursor else None
+        statuses = {status} if isinstance(status, str) else set(status or ())
+        with self._lock:
+            live_all = {r.run_id: self._summary_payload_locked(r) for r in self._runs.values()}
+
+        def in_window(run: dict[str, Any]) -> bool:
+            key = (str(run.get("created_at") or ""), run["run_id"])
+            return (
+                (after is None or key < after)
+                and (not statuses or run.get("status") in statuses)
+                and (created_after is None or key[0] >= created_after)
+                and (created_before is None or key[0] < created_before)
+            )
+
+        live = {rid: run for rid, run in live_all.items() if in_window(run)}
+        stored: list[dict[str, Any]] = []
+        store_next: str | None = None
+        if self._run_store is not None:
+            page = self._run_store.list_runs_page(
+                limit=limit,
+                cursor=cursor,
+                status=status,
+                created_after=created_after,
+                created_before=created_before,
+                fields=columns,
+            )
+            # A live record supersedes its row, even when it no longer matches.
+            stored = [r for r in page.runs if r["run_id"] not in live_all]
+            store_next = page.next_cursor
+            if store_next is not None:
+                last = (str(page.runs[-1].get("created_at") or ""), page.runs[-1]["run_id"])
+                # Anything older than the store's last row belongs to a later page.
+                live = {
+                    rid: run
+                    for rid, run in live.items()
+                    if (str(run.get("created_at") or ""), rid) >= last
+                }
+        rows = stored + [
+            {k: v for k, v in run.items() if k != "final"}
+            if fields is None
+            else {c: run.get(c) for c in columns}
+            for run in live.values()
+        ]
+        rows.sort(key=lambda r: (str(r.get("created_at") or ""), r["run_id"]), reverse=True)
+        if store_next is None:
+            return to_page(rows, limit)
+        # The store holds more past its page, so there is a next page anyway.
+        rows = rows[:limit]
+        if not rows:
+            return RunPage([], store_next)
+        return RunPage(
+            rows, encode_run_cursor(str(rows[-1].get("created_at") or ""), rows[-1]["run_id"])
+        )
 
     def list_runs(self) -> list[dict[str, Any]]:
         with self._lock:
@@ -628,7 +812,7 @@ class RemoteAPIService:
         if normalized_run_id is None:
             return None
 
-        process: subprocess.Popen[str] | None = None
+        process: subprocess.Popen[str] | PooledRun | None = None
         with self._lock:
             record = self._runs.get(normalized_run_id)
             if record is None:
@@ -641,6 +825,9 @@ class RemoteAPIService:
                 record.status = "cancelling"
                 process = record.process
 
+        if process is not None:
+            self._publish_run_state(normalized_run_id)
+
         if process is not None and process.poll() is None:
             try:
                 process.terminate()
@@ -672,6 +859,7 @@ class RemoteAPIService:
         rationale = _non_empty_str(payload.get("rationale")) or ""
         provided_challenge_id = _non_empty_str(payload.get("challenge_id"))
 
+        self._settle_exited(normalized_run_id)
         with self._lock:
             record = self._runs.get(normalized_run_id)
             if record is None:
@@ -743,14 +931,13 @@ class RemoteAPIService:
                 ensure_ascii=False,
             )
             argv = _resume_argv(record)
-            import lg_orch.remote_api as _m
-
-            process = _m._spawn_run_subprocess(argv=argv, cwd=self._repo_root, env=run_env)
+            process = self._spawn_run_process(argv, run_env)
 
             record.argv = argv
             record.process = process
             record.started_at = _utc_now()
             record.finished_at = None
+            record.settled = False
             record.exit_code = None
             record.status = "running"
             record.pending_approval = False
@@ -758,6 +945,7 @@ class RemoteAPIService:
             record.pending_approval_details = {}
             record.approval_history = approval_history
             record.logs.append(f"[approval] approved by {actor}")
+            self._broadcasts.open(normalized_run_id)
             payload_out = self._summary_payload_locked(record)
             trace_path = record.trace_path
 
@@ -770,6 +958,7 @@ class RemoteAPIService:
         )
         if self._run_store is not None:
             self._run_store.upsert(payload_out)
+        self._publish_run_state(normalized_run_id)
         import lg_orch.remote_api as _m2
 
         _m2._start_daemon_thread(
@@ -792,6 +981,7 @@ class RemoteAPIService:
         actor = _non_empty_str(payload.get("actor")) or auth_subject or "operator"
         rationale = _non_empty_str(payload.get("rationale")) or ""
 
+        self._settle_exited(normalized_run_id)
         with self._lock:
             record = self._runs.get(normalized_run_id)
             if record is None:
@@ -830,6 +1020,7 @@ class RemoteAPIService:
         )
         if self._run_store is not None:
             self._run_store.upsert(payload_out)
+        self._publish_run_state(normalized_run_id)
         self._log.info("remote_api_run_rejected", run_id=normalized_run_id, actor=actor)
         return self.get_run(normalized_run_id)
 
@@ -895,10 +1086,15 @@ class RemoteAPIService:
         if process is None:
             return
         stdout = process.stdout
+        tail = TraceJournalTail(trace_journal_path(record.trace_path))
         try:
             if stdout is not None:
                 for raw_line in stdout:
-                    self._append_log(run_id, raw_line.rstrip("\r\n"))
+                    line = raw_line.rstrip("\r\n")
+                    if line == TRACE_APPEND_MARKER:
+                        self._publish_trace_progress(run_id, tail)
+                    else:
+                        self._append_log(run_id, line)
         finally:
             if stdout is not None:
                 stdout.close()
@@ -930,18 +1126,48 @@ class RemoteAPIService:
             if record is None:
                 return
             record.logs.append(line)
+            self._broadcasts.publish(run_id, {"kind": "log", "lines": [line]})
 
-    def _mark_finished(self, run_id: str, exit_code: int) -> None:
+    def _publish_trace_progress(self, run_id: str, tail: TraceJournalTail) -> None:
+        """Broadcast the run's summary with the journal read so far, after an append.
+
+        Only the bytes appended since the last call are read, and never under
+        the service lock.
+        """
+        try:
+            trace_raw = tail.read()
+        except OSError as exc:
+            self._log.warning("remote_api_trace_read_failed", run_id=run_id, error=str(exc))
+            return
         with self._lock:
             record = self._runs.get(run_id)
             if record is None or record.finished_at is not None:
                 return
-            record.exit_code = exit_code
-            record.finished_at = _utc_now()
-            if record.cancel_requested:
-                record.status = "cancelled"
-            else:
-                record.status = "succeeded" if exit_code == 0 else "failed"
+            payload = _apply_trace_state_to_payload(self._summary_payload_locked(record), trace_raw)
+            self._broadcasts.publish(run_id, {"kind": "state", "payload": payload})
+
+    def _settle_exited(self, run_id: str) -> None:
+        """Run :meth:`_mark_finished` now if the process exited but nobody settled it yet."""
+        with self._lock:
+            record = self._runs.get(run_id)
+            process = record.process if record is not None and not record.settled else None
+        exit_code = process.poll() if process is not None else None
+        if exit_code is not None:
+            self._mark_finished(run_id, exit_code)
+
+    def _mark_finished(self, run_id: str, exit_code: int) -> None:
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None or record.settled:
+                return
+            record.settled = True
+            if record.finished_at is None:
+                record.exit_code = exit_code
+                record.finished_at = _utc_now()
+                if record.cancel_requested:
+                    record.status = "cancelled"
+                else:
+                    record.status = "succeeded" if exit_code == 0 else "failed"
             _final_status = record.status
             _start_time = self._run_start_times.pop(run_id, None)
             trace_path = record.trace_path
@@ -962,9 +1188,14 @@ class RemoteAPIService:
             if record is None:
                 return
             _apply_approval_state_to_record(record, approval_state)
+            if isinstance(trace_raw, dict):
+                final_text = str(trace_raw.get("final", "")).strip()
+                if final_text:
+                    record.final = final_text
             payload = self._summary_payload_locked(record)
             approval_history = list(record.approval_history)
             pending_details = dict(record.pending_approval_details)
+            self._publish_state_locked(record, trace_raw)
         if self._run_store is not None:
             self._run_store.upsert(payload)
             try:
@@ -1022,6 +1253,11 @@ class RemoteAPIService:
                 pass
 
     def _refresh_record_locked(self, record: RunRecord) -> None:
+        """Mark *record* finished once its process has exited.
+
+        No I/O happens here, under the lock: the trace-derived state, the
+        run store and the final broadcast are left to :meth:`_mark_finished`.
+        """
         if record.finished_at is not None:
             return
         if record.process is None:
@@ -1035,14 +1271,30 @@ class RemoteAPIService:
             record.status = "cancelled"
         else:
             record.status = "succeeded" if exit_code == 0 else "failed"
-        trace_raw = self._load_trace(record.trace_path)
-        _apply_approval_state_to_record(record, _approval_state_from_trace(trace_raw))
-        if isinstance(trace_raw, dict):
-            final_text = str(trace_raw.get("final", "")).strip()
-            if final_text:
-                record.final = final_text
-        if self._run_store is not None:
-            self._run_store.upsert(self._summary_payload_locked(record))
+
+    def _publish_state_locked(
+        self, record: RunRecord, trace_payload: dict[str, Any] | None
+    ) -> None:
+        """Broadcast the run's summary with *trace_payload*; closes the broadcast once settled.
+
+        The caller reads the trace before taking the lock.
+        """
+        payload = _apply_trace_state_to_payload(self._summary_payload_locked(record), trace_payload)
+        self._broadcasts.publish(record.run_id, {"kind": "state", "payload": payload})
+        if record.finished_at is not None and record.settled:
+            self._broadcasts.close(record.run_id)
+
+    def _publish_run_state(self, run_id: str) -> None:
+        with self._lock:
+            record = self._runs.get(run_id)
+            trace_path = record.trace_path if record is not None else None
+        if trace_path is None:
+            return
+        trace_raw = self._load_trace(trace_path)
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is not None:
+                self._publish_state_locked(record, trace_raw)
 
     def _summary_payload_locked(self, record: RunRecord) -> dict[str, Any]:
         self._refresh_record_locked(record)
@@ -1072,81 +1324,113 @@ class RemoteAPIService:
             payload["final"] = record.final
         return payload
 
+    def open_run_stream(
+        self, run_id: str
+    ) -> tuple[dict[str, Any], list[str], Subscription | None] | None:
+        """Snapshot *run_id* for an SSE client.
+
+        Returns ``(state, log_lines, subscription)``, where *subscription*
+        is ``None`` for a finished run, or ``None`` for an unknown run.
+        """
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None:
+                return None
+            self._refresh_record_locked(record)
+            summary = self._summary_payload_locked(record)
+            logs = list(record.logs)
+            trace_path = record.trace_path
+            subscription = (
+                self._broadcasts.open(run_id).subscribe() if record.finished_at is None else None
+            )
+        return (
+            _apply_trace_state_to_payload(summary, self._load_trace(trace_path)),
+            logs,
+            subscription,
+        )
+
+    def apply_stream_batch(
+        self, run_id: str, state: dict[str, Any], batch: BroadcastBatch
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Fold a broadcast batch into the stream state; returns ``(state, new_log_lines)``."""
+        new_lines: list[str] = []
+        for item in batch.frames:
+            if item.get("kind") == "log":
+                new_lines.extend(item.get("lines", []))
+            elif item.get("kind") == "state":
+                state = item["payload"]
+        if batch.dropped:
+            self._log.warning(
+                "remote_api_sse_subscriber_lagged", run_id=run_id, dropped=batch.dropped
+            )
+        return state, new_lines
+
     def stream_run_sse(self, run_id: str, wfile: Any) -> None:
         """Write Server-Sent Events for a run to wfile until the run finishes.
 
-        CRITICAL FIX 1: Uses ``asyncio.get_event_loop().run_in_executor`` to
-        avoid blocking the HTTP handler thread with ``time.sleep``.  The sleep
-        is offloaded to the default thread-pool executor so concurrent SSE
-        clients do not starve each other.
+        The first frame is the full run summary with every log line so far.
+        After that the client is subscribed to the run's broadcast: it blocks
+        until the capture thread publishes new log lines, a trace append or a
+        lifecycle transition publishes a new summary, so idle subscribers cost
+        neither the service lock nor a trace re-read.  ``event: done`` follows
+        only a terminal status; a stream cut short by the deadline or a closed
+        broadcast just ends, and the client reconnects.
         """
-        import json as _json
-
-        POLL_INTERVAL = 0.6
-        MAX_EVENTS = 3000  # ~50 min at 0.6 s poll interval
-        KEEPALIVE_INTERVAL = 30  # seconds between SSE keepalive comments
-        seen_log_lines = 0
-        last_event_time = time.monotonic()
-        for _ in range(MAX_EVENTS):
-            with self._lock:
-                record = self._runs.get(run_id)
-                if record is None:
-                    payload = None
-                else:
-                    self._refresh_record_locked(record)
-                    summary = self._summary_payload_locked(record)
-                    trace = self._load_trace(record.trace_path)
-                    new_logs = record.logs[seen_log_lines:]
-                    seen_log_lines = len(record.logs)
-                    payload = _apply_trace_state_to_payload(
-                        {
-                            **summary,
-                            "log_lines": len(record.logs),
-                            "new_log_lines": new_logs,
-                        },
-                        trace,
-                    )
-            if payload is None:
-                data = _json.dumps({"error": "not_found", "run_id": run_id})
-                try:
-                    wfile.write(f"data: {data}\n\n".encode())
-                    wfile.flush()
-                except OSError:
-                    return
-                return
-            data = _json.dumps(payload, ensure_ascii=False)
+        opened = self.open_run_stream(run_id)
+        if opened is None:
             try:
-                wfile.write(f"data: {data}\n\n".encode())
+                wfile.write(sse_not_found_frame(run_id))
                 wfile.flush()
             except OSError:
                 return
-            last_event_time = time.monotonic()
-            if payload.get("finished_at") is not None:
-                try:
-                    wfile.write(b"event: done\ndata: {}\n\n")
-                    wfile.flush()
-                except OSError:
-                    pass
-                return
-            # CRITICAL FIX 1: Non-blocking sleep — release the thread back to
-            # the pool while waiting so concurrent SSE clients are not starved.
-            _sleep_event = threading.Event()
-            _sleep_event.wait(timeout=POLL_INTERVAL)
-            # Send SSE keepalive comment if no event sent recently
-            now = time.monotonic()
-            if now - last_event_time > KEEPALIVE_INTERVAL:
+            return
+
+        state, new_lines, subscription = opened
+        log_count = len(new_lines)
+        deadline = time.monotonic() + _SSE_MAX_STREAM_SECS
+        try:
+            while True:
                 try:
-                    wfile.write(b": keepalive\n\n")
+                    wfile.write(sse_state_frame(state, log_count, new_lines))
                     wfile.flush()
-                    last_event_time = now
                 except OSError:
                     return
+                if sse_stream_done(state):
+                    try:
+                        wfile.write(SSE_DONE_FRAME)
+                        wfile.flush()
+                    except OSError:
+                        pass
+                    return
+                if subscription is None or time.monotonic() >= deadline:
+                    return
+
+                batch = subscription.read(timeout=_SSE_KEEPALIVE_SECS)
+                while not batch.frames and not batch.closed:
+                    if time.monotonic() >= deadline:
+                        return
+                    try:
+                        wfile.write(SSE_KEEPALIVE_FRAME)
+                        wfile.flush()
+                    except OSError:
+                        return
+                    batch = subscription.read(timeout=_SSE_KEEPALIVE_SECS)
+
+                state, new_lines = self.apply_stream_batch(run_id, state, batch)
+                log_count += len(new_lines)
+                if batch.closed:
+                    # Settled, suspended for approval, or the service shut down.
+                    subscription.close()
+                    subscription = None
+        finally:
+            if subscription is not None:
+                subscription.close()
 
     def _load_trace(self, trace_path: Path) -> dict[str, Any] | None:
-        if not trace_path.is_file():
+        if not trace_path.is_file() and not trace_journal_path(trace_path).is_file():
             return None
         try:
-            payload_raw = json.loads(trace_path.read_text(encoding="utf-8"))
+            payload_raw = load_trace_payload(trace_path)
         except OSError as exc:
             self._log.warning("remote_api_trace_read_failed", path=str(trace_path), error=str(exc))
             return None
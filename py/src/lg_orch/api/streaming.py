@@ -4,16 +4,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import json
 import queue
 import threading
 import time
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
 
 from lg_orch.logging import get_logger
+from lg_orch.trace import read_trace_journal, trace_journal_path
 
-if TYPE_CHECKING:
-    pass
+_DONE_FRAME = b'data: {"type":"done"}\n\n'
+_KEEPALIVE_FRAME = b": keepalive\n\n"
+_KEEPALIVE_INTERVAL = 30  # seconds between SSE keepalive comments
+_MAX_POLLS = 3000  # up to ~50 minutes at 1 s each
 
 # ---------------------------------------------------------------------------
 # SSE stream registry — one Queue per active /runs/{run_id}/stream client.
@@ -66,6 +74,42 @@ def _emit_tool_stdout_lines(event: dict[str, Any], wfile: Any) -> None:
             return
 
 
+def _write_trace_events(events: list[dict[str, Any]], wfile: Any) -> bool:
+    """Write trace events (plus their tool_stdout lines) as SSE frames.
+
+    Returns ``False`` when the client has disconnected.
+    """
+    for ev in events:
+        try:
+            data = json.dumps(ev, ensure_ascii=False)
+            wfile.write(f"data: {data}\n\n".encode())
+            _emit_tool_stdout_lines(ev, wfile)
+        except OSError:
+            return False
+    return True
+
+
+def _tail_trace_journal(journal_path: Path, offset: int, wfile: Any) -> int | None:
+    """Forward journal events appended since *offset*; return the new offset.
+
+    Returns ``None`` when the client has disconnected.  A missing or
+    unreadable journal leaves *offset* unchanged.
+    """
+    try:
+        chunk = read_trace_journal(journal_path, offset=offset)
+    except OSError:
+        return offset
+    if not chunk.events:
+        return chunk.offset
+    if not _write_trace_events(chunk.events, wfile):
+        return None
+    try:
+        wfile.flush()
+    except OSError:
+        return None
+    return chunk.offset
+
+
 def _send_final_output(run: dict[str, Any] | None, wfile: Any) -> None:
     """Send a ``final_output`` SSE event if the run has a ``trace.final`` value."""
     if run is None:
@@ -84,6 +128,41 @@ def _send_final_output(run: dict[str, Any] | None, wfile: Any) -> None:
         pass
 
 
+def _replay_run_trace(run: dict[str, Any], wfile: Any) -> tuple[Path, int | None] | None:
+    """Write the trace events recorded so far for *run* to *wfile*.
+
+    Returns ``(journal_path, journal_offset)`` where the offset is ``None``
+    when the run wrote a finished JSON trace instead of a live journal, or
+    ``None`` when the client disconnected.
+    """
+    trace_path = Path(str(run.get("trace_path", "")))
+    journal_path = trace_journal_path(trace_path)
+    journal_offset: int | None = None
+    trace_payload: dict[str, Any] | None = None
+    if trace_path.is_file():
+        try:
+            raw = json.loads(trace_path.read_text(encoding="utf-8"))
+            if isinstance(raw, dict):
+                trace_payload = raw
+        except (OSError, json.JSONDecodeError):
+            pass
+    else:
+        journal_offset = 0
+
+    existing_events: list[dict[str, Any]] = []
+    if trace_payload is not None:
+        events_raw = trace_payload.get("events", [])
+        existing_events = [e for e in events_raw if isinstance(e, dict)]
+
+    if not _write_trace_events(existing_events, wfile):
+        return None
+    if journal_offset is not None:
+        journal_offset = _tail_trace_journal(journal_path, journal_offset, wfile)
+        if journal_offset is None:
+            return None
+    return journal_path, journal_offset
+
+
 def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
     """Write new-format SSE events for a run to wfile.
 
@@ -92,13 +171,13 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
     * Replays existing trace events from the trace file first.
     * For completed runs: sends one *done* sentinel and returns.
     * For active runs: drains ``_run_streams[run_id]`` with 1-second timeout;
-      falls back to polling ``service.get_run()`` to detect completion.
+      on each timeout forwards events newly appended to the run's NDJSON
+      trace journal (reading only bytes past the last offset) and polls
+      ``service.get_run()`` to detect completion.
     * Sends ``data: {"type":"done"}\\n\\n`` as the terminal frame.
     * If *run_id* is unknown, sends ``data: {"error":"not_found"}\\n\\n`` and returns.
     * On client disconnect (``OSError`` on ``wfile.write``), cleans up and returns.
     """
-    from pathlib import Path
-
     log = get_logger()
     run = service.get_run(run_id)
     if run is None:
@@ -110,30 +189,10 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
             pass
         return
 
-    # Replay existing trace events from the trace file
-    trace_path = Path(str(run.get("trace_path", "")))
-    trace_payload: dict[str, Any] | None = None
-    if trace_path.is_file():
-        try:
-            raw = json.loads(trace_path.read_text(encoding="utf-8"))
-            if isinstance(raw, dict):
-                trace_payload = raw
-        except (OSError, json.JSONDecodeError):
-            pass
-
-    existing_events: list[dict[str, Any]] = []
-    if trace_payload is not None:
-        events_raw = trace_payload.get("events", [])
-        existing_events = [e for e in events_raw if isinstance(e, dict)]
-
-    for ev in existing_events:
-        try:
-            data = json.dumps(ev, ensure_ascii=False)
-            wfile.write(f"data: {data}\n\n".encode())
-            # Emit tool_stdout lines from tool_result events
-            _emit_tool_stdout_lines(ev, wfile)
-        except OSError:
-            return
+    replayed = _replay_run_trace(run, wfile)
+    if replayed is None:
+        return
+    journal_path, journal_offset = replayed
     try:
         wfile.flush()
     except OSError:
@@ -143,7 +202,7 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
     if run.get("finished_at") is not None:
         _send_final_output(run, wfile)
         try:
-            wfile.write(b'data: {"type":"done"}\n\n')
+            wfile.write(_DONE_FRAME)
             wfile.flush()
         except OSError:
             pass
@@ -153,18 +212,21 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
     q: queue.Queue[dict[str, Any] | None] = queue.Queue()
     with _run_streams_lock:
         _run_streams[run_id] = q
-    KEEPALIVE_INTERVAL = 30  # seconds between SSE keepalive comments
     last_event_time = time.monotonic()
     try:
-        for _ in range(3000):  # up to ~50 minutes at 1 s each
+        for _ in range(_MAX_POLLS):
             try:
                 event = q.get(timeout=1.0)
             except queue.Empty:
+                if journal_offset is not None:
+                    journal_offset = _tail_trace_journal(journal_path, journal_offset, wfile)
+                    if journal_offset is None:
+                        return
                 # Send keepalive comment to prevent proxy/CDN timeout
                 now = time.monotonic()
-                if now - last_event_time > KEEPALIVE_INTERVAL:
+                if now - last_event_time > _KEEPALIVE_INTERVAL:
                     try:
-                        wfile.write(b": keepalive\n\n")
+                        wfile.write(_KEEPALIVE_FRAME)
                         wfile.flush()
                         last_event_time = now
                     except OSError:
@@ -174,7 +236,7 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
                 if current is None or current.get("finished_at") is not None:
                     _send_final_output(current, wfile)
                     try:
-                        wfile.write(b'data: {"type":"done"}\n\n')
+                        wfile.write(_DONE_FRAME)
                         wfile.flush()
                     except OSError:
                         pass
@@ -185,7 +247,7 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
                 current = service.get_run(run_id)
                 _send_final_output(current, wfile)
                 try:
-                    wfile.write(b'data: {"type":"done"}\n\n')
+                    wfile.write(_DONE_FRAME)
                     wfile.flush()
                 except OSError:
                     pass
@@ -205,3 +267,127 @@ def stream_new_sse(service: Any, run_id: str, wfile: Any) -> None:
         with _run_streams_lock:
             _run_streams.pop(run_id, None)
         log.debug("spa_sse_stream_closed", run_id=run_id)
+
+
+# ---------------------------------------------------------------------------
+# asyncio variant — same protocol, no thread held while the client is idle
+# ---------------------------------------------------------------------------
+
+
+class _FrameBuffer:
+    """File-like sink that collects frames from the sync helpers for one async send."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _NotifyingQueue(queue.Queue[dict[str, Any] | None]):
+    """Run-stream queue that also calls *wake* on every put, from any thread."""
+
+    def __init__(self, wake: Callable[[], None]) -> None:
+        super().__init__()
+        self._wake = wake
+
+    def _put(self, item: dict[str, Any] | None) -> None:
+        super()._put(item)
+        self._wake()
+
+
+async def stream_new_sse_async(
+    service: Any,
+    run_id: str,
+    send: Callable[[bytes], Awaitable[bool]],
+    run_blocking: Callable[[Callable[[], Any]], Awaitable[Any]],
+) -> None:
+    """asyncio counterpart of :func:`stream_new_sse` with the same frame protocol.
+
+    *send* writes bytes to the client and returns ``False`` once it has
+    disconnected; *run_blocking* runs file and service reads off the event
+    loop.  Live events wake the coroutine directly from the publishing thread.
+    """
+    log = get_logger()
+    run = await run_blocking(lambda: service.get_run(run_id))
+    if run is None:
+        data = json.dumps({"error": "not_found", "run_id": run_id}, ensure_ascii=False)
+        await send(f"data: {data}\n\n".encode())
+        return
+
+    buf = _FrameBuffer()
+    replayed = await run_blocking(lambda: _replay_run_trace(run, buf))
+    if replayed is None or not await send(buf.take()):
+        return
+    journal_path, journal_offset = replayed
+
+    if run.get("finished_at") is not None:
+        _send_final_output(run, buf)
+        buf.write(_DONE_FRAME)
+        await send(buf.take())
+        return
+
+    loop = asyncio.get_running_loop()
+    woken = asyncio.Event()
+
+    def _wake() -> None:
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(woken.set)
+
+    q = _NotifyingQueue(_wake)
+    with _run_streams_lock:
+        _run_streams[run_id] = q
+    last_event_time = time.monotonic()
+    try:
+        for _ in range(_MAX_POLLS):
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(woken.wait(), 1.0)
+            woken.clear()
+            events: list[dict[str, Any] | None] = []
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    events.append(q.get_nowait())
+            if events:
+                for event in events:
+                    if event is None:
+                        current = await run_blocking(lambda: service.get_run(run_id))
+                        _send_final_output(current, buf)
+                        buf.write(_DONE_FRAME)
+                        await send(buf.take())
+                        return
+                    _write_trace_events([event], buf)
+                if not await send(buf.take()):
+                    return
+                last_event_time = time.monotonic()
+                continue
+            if journal_offset is not None:
+                journal_offset = await run_blocking(
+                    functools.partial(_tail_trace_journal, journal_path, journal_offset, buf)
+                )
+                if not await send(buf.take()):
+                    return
+            now = time.monotonic()
+            if now - last_event_time > _KEEPALIVE_INTERVAL:
+                if not await send(_KEEPALIVE_FRAME):
+                    return
+                last_event_time = now
+            current = await run_blocking(lambda: service.get_run(run_id))
+            if current is None or current.get("finished_at") is not None:
+                _send_final_output(current, buf)
+                buf.write(_DONE_FRAME)
+                await send(buf.take())
+                return
+    finally:
+        with _run_streams_lock:
+            if _run_streams.get(run_id) is q:
+                _run_streams.pop(run_id, None)
+        log.debug("spa_sse_stream_closed", run_id=run_id)
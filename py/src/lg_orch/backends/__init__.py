@@ -16,6 +16,7 @@ from lg_orch.backends._base import (
     resolve_checkpoint_db_path,
     stable_checkpoint_thread_id,
 )
+from lg_orch.backends.delta import DeltaCodec
 from lg_orch.backends.postgres import PostgresCheckpointSaver
 from lg_orch.backends.redis import RedisCheckpointSaver
 from lg_orch.backends.sqlite import SqliteCheckpointSaver
@@ -34,6 +35,8 @@ def create_checkpoint_saver(backend: str, **kwargs: object) -> BaseCheckpointSav
         - ``sqlite``: ``db_path: Path``
         - ``redis``: ``redis_url: str``, ``key_prefix: str``, ``ttl_seconds: int``
         - ``postgres``: ``dsn: str``, ``table_name: str``
+
+        Every backend also accepts ``delta_codec: DeltaCodec``.
     """
     if backend == "sqlite":
         return SqliteCheckpointSaver(**kwargs)  # type: ignore[arg-type]
@@ -49,6 +52,7 @@ def create_checkpoint_saver(backend: str, **kwargs: object) -> BaseCheckpointSav
 __all__ = [
     "BaseCheckpointSaver",
     "CheckpointBackendError",
+    "DeltaCodec",
     "PostgresCheckpointSaver",
     "RedisCheckpointSaver",
     "SqliteCheckpointSaver",
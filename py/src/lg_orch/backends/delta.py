@@ -0,0 +1,366 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Delta encoding of list- and dict-typed channel values, shared by all backends.
+
+Channels such as ``tool_results`` or ``_trace_events`` only grow between
+super-steps, and ``repo_context`` changes a few keys at a time, yet every
+checkpoint used to re-serialise them whole.  :class:`DeltaCodec` remembers
+the last value it wrote per thread, namespace and channel and, when the new
+value extends it, stores only the difference:
+
+- ``append``: a list whose prefix is the base value; the suffix is stored.
+- ``patch``: a dict; changed keys and removed keys are stored.
+- ``same``: the value is unchanged since *base* (Redis and Postgres, which
+  store every channel with every checkpoint).
+
+Each delta names the *ref* it applies to — the channel version in SQLite,
+the checkpoint id in Redis and Postgres — and is tagged ``delta:<type>`` so
+it never reaches ``serde.loads_typed`` as a plain value.  Every
+*snapshot_every*-th write of a channel is a full snapshot, bounding the
+chain a reader walks.
+Reading never needs a codec: :class:`ChannelResolver` follows the chain for
+whatever was stored.
+
+The codec remembers a value as soon as it encodes it, before the caller
+stores anything; savers wrap their write in :meth:`DeltaCodec.forget_on_error`
+(or use :func:`write_guard`) so a failed write does not leave later deltas
+pointing at a missing base.
+
+Deltas are computed against the value the codec last saw, compared by
+equality.  Items of a list or dict already checkpointed must not be mutated
+in place afterwards — LangGraph reducers never do — or the change is missed
+until the next snapshot.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from lg_orch.backends._base import CheckpointBackendError
+
+DELTA_TAG_PREFIX = "delta:"
+_DEFAULT_SNAPSHOT_EVERY = 16
+_DEFAULT_MAX_ENTRIES = 1024
+
+
+def is_delta(type_tag: str) -> bool:
+    return type_tag.startswith(DELTA_TAG_PREFIX)
+
+
+@dataclass(frozen=True)
+class ChannelDelta:
+    """A stored delta: :meth:`apply` it to the value at *base*."""
+
+    base: Any
+    op: str
+    items: list[Any] = field(default_factory=list)
+    updates: dict[Any, Any] = field(default_factory=dict)
+    removed: list[Any] = field(default_factory=list)
+
+    def apply(self, value: Any) -> Any:
+        if self.op == "same":
+            return value
+        if self.op == "append" and isinstance(value, list):
+            return [*value, *self.items]
+        if self.op == "patch" and isinstance(value, dict):
+            patched = dict(value)
+            patched.update(self.updates)
+            for key in self.removed:
+                patched.pop(key, None)
+            return patched
+        raise CheckpointBackendError(
+            f"cannot apply {self.op!r} delta to a {type(value).__name__} base"
+        )
+
+
+def load_delta(serde: Any, type_tag: str, payload: bytes) -> ChannelDelta:
+    if not is_delta(type_tag):
+        raise CheckpointBackendError(f"not a channel delta: {type_tag!r}")
+    record = serde.loads_typed((type_tag[len(DELTA_TAG_PREFIX) :], payload))
+    if not isinstance(record, dict) or "base" not in record:
+        raise CheckpointBackendError("malformed channel delta")
+    return ChannelDelta(
+        base=record["base"],
+        op=str(record.get("op", "")),
+        items=list(record.get("items") or ()),
+        updates=dict(record.get("set") or {}),
+        removed=list(record.get("del") or ()),
+    )
+
+
+class EncodedValue(NamedTuple):
+    type_tag: str
+    payload: bytes
+    # Ref of the value this one is a delta against; None for a snapshot.
+    base: Any
+    # Every ref the reader visits to rebuild the value, nearest first.
+    chain: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: Any
+    ref: Any
+    value: Any
+    depth: int
+    chain: tuple[Any, ...]
+
+
+def _precedes(base: Any, ref: Any) -> bool:
+    # Deltas only point backwards, so a chain cannot loop even if a fork
+    # later rewrites a version.
+    try:
+        return bool(base < ref)
+    except TypeError:
+        return False
+
+
+def _diff(base: Any, value: Any) -> dict[str, Any] | None:
+    if type(base) is list and type(value) is list:
+        n = len(base)
+        if len(value) < n or value[:n] != base:
+            return None
+        return {"op": "append", "items": value[n:]}
+    if type(base) is dict and type(value) is dict:
+        updates = {
+            k: v for k, v in value.items() if k not in base or not (base[k] is v or base[k] == v)
+        }
+        removed = [k for k in base if k not in value]
+        if len(updates) + len(removed) > len(value) // 2:
+            return None
+        return {"op": "patch", "set": updates, "del": removed}
+    return None
+
+
+def _shallow_copy(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else dict(value)
+
+
+class DeltaCodec:
+    """Encode list and dict channel values as deltas against the last write.
+
+    *channels* limits encoding to those channel names; by default every
+    list- or dict-valued channel qualifies.  One codec may serve several
+    savers; it keeps at most *max_entries* base values (one per thread,
+    namespace and channel), least recently written evicted first.
+    """
+
+    def __init__(
+        self,
+        *,
+        channels: Iterable[str] | None = None,
+        snapshot_every: int = _DEFAULT_SNAPSHOT_EVERY,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        self._channels = frozenset(channels) if channels is not None else None
+        self._snapshot_every = snapshot_every
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot_every(self) -> int:
+        return self._snapshot_every
+
+    def handles(self, channel: str, value: Any) -> bool:
+        return isinstance(value, (list, dict)) and (
+            self._channels is None or channel in self._channels
+        )
+
+    def encode(
+        self,
+        serde: Any,
+        *,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel: str,
+        version: Any,
+        ref: Any,
+        value: Any,
+        changed: bool = True,
+    ) -> EncodedValue:
+        """Serialise *value*, stored under *ref*, as a snapshot or a delta.
+
+        *changed* is False when the channel was not written since the last
+        checkpoint; if its *version* matches the remembered one the result
+        merely points at the ref that holds it.
+        """
+        key = (thread_id, checkpoint_ns, channel)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if (
+            entry is not None
+            and not changed
+            and entry.version == version
+            and entry.ref != ref
+            and len(entry.value) == len(value)
+        ):
+            return self._dump_delta(serde, {"op": "same"}, entry)
+
+        record: dict[str, Any] | None = None
+        if (
+            entry is not None
+            and entry.depth + 1 < self._snapshot_every
+            and _precedes(entry.ref, ref)
+        ):
+            record = _diff(entry.value, value)
+        if record is None:
+            type_tag, payload = serde.dumps_typed(value)
+            self._remember(key, _Entry(version, ref, _shallow_copy(value), 0, ()))
+            return EncodedValue(str(type_tag), bytes(payload), None, ())
+
+        assert entry is not None
+        encoded = self._dump_delta(serde, record, entry)
+        self._remember(
+            key, _Entry(version, ref, _shallow_copy(value), entry.depth + 1, encoded.chain)
+        )
+        return encoded
+
+    def forget(self, thread_ids: Iterable[str] | None = None) -> None:
+        """Drop remembered bases, for *thread_ids* or all, after their rows go away."""
+        with self._lock:
+            if thread_ids is None:
+                self._entries.clear()
+                return
+            doomed = set(thread_ids)
+            for key in [k for k in self._entries if k[0] in doomed]:
+                del self._entries[key]
+
+    @contextmanager
+    def forget_on_error(self, thread_id: str) -> Iterator[None]:
+        """Forget *thread_id*'s bases if the write in this block fails.
+
+        The bases remembered while encoding it were never stored, so the
+        thread's next write must be a snapshot.
+        """
+        try:
+            yield
+        except BaseException:
+            self.forget([thread_id])
+            raise
+
+    def _dump_delta(self, serde: Any, record: dict[str, Any], base: _Entry) -> EncodedValue:
+        type_tag, payload = serde.dumps_typed({"base": base.ref, **record})
+        return EncodedValue(
+            DELTA_TAG_PREFIX + str(type_tag), bytes(payload), base.ref, (base.ref, *base.chain)
+        )
+
+    def _remember(self, key: tuple[str, str, str], entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def write_guard(codec: DeltaCodec | None, thread_id: str) -> AbstractContextManager[None]:
+    """:meth:`DeltaCodec.forget_on_error` for an optional codec."""
+    return codec.forget_on_error(thread_id) if codec is not None else nullcontext()
+
+
+class ChannelResolver:
+    """Rebuild channel values from stored ``(type_tag, payload)`` pairs.
+
+    :meth:`feed` the pairs of one checkpoint, then, while :meth:`missing`
+    names a ``{channel: base_ref}``, feed the pairs stored at those refs —
+    or hand every base to :meth:`resolve` at once.  Finished values collect
+    in :attr:`values`.
+    """
+
+    def __init__(self, serde: Any) -> None:
+        self.values: dict[str, Any] = {}
+        self._serde = serde
+        self._chains: dict[str, list[ChannelDelta]] = {}
+        self._waiting: dict[str, Any] = {}
+
+    def missing(self) -> dict[str, Any]:
+        return dict(self._waiting)
+
+    def feed(self, found: Mapping[str, tuple[str, bytes]]) -> None:
+        waiting, self._waiting = self._waiting, {}
+        lost = [channel for channel in waiting if channel not in found]
+        if lost:
+            raise CheckpointBackendError(
+                f"delta base missing for channel {lost[0]!r} at {waiting[lost[0]]!r}"
+            )
+        for channel, (type_tag, payload) in found.items():
+            if is_delta(type_tag):
+                delta = load_delta(self._serde, type_tag, payload)
+                self._chains.setdefault(channel, []).append(delta)
+                self._waiting[channel] = delta.base
+                continue
+            if type_tag == "empty":
+                continue
+            value = self._serde.loads_typed((type_tag, payload))
+            for delta in reversed(self._chains.pop(channel, [])):
+                value = delta.apply(value)
+            self.values[channel] = value
+
+    def resolve(self, bases: Mapping[str, Mapping[str, tuple[str, bytes]]]) -> dict[str, Any]:
+        """Finish every chain from *bases*, the pairs stored per ref (as ``str``)."""
+        while missing := self.missing():
+            self.feed(
+                {
+                    channel: bases[str(ref)][channel]
+                    for channel, ref in missing.items()
+                    if channel in bases.get(str(ref), {})
+                }
+            )
+        return self.values
+
+
+# Redis and Postgres keep the encoded channels of a checkpoint in one field,
+# together with every ref their chains reach so a reader fetches them at once.
+
+
+class PackedChannels(NamedTuple):
+    entries: dict[str, tuple[str, bytes]]
+    bases: list[str]
+
+
+def pack_channels(
+    serde: Any, encoded: Mapping[str, tuple[str, bytes]], bases: Iterable[Any] = ()
+) -> bytes:
+    type_tag, payload = serde.dumps_typed(
+        {
+            "channels": {ch: [tag, data] for ch, (tag, data) in encoded.items()},
+            "bases": sorted({str(ref) for ref in bases}),
+        }
+    )
+    return str(type_tag).encode() + b"\0" + bytes(payload)
+
+
+def unpack_channels(serde: Any, raw: bytes) -> PackedChannels:
+    type_tag, _, payload = bytes(raw).partition(b"\0")
+    packed = serde.loads_typed((type_tag.decode(), payload))
+    if not isinstance(packed, dict) or not isinstance(packed.get("channels"), dict):
+        raise CheckpointBackendError("malformed packed channel values")
+    return PackedChannels(
+        entries={
+            str(ch): (str(entry[0]), bytes(entry[1])) for ch, entry in packed["channels"].items()
+        },
+        bases=[str(ref) for ref in packed.get("bases") or ()],
+    )
+
+
+__all__ = [
+    "DELTA_TAG_PREFIX",
+    "ChannelDelta",
+    "ChannelResolver",
+    "DeltaCodec",
+    "EncodedValue",
+    "PackedChannels",
+    "is_delta",
+    "load_delta",
+    "pack_channels",
+    "unpack_channels",
+    "write_guard",
+]
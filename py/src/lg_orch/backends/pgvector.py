@@ -11,7 +11,7 @@ from __future__ import annotations
 import json
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -21,6 +21,17 @@ _log = structlog.get_logger(__name__)
 
 EmbedderFn = Callable[[str], list[float]]
 
+# Build parameters accepted per index method, with pgvector's defaults.
+_INDEX_DEFAULTS: dict[str, dict[str, int]] = {
+    "hnsw": {"m": 16, "ef_construction": 64},
+    "ivfflat": {"lists": 100},
+}
+# Session setting that trades recall for latency at query time.
+_SEARCH_SETTING: dict[str, str] = {
+    "hnsw": "hnsw.ef_search",
+    "ivfflat": "ivfflat.probes",
+}
+
 
 @dataclass
 class PgMemoryRecord:
@@ -50,6 +61,16 @@ class PgVectorMemoryStore:
         Dimensionality of the embedding vectors (default: 128).
     table_name:
         Name of the table to store memories in (default: ``semantic_memories``).
+    index_type:
+        ``"hnsw"`` or ``"ivfflat"`` to create (if missing) an approximate
+        cosine index on the embedding column; ``None`` (default) leaves the
+        table unindexed so every search is an exact scan.
+    index_params:
+        Build parameters for the index: ``m`` and ``ef_construction`` for
+        HNSW, ``lists`` for IVFFlat.  Unset keys use pgvector's defaults.
+    search_breadth:
+        Per-session ``hnsw.ef_search`` or ``ivfflat.probes``; higher values
+        raise recall at the cost of latency.  ``None`` keeps the server value.
     """
 
     def __init__(
@@ -58,19 +79,37 @@ class PgVectorMemoryStore:
         embedder: EmbedderFn,
         embedding_dim: int = 128,
         table_name: str = "semantic_memories",
+        index_type: str | None = None,
+        index_params: Mapping[str, int] | None = None,
+        search_breadth: int | None = None,
     ) -> None:
+        if index_type is not None and index_type not in _INDEX_DEFAULTS:
+            raise ValueError(f"index_type must be 'hnsw' or 'ivfflat', got {index_type!r}")
+        build_params: dict[str, int] = {}
+        if index_type is not None:
+            build_params = dict(_INDEX_DEFAULTS[index_type])
+            for key, value in (index_params or {}).items():
+                if key not in build_params:
+                    raise ValueError(f"unknown {index_type} index parameter: {key!r}")
+                build_params[key] = int(value)
+        elif index_params or search_breadth is not None:
+            raise ValueError("index_params and search_breadth require index_type")
+
         import psycopg  # type: ignore[import-not-found]
 
         self._dsn = dsn
         self._embedder = embedder
         self._embedding_dim = embedding_dim
         self._table_name = table_name
+        self._index_type = index_type
+        self._index_params = build_params
+        self._search_breadth = search_breadth
         self._lock = threading.Lock()
         self._conn = psycopg.connect(dsn, autocommit=True)
         self._ensure_schema()
 
     def _ensure_schema(self) -> None:
-        """Create the pgvector extension and table if they don't exist."""
+        """Create the pgvector extension, table and configured index if missing."""
         with self._lock, self._conn.cursor() as cur:
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
             cur.execute(
@@ -84,6 +123,18 @@ class PgVectorMemoryStore:
                     )
                     """
             )
+            if self._index_type is None:
+                return
+            with_clause = ", ".join(f"{k} = {v}" for k, v in self._index_params.items())
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table_name}_embedding_{self._index_type}_idx "
+                f"ON {self._table_name} USING {self._index_type} "
+                f"(embedding vector_cosine_ops) WITH ({with_clause})"
+            )
+            if self._search_breadth is not None:
+                cur.execute(
+                    f"SET {_SEARCH_SETTING[self._index_type]} = {int(self._search_breadth)}"
+                )
 
     def store_semantic(
         self,
@@ -121,7 +172,9 @@ class PgVectorMemoryStore:
         """Vector similarity search using pgvector's cosine distance operator.
 
         Returns up to *top_k* records ordered by ascending cosine distance
-        (i.e. most similar first).
+        (i.e. most similar first).  With an ``index_type`` configured the
+        planner can answer from the approximate index, so results may omit
+        some true neighbours (see ``search_breadth``).
         """
         top_k = max(1, top_k)
         query_vec = self._embedder(query_text)
@@ -22,6 +22,13 @@ from langgraph.checkpoint.base import (
 )
 
 from lg_orch.backends._base import BaseCheckpointSaver, parse_config
+from lg_orch.backends.delta import (
+    ChannelResolver,
+    DeltaCodec,
+    pack_channels,
+    unpack_channels,
+    write_guard,
+)
 
 _TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,62}$")
 
@@ -45,11 +52,17 @@ CREATE TABLE IF NOT EXISTS lula_checkpoints (
     metadata_type         TEXT NOT NULL DEFAULT '',
     metadata_blob         BYTEA,
     pending_writes        JSONB,
+    channel_values        BYTEA,
     created_at            TIMESTAMPTZ DEFAULT now(),
     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
 );
 """
 
+# Tables created before delta encoding lack the packed channel column.
+_POSTGRES_ADD_CHANNEL_VALUES = """
+ALTER TABLE lula_checkpoints ADD COLUMN IF NOT EXISTS channel_values BYTEA;
+"""
+
 _POSTGRES_CREATE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_lula_ckpt_thread
     ON lula_checkpoints(thread_id, checkpoint_ns, created_at DESC);
@@ -63,6 +76,13 @@ def _dict_row_factory(cursor: Any) -> Any:
     return dict_row(cursor)
 
 
+def _as_row_dict(cols: list[str], row: Any) -> dict[str, Any]:
+    # Pooled connections may already carry the dict row factory.
+    if isinstance(row, dict):
+        return row
+    return dict(zip(cols, row, strict=False))
+
+
 class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
     """Async checkpoint saver backed by PostgreSQL (psycopg v3).
 
@@ -75,12 +95,16 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
 
     The connection pool is created lazily on first use. Call ``aclose()`` to
     shut down the pool gracefully.
+
+    With a *delta_codec*, list and dict channels go to the ``channel_values``
+    column as deltas against the checkpoint that last wrote them.
     """
 
     def __init__(
         self,
         dsn: str,
         table_name: str = "lula_checkpoints",
+        delta_codec: DeltaCodec | None = None,
     ) -> None:
         try:
             import psycopg_pool  # type: ignore[import-not-found]  # noqa: F401
@@ -95,6 +119,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
         self._table_name = _validate_table_name(table_name)
         self._pool: Any = None
         self._initialized = False
+        self._delta_codec = delta_codec
 
     async def _get_pool(self) -> Any:
         if self._pool is None:
@@ -115,11 +140,15 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
         # Use table_name safely — it is a fixed string from the constructor,
         # never user-supplied data at runtime.
         create_table = _POSTGRES_CREATE_TABLE.replace("lula_checkpoints", self._table_name)
+        add_channel_values = _POSTGRES_ADD_CHANNEL_VALUES.replace(
+            "lula_checkpoints", self._table_name
+        )
         create_index = _POSTGRES_CREATE_INDEX.replace("lula_checkpoints", self._table_name).replace(
             "idx_lula_ckpt_thread", f"idx_{self._table_name}_thread"
         )
         async with pool.connection() as conn:
             await conn.execute(create_table)
+            await conn.execute(add_channel_values)
             await conn.execute(create_index)
             await conn.commit()
         self._initialized = True
@@ -139,6 +168,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
         row: Any,
         *,
         requested_config: RunnableConfig | None,
+        channel_values: dict[str, Any] | None = None,
     ) -> CheckpointTuple:
         thread_id = str(row["thread_id"])
         checkpoint_ns = str(row["checkpoint_ns"])
@@ -157,6 +187,11 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
             Checkpoint,
             self._load_typed(type_tag=checkpoint_type, payload=checkpoint_payload),
         )
+        if channel_values:
+            checkpoint = {
+                **checkpoint,
+                "channel_values": {**checkpoint.get("channel_values", {}), **channel_values},
+            }
 
         metadata_type = str(row["metadata_type"])
         metadata_blob_raw = row["metadata_blob"]
@@ -226,6 +261,31 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
             pending_writes=pending_writes,
         )
 
+    async def _resolve_channels(self, conn: Any, row: dict[str, Any]) -> dict[str, Any]:
+        """Rebuild the packed channel values of *row*, following delta bases."""
+        raw = row.get("channel_values")
+        if not raw:
+            return {}
+        packed = unpack_channels(self.serde, bytes(raw))
+        bases: dict[str, dict[str, tuple[str, bytes]]] = {}
+        if packed.bases:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"SELECT checkpoint_id, channel_values FROM {self._table_name}"
+                    f" WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = ANY(%s)",
+                    (row["thread_id"], row["checkpoint_ns"], packed.bases),
+                )
+                cols = [desc[0] for desc in cur.description or []]
+                for base_row in await cur.fetchall():
+                    base = _as_row_dict(cols, base_row)
+                    if base["channel_values"]:
+                        bases[str(base["checkpoint_id"])] = unpack_channels(
+                            self.serde, bytes(base["channel_values"])
+                        ).entries
+        resolver = ChannelResolver(self.serde)
+        resolver.feed(packed.entries)
+        return resolver.resolve(bases)
+
     # ------------------------------------------------------------------
     # Sync stubs
     # ------------------------------------------------------------------
@@ -306,8 +366,12 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
                 if row_tuple is None:
                     return None
                 cols = [desc[0] for desc in cur.description or []]
-                row = dict(zip(cols, row_tuple, strict=False))
-            return self._row_to_tuple(row, requested_config=requested_config)
+                row = _as_row_dict(cols, row_tuple)
+            return self._row_to_tuple(
+                row,
+                requested_config=requested_config,
+                channel_values=await self._resolve_channels(conn, row),
+            )
 
     async def alist(
         self,
@@ -344,12 +408,17 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
             f"{where_extra} ORDER BY created_at DESC{limit_clause}"
         )
 
-        async with pool.connection() as conn, conn.cursor() as cur:
-            await cur.execute(query, params)
-            cols = [desc[0] for desc in cur.description or []]
-            async for row_tuple in cur:
-                row = dict(zip(cols, row_tuple, strict=False))
-                tup = self._row_to_tuple(row, requested_config=None)
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, params)
+                cols = [desc[0] for desc in cur.description or []]
+                rows = [_as_row_dict(cols, row_tuple) for row_tuple in await cur.fetchall()]
+            for row in rows:
+                tup = self._row_to_tuple(
+                    row,
+                    requested_config=None,
+                    channel_values=await self._resolve_channels(conn, row),
+                )
                 if filter is not None and any(tup.metadata.get(k) != v for k, v in filter.items()):
                     continue
                 yield tup
@@ -365,41 +434,72 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
         thread_id, checkpoint_ns, parent_checkpoint_id = self._parse_config(config)
         checkpoint_id = str(checkpoint["id"])
 
+        packed_values: bytes | None = None
+        codec = self._delta_codec
+        if codec is not None:
+            values = dict(checkpoint.get("channel_values", {}))
+            versions = checkpoint.get("channel_versions", {})
+            encoded: dict[str, tuple[str, bytes]] = {}
+            base_ids: set[Any] = set()
+            for channel, value in list(values.items()):
+                if not codec.handles(channel, value):
+                    continue
+                enc = codec.encode(
+                    self.serde,
+                    thread_id=thread_id,
+                    checkpoint_ns=checkpoint_ns,
+                    channel=channel,
+                    version=versions.get(channel),
+                    ref=checkpoint_id,
+                    value=value,
+                    changed=channel in new_versions,
+                )
+                encoded[channel] = (enc.type_tag, enc.payload)
+                base_ids.update(enc.chain)
+                del values[channel]
+            if encoded:
+                packed_values = pack_channels(self.serde, encoded, base_ids)
+                checkpoint = {**checkpoint, "channel_values": values}
+
         checkpoint_type, checkpoint_blob = self._dump_typed(checkpoint)
         metadata_type, metadata_blob = self._dump_typed(get_checkpoint_metadata(config, metadata))
 
         pool = await self._get_pool()
         tbl = self._table_name
         # HIGH FIX 1: Use psycopg3 %s placeholders instead of asyncpg $N
-        async with pool.connection() as conn:
-            await conn.execute(
-                f"""
-                INSERT INTO {tbl}
-                    (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,
-                     checkpoint, checkpoint_type, metadata_type, metadata_blob, pending_writes)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id) DO UPDATE SET
-                    parent_checkpoint_id = EXCLUDED.parent_checkpoint_id,
-                    checkpoint           = EXCLUDED.checkpoint,
-                    checkpoint_type      = EXCLUDED.checkpoint_type,
-                    metadata_type        = EXCLUDED.metadata_type,
-                    metadata_blob        = EXCLUDED.metadata_blob,
-                    pending_writes       = EXCLUDED.pending_writes,
-                    created_at           = now()
-                """,
-                (
-                    thread_id,
-                    checkpoint_ns,
-                    checkpoint_id,
-                    parent_checkpoint_id or None,
-                    checkpoint_blob,
-                    checkpoint_type,
-                    metadata_type,
-                    metadata_blob,
-                    json.dumps([]),
-                ),
-            )
-            await conn.commit()
+        with write_guard(self._delta_codec, thread_id):
+            async with pool.connection() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO {tbl}
+                        (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,
+                         checkpoint, checkpoint_type, metadata_type, metadata_blob, pending_writes,
+                         channel_values)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id) DO UPDATE SET
+                        parent_checkpoint_id = EXCLUDED.parent_checkpoint_id,
+                        checkpoint           = EXCLUDED.checkpoint,
+                        checkpoint_type      = EXCLUDED.checkpoint_type,
+                        metadata_type        = EXCLUDED.metadata_type,
+                        metadata_blob        = EXCLUDED.metadata_blob,
+                        pending_writes       = EXCLUDED.pending_writes,
+                        channel_values       = EXCLUDED.channel_values,
+                        created_at           = now()
+                    """,
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        parent_checkpoint_id or None,
+                        checkpoint_blob,
+                        checkpoint_type,
+                        metadata_type,
+                        metadata_blob,
+                        json.dumps([]),
+                        packed_values,
+                    ),
+                )
+                await conn.commit()
 
         return {
             "configurable": {
@@ -479,6 +579,8 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[Any]):
         async with pool.connection() as conn:
             await conn.execute(f"DELETE FROM {tbl} WHERE thread_id = %s", (thread_id,))
             await conn.commit()
+        if self._delta_codec is not None:
+            self._delta_codec.forget([thread_id])
 
     async def aclose(self) -> None:
         if self._pool is not None:
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import json
 import time
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from typing import Any, cast
 
 from langchain_core.runnables.config import RunnableConfig
@@ -21,6 +21,17 @@ from langgraph.checkpoint.base import (
 )
 
 from lg_orch.backends._base import BaseCheckpointSaver, CheckpointBackendError, parse_config
+from lg_orch.backends.delta import (
+    ChannelResolver,
+    DeltaCodec,
+    PackedChannels,
+    pack_channels,
+    unpack_channels,
+    write_guard,
+)
+
+# Upper bound on delta bases whose last TTL refresh is remembered.
+_MAX_TRACKED_BASES = 10_000
 
 
 def _try_import_msgpack() -> Any:
@@ -62,6 +73,10 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
     Sync interface methods (``get_tuple``, ``list``, ``put``, ``put_writes``)
     raise ``NotImplementedError``; use the async variants (``aget_tuple``,
     ``alist``, ``aput``, ``aput_writes``) with an async LangGraph runtime.
+
+    With a *delta_codec*, list and dict channels are stored as deltas
+    against the checkpoint that last wrote them.  Checkpoints that deltas
+    are built on get their TTL extended so they outlive their dependents.
     """
 
     # Timeout (seconds) for socket connect and per-command operations.
@@ -76,6 +91,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
         ttl_seconds: int = 86400,
         socket_connect_timeout: float | None = None,
         socket_timeout: float | None = None,
+        delta_codec: DeltaCodec | None = None,
     ) -> None:
         try:
             import redis
@@ -89,6 +105,9 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
         self._redis_url = redis_url
         self._key_prefix = key_prefix
         self._ttl_seconds = ttl_seconds
+        self._delta_codec = delta_codec
+        # Delta base key -> monotonic time its TTL was last extended.
+        self._base_refreshed: dict[str, float] = {}
 
         _conn_timeout = (
             socket_connect_timeout
@@ -167,6 +186,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
                 checkpoint_ns=checkpoint_ns,
                 checkpoint_id=checkpoint_id,
                 requested_config=requested_config,
+                channel_values=self._resolve_channels_sync(thread_id, checkpoint_ns, data),
             )
         except CheckpointBackendError:
             raise
@@ -222,6 +242,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
                     checkpoint_ns=checkpoint_ns,
                     checkpoint_id=ckpt_id,
                     requested_config=None,
+                    channel_values=self._resolve_channels_sync(thread_id, checkpoint_ns, data),
                 )
                 if filter is not None and any(tup.metadata.get(k) != v for k, v in filter.items()):
                     continue
@@ -241,26 +262,19 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
     ) -> RunnableConfig:
         thread_id, checkpoint_ns, parent_checkpoint_id = self._parse_config(config)
         checkpoint_id = str(checkpoint["id"])
-
-        checkpoint_type, checkpoint_blob = self._dump_typed(checkpoint)
-        metadata_type, metadata_blob = self._dump_typed(get_checkpoint_metadata(config, metadata))
-
-        data: dict[str, Any] = {
-            "checkpoint_type": checkpoint_type,
-            "checkpoint_blob": checkpoint_blob,
-            "metadata_type": metadata_type,
-            "metadata_blob": metadata_blob,
-            "parent_checkpoint_id": parent_checkpoint_id or "",
-            "pending_writes": [],
-        }
+        data, base_ids = self._checkpoint_data(
+            config, checkpoint, metadata, new_versions, parent_checkpoint_id
+        )
 
         ckpt_key = self._ckpt_key(thread_id, checkpoint_ns, checkpoint_id)
         idx_key = self._idx_key(thread_id, checkpoint_ns)
+        base_keys = self._bases_to_refresh(thread_id, checkpoint_ns, base_ids)
         score = time.time()
 
-        self._sync_client.set(ckpt_key, _serialize(data))
-        self._sync_client.zadd(idx_key, {checkpoint_id: score})
-        self._expire_keys_sync(ckpt_key, idx_key)
+        with write_guard(self._delta_codec, thread_id):
+            self._sync_client.set(ckpt_key, _serialize(data))
+            self._sync_client.zadd(idx_key, {checkpoint_id: score})
+            self._expire_keys_sync(ckpt_key, idx_key, bases=base_keys)
 
         return {
             "configurable": {
@@ -312,8 +326,94 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
 
         data["pending_writes"] = existing_writes
         self._sync_client.set(ckpt_key, _serialize(data))
+        self._base_refreshed.pop(ckpt_key, None)
         self._expire_keys_sync(ckpt_key)
 
+    # ------------------------------------------------------------------
+    # Delta-encoded channel values
+    # ------------------------------------------------------------------
+
+    def _checkpoint_data(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+        parent_checkpoint_id: str | None,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Build the stored record and the checkpoint ids its deltas depend on."""
+        thread_id, checkpoint_ns, _ = self._parse_config(config)
+        checkpoint_id = str(checkpoint["id"])
+        codec = self._delta_codec
+        encoded: dict[str, tuple[str, bytes]] = {}
+        base_ids: set[str] = set()
+        if codec is not None:
+            values = dict(checkpoint.get("channel_values", {}))
+            versions = checkpoint.get("channel_versions", {})
+            for channel, value in list(values.items()):
+                if not codec.handles(channel, value):
+                    continue
+                enc = codec.encode(
+                    self.serde,
+                    thread_id=thread_id,
+                    checkpoint_ns=checkpoint_ns,
+                    channel=channel,
+                    version=versions.get(channel),
+                    ref=checkpoint_id,
+                    value=value,
+                    changed=channel in new_versions,
+                )
+                encoded[channel] = (enc.type_tag, enc.payload)
+                base_ids.update(enc.chain)
+                del values[channel]
+            checkpoint = {**checkpoint, "channel_values": values}
+
+        checkpoint_type, checkpoint_blob = self._dump_typed(checkpoint)
+        metadata_type, metadata_blob = self._dump_typed(get_checkpoint_metadata(config, metadata))
+        data: dict[str, Any] = {
+            "checkpoint_type": checkpoint_type,
+            "checkpoint_blob": checkpoint_blob,
+            "metadata_type": metadata_type,
+            "metadata_blob": metadata_blob,
+            "parent_checkpoint_id": parent_checkpoint_id or "",
+            "pending_writes": [],
+        }
+        if encoded:
+            data["channel_values"] = pack_channels(self.serde, encoded, base_ids)
+        return data, base_ids
+
+    def _packed_channels(self, data: dict[str, Any]) -> PackedChannels | None:
+        packed = data.get("channel_values")
+        return unpack_channels(self.serde, packed) if packed else None
+
+    def _resolve_packed(self, packed: PackedChannels, raws: Sequence[Any]) -> dict[str, Any]:
+        bases: dict[str, dict[str, tuple[str, bytes]]] = {}
+        for ref, raw in zip(packed.bases, raws, strict=True):
+            base = self._packed_channels(_deserialize(cast(bytes, raw))) if raw else None
+            if base is not None:
+                bases[ref] = base.entries
+        resolver = ChannelResolver(self.serde)
+        resolver.feed(packed.entries)
+        return resolver.resolve(bases)
+
+    def _resolve_channels_sync(
+        self, thread_id: str, checkpoint_ns: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        packed = self._packed_channels(data)
+        if packed is None:
+            return {}
+        keys = [self._ckpt_key(thread_id, checkpoint_ns, ref) for ref in packed.bases]
+        return self._resolve_packed(packed, self._sync_client.mget(keys) if keys else [])
+
+    async def _resolve_channels(
+        self, thread_id: str, checkpoint_ns: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        packed = self._packed_channels(data)
+        if packed is None:
+            return {}
+        keys = [self._ckpt_key(thread_id, checkpoint_ns, ref) for ref in packed.bases]
+        return self._resolve_packed(packed, await self._client.mget(keys) if keys else [])
+
     # ------------------------------------------------------------------
     # Async implementation
     # ------------------------------------------------------------------
@@ -325,13 +425,41 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
     def _load_typed(self, *, type_tag: str, payload: bytes) -> Any:
         return self.serde.loads_typed((type_tag, payload))
 
-    def _expire_keys_sync(self, *keys: str) -> None:
+    def _expire_keys_sync(self, *keys: str, bases: Sequence[str] = ()) -> None:
+        pipe = self._sync_client.pipeline(transaction=False)
         for key in keys:
-            self._sync_client.expire(key, self._ttl_seconds)
+            pipe.expire(key, self._ttl_seconds)
+        for key in bases:
+            pipe.expire(key, 2 * self._ttl_seconds)
+        pipe.execute()
 
-    async def _expire_keys(self, *keys: str) -> None:
+    async def _expire_keys(self, *keys: str, bases: Sequence[str] = ()) -> None:
+        pipe = self._client.pipeline(transaction=False)
         for key in keys:
-            await self._client.expire(key, self._ttl_seconds)
+            pipe.expire(key, self._ttl_seconds)
+        for key in bases:
+            pipe.expire(key, 2 * self._ttl_seconds)
+        await pipe.execute()
+
+    def _bases_to_refresh(
+        self, thread_id: str, checkpoint_ns: str, base_ids: Iterable[str]
+    ) -> Sequence[str]:
+        """Keys of delta bases whose TTL is due for extending.
+
+        Bases get twice the TTL, so refreshing each at most once per TTL
+        keeps it alive past every checkpoint written on top of it meanwhile.
+        """
+        now = time.monotonic()
+        due: list[str] = []
+        for ref in base_ids:
+            key = self._ckpt_key(thread_id, checkpoint_ns, ref)
+            if now - self._base_refreshed.get(key, float("-inf")) >= self._ttl_seconds:
+                self._base_refreshed[key] = now
+                due.append(key)
+        if len(self._base_refreshed) > _MAX_TRACKED_BASES:
+            cutoff = now - self._ttl_seconds
+            self._base_refreshed = {k: t for k, t in self._base_refreshed.items() if t > cutoff}
+        return due
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         try:
@@ -360,6 +488,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
                 checkpoint_ns=checkpoint_ns,
                 checkpoint_id=checkpoint_id,
                 requested_config=requested_config,
+                channel_values=await self._resolve_channels(thread_id, checkpoint_ns, data),
             )
         except CheckpointBackendError:
             raise
@@ -374,6 +503,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
         checkpoint_ns: str,
         checkpoint_id: str,
         requested_config: RunnableConfig | None,
+        channel_values: dict[str, Any] | None = None,
     ) -> CheckpointTuple:
         checkpoint_type = str(data["checkpoint_type"])
         checkpoint_blob = data["checkpoint_blob"]
@@ -384,6 +514,11 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
             Checkpoint,
             self._load_typed(type_tag=checkpoint_type, payload=checkpoint_payload),
         )
+        if channel_values:
+            checkpoint = {
+                **checkpoint,
+                "channel_values": {**checkpoint.get("channel_values", {}), **channel_values},
+            }
 
         metadata_type = str(data["metadata_type"])
         metadata_blob = data["metadata_blob"]
@@ -492,6 +627,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
                     checkpoint_ns=checkpoint_ns,
                     checkpoint_id=ckpt_id,
                     requested_config=None,
+                    channel_values=await self._resolve_channels(thread_id, checkpoint_ns, data),
                 )
                 if filter is not None and any(tup.metadata.get(k) != v for k, v in filter.items()):
                     continue
@@ -511,26 +647,19 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
     ) -> RunnableConfig:
         thread_id, checkpoint_ns, parent_checkpoint_id = self._parse_config(config)
         checkpoint_id = str(checkpoint["id"])
-
-        checkpoint_type, checkpoint_blob = self._dump_typed(checkpoint)
-        metadata_type, metadata_blob = self._dump_typed(get_checkpoint_metadata(config, metadata))
-
-        data: dict[str, Any] = {
-            "checkpoint_type": checkpoint_type,
-            "checkpoint_blob": checkpoint_blob,
-            "metadata_type": metadata_type,
-            "metadata_blob": metadata_blob,
-            "parent_checkpoint_id": parent_checkpoint_id or "",
-            "pending_writes": [],
-        }
+        data, base_ids = self._checkpoint_data(
+            config, checkpoint, metadata, new_versions, parent_checkpoint_id
+        )
 
         ckpt_key = self._ckpt_key(thread_id, checkpoint_ns, checkpoint_id)
         idx_key = self._idx_key(thread_id, checkpoint_ns)
+        base_keys = self._bases_to_refresh(thread_id, checkpoint_ns, base_ids)
         score = time.time()
 
-        await self._client.set(ckpt_key, _serialize(data))
-        await self._client.zadd(idx_key, {checkpoint_id: score})
-        await self._expire_keys(ckpt_key, idx_key)
+        with write_guard(self._delta_codec, thread_id):
+            await self._client.set(ckpt_key, _serialize(data))
+            await self._client.zadd(idx_key, {checkpoint_id: score})
+            await self._expire_keys(ckpt_key, idx_key, bases=base_keys)
 
         return {
             "configurable": {
@@ -582,6 +711,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
 
         data["pending_writes"] = existing_writes
         await self._client.set(ckpt_key, _serialize(data))
+        self._base_refreshed.pop(ckpt_key, None)
         await self._expire_keys(ckpt_key)
 
     async def adelete_thread(self, thread_id: str) -> None:
@@ -594,6 +724,8 @@ class RedisCheckpointSaver(BaseCheckpointSaver[Any]):
                 await self._client.delete(*keys)
             if cursor == 0:
                 break
+        if self._delta_codec is not None:
+            self._delta_codec.forget([thread_id])
 
     async def aclose(self) -> None:
         await self._client.aclose()
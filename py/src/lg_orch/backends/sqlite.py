@@ -5,8 +5,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import sqlite3
-from collections.abc import AsyncIterator, Iterator, Sequence
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, cast
 
@@ -22,28 +25,106 @@ from langgraph.checkpoint.base import (
 )
 
 from lg_orch.backends._base import BaseCheckpointSaver, parse_config
+from lg_orch.backends.delta import ChannelResolver, DeltaCodec, write_guard
+
+# Channel payloads at least this large are stored once per content hash in
+# ``blob_store``; smaller ones stay inline in ``checkpoint_blobs``.
+_DEDUP_MIN_BYTES = 1024
+# (channel, version) pairs per IN (VALUES ...) lookup; two bound parameters
+# each keeps the statement under SQLite's historical 999-variable limit.
+_CHANNEL_LOOKUP_CHUNK = 400
+
+
+def _blob_hash(type_tag: str, payload: bytes) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(type_tag.encode())
+    digest.update(b"\0")
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+def _as_bytes(raw: Any) -> bytes:
+    return raw if isinstance(raw, bytes) else bytes(raw)
 
 
 class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
-    def __init__(self, *, db_path: Path) -> None:
+    """LangGraph checkpointer backed by a single SQLite file in WAL mode.
+
+    Each thread keeps one connection for the saver's lifetime
+    (``reuse_connections=False`` opens one per call instead).  Channel
+    values of at least *dedup_min_bytes* are content-addressed, so a large
+    ``repo_context`` that is re-serialised unchanged at every step is stored
+    once.  :meth:`compact` trims old checkpoints per thread.
+
+    With a *delta_codec*, list and dict channels that merely grew are
+    stored as a delta against their previous version (see
+    :mod:`lg_orch.backends.delta`).
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        reuse_connections: bool = True,
+        dedup_min_bytes: int = _DEDUP_MIN_BYTES,
+        delta_codec: DeltaCodec | None = None,
+    ) -> None:
         super().__init__()
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._reuse_connections = reuse_connections
+        self._dedup_min_bytes = max(1, dedup_min_bytes)
+        self._delta_codec = delta_codec
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._initialize_schema()
 
     @property
     def db_path(self) -> Path:
         return self._db_path
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, timeout=30.0)
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close() may run on another thread;
+        # a reused connection is otherwise only touched by its own thread.
+        conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA synchronous=NORMAL;")
         return conn
 
+    def _connect(self) -> sqlite3.Connection:
+        if not self._reuse_connections:
+            return self._open()
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection inside a transaction; per-call ones are closed after."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            if not self._reuse_connections:
+                conn.close()
+
+    def close(self) -> None:
+        """Close every connection this saver opened; later calls reconnect."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
     def _initialize_schema(self) -> None:
-        with self._connect() as conn:
+        with self._connection() as conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS checkpoints (
@@ -82,10 +163,31 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
 
+                CREATE TABLE IF NOT EXISTS blob_store (
+                    blob_hash TEXT PRIMARY KEY,
+                    type_tag TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                );
+
                 CREATE INDEX IF NOT EXISTS idx_checkpoints_lookup
                     ON checkpoints(thread_id, checkpoint_ns, checkpoint_id DESC);
                 """
             )
+            columns = {
+                str(row["name"])
+                for row in conn.execute("PRAGMA table_info(checkpoint_blobs)").fetchall()
+            }
+            if "blob_hash" not in columns:
+                # Rows written before content addressing keep their payload
+                # inline and a NULL hash.
+                conn.execute("ALTER TABLE checkpoint_blobs ADD COLUMN blob_hash TEXT")
+            if "delta_base" not in columns:
+                # Version of the same channel a delta row applies to.
+                conn.execute("ALTER TABLE checkpoint_blobs ADD COLUMN delta_base TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_checkpoint_blobs_hash"
+                " ON checkpoint_blobs(blob_hash) WHERE blob_hash IS NOT NULL"
+            )
 
     def _dump_typed(self, value: Any) -> tuple[str, bytes]:
         type_tag, payload = self.serde.dumps_typed(value)
@@ -106,25 +208,69 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
         checkpoint_ns: str,
         channel_versions: ChannelVersions,
     ) -> dict[str, Any]:
-        values: dict[str, Any] = {}
-        for channel, version in channel_versions.items():
-            row = conn.execute(
-                """
-                SELECT type_tag, payload
-                FROM checkpoint_blobs
-                WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?
+        stored = self._fetch_channel_payloads(
+            conn=conn,
+            thread_id=thread_id,
+            checkpoint_ns=checkpoint_ns,
+            channel_versions=channel_versions,
+        )
+        resolver = ChannelResolver(self.serde)
+        pending: dict[str, Any] = dict(channel_versions)
+        while pending:
+            resolver.feed(
+                {
+                    channel: stored[(channel, str(version))]
+                    for channel, version in pending.items()
+                    if (channel, str(version)) in stored
+                }
+            )
+            pending = resolver.missing()
+        return resolver.values
+
+    def _fetch_channel_payloads(
+        self,
+        *,
+        conn: sqlite3.Connection,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel_versions: ChannelVersions,
+    ) -> dict[tuple[str, str], tuple[str, bytes]]:
+        """Stored ``(type_tag, payload)`` per ``(channel, version)``, delta bases included."""
+        found: dict[tuple[str, str], tuple[str, bytes]] = {}
+        pairs = list(channel_versions.items())
+        for start in range(0, len(pairs), _CHANNEL_LOOKUP_CHUNK):
+            chunk = pairs[start : start + _CHANNEL_LOOKUP_CHUNK]
+            params: list[Any] = []
+            for channel, version in chunk:
+                params.extend((channel, version))
+            params.extend((thread_id, checkpoint_ns, thread_id, checkpoint_ns))
+            rows = conn.execute(
+                f"""
+                WITH RECURSIVE wanted(channel, version) AS (
+                    VALUES {", ".join(["(?, ?)"] * len(chunk))}
+                    UNION
+                    SELECT cb.channel, cb.delta_base
+                    FROM checkpoint_blobs AS cb
+                    JOIN wanted AS w ON cb.channel = w.channel AND cb.version = w.version
+                    WHERE cb.thread_id = ? AND cb.checkpoint_ns = ?
+                      AND cb.delta_base IS NOT NULL
+                )
+                SELECT cb.channel, cb.version, cb.type_tag, cb.payload,
+                       bs.type_tag AS stored_type, bs.payload AS stored_payload
+                FROM checkpoint_blobs AS cb
+                LEFT JOIN blob_store AS bs ON bs.blob_hash = cb.blob_hash
+                WHERE cb.thread_id = ? AND cb.checkpoint_ns = ?
+                  AND (cb.channel, cb.version) IN (SELECT channel, version FROM wanted)
                 """,
-                (thread_id, checkpoint_ns, channel, version),
-            ).fetchone()
-            if row is None:
-                continue
-            type_tag = str(row["type_tag"])
-            if type_tag == "empty":
-                continue
-            raw_payload = row["payload"]
-            payload = bytes(raw_payload) if not isinstance(raw_payload, bytes) else raw_payload
-            values[channel] = self._load_typed(type_tag=type_tag, payload=payload)
-        return values
+                params,
+            ).fetchall()
+            for row in rows:
+                key = (str(row["channel"]), str(row["version"]))
+                if row["stored_payload"] is not None:
+                    found[key] = (str(row["stored_type"]), _as_bytes(row["stored_payload"]))
+                else:
+                    found[key] = (str(row["type_tag"]), _as_bytes(row["payload"]))
+        return found
 
     def _load_pending_writes(
         self,
@@ -248,7 +394,7 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
         requested_config: RunnableConfig | None = config if checkpoint_id is not None else None
-        with self._connect() as conn:
+        with self._connection() as conn:
             if checkpoint_id is not None:
                 row = conn.execute(
                     """
@@ -342,7 +488,7 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
             {limit_sql}
         """
 
-        with self._connect() as conn:
+        with self._connection() as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
             for row in rows:
                 tuple_value = self._row_to_checkpoint_tuple(
@@ -377,19 +523,73 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
         metadata_type, metadata_blob = self._dump_typed(get_checkpoint_metadata(config, metadata))
         checkpoint_id = str(checkpoint["id"])
 
-        with self._connect() as conn:
-            for channel, version in new_versions.items():
-                if channel in values:
-                    type_tag, payload = self._dump_typed(values[channel])
+        # Serialise everything before taking the write lock.
+        blob_rows: list[tuple[Any, ...]] = []
+        stored_rows: list[tuple[str, str, bytes]] = []
+        codec = self._delta_codec
+        for channel, version in new_versions.items():
+            blob_hash: str | None = None
+            delta_base: str | None = None
+            if channel in values:
+                value = values[channel]
+                if codec is not None and codec.handles(channel, value):
+                    encoded = codec.encode(
+                        self.serde,
+                        thread_id=thread_id,
+                        checkpoint_ns=checkpoint_ns,
+                        channel=channel,
+                        version=version,
+                        ref=version,
+                        value=value,
+                    )
+                    type_tag, payload = encoded.type_tag, encoded.payload
+                    if encoded.base is not None:
+                        delta_base = str(encoded.base)
                 else:
-                    type_tag, payload = "empty", b""
-                conn.execute(
+                    type_tag, payload = self._dump_typed(value)
+                if len(payload) >= self._dedup_min_bytes:
+                    blob_hash = _blob_hash(type_tag, payload)
+                    stored_rows.append((blob_hash, type_tag, payload))
+                    payload = b""
+            else:
+                type_tag, payload = "empty", b""
+            blob_rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    channel,
+                    version,
+                    type_tag,
+                    payload,
+                    blob_hash,
+                    delta_base,
+                )
+            )
+
+        with write_guard(self._delta_codec, thread_id), self._connection() as conn:
+            if stored_rows:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO blob_store (blob_hash, type_tag, payload)"
+                    " VALUES (?, ?, ?)",
+                    stored_rows,
+                )
+            if blob_rows:
+                conn.executemany(
                     """
-                    INSERT OR REPLACE INTO checkpoint_blobs
-                    (thread_id, checkpoint_ns, channel, version, type_tag, payload)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (thread_id, checkpoint_ns, channel, version, type_tag, payload),
+                        INSERT OR REPLACE INTO checkpoint_blobs
+                        (
+                            thread_id,
+                            checkpoint_ns,
+                            channel,
+                            version,
+                            type_tag,
+                            payload,
+                            blob_hash,
+                            delta_base
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                    blob_rows,
                 )
 
             conn.execute(
@@ -438,60 +638,238 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
         if checkpoint_id is None:
             raise ValueError("missing configurable.checkpoint_id")
 
-        with self._connect() as conn:
-            for idx, (channel, value) in enumerate(writes):
-                write_idx = WRITES_IDX_MAP.get(channel, idx)
-                if write_idx >= 0:
-                    existing = conn.execute(
-                        """
-                        SELECT 1
-                        FROM checkpoint_writes
-                        WHERE thread_id = ?
-                          AND checkpoint_ns = ?
-                          AND checkpoint_id = ?
-                          AND task_id = ?
-                          AND idx = ?
-                        """,
-                        (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx),
-                    ).fetchone()
-                    if existing is not None:
-                        continue
-
-                type_tag, payload = self._dump_typed(value)
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO checkpoint_writes
-                    (
-                        thread_id,
-                        checkpoint_ns,
-                        checkpoint_id,
-                        task_id,
-                        idx,
-                        channel,
-                        type_tag,
-                        payload,
-                        task_path
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        thread_id,
-                        checkpoint_ns,
-                        checkpoint_id,
-                        task_id,
-                        write_idx,
-                        channel,
-                        type_tag,
-                        payload,
-                        task_path,
-                    ),
+        # Regular writes (idx >= 0) keep the first value stored for their
+        # slot; special writes such as errors and interrupts overwrite it.
+        keep_rows: list[tuple[Any, ...]] = []
+        replace_rows: list[tuple[Any, ...]] = []
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            type_tag, payload = self._dump_typed(value)
+            row = (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                write_idx,
+                channel,
+                type_tag,
+                payload,
+                task_path,
+            )
+            (keep_rows if write_idx >= 0 else replace_rows).append(row)
+
+        columns = """
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                idx,
+                channel,
+                type_tag,
+                payload,
+                task_path
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        with self._connection() as conn:
+            if keep_rows:
+                conn.executemany(f"INSERT OR IGNORE INTO checkpoint_writes {columns}", keep_rows)
+            if replace_rows:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO checkpoint_writes {columns}", replace_rows
                 )
 
     def delete_thread(self, thread_id: str) -> None:
-        with self._connect() as conn:
+        with self._connection() as conn:
+            hashes = self._thread_blob_hashes(conn, thread_id)
             conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
             conn.execute("DELETE FROM checkpoint_blobs WHERE thread_id = ?", (thread_id,))
             conn.execute("DELETE FROM checkpoint_writes WHERE thread_id = ?", (thread_id,))
+            self._delete_unreferenced_blobs(conn, hashes)
+        if self._delta_codec is not None:
+            self._delta_codec.forget([thread_id])
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def prune(
+        self,
+        thread_ids: Sequence[str],
+        *,
+        strategy: str = "keep_latest",
+        keep_last: int = 1,
+    ) -> None:
+        """Prune *thread_ids*: ``"keep_latest"`` keeps the newest *keep_last*
+        checkpoints per namespace (see :meth:`compact`), ``"delete"`` drops
+        the threads entirely.
+        """
+        if strategy == "delete":
+            for thread_id in thread_ids:
+                self.delete_thread(thread_id)
+        elif strategy == "keep_latest":
+            self.compact(keep_last=keep_last, thread_ids=thread_ids)
+        else:
+            raise ValueError(f"unknown prune strategy: {strategy!r}")
+
+    def compact(
+        self,
+        *,
+        keep_last: int,
+        thread_ids: Sequence[str] | None = None,
+        vacuum: bool = False,
+    ) -> dict[str, int]:
+        """Keep only the newest *keep_last* checkpoints of each thread and namespace.
+
+        Deletes older checkpoints with their pending writes, the channel
+        values no kept checkpoint refers to (directly or as a delta base),
+        and content-addressed blobs nothing refers to any more.  Covers
+        every thread unless *thread_ids* is given.  *vacuum* then rewrites
+        the file to return the space to the OS.
+
+        Returns counts of deleted rows per kind.
+        """
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        counts = {"checkpoints": 0, "writes": 0, "channel_values": 0, "blobs": 0}
+        with self._connection() as conn:
+            # Take the write lock up front so no checkpoint lands between
+            # reading the kept set and deleting what it does not reference.
+            conn.execute("BEGIN IMMEDIATE")
+            query = "SELECT DISTINCT thread_id, checkpoint_ns FROM checkpoints"
+            params: tuple[str, ...] = ()
+            if thread_ids is not None:
+                params = tuple(thread_ids)
+                query += f" WHERE thread_id IN ({', '.join(['?'] * len(params)) or 'NULL'})"
+            scopes = conn.execute(query, params).fetchall()
+            hashes: set[str] = set()
+            for scope in scopes:
+                self._prune_scope(
+                    conn,
+                    str(scope["thread_id"]),
+                    str(scope["checkpoint_ns"]),
+                    keep_last=keep_last,
+                    counts=counts,
+                    hashes=hashes,
+                )
+            counts["blobs"] = self._delete_unreferenced_blobs(conn, hashes)
+        if self._delta_codec is not None:
+            self._delta_codec.forget(thread_ids)
+        if vacuum:
+            with self._connection() as conn:
+                conn.execute("VACUUM")
+        return counts
+
+    def _prune_scope(
+        self,
+        conn: sqlite3.Connection,
+        thread_id: str,
+        checkpoint_ns: str,
+        *,
+        keep_last: int,
+        counts: dict[str, int],
+        hashes: set[str],
+    ) -> None:
+        rows = conn.execute(
+            """
+            SELECT checkpoint_id, checkpoint_type, checkpoint_blob
+            FROM checkpoints
+            WHERE thread_id = ? AND checkpoint_ns = ?
+            ORDER BY checkpoint_id DESC
+            """,
+            (thread_id, checkpoint_ns),
+        ).fetchall()
+        doomed = [(thread_id, checkpoint_ns, str(row["checkpoint_id"])) for row in rows[keep_last:]]
+        if not doomed:
+            return
+
+        referenced: set[tuple[str, str]] = set()
+        for row in rows[:keep_last]:
+            checkpoint = self._load_typed(
+                type_tag=str(row["checkpoint_type"]), payload=_as_bytes(row["checkpoint_blob"])
+            )
+            versions = (
+                checkpoint.get("channel_versions", {}) if isinstance(checkpoint, dict) else {}
+            )
+            if isinstance(versions, dict):
+                referenced.update((str(ch), str(v)) for ch, v in versions.items())
+
+        before = conn.total_changes
+        conn.executemany(
+            "DELETE FROM checkpoints"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            doomed,
+        )
+        counts["checkpoints"] += conn.total_changes - before
+        before = conn.total_changes
+        conn.executemany(
+            "DELETE FROM checkpoint_writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            doomed,
+        )
+        counts["writes"] += conn.total_changes - before
+
+        rows = conn.execute(
+            """
+            SELECT channel, version, blob_hash, delta_base
+            FROM checkpoint_blobs
+            WHERE thread_id = ? AND checkpoint_ns = ?
+            """,
+            (thread_id, checkpoint_ns),
+        ).fetchall()
+        # Delta rows keep the versions they are built on alive.
+        bases = {
+            (str(row["channel"]), str(row["version"])): (str(row["channel"]), row["delta_base"])
+            for row in rows
+            if row["delta_base"] is not None
+        }
+        frontier = list(referenced)
+        while frontier:
+            base = bases.get(frontier.pop())
+            if base is not None and base not in referenced:
+                referenced.add(base)
+                frontier.append(base)
+
+        stale: list[tuple[str, str, str, str]] = []
+        for row in rows:
+            channel, version = str(row["channel"]), str(row["version"])
+            if (channel, version) in referenced:
+                continue
+            stale.append((thread_id, checkpoint_ns, channel, version))
+            if row["blob_hash"] is not None:
+                hashes.add(str(row["blob_hash"]))
+        before = conn.total_changes
+        conn.executemany(
+            "DELETE FROM checkpoint_blobs"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+            stale,
+        )
+        counts["channel_values"] += conn.total_changes - before
+
+    @staticmethod
+    def _thread_blob_hashes(conn: sqlite3.Connection, thread_id: str) -> set[str]:
+        return {
+            str(row["blob_hash"])
+            for row in conn.execute(
+                "SELECT DISTINCT blob_hash FROM checkpoint_blobs"
+                " WHERE thread_id = ? AND blob_hash IS NOT NULL",
+                (thread_id,),
+            ).fetchall()
+        }
+
+    @staticmethod
+    def _delete_unreferenced_blobs(conn: sqlite3.Connection, hashes: Iterable[str]) -> int:
+        before = conn.total_changes
+        conn.executemany(
+            """
+            DELETE FROM blob_store
+            WHERE blob_hash = ?
+              AND NOT EXISTS (SELECT 1 FROM checkpoint_blobs WHERE blob_hash = ?)
+            """,
+            [(h, h) for h in hashes],
+        )
+        return conn.total_changes - before
 
     # Offloaded to thread to avoid blocking the asyncio event loop.
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
@@ -535,5 +913,14 @@ class SqliteCheckpointSaver(BaseCheckpointSaver[Any]):
     async def adelete_thread(self, thread_id: str) -> None:
         await asyncio.to_thread(self.delete_thread, thread_id)
 
+    async def aprune(
+        self,
+        thread_ids: Sequence[str],
+        *,
+        strategy: str = "keep_latest",
+        keep_last: int = 1,
+    ) -> None:
+        await asyncio.to_thread(self.prune, thread_ids, strategy=strategy, keep_last=keep_last)
+
 
 __all__ = ["SqliteCheckpointSaver"]
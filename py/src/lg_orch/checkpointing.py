@@ -7,6 +7,7 @@ from __future__ import annotations
 from lg_orch.backends import (
     BaseCheckpointSaver,
     CheckpointBackendError,
+    DeltaCodec,
     PostgresCheckpointSaver,
     RedisCheckpointSaver,
     SqliteCheckpointSaver,
@@ -19,6 +20,7 @@ from lg_orch.backends import (
 __all__ = [
     "BaseCheckpointSaver",
     "CheckpointBackendError",
+    "DeltaCodec",
     "PostgresCheckpointSaver",
     "RedisCheckpointSaver",
     "SqliteCheckpointSaver",
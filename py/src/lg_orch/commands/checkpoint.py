@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""checkpoint_prune_command — retention for the SQLite checkpoint store."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from lg_orch.logging import get_logger
+
+
+def checkpoint_prune_command(args: Any, *, repo_root: Path) -> int:
+    """Keep the newest ``--keep-last`` checkpoints per thread and print the counts.
+
+    Parameters
+    ----------
+    args:
+        Parsed argparse namespace from the ``checkpoint-prune`` subcommand.
+        Expected attributes: ``db_path`` (str, optional — defaults to the
+        configured ``[checkpoint].db_path``), ``keep_last`` (int),
+        ``thread_id`` (list of str, optional) and ``vacuum`` (bool).
+    repo_root:
+        Resolved repository root, used to load config and resolve paths.
+    """
+    log = get_logger()
+    keep_last = int(getattr(args, "keep_last", 0) or 0)
+    if keep_last < 1:
+        log.error("checkpoint_prune_keep_last_invalid", keep_last=keep_last)
+        return 2
+
+    from lg_orch.checkpointing import SqliteCheckpointSaver, resolve_checkpoint_db_path
+
+    db_path_raw = getattr(args, "db_path", None)
+    if not db_path_raw:
+        from lg_orch.config import load_config
+
+        try:
+            cfg = load_config(repo_root=repo_root)
+        except Exception as exc:
+            log.error("config_load_failed", error=str(exc), repo_root=str(repo_root))
+            return 2
+        if cfg.checkpoint.backend not in ("", "sqlite"):
+            log.error("checkpoint_prune_backend_unsupported", backend=cfg.checkpoint.backend)
+            return 2
+        db_path_raw = cfg.checkpoint.db_path
+    db_path = resolve_checkpoint_db_path(repo_root=repo_root, db_path=str(db_path_raw))
+    if not db_path.is_file():
+        log.error("checkpoint_prune_db_missing", db_path=str(db_path))
+        return 2
+
+    thread_ids = getattr(args, "thread_id", None) or None
+    saver = SqliteCheckpointSaver(db_path=db_path)
+    try:
+        counts = saver.compact(
+            keep_last=keep_last,
+            thread_ids=thread_ids,
+            vacuum=bool(getattr(args, "vacuum", False)),
+        )
+    finally:
+        saver.close()
+    log.info("checkpoint_prune_done", db_path=str(db_path), **counts)
+    sys.stdout.write(json.dumps({"db_path": str(db_path), "deleted": counts}) + "\n")
+    return 0
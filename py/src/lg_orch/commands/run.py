@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import sys
 import uuid
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, cast
 
@@ -18,6 +19,7 @@ from langchain_core.runnables.config import RunnableConfig
 
 from lg_orch.backends.redis import RedisCheckpointSaver
 from lg_orch.checkpointing import (
+    DeltaCodec,
     create_checkpoint_saver,
     resolve_checkpoint_db_path,
     stable_checkpoint_thread_id,
@@ -26,11 +28,23 @@ from lg_orch.config import AppConfig
 from lg_orch.console import console
 from lg_orch.graph import build_graph
 from lg_orch.logging import get_logger
-from lg_orch.trace import write_run_trace
+from lg_orch.trace import (
+    TRACE_APPEND_MARKER,
+    TraceJournal,
+    trace_journal_path,
+    write_run_trace,
+)
 from lg_orch.visualize import render_run_header, render_trace_dashboard
 
 
-def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
+def run_command(
+    args: Any,
+    *,
+    cfg: AppConfig,
+    repo_root: Path,
+    env: Mapping[str, str] | None = None,
+    graph: Any | None = None,
+) -> int:
     """Execute the main orchestration graph for a single request.
 
     Parameters
@@ -41,11 +55,18 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
         Already-loaded :class:`~lg_orch.config.AppConfig`.
     repo_root:
         Resolved repository root path.
+    env:
+        Environment to read the per-run ``LG_*`` variables from; defaults to
+        ``os.environ``.
+    graph:
+        A graph from :func:`~lg_orch.graph.build_graph` without a checkpointer
+        to reuse instead of compiling one; the checkpointer goes on a copy.
     """
     import contextlib
     import os
 
     log = get_logger()
+    environ = os.environ if env is None else env
 
     from lg_orch.main import _validated_run_id  # thin helper stays in main
 
@@ -63,7 +84,7 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
     # HIGH FIX 5: Read approvals from temp file (LG_RESUME_APPROVALS_FILE)
     # instead of environment variable to avoid leaking secrets via /proc.
     # Falls back to LG_RESUME_APPROVALS_JSON for backward compatibility.
-    resume_approvals_file = str(os.environ.get("LG_RESUME_APPROVALS_FILE", "")).strip()
+    resume_approvals_file = str(environ.get("LG_RESUME_APPROVALS_FILE", "")).strip()
     resume_approvals_raw = ""
     if resume_approvals_file:
         try:
@@ -75,7 +96,7 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
             with contextlib.suppress(OSError):
                 os.unlink(resume_approvals_file)
     if not resume_approvals_raw:
-        resume_approvals_raw = str(os.environ.get("LG_RESUME_APPROVALS_JSON", "")).strip()
+        resume_approvals_raw = str(environ.get("LG_RESUME_APPROVALS_JSON", "")).strip()
     if resume_approvals_raw:
         try:
             parsed_resume_approvals = json.loads(resume_approvals_raw)
@@ -86,7 +107,7 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
                 resume_approvals = parsed_resume_approvals
 
     approval_context: dict[str, Any] | None = None
-    approval_context_raw = str(os.environ.get("LG_APPROVAL_CONTEXT_JSON", "")).strip()
+    approval_context_raw = str(environ.get("LG_APPROVAL_CONTEXT_JSON", "")).strip()
     if approval_context_raw:
         try:
             parsed_approval_context = json.loads(approval_context_raw)
@@ -96,9 +117,9 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
             if isinstance(parsed_approval_context, dict):
                 approval_context = parsed_approval_context
 
-    request_id = str(os.environ.get("LG_REQUEST_ID", "")).strip()
-    remote_api_auth_subject = str(os.environ.get("LG_REMOTE_API_AUTH_SUBJECT", "")).strip()
-    remote_api_client_ip = str(os.environ.get("LG_REMOTE_API_CLIENT_IP", "")).strip()
+    request_id = str(environ.get("LG_REQUEST_ID", "")).strip()
+    remote_api_auth_subject = str(environ.get("LG_REMOTE_API_AUTH_SUBJECT", "")).strip()
+    remote_api_client_ip = str(environ.get("LG_REMOTE_API_CLIENT_IP", "")).strip()
 
     checkpointer = None
     checkpoint_runtime: dict[str, str | bool] = {
@@ -113,12 +134,16 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
     if cfg.checkpoint.enabled:
         db_path = resolve_checkpoint_db_path(repo_root=repo_root, db_path=cfg.checkpoint.db_path)
         _backend = cfg.checkpoint.backend
+        _delta: dict[str, Any] = {}
+        if cfg.checkpoint.delta_snapshot_every > 0:
+            _delta["delta_codec"] = DeltaCodec(snapshot_every=cfg.checkpoint.delta_snapshot_every)
         if _backend == "redis":
             try:
                 _redis_saver = create_checkpoint_saver(
                     "redis",
                     redis_url=cfg.checkpoint.redis_url,
                     ttl_seconds=cfg.checkpoint.redis_ttl_seconds,
+                    **_delta,
                 )
                 # Verify connectivity before committing to Redis backend.
                 # The socket_connect_timeout (default 5s) on the client
@@ -132,14 +157,15 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
                     error=str(exc),
                     fallback="sqlite",
                 )
-                checkpointer = create_checkpoint_saver("sqlite", db_path=db_path)
+                checkpointer = create_checkpoint_saver("sqlite", db_path=db_path, **_delta)
         elif _backend == "postgres":
             checkpointer = create_checkpoint_saver(
                 "postgres",
                 dsn=cfg.checkpoint.postgres_dsn,
+                **_delta,
             )
         else:
-            checkpointer = create_checkpoint_saver("sqlite", db_path=db_path)
+            checkpointer = create_checkpoint_saver("sqlite", db_path=db_path, **_delta)
         thread_id = stable_checkpoint_thread_id(
             request=str(args.request),
             thread_prefix=cfg.checkpoint.thread_prefix,
@@ -183,7 +209,12 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
                         checkpoint_runtime["resume_checkpoint_id"] = latest_checkpoint_id.strip()
         run_config = {"configurable": configurable}
 
-    app = build_graph(checkpointer=checkpointer)
+    if graph is None:
+        app = build_graph(checkpointer=checkpointer)
+    elif checkpointer is not None:
+        app = graph.copy(update={"checkpointer": checkpointer})
+    else:
+        app = graph
     run_id = provided_run_id or uuid.uuid4().hex
     state: dict[str, Any] = {
         "request": str(args.request),
@@ -279,12 +310,36 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
     if run_config is not None:
         stream_kwargs["config"] = run_config
 
+    # Journal traces are appended after every node so the API and trace viewer
+    # can tail ``run-<id>.ndjson`` while the run is still in progress.
+    trace_journal: TraceJournal | None = None
+    trace_as_journal = trace_enabled and cfg.trace.format == "journal"
+    if trace_as_journal:
+        out_dir_abs = (repo_root / str(state["_trace_out_dir"])).resolve()
+        try:
+            trace_journal = TraceJournal(
+                trace_journal_path(out_dir_abs / f"run-{run_id}.json"), run_id=run_id
+            )
+        except OSError as exc:
+            log.warning("trace_journal_open_failed", error=str(exc))
+
+    trace_notify = bool(getattr(args, "trace_notify", False))
     stream_step = 0
     for event in app.stream(state, **stream_kwargs):
         for node_name, node_state in event.items():
             stream_step += 1
+            if trace_journal is not None and "_trace_events" in node_state:
+                try:
+                    appended = trace_journal.append_events(node_state["_trace_events"])
+                except OSError as exc:
+                    log.warning("trace_journal_append_failed", error=str(exc))
+                    trace_journal = None
+                else:
+                    if appended and trace_notify:
+                        sys.stdout.write(TRACE_APPEND_MARKER + "\n")
+                        sys.stdout.flush()
             if view == "console":
-                event_count = len(list(node_state.get("_trace_events", [])))
+                event_count = len(node_state.get("_trace_events", []))
                 tool_count = len(list(node_state.get("tool_results", [])))
                 console.print(
                     f"[lula.muted]\\[{stream_step:02d}][/] "
@@ -361,6 +416,7 @@ def run_command(args: Any, *, cfg: AppConfig, repo_root: Path) -> int:
                 repo_root=repo_root,
                 out_dir=Path(str(out.get("_trace_out_dir", "artifacts/runs"))),
                 state=out,
+                journal=trace_as_journal,
             )
             log.info("trace_written", path=str(trace_path))
 
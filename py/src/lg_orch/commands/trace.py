@@ -14,6 +14,7 @@ from typing import Any
 
 from lg_orch.graph import export_mermaid
 from lg_orch.logging import get_logger
+from lg_orch.trace import export_trace_json, iter_trace_files, load_trace_payload
 from lg_orch.visualize import (
     render_trace_dashboard,
     render_trace_dashboard_html,
@@ -24,7 +25,7 @@ from lg_orch.visualize import (
 def _trace_payload_from_path(trace_path: Path, *, warn_context: str) -> dict[str, Any] | None:
     log = get_logger()
     try:
-        payload_raw = json.loads(trace_path.read_text(encoding="utf-8"))
+        payload_raw = load_trace_payload(trace_path)
     except OSError as exc:
         log.warning(f"{warn_context}_read_failed", path=str(trace_path), error=str(exc))
         return None
@@ -62,7 +63,7 @@ def _trace_run_summary(
 
 
 def trace_view_command(args: Any) -> int:
-    """Render a single trace JSON file as console dashboard or HTML.
+    """Render a single trace (JSON or NDJSON journal) as console dashboard or HTML.
 
     Parameters
     ----------
@@ -72,7 +73,7 @@ def trace_view_command(args: Any) -> int:
     log = get_logger()
     trace_path = Path(str(args.trace_path))
     try:
-        payload_raw = json.loads(trace_path.read_text(encoding="utf-8"))
+        payload_raw = load_trace_payload(trace_path)
     except OSError as exc:
         log.error("trace_read_failed", path=str(trace_path), error=str(exc))
         return 2
@@ -131,13 +132,13 @@ def trace_site_command(args: Any) -> int:
         log.error("trace_site_dir_create_failed", path=str(output_dir), error=str(exc))
         return 2
 
-    for trace_path in sorted(trace_dir.glob("run-*.json"), reverse=True):
+    for trace_path in iter_trace_files(trace_dir):
         payload_raw = _trace_payload_from_path(trace_path, warn_context="trace_site")
         if payload_raw is None:
             continue
 
         dashboard_name = f"{trace_path.stem}.html"
-        trace_href = f"traces/{trace_path.name}"
+        trace_href = f"traces/{trace_path.stem}.json"
 
         try:
             dashboard_html = render_trace_dashboard_html(
@@ -147,7 +148,7 @@ def trace_site_command(args: Any) -> int:
                 trace_json_href=trace_href,
             )
             (output_dir / dashboard_name).write_text(dashboard_html, encoding="utf-8")
-            (trace_copy_dir / trace_path.name).write_text(
+            (trace_copy_dir / f"{trace_path.stem}.json").write_text(
                 json.dumps(payload_raw, ensure_ascii=False, indent=2),
                 encoding="utf-8",
             )
@@ -179,6 +180,27 @@ def trace_site_command(args: Any) -> int:
     return 0
 
 
+def trace_export_command(args: Any) -> int:
+    """Export an NDJSON trace journal as the monolithic ``run-<id>.json`` format.
+
+    Parameters
+    ----------
+    args:
+        Parsed argparse namespace from the ``trace-export`` subcommand.
+    """
+    log = get_logger()
+    journal_path = Path(str(args.journal_path))
+    output_raw = getattr(args, "output", None)
+    output_path = Path(str(output_raw)) if output_raw else journal_path.with_suffix(".json")
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        export_trace_json(journal_path, output_path)
+    except OSError as exc:
+        log.error("trace_export_failed", path=str(journal_path), error=str(exc))
+        return 2
+    return 0
+
+
 def trace_serve_command(args: Any) -> int:
     """Serve trace files over HTTP for browser-based inspection.
 
@@ -279,6 +279,7 @@ class Trace:
     enabled: bool
     output_dir: str
     capture_model_metadata: bool = True
+    format: str = "json"
 
 
 @dataclass(frozen=True)
@@ -294,6 +295,13 @@ class RemoteAPIConfig:
     default_namespace: str = ""
     jwt_secret: str | None = None  # reads JWT_SECRET env
     jwks_url: str | None = None  # reads JWKS_URL env
+    server_mode: str = "threaded"  # "threaded" | "asyncio"
+    max_connections: int = 256
+    max_sse_subscribers: int = 128
+    worker_threads: int = 16
+    run_pool_size: int = 0  # 0 = one subprocess per run
+    run_pool_max_runs: int = 50
+    run_pool_max_rss_mb: int = 2048
 
 
 @dataclass(frozen=True)
@@ -306,6 +314,8 @@ class Checkpoint:
     redis_url: str = "redis://localhost:6379/0"
     postgres_dsn: str = ""
     redis_ttl_seconds: int = 86400
+    # Full snapshot every N delta-encoded channel writes; 0 disables deltas.
+    delta_snapshot_every: int = 0
 
 
 @dataclass(frozen=True)
@@ -560,8 +570,10 @@ def _parse_openai_compatible_serverless(
     return OpenAICompatibleServerless(base_url=base_url, api_key=api_key, timeout_s=timeout_raw)
 
 
-def load_config(*, repo_root: Path) -> AppConfig:
-    profile = os.environ.get("LG_PROFILE", "dev").strip() or "dev"
+def load_config(*, repo_root: Path, profile: str | None = None) -> AppConfig:
+    if profile is None:
+        profile = os.environ.get("LG_PROFILE", "dev")
+    profile = profile.strip() or "dev"
     cfg_path = repo_root / "configs" / f"runtime.{profile}.toml"
     try:
         raw = tomllib.loads(cfg_path.read_text(encoding="utf-8"))
@@ -747,10 +759,14 @@ def load_config(*, repo_root: Path) -> AppConfig:
 
     mcp = MCPConfig(enabled=mcp_enabled_raw, servers=servers)
 
+    trace_format = str(trace_raw.get("format", "json")).strip().lower() or "json"
+    if trace_format not in {"json", "journal"}:
+        raise ConfigError("trace.format must be one of: json, journal")
     trace = Trace(
         enabled=bool(trace_raw.get("enabled", False)),
         output_dir=str(trace_raw.get("output_dir", "artifacts/runs")),
         capture_model_metadata=bool(trace_raw.get("capture_model_metadata", True)),
+        format=trace_format,
     )
 
     auth_mode_raw = remote_api_raw.get(
@@ -794,6 +810,41 @@ def load_config(*, repo_root: Path) -> AppConfig:
     jwt_secret = _opt_str_or_env(remote_api_raw, "jwt_secret", "JWT_SECRET")
     jwks_url = _opt_str_or_env(remote_api_raw, "jwks_url", "JWKS_URL")
 
+    server_mode_raw = remote_api_raw.get(
+        "server_mode", os.environ.get("LG_REMOTE_API_SERVER_MODE", "threaded")
+    )
+    if not isinstance(server_mode_raw, str):
+        raise ConfigError("missing/invalid remote_api.server_mode")
+    server_mode = server_mode_raw.strip().lower() or "threaded"
+    if server_mode not in {"threaded", "asyncio"}:
+        raise ConfigError("remote_api.server_mode must be one of: threaded, asyncio")
+    max_connections = _opt_int_or_env(
+        remote_api_raw, "max_connections", "LG_REMOTE_API_MAX_CONNECTIONS", default=256
+    )
+    max_sse_subscribers = _opt_int_or_env(
+        remote_api_raw, "max_sse_subscribers", "LG_REMOTE_API_MAX_SSE_SUBSCRIBERS", default=128
+    )
+    worker_threads = _opt_int_or_env(
+        remote_api_raw, "worker_threads", "LG_REMOTE_API_WORKER_THREADS", default=16
+    )
+    if min(max_connections, max_sse_subscribers, worker_threads) < 1:
+        raise ConfigError(
+            "remote_api.max_connections, max_sse_subscribers and worker_threads must be >= 1"
+        )
+    run_pool_size = _opt_int_or_env(
+        remote_api_raw, "run_pool_size", "LG_REMOTE_API_RUN_POOL_SIZE", default=0
+    )
+    run_pool_max_runs = _opt_int_or_env(
+        remote_api_raw, "run_pool_max_runs", "LG_REMOTE_API_RUN_POOL_MAX_RUNS", default=50
+    )
+    run_pool_max_rss_mb = _opt_int_or_env(
+        remote_api_raw, "run_pool_max_rss_mb", "LG_REMOTE_API_RUN_POOL_MAX_RSS_MB", default=2048
+    )
+    if run_pool_size < 0:
+        raise ConfigError("remote_api.run_pool_size must be 0 (disabled) or >= 1")
+    if run_pool_max_runs < 1 or run_pool_max_rss_mb < 1:
+        raise ConfigError("remote_api.run_pool_max_runs and run_pool_max_rss_mb must be >= 1")
+
     remote_api = RemoteAPIConfig(
         auth_mode=auth_mode,
         bearer_token=bearer_token,
@@ -818,6 +869,13 @@ def load_config(*, repo_root: Path) -> AppConfig:
         default_namespace=default_namespace,
         jwt_secret=jwt_secret,
         jwks_url=jwks_url,
+        server_mode=server_mode,
+        max_connections=max_connections,
+        max_sse_subscribers=max_sse_subscribers,
+        worker_threads=worker_threads,
+        run_pool_size=run_pool_size,
+        run_pool_max_runs=run_pool_max_runs,
+        run_pool_max_rss_mb=run_pool_max_rss_mb,
     )
 
     # Checkpoint section
@@ -846,6 +904,9 @@ def load_config(*, repo_root: Path) -> AppConfig:
     checkpoint_redis_ttl = _opt_int(checkpoint_raw, "redis_ttl_seconds", default=86400)
     if checkpoint_redis_ttl < 1:
         raise ConfigError("checkpoint.redis_ttl_seconds must be >= 1")
+    checkpoint_delta_snapshot_every = _opt_int(checkpoint_raw, "delta_snapshot_every", default=0)
+    if checkpoint_delta_snapshot_every < 0:
+        raise ConfigError("checkpoint.delta_snapshot_every must be >= 0")
 
     checkpoint = Checkpoint(
         enabled=checkpoint_enabled,
@@ -856,6 +917,7 @@ def load_config(*, repo_root: Path) -> AppConfig:
         redis_url=checkpoint_redis_url,
         postgres_dsn=checkpoint_postgres_dsn,
         redis_ttl_seconds=checkpoint_redis_ttl,
+        delta_snapshot_every=checkpoint_delta_snapshot_every,
     )
 
     vericoding = VericodingConfig(
@@ -969,6 +1031,13 @@ def load_config(*, repo_root: Path) -> AppConfig:
             default_namespace=remote_api.default_namespace,
             jwt_secret=_new_jwt_secret,
             jwks_url=_new_jwks_url,
+            server_mode=remote_api.server_mode,
+            max_connections=remote_api.max_connections,
+            max_sse_subscribers=remote_api.max_sse_subscribers,
+            worker_threads=remote_api.worker_threads,
+            run_pool_size=remote_api.run_pool_size,
+            run_pool_max_runs=remote_api.run_pool_max_runs,
+            run_pool_max_rss_mb=remote_api.run_pool_max_rss_mb,
         )
 
     _cp_s = CheckpointSettings()
@@ -981,6 +1050,7 @@ def load_config(*, repo_root: Path) -> AppConfig:
         "redis_url": checkpoint.redis_url,
         "postgres_dsn": checkpoint.postgres_dsn,
         "redis_ttl_seconds": checkpoint.redis_ttl_seconds,
+        "delta_snapshot_every": checkpoint.delta_snapshot_every,
     }
     _cp_changed = False
     if _cp_s.backend:
@@ -19,6 +19,7 @@ from lg_orch.nodes import (
     verifier,
 )
 from lg_orch.state import OrchStateDict
+from lg_orch.trace import seal_trace_events
 from lg_orch.visualize import GraphEdge, graph_mermaid
 
 
@@ -27,7 +28,9 @@ def _make_traced_node(node_fn: Any, node_name: str) -> Any:
 
     The span is named ``node.<node_name>`` and carries three attributes:
     ``graph.node``, ``graph.run_id``, and ``graph.lane`` (the ``_lane``
-    field in state, when present).
+    field in state, when present).  The node's ``_trace_events`` log is
+    sealed into a plain list on the way out (see
+    :func:`~lg_orch.trace.seal_trace_events`).
     """
 
     def _traced(state: dict[str, Any]) -> Any:
@@ -38,7 +41,7 @@ def _make_traced_node(node_fn: Any, node_name: str) -> Any:
             tracer = _otel_trace.get_tracer("lg_orch.graph")
         except Exception:
             # OTel import failed — run the node without tracing.
-            return node_fn(state)
+            return seal_trace_events(node_fn(state))
 
         run_id = str(state.get("_run_id", ""))
         lane = str(state.get("_lane", ""))
@@ -51,7 +54,7 @@ def _make_traced_node(node_fn: Any, node_name: str) -> Any:
             },
         ) as span:
             try:
-                return node_fn(state)
+                return seal_trace_events(node_fn(state))
             except Exception as exc:
                 span.record_exception(exc)
                 span.set_status(_StatusCode.ERROR)
@@ -10,9 +10,11 @@ Three independent tiers:
   - episodic:   per-run summaries and outcomes.
   - procedural: verified action sequences that succeeded.
 
-sqlite-vec provides an indexed vector search that replaces the former O(n)
-full-table cosine scan.  When the extension is unavailable the store falls
-back to the original numpy path transparently.
+sqlite-vec keeps the vectors inside SQLite and scans them exactly.  When the
+extension is unavailable the store searches a memory-mapped matrix instead
+(see :mod:`lg_orch.vector_index`).  Setting ``LG_MEMORY_ANN_INDEX=ivf`` (or
+``ann_index="ivf"``) replaces both exact scans with an approximate IVF-flat
+index whose recall/latency trade-off is tuned by ``LG_MEMORY_ANN_PROBES``.
 """
 
 from __future__ import annotations
@@ -23,13 +25,16 @@ import os
 import sqlite3
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Literal, cast
 
 import numpy as np
 import structlog
 
+from lg_orch.vector_index import VectorIndex, make_vector_index
+
 _log = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -95,6 +100,12 @@ class OllamaEmbedder:
 
     Requires Ollama to be running at the configured endpoint.
     Falls back to stub_embedder on connection failure.
+
+    :meth:`embed_many` sends up to *batch_size* texts per ``/api/embed``
+    request with at most *max_concurrency* requests in flight.
+    :meth:`try_embed_many` does the same but reports failed texts as
+    ``None`` instead of substituting stub vectors, so callers can avoid
+    caching them.
     """
 
     def __init__(
@@ -102,12 +113,20 @@ class OllamaEmbedder:
         model: str = "nomic-embed-text",
         base_url: str = "http://localhost:11434",
         timeout: float = 10.0,
+        batch_size: int = 32,
+        max_concurrency: int = 4,
     ) -> None:
         self._model = model
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
         self._available: bool | None = None  # None = not yet probed
 
+    @property
+    def model(self) -> str:
+        return self._model
+
     def _probe(self) -> bool:
         """Check if Ollama is reachable. Cached after first call."""
         if self._available is not None:
@@ -130,29 +149,223 @@ class OllamaEmbedder:
             )
         return self._available
 
+    def _post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        import urllib.request
+
+        req = urllib.request.Request(
+            f"{self._base_url}{path}",
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=self._timeout) as resp:
+            data = json.loads(resp.read())
+        return data if isinstance(data, dict) else {}
+
     def __call__(self, text: str) -> list[float]:
-        if not self._probe():
-            return cast(list[float], stub_embedder(text).tolist())
-        try:
-            import json as _json
-            import urllib.request
+        embedding = self._embed_one(text) if self._probe() else None
+        if embedding is None:
+            return _stub_embedder_as_list(text)
+        return embedding
 
-            payload = _json.dumps({"model": self._model, "prompt": text}).encode()
-            req = urllib.request.Request(
-                f"{self._base_url}/api/embeddings",
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST",
+    def _embed_one(self, text: str) -> list[float] | None:
+        try:
+            embedding = self._post("/api/embeddings", {"model": self._model, "prompt": text}).get(
+                "embedding", []
             )
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                data = _json.loads(resp.read())
-                embedding = data.get("embedding", [])
-                if not embedding:
-                    return cast(list[float], stub_embedder(text).tolist())
-                return [float(v) for v in embedding]
         except Exception as e:
             _log.warning("OllamaEmbedder.embedding_failed", error=str(e), fallback="stub_embedder")
-            return cast(list[float], stub_embedder(text).tolist())
+            return None
+        return [float(v) for v in embedding] if embedding else None
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float] | None]:
+        """Embed *texts* in one ``/api/embed`` request, per text on failure."""
+        try:
+            raw = self._post("/api/embed", {"model": self._model, "input": texts}).get(
+                "embeddings", []
+            )
+            if isinstance(raw, list) and len(raw) == len(texts) and all(raw):
+                return [[float(v) for v in vec] for vec in raw]
+            _log.warning("OllamaEmbedder.batch_embedding_incomplete", expected=len(texts))
+        except Exception as e:
+            # Older Ollama releases only expose the single-prompt endpoint.
+            _log.warning("OllamaEmbedder.batch_embedding_failed", error=str(e))
+        return [self._embed_one(text) for text in texts]
+
+    def embed_many(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed *texts*, preserving order."""
+        return [
+            vec if vec is not None else _stub_embedder_as_list(text)
+            for text, vec in zip(texts, self.try_embed_many(texts), strict=True)
+        ]
+
+    def try_embed_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """Embed *texts*, preserving order; ``None`` where Ollama gave no vector."""
+        if not texts:
+            return []
+        if not self._probe():
+            return [None] * len(texts)
+        batches = [
+            list(texts[i : i + self._batch_size]) for i in range(0, len(texts), self._batch_size)
+        ]
+        if len(batches) == 1:
+            return self._embed_batch(batches[0])
+        workers = min(self._max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._embed_batch, batches))
+        return [vec for batch in results for vec in batch]
+
+
+def embed_many(
+    embedder: Embedder | EmbedderFn, texts: Sequence[str]
+) -> list[np.ndarray[Any, np.dtype[np.float32]]]:
+    """Embed *texts* with *embedder*, batching when it provides ``embed_many``."""
+    batch_fn = getattr(embedder, "embed_many", None)
+    raw: Sequence[Any] = batch_fn(texts) if callable(batch_fn) else [embedder(t) for t in texts]
+    return [np.asarray(vec, dtype=np.float32) for vec in raw]
+
+
+def _try_embed_many(
+    embedder: Embedder | EmbedderFn, texts: Sequence[str]
+) -> tuple[list[np.ndarray[Any, np.dtype[np.float32]]], list[bool]]:
+    """Like :func:`embed_many`, also flagging which vectors the provider produced.
+
+    Stub fallbacks are flagged ``False``; embedders without ``try_embed_many``
+    are trusted.
+    """
+    try_fn = getattr(embedder, "try_embed_many", None)
+    if not callable(try_fn):
+        return embed_many(embedder, texts), [True] * len(texts)
+    raw: Sequence[Any] = try_fn(texts)
+    vectors = [
+        np.asarray(vec if vec is not None else _stub_embedder_as_list(text), dtype=np.float32)
+        for text, vec in zip(texts, raw, strict=True)
+    ]
+    return vectors, [vec is not None for vec in raw]
+
+
+def _embedder_model_name(embedder: Embedder | EmbedderFn) -> str:
+    model = getattr(embedder, "model", None)
+    if isinstance(model, str) and model:
+        return model
+    fn = embedder if hasattr(embedder, "__qualname__") else type(embedder)
+    return f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', 'embedder')}"
+
+
+class EmbeddingCache:
+    """SQLite-backed LRU cache of embeddings keyed by content hash.
+
+    Keys are ``sha256(model, dim, text)`` so switching model or dimension
+    never serves stale vectors.  With ``dim=None`` the dimension is the one
+    the model actually returns: it is learned from the first :meth:`put_many`
+    and remembered per model in the database, and every lookup misses until
+    then.  Once more than *max_entries* rows exist the least recently used
+    ones are deleted.  Thread-safe.
+    """
+
+    def __init__(
+        self, db_path: str, *, model: str, dim: int | None = None, max_entries: int = 10_000
+    ) -> None:
+        self._model = model
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.executescript(_EMBEDDING_CACHE_DDL)
+            self._conn.commit()
+            row = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+            self._count = int(row[0])
+            if dim is None:
+                row = self._conn.execute(
+                    "SELECT dim FROM embedding_cache_dims WHERE model = ?", (model,)
+                ).fetchone()
+                dim = int(row[0]) if row is not None else None
+        self._dim = dim
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{self._model}\0{self._dim}\0".encode())
+        digest.update(text.encode("utf-8", errors="replace"))
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_many(self, texts: Sequence[str]) -> list[np.ndarray[Any, np.dtype[np.float32]] | None]:
+        """Return cached vectors for *texts* (``None`` for misses) and mark hits as used."""
+        if self._dim is None:
+            return [None] * len(texts)
+        keys = [self.key(t) for t in texts]
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                for k, blob in self._conn.execute(
+                    f"SELECT key, embedding FROM embedding_cache WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    found[str(k)] = bytes(blob)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE key = ?",
+                    [(now, k) for k in found],
+                )
+                self._conn.commit()
+        return [
+            np.frombuffer(found[k], dtype=np.float32).copy() if k in found else None for k in keys
+        ]
+
+    def put_many(
+        self, texts: Sequence[str], vectors: Sequence[np.ndarray[Any, np.dtype[np.float32]]]
+    ) -> None:
+        """Store *vectors*; entries whose length is not ``dim`` are skipped."""
+        if self._dim is None:
+            first = next((v for v in vectors if v.ndim == 1 and v.shape[0] > 0), None)
+            if first is None:
+                return
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embedding_cache_dims (model, dim) VALUES (?, ?)",
+                    (self._model, int(first.shape[0])),
+                )
+                self._conn.commit()
+            self._dim = int(first.shape[0])
+        now = time.time()
+        rows = [
+            (self.key(t), v.astype(np.float32).tobytes(), now)
+            for t, v in zip(texts, vectors, strict=True)
+            if v.shape == (self._dim,)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, embedding, last_used) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            self._count = int(
+                self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            )
+            excess = self._count - self._max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM embedding_cache WHERE key IN "
+                    "(SELECT key FROM embedding_cache ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._count -= excess
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 def probe_ollama(base_url: str = "http://localhost:11434") -> bool:
@@ -171,7 +384,8 @@ def make_embedder(provider: str | None = None, **kwargs: object) -> EmbedderFn:
 
     Args:
         provider: One of "ollama", "stub", or None (auto-detect from env).
-        **kwargs: Provider-specific arguments (model, base_url, timeout).
+        **kwargs: Provider-specific arguments (model, base_url, timeout,
+            batch_size, max_concurrency).
 
     Environment variables:
         LG_EMBED_PROVIDER: "ollama" | "stub" (default: "stub")
@@ -199,7 +413,17 @@ def make_embedder(provider: str | None = None, **kwargs: object) -> EmbedderFn:
         )
         timeout_raw = kwargs.get("timeout", 10.0)
         timeout = float(timeout_raw) if isinstance(timeout_raw, (int, float)) else 10.0
-        return OllamaEmbedder(model=model, base_url=base_url, timeout=timeout)
+        batch_size_raw = kwargs.get("batch_size", 32)
+        batch_size = int(batch_size_raw) if isinstance(batch_size_raw, int) else 32
+        concurrency_raw = kwargs.get("max_concurrency", 4)
+        max_concurrency = int(concurrency_raw) if isinstance(concurrency_raw, int) else 4
+        return OllamaEmbedder(
+            model=model,
+            base_url=base_url,
+            timeout=timeout,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
 
     # Default: stub
     return _stub_embedder_as_list
@@ -209,6 +433,23 @@ def make_embedder(provider: str | None = None, **kwargs: object) -> EmbedderFn:
 # DDL
 # ---------------------------------------------------------------------------
 
+_EMBEDDING_CACHE_DDL = """
+PRAGMA journal_mode=WAL;
+PRAGMA busy_timeout=5000;
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key         TEXT    PRIMARY KEY,
+    embedding   BLOB    NOT NULL,
+    last_used   REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used);
+
+CREATE TABLE IF NOT EXISTS embedding_cache_dims (
+    model       TEXT    PRIMARY KEY,
+    dim         INTEGER NOT NULL
+);
+"""
+
 _DDL = """
 PRAGMA journal_mode=WAL;
 PRAGMA synchronous=NORMAL;
@@ -290,20 +531,15 @@ def _infer_task_type(query: str) -> str:
     return words[0] if words else "unknown"
 
 
-def _cosine_similarity(
-    a: np.ndarray[Any, np.dtype[np.float32]],
-    b: np.ndarray[Any, np.dtype[np.float32]],
-) -> float:
-    """Cosine similarity between two float32 vectors (both assumed unit-norm)."""
-    return float(np.dot(a, b))
-
-
 def _approx_tokens(text: str) -> int:
     if not text:
         return 0
     return max(1, (len(text) + 3) // 4)
 
 
+_MATRIX_SYNC_BATCH = 4096
+
+
 # ---------------------------------------------------------------------------
 # LongTermMemoryStore
 # ---------------------------------------------------------------------------
@@ -317,8 +553,22 @@ class LongTermMemoryStore:
         db_path: str,
         embedder: Embedder | EmbedderFn | None = None,
         embedding_dim: int = 128,
+        embedding_cache_size: int | None = None,
+        ann_index: str | None = None,
+        ann_probes: int | None = None,
+        ann_lists: int | None = None,
     ) -> None:
         self._db_path = db_path
+        # Vector index (LG_MEMORY_ANN_INDEX=flat|ivf); validated before any I/O.
+        self._ann_index = (ann_index or os.environ.get("LG_MEMORY_ANN_INDEX") or "flat").lower()
+        if self._ann_index not in ("flat", "ivf"):
+            raise ValueError(f"unknown ann_index {self._ann_index!r} (expected 'flat' or 'ivf')")
+        if ann_probes is None:
+            ann_probes = int(os.environ.get("LG_MEMORY_ANN_PROBES", "8") or 8)
+        if ann_lists is None:
+            ann_lists = int(os.environ.get("LG_MEMORY_ANN_LISTS", "0") or 0) or None
+        self._ann_probes = ann_probes
+        self._ann_lists = ann_lists
         if embedder is not None:
             self._embedder: Embedder | EmbedderFn = embedder
             _using_stub = False
@@ -336,6 +586,16 @@ class LongTermMemoryStore:
                     "Set LG_EMBED_PROVIDER=ollama to enable semantic retrieval."
                 ),
             )
+        # Embedding cache (LG_EMBED_CACHE_SIZE, 0 disables); pointless for the stub.
+        if embedding_cache_size is None:
+            embedding_cache_size = int(os.environ.get("LG_EMBED_CACHE_SIZE", "10000") or 0)
+        self._embedding_cache: EmbeddingCache | None = None
+        if embedding_cache_size > 0 and not _using_stub:
+            self._embedding_cache = EmbeddingCache(
+                db_path,
+                model=_embedder_model_name(self._embedder),
+                max_entries=embedding_cache_size,
+            )
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
@@ -366,16 +626,85 @@ class LongTermMemoryStore:
                 fallback="numpy_cosine_scan",
             )
 
+        # --- numpy path: persistent embedding matrix or IVF index ---
+        self._matrix: VectorIndex | None = None
+        if not self._has_vec or self._ann_index == "ivf":
+            with self._lock:
+                self._open_matrix(db_path)
+
     # ------------------------------------------------------------------
     # Internal utilities
     # ------------------------------------------------------------------
 
+    def _open_matrix(self, db_path: str) -> None:
+        """Map the vector index, rebuilding it from SQLite when stale."""
+        row = self._conn.execute(
+            "SELECT COUNT(*) AS n, COALESCE(MAX(id), 0) AS max_id FROM semantic_memories"
+        ).fetchone()
+        self._matrix = self._make_index(db_path)
+        try:
+            self._matrix.load()
+            if self._matrix.matches(int(row["n"]), int(row["max_id"])):
+                return
+            self._matrix.reset()
+        except OSError as exc:
+            self._fall_back_to_memory_matrix(exc)
+            return
+        self._sync_matrix()
+        _log.info("long_term_memory.embedding_matrix_rebuilt", rows=len(self._matrix))
+
+    def _make_index(self, db_path: str) -> VectorIndex:
+        return make_vector_index(
+            self._ann_index, db_path, n_lists=self._ann_lists, n_probes=self._ann_probes
+        )
+
+    def _fall_back_to_memory_matrix(self, exc: OSError) -> None:
+        _log.warning("long_term_memory.embedding_matrix_unavailable", reason=str(exc))
+        self._matrix = self._make_index(":memory:")
+        self._sync_matrix()
+
+    def _sync_matrix(self) -> None:
+        """Append rows added since the matrix was last updated (caller holds the lock)."""
+        matrix = self._matrix
+        if matrix is None:
+            return
+        try:
+            while True:
+                rows = self._conn.execute(
+                    "SELECT id, embedding FROM semantic_memories WHERE id > ? ORDER BY id LIMIT ?",
+                    (matrix.last_id, _MATRIX_SYNC_BATCH),
+                ).fetchall()
+                matrix.extend([(int(r["id"]), bytes(r["embedding"])) for r in rows])
+                if len(rows) < _MATRIX_SYNC_BATCH:
+                    return
+        except OSError as exc:
+            # A torn append is detected as stale (and rebuilt) on the next start.
+            self._fall_back_to_memory_matrix(exc)
+
     def _embed(self, text: str) -> np.ndarray[Any, np.dtype[np.float32]]:
-        raw = self._embedder(text)
-        if isinstance(raw, np.ndarray):
-            return raw.astype(np.float32)
-        # EmbedderFn returns list[float]
-        return np.array(raw, dtype=np.float32)
+        return self._embed_many([text])[0]
+
+    def _embed_many(self, texts: Sequence[str]) -> list[np.ndarray[Any, np.dtype[np.float32]]]:
+        """Embed *texts* in one batch, serving repeats from the embedding cache.
+
+        Stub vectors substituted while the provider is unreachable are
+        returned but never cached.
+        """
+        cache = self._embedding_cache
+        if cache is None:
+            return embed_many(self._embedder, texts)
+        vectors = cache.get_many(texts)
+        misses = [i for i, vec in enumerate(vectors) if vec is None]
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            fresh, real = _try_embed_many(self._embedder, miss_texts)
+            cache.put_many(
+                [t for t, ok in zip(miss_texts, real, strict=True) if ok],
+                [v for v, ok in zip(fresh, real, strict=True) if ok],
+            )
+            for i, vec in zip(misses, fresh, strict=True):
+                vectors[i] = vec
+        return cast(list[np.ndarray[Any, np.dtype[np.float32]]], vectors)
 
     @staticmethod
     def _blob_to_vec(blob: bytes, dim: int) -> np.ndarray[Any, np.dtype[np.float32]]:
@@ -412,13 +741,60 @@ class LongTermMemoryStore:
                     (rowid, blob),
                 )
             self._conn.commit()
+            self._sync_matrix()
             return rowid
 
+    def store_semantic_many(
+        self,
+        contents: Sequence[str],
+        metadata: Sequence[dict[str, Any] | None] | None = None,
+    ) -> list[int]:
+        """Embed and store several semantic facts in one transaction.
+
+        Embeddings are requested as a single batch.  Returns the row ids in
+        input order.
+        """
+        if metadata is None:
+            metadata = [None] * len(contents)
+        if len(metadata) != len(contents):
+            raise ValueError("metadata must have one entry per content")
+        if not contents:
+            return []
+        blobs = [self._vec_to_blob(vec) for vec in self._embed_many(contents)]
+        now = time.time()
+        rowids: list[int] = []
+        with self._lock:
+            try:
+                for content, meta, blob in zip(contents, metadata, blobs, strict=True):
+                    cur = self._conn.execute(
+                        "INSERT INTO semantic_memories (content, metadata, embedding, created_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (
+                            content,
+                            json.dumps(meta or {}, ensure_ascii=False, sort_keys=True),
+                            blob,
+                            now,
+                        ),
+                    )
+                    rowids.append(int(cur.lastrowid))  # type: ignore[arg-type]
+                if self._has_vec:
+                    self._conn.executemany(
+                        "INSERT INTO vec_memories(rowid, embedding) VALUES (?, ?)",
+                        list(zip(rowids, blobs, strict=True)),
+                    )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._sync_matrix()
+        return rowids
+
     def search_semantic(self, query: str, top_k: int = 5) -> list[MemoryRecord]:
         """Vector similarity search over stored embeddings.
 
-        When sqlite-vec is available the search is an indexed O(log n) lookup.
-        Otherwise falls back to the original numpy O(n) cosine scan.
+        With the default ``flat`` index this is an exact O(n) scan, run by
+        sqlite-vec when available and over the memory-mapped matrix otherwise.
+        With ``ivf`` only the ``ann_probes`` nearest clusters are scanned.
 
         When ``LG_QRAG_ENABLED=true`` is set, raw vector results are re-ranked
         through :class:`~lg_orch.qrag.QRAGRetriever` for value-based ordering.
@@ -426,7 +802,7 @@ class LongTermMemoryStore:
         top_k = max(1, top_k)
         query_vec = self._embed(query)
 
-        if self._has_vec:
+        if self._matrix is None:
             results = self._search_semantic_vec(query_vec, top_k)
         else:
             results = self._search_semantic_numpy(query_vec, top_k)
@@ -441,34 +817,28 @@ class LongTermMemoryStore:
         self, results: list[MemoryRecord], query: str, top_k: int
     ) -> list[MemoryRecord]:
         """Re-rank *results* using Q-RAG value-based retrieval."""
-        from lg_orch.qrag import QRAGRetriever
+        from lg_orch.qrag import CandidateBatch, QRAGRetriever, _success_value
 
         if not results:
             return results
 
         task_type = _infer_task_type(query)
-        candidates: list[dict[str, Any]] = []
-        for rec in results:
-            cand: dict[str, Any] = {
-                "content": rec.content,
-                "metadata": {**rec.metadata, "created_at": rec.created_at},
-                "similarity": 1.0,  # already ranked by similarity
-            }
-            if rec.embedding is not None:
-                cand["embedding"] = rec.embedding.tolist()
-            candidates.append(cand)
+        dim = next((r.embedding.shape[0] for r in results if r.embedding is not None), 0)
+        embeddings = np.zeros((len(results), dim), dtype=np.float32)
+        for row, rec in enumerate(results):
+            if rec.embedding is not None and rec.embedding.shape[0] == dim:
+                embeddings[row] = rec.embedding
+        batch = CandidateBatch.from_arrays(
+            embeddings,
+            similarity=np.ones(len(results)),  # already ranked by similarity
+            created_at=[rec.created_at for rec in results],
+            success=[_success_value(rec.metadata) for rec in results],
+            task_types=[str(rec.metadata.get("task_type", "")) for rec in results],
+        )
 
         retriever = QRAGRetriever()
-        scored = retriever.retrieve(candidates, query_task_type=task_type, top_k=top_k)
-
-        # Map scored results back to MemoryRecords (preserve order from Q-RAG)
-        content_to_rec: dict[str, MemoryRecord] = {r.content: r for r in results}
-        reranked: list[MemoryRecord] = []
-        for sm in scored:
-            matched = content_to_rec.get(sm.content)
-            if matched is not None:
-                reranked.append(matched)
-        return reranked
+        indices, _ = retriever.rerank(batch, query_task_type=task_type, top_k=top_k)
+        return [results[i] for i in indices.tolist()]
 
     # -- sqlite-vec accelerated path --
 
@@ -522,7 +892,7 @@ class LongTermMemoryStore:
             )
         return results
 
-    # -- numpy fallback path (original O(n) scan) --
+    # -- numpy path (flat scan or IVF index) --
 
     def _search_semantic_numpy(
         self,
@@ -530,38 +900,39 @@ class LongTermMemoryStore:
         top_k: int,
     ) -> list[MemoryRecord]:
         with self._lock:
+            self._sync_matrix()
+            hits = self._matrix.top_k(query_vec, top_k) if self._matrix is not None else []
+            if not hits:
+                return []
+            placeholders = ",".join("?" for _ in hits)
             rows = self._conn.execute(
-                "SELECT id, content, metadata, embedding, created_at FROM semantic_memories"
+                f"SELECT id, content, metadata, embedding, created_at "
+                f"FROM semantic_memories WHERE id IN ({placeholders})",
+                [row_id for row_id, _ in hits],
             ).fetchall()
 
-        if not rows:
-            return []
-
-        scored: list[tuple[float, MemoryRecord]] = []
-        for row in rows:
-            try:
-                vec = self._blob_to_vec(row["embedding"], self._embedding_dim)
-                sim = _cosine_similarity(query_vec, vec)
-            except Exception:
-                sim = 0.0
-                vec = None
+        row_by_id: dict[int, sqlite3.Row] = {int(r["id"]): r for r in rows}
+        results: list[MemoryRecord] = []
+        for row_id, _ in hits:
+            row = row_by_id.get(row_id)
+            if row is None:
+                continue
             try:
                 meta: dict[str, Any] = json.loads(row["metadata"])
             except (json.JSONDecodeError, TypeError):
                 meta = {}
-            rec = MemoryRecord(
-                id=int(row["id"]),
-                tier="semantic",
-                run_id=None,
-                content=str(row["content"]),
-                metadata=meta,
-                created_at=float(row["created_at"]),
-                embedding=vec if vec is not None else None,
+            results.append(
+                MemoryRecord(
+                    id=row_id,
+                    tier="semantic",
+                    run_id=None,
+                    content=str(row["content"]),
+                    metadata=meta,
+                    created_at=float(row["created_at"]),
+                    embedding=self._blob_to_vec(row["embedding"], self._embedding_dim),
+                )
             )
-            scored.append((sim, rec))
-
-        scored.sort(key=lambda t: t[0], reverse=True)
-        return [rec for _, rec in scored[:top_k]]
+        return results
 
     # ------------------------------------------------------------------
     # Episodic tier
@@ -809,6 +1180,8 @@ class LongTermMemoryStore:
     # ------------------------------------------------------------------
 
     def close(self) -> None:
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
         with self._lock:
             self._conn.close()
 
@@ -817,11 +1190,13 @@ __all__ = [
     "_TASK_TYPE_KEYWORDS",
     "Embedder",
     "EmbedderFn",
+    "EmbeddingCache",
     "LongTermMemoryStore",
     "MemoryRecord",
     "OllamaEmbedder",
     "Tier",
     "_infer_task_type",
+    "embed_many",
     "make_embedder",
     "probe_ollama",
     "stub_embedder",
@@ -13,9 +13,11 @@ commands submodules (``_validated_run_id``, ``_trace_run_summary``,
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import sys
+from collections.abc import Mapping
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
@@ -23,6 +25,7 @@ from urllib.parse import urlsplit
 
 from lg_orch.graph import export_mermaid
 from lg_orch.logging import configure_logging, get_logger, init_telemetry
+from lg_orch.trace import iter_trace_files, load_trace_payload, trace_journal_path
 from lg_orch.visualize import (
     render_trace_dashboard_html,
     render_trace_site_index_html,
@@ -57,6 +60,8 @@ def _build_parser() -> argparse.ArgumentParser:
     run_p.add_argument("--resume", action="store_true")
     run_p.add_argument("--thread-id", default=None)
     run_p.add_argument("--checkpoint-id", default=None)
+    # Set by the remote API, which follows the journal as the run appends to it.
+    run_p.add_argument("--trace-notify", action="store_true", help=argparse.SUPPRESS)
     run_p.add_argument("--view", choices=["classic", "console"], default="console")
 
     run_multi_p = sub.add_parser("run-multi")
@@ -73,6 +78,9 @@ def _build_parser() -> argparse.ArgumentParser:
     trace_view_p.add_argument("--width", type=int, default=88)
     trace_view_p.add_argument("--format", choices=["console", "html"], default="console")
     trace_view_p.add_argument("--output", default=None)
+    trace_export_p = sub.add_parser("trace-export")
+    trace_export_p.add_argument("journal_path")
+    trace_export_p.add_argument("--output", default=None)
     trace_site_p = sub.add_parser("trace-site")
     trace_site_p.add_argument("trace_dir")
     trace_site_p.add_argument("--output-dir", default=None)
@@ -87,15 +95,28 @@ def _build_parser() -> argparse.ArgumentParser:
     sub_heal.add_argument("--repo-root", type=str, default=None)
     sub_heal.add_argument("--runner-base-url", type=str, default=None)
     sub_heal.add_argument("--max-iterations", type=int, default=5)
+    prune_p = sub.add_parser(
+        "checkpoint-prune", help="Delete old checkpoints from the SQLite checkpoint store"
+    )
+    prune_p.add_argument("--repo-root", default=None)
+    prune_p.add_argument("--db-path", default=None)
+    prune_p.add_argument("--keep-last", type=int, default=20)
+    prune_p.add_argument("--thread-id", action="append", default=None)
+    prune_p.add_argument("--vacuum", action="store_true")
     return p
 
 
-def _resolve_repo_root(*, repo_root_arg: str | None) -> Path:
+def _resolve_repo_root(
+    *,
+    repo_root_arg: str | None,
+    cwd: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> Path:
     import os
 
     if repo_root_arg and repo_root_arg.strip():
         return Path(repo_root_arg).expanduser().resolve()
-    env_root = os.environ.get("LG_REPO_ROOT")
+    env_root = (os.environ if env is None else env).get("LG_REPO_ROOT")
     if env_root and env_root.strip():
         return Path(env_root).expanduser().resolve()
 
@@ -117,7 +138,7 @@ def _resolve_repo_root(*, repo_root_arg: str | None) -> Path:
             cur = cur.parent
         return None
 
-    cwd = Path.cwd().resolve()
+    cwd = (Path.cwd() if cwd is None else cwd).resolve()
     found = find_root(cwd)
     if found is not None:
         return found
@@ -135,7 +156,7 @@ def _resolve_repo_root(*, repo_root_arg: str | None) -> Path:
 def _trace_payload_from_path(trace_path: Path, *, warn_context: str) -> dict[str, Any] | None:
     log = get_logger()
     try:
-        payload_raw = json.loads(trace_path.read_text(encoding="utf-8"))
+        payload_raw = load_trace_payload(trace_path)
     except OSError as exc:
         log.warning(f"{warn_context}_read_failed", path=str(trace_path), error=str(exc))
         return None
@@ -212,7 +233,7 @@ def _trace_payload_for_run(
     if normalized_run_id is None:
         return None
     trace_path = trace_dir / f"run-{normalized_run_id}.json"
-    if not trace_path.is_file():
+    if not trace_path.is_file() and not trace_journal_path(trace_path).is_file():
         return None
     return _trace_payload_from_path(trace_path, warn_context=warn_context)
 
@@ -225,7 +246,7 @@ def _trace_http_response(
 ) -> tuple[int, str, bytes]:
     route = urlsplit(request_path).path.rstrip("/") or "/"
     runs: list[dict[str, Any]] = []
-    for trace_path in sorted(trace_dir.glob("run-*.json"), reverse=True):
+    for trace_path in iter_trace_files(trace_dir):
         payload = _trace_payload_from_path(trace_path, warn_context="trace_server")
         if payload is None:
             continue
@@ -332,6 +353,11 @@ def cli(argv: list[str] | None = None) -> int:
 
         return trace_view_command(args)
 
+    if args.cmd == "trace-export":
+        from lg_orch.commands.trace import trace_export_command
+
+        return trace_export_command(args)
+
     if args.cmd == "trace-site":
         from lg_orch.commands.trace import trace_site_command
 
@@ -352,6 +378,11 @@ def cli(argv: list[str] | None = None) -> int:
 
         return heal_command(args, repo_root=repo_root)
 
+    if args.cmd == "checkpoint-prune":
+        from lg_orch.commands.checkpoint import checkpoint_prune_command
+
+        return checkpoint_prune_command(args, repo_root=repo_root)
+
     if args.cmd == "run-multi":
         import asyncio as _asyncio
 
@@ -407,5 +438,62 @@ def main(argv: list[str]) -> int:
     return cli(argv[1:])
 
 
+# ---------------------------------------------------------------------------
+# Warm run-pool workers (lg_orch.api.run_pool)
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def warm_up() -> Any:
+    """Set up telemetry and logging and compile the graph, once per process.
+
+    Returns the graph, compiled without a checkpointer; each run attaches its
+    own to a copy.
+    """
+    import os as _os
+
+    from lg_orch.graph import build_graph
+
+    init_telemetry(
+        service_name="lula-orchestrator",
+        otlp_endpoint=_os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT"),
+    )
+    configure_logging()
+    return build_graph()
+
+
+@functools.cache
+def _pooled_config(repo_root: Path, profile: str | None) -> Any:
+    from lg_orch.config import load_config
+
+    return load_config(repo_root=repo_root, profile=profile)
+
+
+def pool_main(argv: list[str], *, cwd: Path, env: Mapping[str, str]) -> int:
+    """``lg-orch run`` on a warm pool worker.
+
+    The graph from :func:`warm_up` and the loaded config are reused across
+    runs.  *cwd* and *env* are the run's; they are passed down instead of
+    being installed process-wide.  Other subcommands are rejected.
+    """
+    graph = warm_up()
+    log = get_logger()
+    args = _build_parser().parse_args(argv[1:])
+    if args.cmd != "run":
+        log.error("pool_command_unsupported", cmd=str(args.cmd))
+        return 2
+    repo_root = _resolve_repo_root(repo_root_arg=args.repo_root, cwd=cwd, env=env)
+    profile = args.profile or env.get("LG_PROFILE")
+    try:
+        cfg = _pooled_config(repo_root, profile)
+    except Exception as exc:
+        log.error("config_load_failed", error=str(exc), repo_root=str(repo_root))
+        return 2
+
+    from lg_orch.commands.run import run_command
+
+    return run_command(args, cfg=cfg, repo_root=repo_root, env=env, graph=graph)
+
+
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv))
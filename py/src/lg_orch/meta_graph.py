@@ -7,30 +7,44 @@ Callers supply a ``run_graph`` callable that wraps the actual LangGraph
 invocation; this module only handles DAG construction, scheduling,
 concurrency control, and result collection.
 
+Ready tasks are tracked incrementally (per-task count of unfinished
+dependencies) and launched in the order chosen by a :class:`SchedulingPolicy`:
+list order by default, or longest-remaining-path first with
+:class:`CriticalPathPolicy`.  Tasks may also carry a ``priority`` and
+``resources`` that are capped by ``resource_limits``.
+
 Exported public names:
     SubAgentTask, DependencyGraph, DependencyPatch, MetaGraphScheduler,
-    MetaRunResult, run_meta_graph
+    MetaRunResult, SchedulingPolicy, FifoPolicy, CriticalPathPolicy,
+    TaskDurationHistory, run_meta_graph
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import dataclasses
+import heapq
+import threading
 import time
 from collections import deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from typing import Any, Literal
 
 import structlog
 
-from lg_orch.worktree import WorktreeLease
+from lg_orch.worktree import WorktreeContext, WorktreeLease, WorktreePool
 
 __all__ = [
+    "CriticalPathPolicy",
     "DependencyGraph",
     "DependencyPatch",
+    "FifoPolicy",
     "MetaGraphScheduler",
     "MetaRunResult",
+    "SchedulingPolicy",
     "SubAgentTask",
+    "TaskDurationHistory",
     "run_meta_graph",
 ]
 
@@ -55,6 +69,14 @@ class SubAgentTask:
     error: str | None = None
     started_at: float | None = None
     finished_at: float | None = None
+    # Higher runs first among ready tasks (ties broken by the policy).
+    priority: int = 0
+    # Resource keys such as "repo:auth" or "runner:http://r1:8088"; see
+    # MetaGraphScheduler's ``resource_limits``.
+    resources: list[str] = dataclasses.field(default_factory=list)
+    # Paths a pooled worktree checks out for this task (sparse checkout);
+    # empty means the whole tree.
+    sparse_paths: list[str] = dataclasses.field(default_factory=list)
 
 
 @dataclasses.dataclass
@@ -117,6 +139,12 @@ class DependencyGraph:
         # propagate back to SubAgentTask.depends_on.
         self._depends_on: dict[str, list[str]] = {t.task_id: list(t.depends_on) for t in tasks}
         self._validate_no_cycles()
+        # Reverse adjacency (task_id → tasks that depend on it), kept in step
+        # with ``_depends_on`` so completions and edge checks are local.
+        self._dependents: dict[str, set[str]] = {tid: set() for tid in self._id_set}
+        for task_id, deps in self._depends_on.items():
+            for dep in deps:
+                self._dependents[dep].add(task_id)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -174,13 +202,25 @@ class DependencyGraph:
         if from_id in self._depends_on[to_id]:
             # Edge already exists; idempotent.
             return
+        # The new edge closes a cycle iff from_id is already downstream of to_id.
+        if self._reaches(to_id, from_id):
+            raise ValueError("Cycle detected in task dependency graph")
         self._depends_on[to_id].append(from_id)
-        try:
-            self._validate_no_cycles()
-        except ValueError:
-            # Roll back the addition before re-raising.
-            self._depends_on[to_id].remove(from_id)
-            raise
+        self._dependents[from_id].add(to_id)
+
+    def _reaches(self, start: str, target: str) -> bool:
+        """True if *target* is *start* or depends on it, directly or transitively."""
+        stack = [start]
+        seen = {start}
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for nxt in self._dependents[node]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return False
 
     def remove_edge(self, from_id: str, to_id: str) -> None:
         """Remove the directed edge ``from_id → to_id`` if it exists.
@@ -190,6 +230,7 @@ class DependencyGraph:
         deps = self._depends_on.get(to_id)
         if deps is not None and from_id in deps:
             deps.remove(from_id)
+            self._dependents[from_id].discard(to_id)
 
     def clone(self) -> DependencyGraph:
         """Return a deep copy of this graph's adjacency structures.
@@ -202,18 +243,49 @@ class DependencyGraph:
         new_graph._tasks = self._tasks  # shared task objects intentionally
         new_graph._id_set = set(self._id_set)
         new_graph._depends_on = {tid: list(deps) for tid, deps in self._depends_on.items()}
+        new_graph._dependents = {tid: set(deps) for tid, deps in self._dependents.items()}
         return new_graph
 
     # ------------------------------------------------------------------
     # Public query methods
     # ------------------------------------------------------------------
 
+    @property
+    def tasks(self) -> list[SubAgentTask]:
+        return self._tasks
+
+    def dependencies(self, task_id: str) -> list[str]:
+        """Task ids *task_id* waits for."""
+        return list(self._depends_on[task_id])
+
+    def dependents(self, task_id: str) -> set[str]:
+        """Task ids that wait for *task_id*."""
+        return set(self._dependents[task_id])
+
+    def topological_order(self) -> list[str]:
+        """Task ids with every task after all of its dependencies (Kahn, list order)."""
+        in_degree = {tid: len(deps) for tid, deps in self._depends_on.items()}
+        queue: deque[str] = deque(t.task_id for t in self._tasks if in_degree[t.task_id] == 0)
+        order: list[str] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for dependent_id in self._dependents[node]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        return order
+
     def ready_tasks(
         self,
         completed_ids: set[str],
         failed_ids: set[str],
     ) -> list[SubAgentTask]:
-        """Return pending tasks whose every dependency has completed."""
+        """Return pending tasks whose every dependency has completed.
+
+        This scans every task; :class:`MetaGraphScheduler` tracks readiness
+        incrementally instead and does not call it.
+        """
         ready: list[SubAgentTask] = []
         for task in self._tasks:
             if task.status != "pending":
@@ -242,6 +314,171 @@ class DependencyGraph:
         return True
 
 
+# ---------------------------------------------------------------------------
+# Scheduling policies
+# ---------------------------------------------------------------------------
+
+
+class TaskDurationHistory:
+    """Smoothed run time per task id, fed by the scheduler after each success.
+
+    Share one instance across :class:`MetaGraphScheduler` runs so
+    :class:`CriticalPathPolicy` can weigh tasks by how long they took before.
+    """
+
+    def __init__(self, *, alpha: float = 0.3, default_s: float = 1.0) -> None:
+        self._alpha = alpha
+        self._default_s = default_s
+        self._estimates: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, task_id: str, duration_s: float) -> None:
+        with self._lock:
+            prev = self._estimates.get(task_id)
+            self._estimates[task_id] = (
+                duration_s if prev is None else prev + self._alpha * (duration_s - prev)
+            )
+
+    def estimate(self, task_id: str) -> float:
+        with self._lock:
+            return self._estimates.get(task_id, self._default_s)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._estimates)
+
+
+class SchedulingPolicy:
+    """Orders ready tasks; the smallest :meth:`key` launches first.
+
+    :meth:`prepare` is called with the graph before the first launch and
+    again after every applied :class:`DependencyPatch`.  The base class keeps
+    list order, after ``priority``.
+    """
+
+    def prepare(self, dag: DependencyGraph) -> None:
+        self._index = {t.task_id: i for i, t in enumerate(dag.tasks)}
+
+    def key(self, task: SubAgentTask) -> tuple[Any, ...]:
+        return (-task.priority, self._index.get(task.task_id, 0))
+
+
+class FifoPolicy(SchedulingPolicy):
+    """Launch ready tasks in list order (the default)."""
+
+
+class CriticalPathPolicy(SchedulingPolicy):
+    """Launch the task with the longest remaining path to a sink first.
+
+    A task's rank is its own estimated duration plus the largest rank among
+    its dependents, so work that gates long chains starts early.  Estimates
+    come from *history* (or *durations*, a fixed mapping), falling back to
+    *default_duration_s*.  ``priority`` still takes precedence.
+    """
+
+    def __init__(
+        self,
+        history: TaskDurationHistory | None = None,
+        *,
+        durations: Mapping[str, float] | None = None,
+        default_duration_s: float = 1.0,
+    ) -> None:
+        self._history = history
+        self._durations = dict(durations or {})
+        self._default_duration_s = default_duration_s
+        self._rank: dict[str, float] = {}
+
+    def _duration(self, task_id: str) -> float:
+        if task_id in self._durations:
+            return self._durations[task_id]
+        if self._history is not None:
+            return self._history.estimate(task_id)
+        return self._default_duration_s
+
+    def prepare(self, dag: DependencyGraph) -> None:
+        super().prepare(dag)
+        rank: dict[str, float] = {}
+        for task_id in reversed(dag.topological_order()):
+            tail = max((rank[d] for d in dag._dependents[task_id]), default=0.0)
+            rank[task_id] = self._duration(task_id) + tail
+        self._rank = rank
+
+    def rank(self, task_id: str) -> float:
+        return self._rank.get(task_id, 0.0)
+
+    def key(self, task: SubAgentTask) -> tuple[Any, ...]:
+        return (-task.priority, -self._rank.get(task.task_id, 0.0), *super().key(task)[1:])
+
+
+class _ReadyQueue:
+    """Ready tasks in policy order, maintained from unfinished-dependency counts.
+
+    A completion touches only the finished task's dependents, so a run over
+    *n* tasks and *e* edges costs O((n + e) log n) instead of a full rescan
+    per completion.  Heap entries are checked lazily on pop, which keeps
+    rewiring cheap: affected counts are recomputed and the heap rebuilt.
+    """
+
+    def __init__(self, dag: DependencyGraph, policy: SchedulingPolicy) -> None:
+        self._dag = dag
+        self._policy = policy
+        self._completed: set[str] = set()
+        self._unmet = {tid: len(deps) for tid, deps in dag._depends_on.items()}
+        self._by_id = {t.task_id: t for t in dag.tasks}
+        self._heap: list[tuple[tuple[Any, ...], str]] = []
+        self._queued: set[str] = set()
+        policy.prepare(dag)
+        for task in dag.tasks:
+            self._offer(task.task_id)
+
+    def _offer(self, task_id: str) -> None:
+        if task_id in self._queued or self._unmet[task_id] > 0:
+            return
+        if self._by_id[task_id].status != "pending":
+            return
+        self._queued.add(task_id)
+        heapq.heappush(self._heap, (self._policy.key(self._by_id[task_id]), task_id))
+
+    def complete(self, task_id: str) -> None:
+        self._completed.add(task_id)
+        for dependent_id in self._dag._dependents[task_id]:
+            self._unmet[dependent_id] -= 1
+            self._offer(dependent_id)
+
+    def rewire(self, dag: DependencyGraph, touched: Iterable[str]) -> None:
+        """Adopt *dag* after a patch changed the dependencies of *touched*."""
+        self._dag = dag
+        for task_id in touched:
+            self._unmet[task_id] = sum(
+                1 for dep in dag._depends_on[task_id] if dep not in self._completed
+            )
+        self._policy.prepare(dag)
+        stale = self._queued
+        self._heap = []
+        self._queued = set()
+        for task_id in [*stale, *touched]:
+            self._offer(task_id)
+
+    def pop(self, can_run: Callable[[SubAgentTask], bool]) -> SubAgentTask | None:
+        """Best ready task that *can_run* accepts, or ``None``."""
+        deferred: list[tuple[tuple[Any, ...], str]] = []
+        chosen: SubAgentTask | None = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            task = self._by_id[entry[1]]
+            if task.status != "pending" or self._unmet[task.task_id] > 0:
+                self._queued.discard(task.task_id)
+                continue
+            if can_run(task):
+                self._queued.discard(task.task_id)
+                chosen = task
+                break
+            deferred.append(entry)
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        return chosen
+
+
 class MetaGraphScheduler:
     """Async scheduler that dispatches :class:`SubAgentTask` instances in
     dependency order with bounded parallelism.
@@ -260,6 +497,17 @@ class MetaGraphScheduler:
                           graph before the next scheduling cycle.  When
                           *False* (default), any such patch is silently
                           ignored and existing behaviour is preserved.
+        policy: Orders ready tasks; defaults to :class:`FifoPolicy`.
+        resource_limits: Caps on concurrently running tasks per resource.
+                         Keys are either a full resource key (``"repo:auth"``)
+                         or a kind (``"repo"``), which caps each key of that
+                         kind separately.  The full key wins when both match.
+        duration_history: Receives the run time of every successful task;
+                          pass the same instance to :class:`CriticalPathPolicy`.
+        worktree_pool: Lease isolated worktrees from this started
+                       :class:`~lg_orch.worktree.WorktreePool` instead of
+                       creating one per task.  Implies worktree isolation;
+                       each task's ``sparse_paths`` go to the lease.
     """
 
     def __init__(
@@ -272,6 +520,10 @@ class MetaGraphScheduler:
         worktree_isolation: bool = False,
         worktree_base_path: str = ".",
         dynamic_rewiring: bool = False,
+        policy: SchedulingPolicy | None = None,
+        resource_limits: Mapping[str, int] | None = None,
+        duration_history: TaskDurationHistory | None = None,
+        worktree_pool: WorktreePool | None = None,
     ) -> None:
         self.tasks = tasks
         # run_graph may legitimately be None in test setups that only test
@@ -281,12 +533,17 @@ class MetaGraphScheduler:
         )
         self._max_parallel = max(1, max_parallel)
         self._fail_fast = fail_fast
-        self._worktree_isolation = worktree_isolation
+        self._worktree_isolation = worktree_isolation or worktree_pool is not None
         self._worktree_base_path = worktree_base_path
+        self._worktree_pool = worktree_pool
         self._dynamic_rewiring = dynamic_rewiring
         # Populated by run() so that _run_task_plain / _run_task_isolated can
         # apply dependency patches to the live graph.  None outside of run().
         self._dag: DependencyGraph | None = None
+        self._policy = policy if policy is not None else FifoPolicy()
+        self._resource_limits = {k: max(1, int(v)) for k, v in (resource_limits or {}).items()}
+        self._duration_history = duration_history
+        self._ready: _ReadyQueue | None = None
 
     # ------------------------------------------------------------------
     # Public interface
@@ -298,8 +555,8 @@ class MetaGraphScheduler:
         Scheduling loop (Python 3.11+, structured concurrency style):
 
         1. Build a :class:`DependencyGraph` from *self.tasks*.
-        2. Repeatedly find *ready* tasks and launch them as asyncio tasks,
-           limited by the semaphore to *max_parallel* concurrent invocations.
+        2. Launch ready tasks in policy order as asyncio tasks, up to
+           *max_parallel* at once and within any ``resource_limits``.
         3. After each :func:`asyncio.wait` FIRST_COMPLETED round, process
            results and update the completed / failed sets.
         4. If ``fail_fast`` is *True* and any failure occurred, mark remaining
@@ -313,30 +570,26 @@ class MetaGraphScheduler:
         """
         dag = DependencyGraph(self.tasks)
         self._dag = dag
-        sema = asyncio.Semaphore(self._max_parallel)
-        completed_ids: set[str] = set()
-        failed_ids: set[str] = set()
-        started_ids: set[str] = set()
+        ready = self._ready = _ReadyQueue(dag, self._policy)
+        in_use: dict[str, int] = {}
         # Maps the live asyncio.Task → the SubAgentTask it is executing.
         running: dict[asyncio.Task[None], SubAgentTask] = {}
         start = time.monotonic()
 
         try:
             while True:
-                # ── Launch all newly-ready tasks ──────────────────────────────
-                for task in self._dag.ready_tasks(completed_ids, failed_ids):
-                    if task.task_id in started_ids:
-                        continue
-                    started_ids.add(task.task_id)
-
-                    # Default-argument capture is required inside a loop to avoid
-                    # the classic late-binding closure pitfall.
-                    async def _launch(t: SubAgentTask = task) -> None:
-                        async with sema:
-                            await self._run_task(t)
-
+                # ── Launch ready tasks while there is capacity ────────────────
+                while len(running) < self._max_parallel:
+                    task = ready.pop(lambda t: self._fits(t, in_use))
+                    if task is None:
+                        break
+                    for key in task.resources:
+                        in_use[key] = in_use.get(key, 0) + 1
+                    # _run_task flips the status to "running" on its first step;
+                    # claim the task now so it cannot be popped twice.
+                    task.status = "running"
                     asyncio_task: asyncio.Task[None] = asyncio.create_task(
-                        _launch(), name=f"sub_agent_{task.task_id}"
+                        self._run_task(task), name=f"sub_agent_{task.task_id}"
                     )
                     running[asyncio_task] = task
 
@@ -357,15 +610,21 @@ class MetaGraphScheduler:
                 new_failures: list[SubAgentTask] = []
                 for done_asyncio_task in done_set:
                     sub_task = running.pop(done_asyncio_task)
+                    for key in sub_task.resources:
+                        in_use[key] -= 1
                     # _run_task already sets status; handle unexpected cancellation.
                     if sub_task.status == "running":
                         sub_task.status = "failed"
                         sub_task.error = "cancelled before completion"
                         sub_task.finished_at = time.monotonic()
                     if sub_task.status == "success":
-                        completed_ids.add(sub_task.task_id)
+                        ready.complete(sub_task.task_id)
+                        if self._duration_history is not None and sub_task.started_at:
+                            self._duration_history.record(
+                                sub_task.task_id,
+                                (sub_task.finished_at or time.monotonic()) - sub_task.started_at,
+                            )
                     else:
-                        failed_ids.add(sub_task.task_id)
                         new_failures.append(sub_task)
 
                 # ── Fail-fast handling ────────────────────────────────────────
@@ -393,6 +652,7 @@ class MetaGraphScheduler:
                     break
         finally:
             self._dag = None
+            self._ready = None
 
         total = time.monotonic() - start
         succeeded = sum(1 for t in self.tasks if t.status == "success")
@@ -414,6 +674,19 @@ class MetaGraphScheduler:
             skipped=skipped,
         )
 
+    def _limit_for(self, key: str) -> int | None:
+        limit = self._resource_limits.get(key)
+        if limit is None and ":" in key:
+            limit = self._resource_limits.get(key.split(":", 1)[0])
+        return limit
+
+    def _fits(self, task: SubAgentTask, in_use: dict[str, int]) -> bool:
+        for key in task.resources:
+            limit = self._limit_for(key)
+            if limit is not None and in_use.get(key, 0) >= limit:
+                return False
+        return True
+
     # ------------------------------------------------------------------
     # Internal task runner
     # ------------------------------------------------------------------
@@ -461,15 +734,16 @@ class MetaGraphScheduler:
             )
 
     async def _run_task_isolated(self, task: SubAgentTask) -> None:
-        """Execute the task inside a :class:`WorktreeLease`."""
+        """Execute the task inside a :class:`WorktreeLease` or a pooled worktree."""
         succeeded = False
         final_state: dict[str, Any] = {}
+        lease: contextlib.AbstractAsyncContextManager[WorktreeContext] = (
+            self._worktree_pool.lease(task.task_id, paths=task.sparse_paths, merge=True)
+            if self._worktree_pool is not None
+            else WorktreeLease(task.task_id, self._worktree_base_path, merge=True)
+        )
         try:
-            async with WorktreeLease(
-                task.task_id,
-                self._worktree_base_path,
-                merge=True,
-            ) as wt_ctx:
+            async with lease as wt_ctx:
                 state_with_path: dict[str, Any] = {
                     **task.input_state,
                     "worktree_path": wt_ctx.worktree_path,
@@ -541,6 +815,9 @@ class MetaGraphScheduler:
 
         # Atomic swap: replace the live graph with the validated clone.
         self._dag = candidate
+        if self._ready is not None:
+            touched = {to_id for _, to_id in (*raw_patch.remove_edges, *raw_patch.add_edges)}
+            self._ready.rewire(candidate, touched & candidate._id_set)
         log.info(
             "meta_graph.patch_applied",
             task_id=task_id,
@@ -567,6 +844,10 @@ async def run_meta_graph(
     worktree_isolation: bool = False,
     worktree_base_path: str = ".",
     dynamic_rewiring: bool = False,
+    policy: SchedulingPolicy | None = None,
+    resource_limits: Mapping[str, int] | None = None,
+    duration_history: TaskDurationHistory | None = None,
+    worktree_pool: WorktreePool | None = None,
 ) -> MetaRunResult:
     """Top-level convenience function.
 
@@ -582,6 +863,12 @@ async def run_meta_graph(
         dynamic_rewiring: When *True*, honour ``"dependency_patch"`` keys in
                           task results.  When *False* (default), patches are
                           ignored and behaviour is identical to pre-Wave-8.
+        policy: Orders ready tasks (default :class:`FifoPolicy`).
+        resource_limits: Per-resource concurrency caps; see
+                         :class:`MetaGraphScheduler`.
+        duration_history: Records task run times for :class:`CriticalPathPolicy`.
+        worktree_pool: Pool to lease isolated worktrees from; see
+                       :class:`MetaGraphScheduler`.
 
     Returns:
         A :class:`MetaRunResult` with full per-task detail and aggregate counts.
@@ -594,5 +881,9 @@ async def run_meta_graph(
         worktree_isolation=worktree_isolation,
         worktree_base_path=worktree_base_path,
         dynamic_rewiring=dynamic_rewiring,
+        policy=policy,
+        resource_limits=resource_limits,
+        duration_history=duration_history,
+        worktree_pool=worktree_pool,
     )
     return await scheduler.run()
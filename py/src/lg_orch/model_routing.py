@@ -2,15 +2,25 @@
 # Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
 from __future__ import annotations
 
+import bisect
 import collections
+import json
+import math
 import os
+import socket
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from lg_orch.state import ModelRoutingDecision
 
+try:
+    from lg_orch.api.metrics import LULA_SLA_DEGRADED_MODELS as _SLA_DEGRADED_MODELS
+except ImportError:
+    _SLA_DEGRADED_MODELS = None  # type: ignore[assignment]
+
 
 def decide_model_route(
     *,
@@ -406,71 +416,417 @@ class SlaConfig:
     entries: list[SlaEntry] = field(default_factory=list)
 
 
+class LatencySketch:
+    """Mergeable streaming quantile sketch of latencies (seconds), DDSketch-style.
+
+    Samples are counted in log-spaced buckets whose boundaries grow by
+    ``gamma = (1 + a) / (1 - a)``, so any quantile is answered within relative
+    error *a* of a real sample.  Adding or removing a sample touches one
+    bucket; reads walk the (small, bounded) set of occupied buckets instead of
+    sorting raw samples.  Two sketches with the same accuracy merge by adding
+    bucket counts, which is how SLA state is shared between API workers.
+    """
+
+    # Latencies at or below this are counted together and reported as 0.0.
+    _MIN_VALUE: ClassVar[float] = 1e-6
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self._accuracy = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._counts: dict[int, int] = {}
+        self._keys: list[int] = []
+        self._zero = 0
+        self._count = 0
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self._accuracy
+
+    def count(self) -> int:
+        return self._count
+
+    def key(self, value: float) -> int | None:
+        """Bucket key for *value*; ``None`` means the zero bucket."""
+        if value <= self._MIN_VALUE:
+            return None
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add_key(self, key: int | None, n: int = 1) -> None:
+        self._count += n
+        if key is None:
+            self._zero += n
+            return
+        if key not in self._counts:
+            bisect.insort(self._keys, key)
+            self._counts[key] = 0
+        self._counts[key] += n
+
+    def remove_key(self, key: int | None, n: int = 1) -> None:
+        if key is None:
+            n = min(n, self._zero)
+            self._zero -= n
+            self._count -= n
+            return
+        current = self._counts.get(key, 0)
+        n = min(n, current)
+        if n <= 0:
+            return
+        self._count -= n
+        if current == n:
+            del self._counts[key]
+            del self._keys[bisect.bisect_left(self._keys, key)]
+        else:
+            self._counts[key] = current - n
+
+    def add(self, value: float) -> None:
+        self.add_key(self.key(value))
+
+    def merge(self, other: LatencySketch) -> None:
+        if other._accuracy != self._accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        if other._zero:
+            self.add_key(None, other._zero)
+        for key, n in other._counts.items():
+            self.add_key(key, n)
+
+    def copy(self) -> LatencySketch:
+        out = LatencySketch(self._accuracy)
+        out.merge(self)
+        return out
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated *q*-quantile (0 <= q <= 1), or ``None`` when empty."""
+        if self._count == 0:
+            return None
+        rank = min(int(self._count * min(max(q, 0.0), 1.0)), self._count - 1)
+        if rank < self._zero:
+            return 0.0
+        # High quantiles are the common read, so count down from the top.
+        above = self._count - 1 - rank
+        seen = 0
+        for key in reversed(self._keys):
+            seen += self._counts[key]
+            if seen > above:
+                return 2.0 * self._gamma**key / (self._gamma + 1.0)
+        return 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self._accuracy,
+            "zero": self._zero,
+            "counts": {str(k): n for k, n in self._counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencySketch:
+        out = cls(float(data.get("relative_accuracy", 0.01)))
+        zero = int(data.get("zero", 0))
+        if zero > 0:
+            out.add_key(None, zero)
+        counts = data.get("counts", {})
+        if isinstance(counts, dict):
+            for k, n in counts.items():
+                if int(n) > 0:
+                    out.add_key(int(k), int(n))
+        return out
+
+
 class LatencyWindow:
-    """Fixed-size circular buffer of wall-clock latency samples (seconds)."""
+    """Rolling window of wall-clock latency samples (seconds) backed by a sketch.
+
+    A sample leaves the window once *window_size* newer samples exist or it is
+    older than *max_age_s*, so a model that recovers stops looking degraded
+    even when traffic to it is light.  Quantile reads cost one walk over the
+    sketch's occupied buckets, not a sort of the window.
 
-    def __init__(self, model_id: str, window_size: int = 200) -> None:
+    :meth:`set_remote` attaches a sketch merged from other workers (see
+    :class:`RedisSlaStateStore`); quantiles then cover both, while
+    :meth:`snapshot` and :meth:`sample_count` stay local.
+    """
+
+    _MIN_SAMPLES: ClassVar[int] = 5
+
+    def __init__(
+        self,
+        model_id: str,
+        window_size: int = 200,
+        *,
+        max_age_s: float = 300.0,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._model_id = model_id
         self._window_size = window_size
-        self._buf: collections.deque[float] = collections.deque(maxlen=window_size)
+        self._max_age_s = max_age_s
+        self._clock = clock
+        self._buf: collections.deque[tuple[float, int | None]] = collections.deque()
+        self._sketch = LatencySketch(relative_accuracy)
+        self._remote: LatencySketch | None = None
+        self._combined: LatencySketch | None = None
         self._lock = threading.Lock()
 
     @property
     def model_id(self) -> str:
         return self._model_id
 
+    def _expire(self, now: float) -> None:
+        horizon = now - self._max_age_s
+        buf = self._buf
+        while buf and (len(buf) > self._window_size or buf[0][0] < horizon):
+            _, key = buf.popleft()
+            self._sketch.remove_key(key)
+            self._combined = None
+
     def record(self, latency_s: float) -> None:
         with self._lock:
-            self._buf.append(latency_s)
+            now = self._clock()
+            key = self._sketch.key(latency_s)
+            self._buf.append((now, key))
+            self._sketch.add_key(key)
+            self._combined = None
+            self._expire(now)
+
+    def set_remote(self, sketch: LatencySketch | None) -> None:
+        with self._lock:
+            self._remote = sketch if sketch is not None and sketch.count() else None
+            self._combined = None
 
-    def p95(self) -> float | None:
+    def snapshot(self) -> LatencySketch:
+        """Copy of the local (this process only) sketch."""
         with self._lock:
-            samples = list(self._buf)
-        if len(samples) < 5:
-            return None
-        sorted_samples = sorted(samples)
-        idx = int(len(sorted_samples) * 0.95)
-        idx = min(idx, len(sorted_samples) - 1)
-        return sorted_samples[idx]
+            self._expire(self._clock())
+            return self._sketch.copy()
+
+    def quantile(self, q: float) -> float | None:
+        with self._lock:
+            self._expire(self._clock())
+            sketch = self._sketch
+            if self._remote is not None:
+                if self._combined is None:
+                    self._combined = self._sketch.copy()
+                    self._combined.merge(self._remote)
+                sketch = self._combined
+            if sketch.count() < self._MIN_SAMPLES:
+                return None
+            return sketch.quantile(q)
+
+    def p50(self) -> float | None:
+        return self.quantile(0.50)
+
+    def p95(self) -> float | None:
+        return self.quantile(0.95)
+
+    def p99(self) -> float | None:
+        return self.quantile(0.99)
 
     def sample_count(self) -> int:
         with self._lock:
+            self._expire(self._clock())
             return len(self._buf)
 
 
+class RedisSlaStateStore:
+    """Shares per-model latency sketches between API workers through Redis.
+
+    Each model has one hash, ``<namespace>:sla:<model_id>``, holding one field
+    per worker: a JSON ``{"ts": ..., "sketch": ...}`` of that worker's local
+    window.  Readers merge every other worker's sketch; entries older than
+    *ttl_s* are ignored, and the hash itself expires so departed workers
+    age out.  Each sync is one pipelined round trip for writes and one for
+    reads.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        *,
+        client: Any = None,
+        namespace: str = "lula",
+        worker_id: str | None = None,
+        ttl_s: float = 60.0,
+        connect_timeout: float = 2.0,
+        socket_timeout: float = 2.0,
+    ) -> None:
+        if client is None:
+            if not redis_url:
+                raise ValueError("redis_url or client is required")
+            import redis as redis_lib
+
+            client = redis_lib.from_url(
+                redis_url,
+                socket_connect_timeout=connect_timeout,
+                socket_timeout=socket_timeout,
+                decode_responses=True,
+            )
+            client.ping()
+        self._client: Any = client
+        self._namespace = namespace.strip() or "lula"
+        self._worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._ttl_s = ttl_s
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    def _key(self, model_id: str) -> str:
+        return f"{self._namespace}:sla:{model_id}"
+
+    def publish(self, sketches: dict[str, LatencySketch]) -> None:
+        if not sketches:
+            return
+        now = time.time()
+        ttl = max(1, math.ceil(self._ttl_s))
+        pipe = self._client.pipeline(transaction=False)
+        for model_id, sketch in sketches.items():
+            key = self._key(model_id)
+            pipe.hset(key, self._worker_id, json.dumps({"ts": now, "sketch": sketch.to_dict()}))
+            pipe.expire(key, ttl)
+        pipe.execute()
+
+    def fetch(self, model_ids: list[str]) -> dict[str, LatencySketch]:
+        """Merged sketches from every *other* live worker, keyed by model id."""
+        if not model_ids:
+            return {}
+        pipe = self._client.pipeline(transaction=False)
+        for model_id in model_ids:
+            pipe.hgetall(self._key(model_id))
+        replies = pipe.execute()
+        horizon = time.time() - self._ttl_s
+        out: dict[str, LatencySketch] = {}
+        for model_id, fields in zip(model_ids, replies, strict=True):
+            merged: LatencySketch | None = None
+            for worker, raw in (fields or {}).items():
+                if worker == self._worker_id:
+                    continue
+                try:
+                    entry = json.loads(raw)
+                    if float(entry.get("ts", 0.0)) < horizon:
+                        continue
+                    sketch = LatencySketch.from_dict(entry.get("sketch", {}))
+                    if merged is None:
+                        merged = sketch
+                    else:
+                        merged.merge(sketch)
+                except (TypeError, ValueError, AttributeError):
+                    continue
+            if merged is not None and merged.count():
+                out[model_id] = merged
+        return out
+
+
+def create_sla_state_store(redis_url: str | None = None) -> RedisSlaStateStore | None:
+    """Return a shared SLA state store when Redis is configured, else ``None``.
+
+    Uses *redis_url* or ``LG_CHECKPOINT_REDIS_URL``.  An unreachable Redis
+    leaves SLA routing per process rather than failing startup.
+    """
+    url = redis_url or os.environ.get("LG_CHECKPOINT_REDIS_URL", "")
+    if not url:
+        return None
+    try:
+        return RedisSlaStateStore(url)
+    except Exception:
+        return None
+
+
 class SlaRoutingPolicy:
-    """Routes model calls to fallback when a primary model's p95 exceeds threshold."""
+    """Routes model calls to fallback when a primary model's p95 exceeds threshold.
+
+    With a *shared_store* and at least one threshold, a daemon thread
+    publishes the local windows and pulls in other workers' sketches every
+    *sync_interval_s*, so every worker routes on the same fleet-wide p95
+    without a Redis round trip on the request path.  Store errors are
+    swallowed; routing then carries on with the last merged view.  Call
+    :meth:`close` to stop the thread.
+    """
 
     def __init__(
         self,
         thresholds: dict[str, float],
         fallbacks: dict[str, str],
         windows: dict[str, LatencyWindow] | None = None,
+        *,
+        shared_store: RedisSlaStateStore | None = None,
+        sync_interval_s: float = 5.0,
     ) -> None:
         self._thresholds = dict(thresholds)
         self._fallbacks = dict(fallbacks)
         self._windows: dict[str, LatencyWindow] = dict(windows) if windows is not None else {}
         self._windows_lock = threading.Lock()
+        self._shared_store = shared_store
+        self._sync_interval_s = sync_interval_s
+        self._sync_lock = threading.Lock()
+        self._stop_sync = threading.Event()
+        self._sync_thread: threading.Thread | None = None
+        if shared_store is not None and self._thresholds:
+            self._sync_thread = threading.Thread(
+                target=self._sync_loop, name="sla-sync", daemon=True
+            )
+            self._sync_thread.start()
+
+    def _window(self, model_id: str) -> LatencyWindow:
+        with self._windows_lock:
+            window = self._windows.get(model_id)
+            if window is None:
+                window = self._windows[model_id] = LatencyWindow(model_id)
+            return window
+
+    def _sync_loop(self) -> None:
+        while not self._stop_sync.wait(timeout=self._sync_interval_s):
+            self.sync()
+
+    def close(self) -> None:
+        """Stop the background sync thread, if one is running."""
+        self._stop_sync.set()
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            self._sync_thread.join(timeout=5)
+        self._sync_thread = None
+
+    def sync(self) -> None:
+        """Exchange window sketches with the shared store, if one is set."""
+        store = self._shared_store
+        if store is None:
+            return
+        # One caller syncs; a concurrent one skips rather than queueing.
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            with self._windows_lock:
+                windows = dict(self._windows)
+            local = {m: w.snapshot() for m, w in windows.items()}
+            store.publish({m: sk for m, sk in local.items() if sk.count()})
+            model_ids = sorted(set(windows) | set(self._thresholds))
+            remote = store.fetch(model_ids)
+            for model_id in model_ids:
+                if model_id in remote or model_id in windows:
+                    self._window(model_id).set_remote(remote.get(model_id))
+        except Exception:
+            pass
+        finally:
+            self._sync_lock.release()
 
     def record_latency(self, model_id: str, latency_s: float) -> None:
-        with self._windows_lock:
-            if model_id not in self._windows:
-                self._windows[model_id] = LatencyWindow(model_id)
-            window = self._windows[model_id]
-        window.record(latency_s)
+        self._window(model_id).record(latency_s)
+
+    def _is_degraded(self, model_id: str, window: LatencyWindow) -> bool | None:
+        threshold = self._thresholds.get(model_id)
+        if threshold is None:
+            return None
+        p95 = window.p95()
+        degraded = p95 is not None and p95 > threshold
+        if _SLA_DEGRADED_MODELS is not None:
+            _SLA_DEGRADED_MODELS.labels(model=model_id).set(1 if degraded else 0)
+        return degraded
 
     def select_model(self, requested_model: str) -> str:
         with self._windows_lock:
             window = self._windows.get(requested_model)
         if window is None:
             return requested_model
-        p95 = window.p95()
-        if p95 is None:
-            return requested_model
-        threshold = self._thresholds.get(requested_model)
-        if threshold is None:
-            return requested_model
-        if p95 > threshold:
+        if self._is_degraded(requested_model, window):
             fallback = self._fallbacks.get(requested_model)
             if fallback is not None:
                 return fallback
@@ -479,15 +835,7 @@ class SlaRoutingPolicy:
     def degraded_models(self) -> list[str]:
         with self._windows_lock:
             snapshot = dict(self._windows)
-        result: list[str] = []
-        for model_id, window in snapshot.items():
-            p95 = window.p95()
-            if p95 is None:
-                continue
-            threshold = self._thresholds.get(model_id)
-            if threshold is not None and p95 > threshold:
-                result.append(model_id)
-        return result
+        return [m for m, w in snapshot.items() if self._is_degraded(m, w)]
 
 
 def build_sla_policy(config: SlaConfig) -> SlaRoutingPolicy | None:
@@ -498,7 +846,9 @@ def build_sla_policy(config: SlaConfig) -> SlaRoutingPolicy | None:
     for entry in config.entries:
         thresholds[entry.model_id] = entry.threshold_p95_s
         fallbacks[entry.model_id] = entry.fallback_model_id
-    return SlaRoutingPolicy(thresholds=thresholds, fallbacks=fallbacks)
+    return SlaRoutingPolicy(
+        thresholds=thresholds, fallbacks=fallbacks, shared_store=create_sla_state_store()
+    )
 
 
 # ---------------------------------------------------------------------------
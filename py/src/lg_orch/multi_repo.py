@@ -12,6 +12,7 @@ Exported public names:
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 from dataclasses import dataclass, field
 from typing import Any
@@ -21,9 +22,11 @@ import structlog
 from lg_orch.meta_graph import (
     MetaGraphScheduler,
     MetaRunResult,
+    SchedulingPolicy,
     SubAgentTask,
+    TaskDurationHistory,
 )
-from lg_orch.scip_index import ScipIndex, ScipSymbol, load_scip_index
+from lg_orch.scip_index import ScipIndex, get_scip_index
 
 __all__ = [
     "CrossRepoHandoff",
@@ -61,8 +64,7 @@ def _scip_summary(index: ScipIndex | None) -> list[dict[str, Any]]:
     """Return a truncated, serialisable summary of the top symbols in *index*."""
     if index is None:
         return []
-    sorted_syms: list[ScipSymbol] = sorted(index.symbols, key=lambda s: s.name)
-    top: list[ScipSymbol] = sorted_syms[:_SCIP_SUMMARY_LIMIT]
+    top = index.top_symbols(_SCIP_SUMMARY_LIMIT)
     return [
         {
             "name": sym.name,
@@ -86,7 +88,18 @@ class MultiRepoScheduler:
     - ``runner_url``: URL of the Rust runner for that repository.
     - ``scip_summary``: list of up to 20 symbol dicts from the SCIP index.
     - ``active_handoff``: a ``CrossRepoHandoff`` dict if one targets this task
-      (keyed by *task_id*), otherwise the key is absent.
+      (keyed by *task_id*), otherwise the key is absent.  It also carries
+      ``symbol_edges``: for each shared symbol, where the source repo uses it
+      and where the target repo defines it, read from the cross-repo edge
+      table.
+
+    Each task is also tagged with the resources ``repo:<name>`` and
+    ``runner:<runner_url>``, so ``resource_limits={"repo": 2}`` allows at most
+    two concurrent tasks per repository.
+
+    SCIP indexes not preloaded on a :class:`RepoConfig` are loaded
+    concurrently before enrichment, through the process-wide cache of
+    :func:`~lg_orch.scip_index.get_scip_index`.
 
     Args:
         repos: All repository configurations participating in the run.
@@ -94,6 +107,9 @@ class MultiRepoScheduler:
         concurrency: Maximum number of sub-agent tasks running simultaneously.
         worktree_isolation: Forwarded to the inner :class:`MetaGraphScheduler`.
         dynamic_rewiring: Forwarded to the inner :class:`MetaGraphScheduler`.
+        policy: Forwarded to the inner :class:`MetaGraphScheduler`.
+        resource_limits: Forwarded to the inner :class:`MetaGraphScheduler`.
+        duration_history: Forwarded to the inner :class:`MetaGraphScheduler`.
     """
 
     def __init__(
@@ -103,12 +119,19 @@ class MultiRepoScheduler:
         concurrency: int = 4,
         worktree_isolation: bool = False,
         dynamic_rewiring: bool = False,
+        *,
+        policy: SchedulingPolicy | None = None,
+        resource_limits: dict[str, int] | None = None,
+        duration_history: TaskDurationHistory | None = None,
     ) -> None:
         self._repos: dict[str, RepoConfig] = {r.name: r for r in repos}
         self._task_repo_map = task_repo_map
         self._concurrency = concurrency
         self._worktree_isolation = worktree_isolation
         self._dynamic_rewiring = dynamic_rewiring
+        self._policy = policy
+        self._resource_limits = resource_limits
+        self._duration_history = duration_history
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -139,13 +162,16 @@ class MultiRepoScheduler:
         """Mutate ``task.input_state`` in-place with repo context and handoffs."""
         repo = self._resolve_repo(task.task_id)
 
-        # Lazy-load the SCIP index on first encounter if not pre-loaded.
+        # Normally loaded up-front by _load_indexes; kept for direct callers.
         if repo.scip_index is None:
-            repo.scip_index = load_scip_index(repo.root_path)
+            repo.scip_index = get_scip_index(repo.root_path)
 
         task.input_state["repo_root"] = repo.root_path
         task.input_state["runner_url"] = repo.runner_url
         task.input_state["scip_summary"] = _scip_summary(repo.scip_index)
+        for resource in (f"repo:{repo.name}", f"runner:{repo.runner_url}"):
+            if resource not in task.resources:
+                task.resources.append(resource)
 
         # Find any handoff whose target_repo matches this task's repo name.
         repo_name = self._task_repo_map[task.task_id]
@@ -154,7 +180,9 @@ class MultiRepoScheduler:
             # Use the first matching handoff; convert to a plain dict so the
             # inner graph does not need to import this module's types.
             h = matching[0]
-            task.input_state["active_handoff"] = dataclasses.asdict(h)
+            active = dataclasses.asdict(h)
+            active["symbol_edges"] = self._symbol_edges(h)
+            task.input_state["active_handoff"] = active
             log.info(
                 "multi_repo.handoff_injected",
                 task_id=task.task_id,
@@ -163,6 +191,48 @@ class MultiRepoScheduler:
                 shared_symbols=h.shared_symbols,
             )
 
+    def _symbol_edges(self, handoff: CrossRepoHandoff) -> list[dict[str, Any]]:
+        """Per shared symbol: its uses in the source repo and definitions in the target."""
+        source = self._repos.get(handoff.source_repo)
+        target = self._repos.get(handoff.target_repo)
+        if source is None or target is None:
+            return []
+        if source.scip_index is None or target.scip_index is None:
+            return []
+        edges = source.scip_index.cross_repo_edges(target.scip_index)
+        out: list[dict[str, Any]] = []
+        for name in handoff.shared_symbols:
+            pairs = edges.get(name, [])
+            if not pairs:
+                continue
+            out.append(
+                {
+                    "symbol": name,
+                    "used_by": sorted({f"{s.file_path}:{s.name}" for s, _ in pairs}),
+                    "defined_in": sorted({r.file_path for _, r in pairs}),
+                }
+            )
+        return out
+
+    async def _load_indexes(
+        self, tasks: list[SubAgentTask], handoffs: list[CrossRepoHandoff]
+    ) -> None:
+        """Load every missing SCIP index for *tasks* and *handoffs* concurrently."""
+        repos = [self._resolve_repo(t.task_id) for t in tasks]
+        # Handoff edges need both ends, including repos with no task of their own.
+        for h in handoffs:
+            repos.extend(
+                self._repos[name] for name in (h.source_repo, h.target_repo) if name in self._repos
+            )
+        pending = {repo.name: repo for repo in repos if repo.scip_index is None}
+        if not pending:
+            return
+        indexes = await asyncio.gather(
+            *(asyncio.to_thread(get_scip_index, repo.root_path) for repo in pending.values())
+        )
+        for repo, index in zip(pending.values(), indexes, strict=True):
+            repo.scip_index = index
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -177,8 +247,11 @@ class MultiRepoScheduler:
         Steps:
         1. Validate that every task has a known repo mapping (raises ``ValueError``
            immediately if any mapping is missing).
-        2. Enrich each task's ``input_state`` with repo context and handoffs.
+        2. Load missing SCIP indexes concurrently, then enrich each task's
+           ``input_state`` with repo context and handoffs.
         3. Delegate to :class:`~lg_orch.meta_graph.MetaGraphScheduler`.
+        4. Reindex the SCIP entries of files that tasks patched (without
+           worktree isolation; see :meth:`_reindex_patched_files`).
 
         Args:
             tasks: All sub-agent tasks to schedule.
@@ -196,6 +269,8 @@ class MultiRepoScheduler:
         for task in tasks:
             self._resolve_repo(task.task_id)
 
+        await self._load_indexes(tasks, resolved_handoffs)
+
         # Enrich each task in-place.
         for task in tasks:
             self._enrich_task(task, resolved_handoffs)
@@ -207,5 +282,45 @@ class MultiRepoScheduler:
             fail_fast=True,
             worktree_isolation=self._worktree_isolation,
             dynamic_rewiring=self._dynamic_rewiring,
+            policy=self._policy,
+            resource_limits=self._resource_limits,
+            duration_history=self._duration_history,
         )
-        return await scheduler.run()
+        result = await scheduler.run()
+        self._reindex_patched_files(result.tasks)
+        return result
+
+    def _reindex_patched_files(self, tasks: list[SubAgentTask]) -> None:
+        """Refresh each repo's SCIP index for the files its tasks patched.
+
+        The executor records ``_scip_dirty_paths`` for successful
+        ``apply_patch`` calls; only those files are re-extracted.  With
+        worktree isolation the patches landed in a worktree that is gone by
+        now, and reach ``root_path`` only if the merge-back succeeded, so the
+        index is marked stale instead of re-reading files that may be old.
+        """
+        for task in tasks:
+            if not isinstance(task.result, dict):
+                continue
+            dirty = task.result.get("_scip_dirty_paths")
+            if not isinstance(dirty, list) or not dirty:
+                continue
+            repo = self._resolve_repo(task.task_id)
+            if repo.scip_index is None:
+                continue
+            if self._worktree_isolation:
+                repo.scip_index.mark_stale()
+                log.info(
+                    "multi_repo.scip_reindex_skipped",
+                    task_id=task.task_id,
+                    repo=repo.name,
+                    reason="worktree_isolation",
+                )
+                continue
+            refreshed = repo.scip_index.reindex_files(str(p) for p in dirty)
+            log.info(
+                "multi_repo.scip_reindexed",
+                task_id=task.task_id,
+                repo=repo.name,
+                files=refreshed,
+            )
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -19,12 +24,19 @@ from lg_orch.memory import (
 )
 from lg_orch.model_routing import record_model_route
 from lg_orch.nodes._utils import validate_base_url as _validate_base_url_fn
+from lg_orch.sqlite_registry import discard as _discard_shared_db
 from lg_orch.tools import MCPClient, RunnerClient
 from lg_orch.trace import append_event
 
 _WORD_RE = re.compile(r"[a-zA-Z0-9_]+")
 _PERSISTENT_REPO_CONTEXT_KEYS = ("system_prompt", "structural_ast_map", "semantic_hits")
 
+# Memory lookups (episodic, semantic, procedural) run concurrently on a small
+# process-wide pool; each is a read on a shared SQLite connection.
+_MEMORY_LOOKUP_WORKERS = 3
+_memory_pool: ThreadPoolExecutor | None = None
+_memory_pool_lock = threading.Lock()
+
 
 def _validate_base_url(url: str) -> bool:
     try:
@@ -252,11 +264,11 @@ def _load_cached_procedures(state: dict[str, Any]) -> list[dict[str, Any]]:
     try:
         from lg_orch.procedure_cache import ProcedureCache
 
-        cache = ProcedureCache(db_path=Path(procedure_cache_path))
-        try:
-            return cache.lookup_procedure(request=request, limit=3)
-        finally:
-            cache.close()
+        cache = ProcedureCache.open_reader(db_path=Path(procedure_cache_path))
+        return cache.lookup_procedure(request=request, limit=3)
+    except sqlite3.Error:
+        _discard_shared_db(Path(procedure_cache_path))
+        return []
     except Exception:
         return []
 
@@ -278,15 +290,15 @@ def _load_episodic_context(state: dict[str, Any]) -> list[dict[str, Any]]:
     try:
         from lg_orch.run_store import RunStore
 
-        store = RunStore(db_path=Path(run_store_path))
-        try:
-            return store.get_episodic_context(
-                failure_fingerprint=fingerprint,
-                failure_class=failure_class,
-                limit=5,
-            )
-        finally:
-            store.close()
+        store = RunStore.open_reader(db_path=Path(run_store_path))
+        return store.get_episodic_context(
+            failure_fingerprint=fingerprint,
+            failure_class=failure_class,
+            limit=5,
+        )
+    except sqlite3.Error:
+        _discard_shared_db(Path(run_store_path))
+        return []
     except Exception:
         return []
 
@@ -301,15 +313,55 @@ def _load_semantic_context(state: dict[str, Any]) -> list[dict[str, Any]]:
     try:
         from lg_orch.run_store import RunStore
 
-        store = RunStore(db_path=Path(run_store_path))
-        try:
-            return store.search_semantic_memories(query=query, limit=5)
-        finally:
-            store.close()
+        store = RunStore.open_reader(db_path=Path(run_store_path))
+        return store.search_semantic_memories(query=query, limit=5)
+    except sqlite3.Error:
+        _discard_shared_db(Path(run_store_path))
+        return []
     except Exception:
         return []
 
 
+def _memory_lookup_pool() -> ThreadPoolExecutor:
+    global _memory_pool
+    with _memory_pool_lock:
+        if _memory_pool is None:
+            _memory_pool = ThreadPoolExecutor(
+                max_workers=_MEMORY_LOOKUP_WORKERS, thread_name_prefix="context-memory"
+            )
+        return _memory_pool
+
+
+def _timed_lookup(
+    loader: Callable[[dict[str, Any]], list[dict[str, Any]]], state: dict[str, Any]
+) -> tuple[list[dict[str, Any]], float]:
+    started = time.perf_counter()
+    result = loader(state)
+    return result, round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def _load_memory_context(
+    state: dict[str, Any],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, float]]:
+    """Run the episodic, semantic and procedural lookups concurrently.
+
+    Returns the results and per-lookup wall time in milliseconds, keyed by
+    ``episodic_facts``, ``semantic_memories`` and ``cached_procedures``.
+    """
+    loaders: dict[str, Callable[[dict[str, Any]], list[dict[str, Any]]]] = {
+        "episodic_facts": _load_episodic_context,
+        "semantic_memories": _load_semantic_context,
+        "cached_procedures": _load_cached_procedures,
+    }
+    pool = _memory_lookup_pool()
+    futures = {key: pool.submit(_timed_lookup, loader, state) for key, loader in loaders.items()}
+    results: dict[str, list[dict[str, Any]]] = {}
+    timings: dict[str, float] = {}
+    for key, future in futures.items():
+        results[key], timings[key] = future.result()
+    return results, timings
+
+
 def context_builder(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
     if isinstance(state, BaseModel):
         state = _state_to_dict(state)
@@ -399,19 +451,11 @@ def context_builder(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
         log.warning("context_builder_mcp_catalog_failed", error=str(exc))
         mcp_tools = []
 
-    # Episodic memory: cross-session recovery facts
-    episodic_facts = _load_episodic_context(state)
-    if episodic_facts:
-        repo_context["episodic_facts"] = episodic_facts
-
-    semantic_memories = _load_semantic_context(state)
-    if semantic_memories:
-        repo_context["semantic_memories"] = semantic_memories
-
-    # Procedural memory: inject cached procedures for routine operations
-    cached_procedures = _load_cached_procedures(state)
-    if cached_procedures:
-        repo_context["cached_procedures"] = cached_procedures
+    # Episodic facts, semantic memories and cached procedures (looked up concurrently)
+    memory_context, memory_lookup_ms = _load_memory_context(state)
+    for key, value in memory_context.items():
+        if value:
+            repo_context[key] = value
 
     layers = build_context_layers(state=state, repo_context=repo_context)
     repo_context["semantic_hits"] = layers["semantic_hits"]
@@ -464,6 +508,7 @@ def context_builder(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
             "phase": "end",
             "top_level": len(repo_context["top_level"]),
             "planner_context_tokens": repo_context["planner_context"].get("token_estimate", 0),
+            "memory_lookup_ms": memory_lookup_ms,
         },
     )
     return prune_pre_verification_history(out)
@@ -5,7 +5,11 @@ from __future__ import annotations
 import fnmatch
 import json
 import os
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, cast
 
 from pydantic import BaseModel
 
@@ -14,6 +18,7 @@ from lg_orch.logging import get_logger
 from lg_orch.memory import _state_to_dict, ensure_history_policy, prune_pre_verification_history
 from lg_orch.model_routing import tool_routing_metadata
 from lg_orch.nodes._utils import validate_base_url as _validate_base_url_fn
+from lg_orch.remote_api import push_run_event
 from lg_orch.tools import RunnerClient
 from lg_orch.trace import append_event
 
@@ -190,6 +195,275 @@ def _path_matches_allowlist(path: str, allowed_write_paths: tuple[str, ...]) ->
     return any(fnmatch.fnmatch(normalized, pattern) for pattern in allowed_write_paths)
 
 
+# Runner tools that never mutate the workspace or its snapshot/checkpoint
+# state.  Steps made only of these may overlap with each other.
+_READ_ONLY_TOOLS: frozenset[str] = frozenset(
+    {
+        "health",
+        "read_file",
+        "list_files",
+        "search_files",
+        "search_codebase",
+        "ast_index_summary",
+    }
+)
+_DEFAULT_MAX_INFLIGHT_STEPS = 4
+
+
+def _max_inflight_steps() -> int:
+    """Read-only steps dispatched concurrently, from ``LG_EXECUTOR_MAX_INFLIGHT_STEPS``.
+
+    ``1`` restores strictly sequential step execution.
+    """
+    return max(
+        1,
+        _as_int(
+            os.environ.get("LG_EXECUTOR_MAX_INFLIGHT_STEPS", ""),
+            default=_DEFAULT_MAX_INFLIGHT_STEPS,
+        ),
+    )
+
+
+def _is_read_only_step(step: dict[str, Any]) -> bool:
+    tools = step.get("tools", [])
+    return (
+        isinstance(tools, list)
+        and bool(tools)
+        and all(isinstance(t, dict) and str(t.get("tool")) in _READ_ONLY_TOOLS for t in tools)
+    )
+
+
+class _StepWindow:
+    """Bounded, ordered window of step batches in flight on the runner.
+
+    Batches are submitted to a small thread pool and handed back by
+    :meth:`drain` strictly in submission order, so results land in
+    ``tool_results`` exactly as sequential execution would have left them.
+    """
+
+    def __init__(self, client: RunnerClient, *, size: int) -> None:
+        self.size = size
+        self._client = client
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: deque[tuple[Any, Future[list[dict[str, Any]]]]] = deque()
+
+    def submit(self, meta: Any, calls: list[dict[str, Any]]) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.size, thread_name_prefix="executor-step"
+            )
+        future = self._pool.submit(self._client.batch_execute_tools, calls=calls)
+        self._pending.append((meta, future))
+
+    def drain(
+        self, keep: int
+    ) -> Iterator[tuple[Any, list[dict[str, Any]] | None, BaseException | None]]:
+        """Yield ``(meta, results, error)`` for the oldest batches until *keep* remain."""
+        while len(self._pending) > keep:
+            meta, future = self._pending.popleft()
+            try:
+                results = future.result()
+            except Exception as exc:
+                yield meta, None, exc
+            else:
+                yield meta, results, None
+
+    def discard(self) -> list[Any]:
+        """Drop every batch still in flight and return their metadata."""
+        dropped = []
+        while self._pending:
+            meta, future = self._pending.popleft()
+            future.cancel()
+            dropped.append(meta)
+        return dropped
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _StdoutForwarder:
+    """Reassembles streamed stdout chunks into lines for the run's SSE stream."""
+
+    def __init__(self, run_id: str, calls: list[dict[str, Any]]) -> None:
+        self._run_id = run_id
+        self._tools = [str(c.get("tool", "")) for c in calls]
+        self._partial: dict[int, str] = {}
+
+    def feed(self, idx: int, chunk: str) -> None:
+        *lines, rest = (self._partial.pop(idx, "") + chunk).split("\n")
+        if rest:
+            self._partial[idx] = rest
+        for line in lines:
+            self._emit(idx, line)
+
+    def flush(self, idx: int) -> None:
+        rest = self._partial.pop(idx, "")
+        if rest:
+            self._emit(idx, rest)
+
+    def _emit(self, idx: int, line: str) -> None:
+        if line.strip():
+            push_run_event(
+                self._run_id, {"type": "tool_stdout", "tool": self._tools[idx], "line": line}
+            )
+
+
+def _execute_streaming(
+    client: RunnerClient,
+    calls: list[dict[str, Any]],
+    *,
+    run_id: str,
+    on_result: Callable[[dict[str, Any], dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Run one step's batch over the runner's streaming endpoint.
+
+    Output lines reach the run's SSE stream while tools are still running, and
+    each call's outcome is pushed, then handed to ``on_result(call, result)``,
+    as soon as it finishes instead of when the slowest call in the batch does.
+    Results are returned in call order.
+    """
+    forwarder = _StdoutForwarder(run_id, calls)
+    results: list[dict[str, Any] | None] = [None] * len(calls)
+    for idx, envelope in client.stream_batch_execute_tools(calls=calls, on_stdout=forwarder.feed):
+        forwarder.flush(idx)
+        results[idx] = envelope
+        push_run_event(
+            run_id,
+            {
+                "type": "tool_result",
+                "tool": str(envelope.get("tool", calls[idx].get("tool", ""))),
+                "ok": bool(envelope.get("ok", False)),
+                "exit_code": envelope.get("exit_code"),
+                "timing_ms": envelope.get("timing_ms"),
+            },
+        )
+        if on_result is not None:
+            on_result(calls[idx], envelope)
+    return [result for result in results if result is not None]
+
+
+def _step_failure_result(state: dict[str, Any], exc: BaseException | None) -> dict[str, Any]:
+    return {
+        "tool": "batch_execute",
+        "ok": False,
+        "exit_code": 1,
+        "stdout": "",
+        "stderr": str(exc),
+        "diagnostics": [],
+        "timing_ms": 0,
+        "artifacts": {"error": "executor_failed"},
+        "route": tool_routing_metadata(state, stage="executor"),
+    }
+
+
+def _absorb_result(
+    state: dict[str, Any],
+    call: dict[str, Any],
+    result: dict[str, Any],
+    *,
+    checkpoint_state: dict[str, Any],
+    glean_auditor: GleanAuditor | None,
+) -> None:
+    """Post-process one finished call: GLEAN checks, SCIP dirty paths, checkpoint metadata."""
+    if glean_auditor is not None:
+        glean_auditor.check_post_execution(str(result.get("tool", "")), result)
+
+    # Record which files successful apply_patch calls touched so the SCIP
+    # index can reindex just those; without a path list it is simply stale.
+    if result.get("tool") == "apply_patch" and result.get("ok", False):
+        state["_scip_index_stale"] = True
+        input_payload = call.get("input", {})
+        changed = (
+            _apply_patch_changed_paths(input_payload) if isinstance(input_payload, dict) else None
+        )
+        if changed:
+            dirty = state.get("_scip_dirty_paths", [])
+            state["_scip_dirty_paths"] = sorted(
+                {*(dirty if isinstance(dirty, list) else []), *changed}
+            )
+
+    snapshot_meta = result.get("snapshot")
+    if isinstance(snapshot_meta, dict):
+        checkpoint = snapshot_meta.get("checkpoint")
+        if isinstance(checkpoint, dict):
+            thread_id = checkpoint.get("thread_id")
+            if isinstance(thread_id, str) and thread_id.strip():
+                checkpoint_state["thread_id"] = thread_id.strip()
+            checkpoint_ns = checkpoint.get("checkpoint_ns")
+            if isinstance(checkpoint_ns, str):
+                checkpoint_state["checkpoint_ns"] = checkpoint_ns
+            checkpoint_id = checkpoint.get("checkpoint_id")
+            if isinstance(checkpoint_id, str) and checkpoint_id.strip():
+                checkpoint_state["latest_checkpoint_id"] = checkpoint_id.strip()
+            run_id = checkpoint.get("run_id")
+            if isinstance(run_id, str) and run_id.strip():
+                checkpoint_state["run_id"] = run_id.strip()
+        snapshot_id = snapshot_meta.get("snapshot_id")
+        if isinstance(snapshot_id, str) and snapshot_id.strip():
+            checkpoint_state["latest_snapshot_id"] = snapshot_id.strip()
+
+    undo_meta = result.get("undo")
+    if isinstance(undo_meta, dict):
+        undo_snapshot_id = undo_meta.get("restored_snapshot_id")
+        if isinstance(undo_snapshot_id, str) and undo_snapshot_id.strip():
+            checkpoint_state["latest_snapshot_id"] = undo_snapshot_id.strip()
+        checkpoint = undo_meta.get("checkpoint")
+        if isinstance(checkpoint, dict):
+            checkpoint_id = checkpoint.get("checkpoint_id")
+            if isinstance(checkpoint_id, str) and checkpoint_id.strip():
+                checkpoint_state["latest_checkpoint_id"] = checkpoint_id.strip()
+
+
+def _record_batch(
+    state: dict[str, Any],
+    *,
+    calls: list[dict[str, Any]],
+    batch_results: list[dict[str, Any]],
+    route_metadata: dict[str, Any],
+    tool_results: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Append one step's results, in call order, and its ``tools`` trace event."""
+    tool_results.extend(batch_results)
+    return append_event(
+        state,
+        kind="tools",
+        data={
+            "count": len(calls),
+            "tools": [str(c.get("tool")) for c in calls],
+            "lane": route_metadata.get("lane", "interactive"),
+        },
+    )
+
+
+def _absorb_batch_results(
+    state: dict[str, Any],
+    *,
+    calls: list[dict[str, Any]],
+    batch_results: list[dict[str, Any]],
+    route_metadata: dict[str, Any],
+    tool_results: list[dict[str, Any]],
+    checkpoint_state: dict[str, Any],
+    glean_auditor: GleanAuditor | None,
+) -> dict[str, Any]:
+    """Record one step's runner results and thread their checkpoint metadata forward."""
+    for call, result in zip(calls, batch_results, strict=False):
+        _absorb_result(
+            state,
+            call,
+            result,
+            checkpoint_state=checkpoint_state,
+            glean_auditor=glean_auditor,
+        )
+    return _record_batch(
+        state,
+        calls=calls,
+        batch_results=batch_results,
+        route_metadata=route_metadata,
+        tool_results=tool_results,
+    )
+
+
 def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
     if isinstance(state, BaseModel):
         state = _state_to_dict(state)
@@ -252,16 +526,49 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
     allowed_write_paths = _configured_write_allowlist(guards)
     checkpoint_state_raw = state.get("_checkpoint", {})
     checkpoint_state = dict(checkpoint_state_raw) if isinstance(checkpoint_state_raw, dict) else {}
+    run_id = str(state.get("_run_id") or "").strip()
     stop_execution = False
+    window = _StepWindow(client, size=_max_inflight_steps())
+
+    def _drain(keep: int) -> bool:
+        """Absorb in-flight steps, oldest first, until at most *keep* remain."""
+        nonlocal state, tool_calls_used
+        for (step_id, step_results, calls, route_metadata), batch_results, exc in window.drain(
+            keep
+        ):
+            tool_results.extend(step_results)
+            if batch_results is None:
+                # Later in-flight steps are read-only; drop them as if they never ran.
+                tool_calls_used -= len(calls) + sum(len(meta[2]) for meta in window.discard())
+                log.error("executor_step_failed", error=str(exc), step_id=step_id)
+                tool_results.append(_step_failure_result(cast(dict[str, Any], state), exc))
+                return True
+            state = _absorb_batch_results(
+                cast(dict[str, Any], state),
+                calls=calls,
+                batch_results=batch_results,
+                route_metadata=route_metadata,
+                tool_results=tool_results,
+                checkpoint_state=checkpoint_state,
+                glean_auditor=glean_auditor,
+            )
+        return False
+
     for step in plan.get("steps", []):
         if stop_execution:
             break
+        # Read-only steps join the in-flight window; anything else waits for
+        # it to empty, so mutations and checkpoint threading stay ordered.
+        concurrent = window.size > 1 and _is_read_only_step(step)
+        if not concurrent and _drain(0):
+            break
+        step_out: list[dict[str, Any]] = [] if concurrent else tool_results
+        calls: list[dict[str, Any]] = []
         try:
-            calls: list[dict[str, Any]] = []
             route_metadata = tool_routing_metadata(state, stage="executor")
             planned_tools = step.get("tools", [])
             if max_tool_calls > 0 and tool_calls_used + len(planned_tools) > max_tool_calls:
-                tool_results.append(
+                step_out.append(
                     _budget_failure_result(
                         tool="batch_execute",
                         message=(
@@ -273,8 +580,8 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                     )
                 )
                 stop_execution = True
-                break
-            for tool_call in step.get("tools", []):
+                planned_tools = []
+            for tool_call in planned_tools:
                 input_payload = dict(tool_call.get("input", {}))
                 tool_name = str(tool_call.get("tool"))
                 if tool_name == "apply_patch":
@@ -285,7 +592,7 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                             input_payload=input_payload,
                         )
                         if approval is None:
-                            tool_results.append(
+                            step_out.append(
                                 _budget_failure_result(
                                     tool=tool_name,
                                     message=(
@@ -328,7 +635,7 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                     if allowed_write_paths:
                         changed_paths = _apply_patch_changed_paths(input_payload)
                         if not changed_paths:
-                            tool_results.append(
+                            step_out.append(
                                 _budget_failure_result(
                                     tool=tool_name,
                                     message=(
@@ -355,7 +662,7 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                             None,
                         )
                         if denied_path is not None:
-                            tool_results.append(
+                            step_out.append(
                                 _budget_failure_result(
                                     tool=tool_name,
                                     message=(
@@ -376,7 +683,7 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                 if tool_name == "apply_patch" and max_patch_bytes > 0:
                     patch_bytes = _estimate_patch_bytes(input_payload)
                     if patch_bytes > max_patch_bytes:
-                        tool_results.append(
+                        step_out.append(
                             _budget_failure_result(
                                 tool=tool_name,
                                 message=(
@@ -395,7 +702,7 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                     blocking = glean_auditor.check_pre_execution(tool_name, input_payload)
                     if blocking:
                         detail = "; ".join(v.detail for v in blocking)
-                        tool_results.append(
+                        step_out.append(
                             _budget_failure_result(
                                 tool=tool_name,
                                 message=f"GLEAN blocked: {detail}",
@@ -414,81 +721,64 @@ def executor(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
                         "input": input_payload,
                     }
                 )
-            if calls:
+            if concurrent:
+                if _drain(window.size - 1 if calls else 0):
+                    stop_execution = True
+                    break
+                if calls:
+                    tool_calls_used += len(calls)
+                    window.submit((step.get("id"), step_out, calls, route_metadata), calls)
+                    continue
+                tool_results.extend(step_out)
+            if calls and run_id:
+                # Each call is post-processed as it finishes; only the
+                # step's summary waits for the whole batch.
+                batch_results = _execute_streaming(
+                    client,
+                    calls,
+                    run_id=run_id,
+                    on_result=partial(
+                        _absorb_result,
+                        state,
+                        checkpoint_state=checkpoint_state,
+                        glean_auditor=glean_auditor,
+                    ),
+                )
+                tool_calls_used += len(calls)
+                state = _record_batch(
+                    state,
+                    calls=calls,
+                    batch_results=batch_results,
+                    route_metadata=route_metadata,
+                    tool_results=tool_results,
+                )
+            elif calls:
                 batch_results = client.batch_execute_tools(calls=calls)
-                # GLEAN post-execution checks
-                if glean_auditor is not None:
-                    for result in batch_results:
-                        glean_auditor.check_post_execution(str(result.get("tool", "")), result)
-                tool_results.extend(batch_results)
                 tool_calls_used += len(calls)
-
-                # Mark the SCIP index as stale if any apply_patch succeeded
-                for result in batch_results:
-                    if result.get("tool") == "apply_patch" and result.get("ok", False):
-                        state["_scip_index_stale"] = True
-                        break
-
-                for result in batch_results:
-                    snapshot_meta = result.get("snapshot")
-                    if isinstance(snapshot_meta, dict):
-                        checkpoint = snapshot_meta.get("checkpoint")
-                        if isinstance(checkpoint, dict):
-                            thread_id = checkpoint.get("thread_id")
-                            if isinstance(thread_id, str) and thread_id.strip():
-                                checkpoint_state["thread_id"] = thread_id.strip()
-                            checkpoint_ns = checkpoint.get("checkpoint_ns")
-                            if isinstance(checkpoint_ns, str):
-                                checkpoint_state["checkpoint_ns"] = checkpoint_ns
-                            checkpoint_id = checkpoint.get("checkpoint_id")
-                            if isinstance(checkpoint_id, str) and checkpoint_id.strip():
-                                checkpoint_state["latest_checkpoint_id"] = checkpoint_id.strip()
-                            run_id = checkpoint.get("run_id")
-                            if isinstance(run_id, str) and run_id.strip():
-                                checkpoint_state["run_id"] = run_id.strip()
-                        snapshot_id = snapshot_meta.get("snapshot_id")
-                        if isinstance(snapshot_id, str) and snapshot_id.strip():
-                            checkpoint_state["latest_snapshot_id"] = snapshot_id.strip()
-
-                    undo_meta = result.get("undo")
-                    if isinstance(undo_meta, dict):
-                        undo_snapshot_id = undo_meta.get("restored_snapshot_id")
-                        if isinstance(undo_snapshot_id, str) and undo_snapshot_id.strip():
-                            checkpoint_state["latest_snapshot_id"] = undo_snapshot_id.strip()
-                        checkpoint = undo_meta.get("checkpoint")
-                        if isinstance(checkpoint, dict):
-                            checkpoint_id = checkpoint.get("checkpoint_id")
-                            if isinstance(checkpoint_id, str) and checkpoint_id.strip():
-                                checkpoint_state["latest_checkpoint_id"] = checkpoint_id.strip()
-                state = append_event(
+                state = _absorb_batch_results(
                     state,
-                    kind="tools",
-                    data={
-                        "count": len(calls),
-                        "tools": [str(c.get("tool")) for c in calls],
-                        "lane": route_metadata.get("lane", "interactive"),
-                    },
+                    calls=calls,
+                    batch_results=batch_results,
+                    route_metadata=route_metadata,
+                    tool_results=tool_results,
+                    checkpoint_state=checkpoint_state,
+                    glean_auditor=glean_auditor,
                 )
         except Exception as exc:
+            if concurrent:
+                if _drain(0):
+                    stop_execution = True
+                    break
+                tool_results.extend(step_out)
             log.error(
                 "executor_step_failed",
                 error=str(exc),
                 step_id=step.get("id"),
             )
-            tool_results.append(
-                {
-                    "tool": "batch_execute",
-                    "ok": False,
-                    "exit_code": 1,
-                    "stdout": "",
-                    "stderr": str(exc),
-                    "diagnostics": [],
-                    "timing_ms": 0,
-                    "artifacts": {"error": "executor_failed"},
-                    "route": tool_routing_metadata(state, stage="executor"),
-                }
-            )
+            tool_results.append(_step_failure_result(state, exc))
             stop_execution = True
+    _drain(0)
+    window.close()
     budgets["tool_calls_used"] = tool_calls_used
     budgets["tool_calls_limit"] = max_tool_calls
     budgets["patch_bytes_limit"] = max_patch_bytes
@@ -2,8 +2,6 @@
 # Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
 from __future__ import annotations
 
-import asyncio
-import concurrent.futures
 import os
 import time
 from typing import Any
@@ -14,7 +12,7 @@ from lg_orch.logging import get_logger
 from lg_orch.memory import _state_to_dict
 from lg_orch.remote_api import push_run_event
 from lg_orch.tools import InferenceClient
-from lg_orch.tools.inference_client import InferenceResponse
+from lg_orch.tools.inference_client import InferenceResponse, run_on_shared_loop
 from lg_orch.trace import append_event
 
 _SYSTEM_PROMPT = (
@@ -156,8 +154,8 @@ def _stream_llm_with_events(
 ) -> InferenceResponse:
     """Run streaming LLM call, emitting llm_chunk SSE events per token.
 
-    Runs the async generator in a thread pool to remain safe in sync graph nodes
-    that may already have a running event loop (e.g. LangGraph internals).
+    Same bridge as the coder node: the stream runs on the shared loop via
+    :func:`~lg_orch.tools.inference_client.run_on_shared_loop`.
     """
     started = time.perf_counter()
     chunks: list[str] = []
@@ -174,21 +172,7 @@ def _stream_llm_with_events(
             push_run_event(run_id, {"type": "llm_chunk", "node": node, "delta": token})
         return "".join(chunks)
 
-    # MEDIUM FIX 3: Safely run async coroutine regardless of whether an
-    # event loop is already running (e.g. inside LangGraph's async context).
-    # Using a dedicated thread avoids "RuntimeError: This event loop is
-    # already running" when called from a ThreadPoolExecutor.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        future = pool.submit(asyncio.run, _run())
-        try:
-            text = future.result()
-        except RuntimeError:
-            # Fallback: if asyncio.run fails (nested loop), create a new loop
-            loop = asyncio.new_event_loop()
-            try:
-                text = loop.run_until_complete(_run())
-            finally:
-                loop.close()
+    text = run_on_shared_loop(_run())
 
     latency_ms = int((time.perf_counter() - started) * 1000)
     return InferenceResponse(
@@ -29,7 +29,7 @@ from lg_orch.state import (
     VerifierReport,
 )
 from lg_orch.tools import RunnerClient
-from lg_orch.trace import append_event
+from lg_orch.trace import TraceEventLog, append_event
 
 _VERIFIER_SCHEMA_PATH = (
     Path(__file__).parent.parent.parent.parent.parent / "schemas" / "verifier_report.schema.json"
@@ -941,7 +941,7 @@ def verifier(state: dict[str, Any] | BaseModel) -> dict[str, Any]:
     # inject a synthetic check so the verifier fails accordingly.
     glean_blocking_count = 0
     trace_events_raw = state.get("_trace_events", [])
-    if isinstance(trace_events_raw, list):
+    if isinstance(trace_events_raw, list | TraceEventLog):
         for evt in trace_events_raw:
             if isinstance(evt, dict) and evt.get("kind") == "glean":
                 glean_data = evt.get("data", {})
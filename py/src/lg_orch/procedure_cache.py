@@ -16,6 +16,8 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
+from lg_orch.sqlite_registry import ensure_initialised, read_only_connection
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS procedures (
     procedure_id TEXT PRIMARY KEY,
@@ -50,11 +52,29 @@ class ProcedureCache:
         self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         self._lock = threading.Lock()
+        self._shared = False
         with self._lock:
             self._conn.executescript(_SCHEMA)
             self._conn.commit()
 
+    @classmethod
+    def open_reader(cls, *, db_path: Path) -> ProcedureCache:
+        """Return a lookup-only cache on the process-wide read-only connection.
+
+        The schema is created once per process per path.  Writes through a
+        reader fail, and :meth:`close` leaves the shared connection open.
+        """
+        ensure_initialised(db_path, "procedure_cache", lambda: cls(db_path=db_path).close())
+        shared = read_only_connection(db_path)
+        cache = cls.__new__(cls)
+        cache._conn = shared.conn
+        cache._lock = shared.lock
+        cache._shared = True
+        return cache
+
     def close(self) -> None:
+        if self._shared:
+            return
         with self._lock:
             self._conn.close()
 
@@ -16,13 +16,18 @@ from __future__ import annotations
 
 import math
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import structlog
 
 _log = structlog.get_logger(__name__)
 
+FloatArray = np.ndarray[Any, np.dtype[np.float32]]
+ScoreArray = np.ndarray[Any, np.dtype[np.float64]]
+
 
 @dataclass
 class ScoredMemory:
@@ -35,6 +40,89 @@ class ScoredMemory:
     combined_score: float  # weighted combination
 
 
+@dataclass(frozen=True)
+class CandidateBatch:
+    """Column-oriented candidates for :meth:`QRAGRetriever.rerank`.
+
+    ``embeddings`` is an ``(n, d)`` float32 matrix whose rows are
+    L2-normalised; candidates without a usable embedding have an all-zero
+    row, so they are never penalised and never penalise others.
+    ``created_at`` holds Unix timestamps with NaN for unknown ages and
+    ``task_types`` the lower-cased ``metadata["task_type"]`` values.
+    """
+
+    embeddings: FloatArray
+    similarity: ScoreArray
+    created_at: ScoreArray
+    success: ScoreArray
+    task_types: Sequence[str]
+    contents: Sequence[str] = ()
+    metadata: Sequence[dict[str, Any]] = ()
+
+    def __len__(self) -> int:
+        return int(self.similarity.shape[0])
+
+    @classmethod
+    def from_arrays(
+        cls,
+        embeddings: Any,
+        *,
+        similarity: Any,
+        created_at: Any = None,
+        success: Any = None,
+        task_types: Sequence[str] | None = None,
+        contents: Sequence[str] = (),
+        metadata: Sequence[dict[str, Any]] = (),
+    ) -> CandidateBatch:
+        """Build a batch from an ``(n, d)`` embedding matrix and per-row arrays."""
+        sims = np.asarray(similarity, dtype=np.float64).reshape(-1)
+        n = sims.shape[0]
+        matrix = np.array(embeddings, dtype=np.float32, copy=True).reshape(n, -1)
+        norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+        usable = norms >= 1e-9
+        np.divide(matrix, norms[:, None], out=matrix, where=usable[:, None])
+        matrix[~usable] = 0.0
+        return cls(
+            embeddings=matrix,
+            similarity=sims,
+            created_at=(
+                np.full(n, np.nan)
+                if created_at is None
+                else np.asarray(created_at, dtype=np.float64).reshape(-1)
+            ),
+            success=(
+                np.full(n, 0.5)
+                if success is None
+                else np.clip(np.asarray(success, dtype=np.float64).reshape(-1), 0.0, 1.0)
+            ),
+            task_types=(
+                [""] * n if task_types is None else [t.strip().lower() for t in task_types]
+            ),
+            contents=contents,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def from_candidates(cls, candidates: Sequence[dict[str, Any]]) -> CandidateBatch:
+        """Build a batch from the candidate dicts accepted by :meth:`QRAGRetriever.retrieve`."""
+        metadata = [dict(c.get("metadata", {})) for c in candidates]
+        vectors = [_embedding_array(c.get("embedding")) for c in candidates]
+        dim = next((v.shape[0] for v in vectors if v.shape[0]), 0)
+        matrix = np.zeros((len(candidates), dim), dtype=np.float32)
+        for row, vec in enumerate(vectors):
+            if vec.shape[0] == dim:
+                matrix[row] = vec
+        return cls.from_arrays(
+            matrix,
+            similarity=[float(c.get("similarity", 0.0)) for c in candidates],
+            created_at=[_timestamp_or_nan(m.get("created_at")) for m in metadata],
+            success=[_success_value(m) for m in metadata],
+            task_types=[str(m.get("task_type", "")) for m in metadata],
+            contents=[str(c.get("content", "")) for c in candidates],
+            metadata=metadata,
+        )
+
+
 class QRAGRetriever:
     """Multi-step retrieval with value-based re-ranking.
 
@@ -45,6 +133,9 @@ class QRAGRetriever:
       - Diversity: penalize memories too similar to already-selected ones (MMR)
       - Success history: memories from successful runs score higher
 
+    Scoring runs over a :class:`CandidateBatch` with NumPy; only the greedy
+    MMR selection loops, once per selected item.
+
     The architecture is designed to accept a learned value function later
     (replacing the heuristic signals with an RL-trained estimator).
     """
@@ -79,163 +170,174 @@ class QRAGRetriever:
           - content (str)
           - metadata (dict) — may contain ``task_type``, ``success``, ``created_at``
           - similarity (float) — cosine similarity from vector search
-          - embedding (list[float], optional) — for diversity calculation
+          - embedding (list[float] or ndarray, optional) — for diversity calculation
         """
         if not candidates:
             return []
 
-        top_k = max(1, top_k)
-
-        # Score every candidate
-        scored: list[tuple[float, ScoredMemory]] = []
-        for cand in candidates:
-            similarity = float(cand.get("similarity", 0.0))
-            metadata = dict(cand.get("metadata", {}))
-            value = self._compute_value(cand, query_task_type)
-
-            combined = (
-                self.similarity_weight * similarity
-                + self.recency_weight * self._recency_score(metadata.get("created_at"))
-                + self.success_weight * self._success_score(metadata)
-                + (1.0 - self.diversity_weight) * value  # placeholder before MMR
-            )
-            scored.append(
-                (
-                    combined,
-                    ScoredMemory(
-                        content=str(cand.get("content", "")),
-                        metadata=metadata,
-                        similarity=similarity,
-                        value=value,
-                        combined_score=combined,
-                    ),
-                )
+        batch = CandidateBatch.from_candidates(candidates)
+        values = self._value_vector(batch, query_task_type)
+        indices, scores = self.rerank(batch, query_task_type, top_k=top_k)
+        return [
+            ScoredMemory(
+                content=batch.contents[i],
+                metadata=batch.metadata[i],
+                similarity=float(batch.similarity[i]),
+                value=float(values[i]),
+                combined_score=float(score),
             )
+            for i, score in zip(indices.tolist(), scores.tolist(), strict=True)
+        ]
 
-        # Sort by combined score descending
-        scored.sort(key=lambda t: t[0], reverse=True)
-
-        # Greedy MMR-style selection for diversity
-        selected: list[ScoredMemory] = []
-        selected_embeddings: list[list[float]] = []
-
-        for _, mem in scored:
-            if len(selected) >= top_k:
-                break
-
-            embedding = _extract_embedding(
-                next((c for c in candidates if c.get("content") == mem.content), None)
-            )
+    def rerank(
+        self,
+        batch: CandidateBatch,
+        query_task_type: str,
+        top_k: int = 5,
+    ) -> tuple[np.ndarray[Any, np.dtype[np.intp]], ScoreArray]:
+        """Return ``(indices, scores)`` of the top-k rows of *batch*, best first."""
+        return self.rerank_batch(batch, [query_task_type], top_k=top_k)[0]
 
-            if embedding and selected_embeddings:
-                penalty = self._diversity_penalty(embedding, selected_embeddings)
-                mem = ScoredMemory(
-                    content=mem.content,
-                    metadata=mem.metadata,
-                    similarity=mem.similarity,
-                    value=mem.value,
-                    combined_score=mem.combined_score - self.diversity_weight * penalty,
-                )
+    def rerank_batch(
+        self,
+        batch: CandidateBatch,
+        query_task_types: Sequence[str],
+        *,
+        similarities: Any = None,
+        top_k: int = 5,
+    ) -> list[tuple[np.ndarray[Any, np.dtype[np.intp]], ScoreArray]]:
+        """Re-rank one candidate pool for many queries at once.
 
-            selected.append(mem)
-            if embedding:
-                selected_embeddings.append(embedding)
+        *similarities* is an optional ``(len(query_task_types), n)`` matrix of
+        per-query vector-search scores; by default every query uses
+        ``batch.similarity``.  Query-independent signals are computed once and
+        the combined scores for all queries in one broadcast.
+        """
+        n_queries = len(query_task_types)
+        if n_queries == 0:
+            return []
+        if len(batch) == 0:
+            empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64))
+            return [empty for _ in range(n_queries)]
+
+        if similarities is None:
+            sims = np.broadcast_to(batch.similarity, (n_queries, len(batch)))
+        else:
+            sims = np.asarray(similarities, dtype=np.float64).reshape(n_queries, len(batch))
+
+        base = (
+            self.recency_weight * self._recency_vector(batch.created_at)
+            + self.success_weight * batch.success
+            + (1.0 - self.diversity_weight) * 0.4 * batch.success
+        )
+        task_match = _task_match_matrix(batch.task_types, query_task_types)
+        match_weight = (1.0 - self.diversity_weight) * 0.6
+        combined = self.similarity_weight * sims + base + match_weight * task_match
+        top_k = max(1, top_k)
+        return [self._mmr(row, batch.embeddings, top_k) for row in combined]
 
-        # Re-sort after diversity adjustment
-        selected.sort(key=lambda m: m.combined_score, reverse=True)
-        return selected
+    def _mmr(
+        self, combined: ScoreArray, embeddings: FloatArray, top_k: int
+    ) -> tuple[np.ndarray[Any, np.dtype[np.intp]], ScoreArray]:
+        """Greedy MMR over *combined* with an incrementally maintained max-similarity vector.
 
-    def _compute_value(self, memory: dict[str, Any], query_task_type: str) -> float:
-        """Heuristic value function estimating downstream utility.
+        Each step picks the highest ``combined - diversity_weight * max_sim``
+        among unselected rows (ties go to the lower index), then folds that
+        row's cosine similarities into ``max_sim`` with one matrix-vector
+        product.
+        """
+        k = min(top_k, combined.shape[0])
+        adjusted = combined.copy()
+        max_sim = np.zeros(combined.shape[0], dtype=np.float64)
+        chosen = np.empty(k, dtype=np.intp)
+        scores = np.empty(k, dtype=np.float64)
+        for step in range(k):
+            idx = int(np.argmax(adjusted))
+            chosen[step] = idx
+            scores[step] = adjusted[idx]
+            adjusted[idx] = -np.inf
+            if step + 1 < k and embeddings.shape[1] and embeddings[idx].any():
+                sims = np.clip(embeddings @ embeddings[idx], 0.0, 1.0)
+                grown = np.maximum(max_sim, sims)
+                adjusted -= self.diversity_weight * (grown - max_sim)
+                max_sim = grown
+        order = np.argsort(-scores, kind="stable")
+        return chosen[order], scores[order]
+
+    def _value_vector(self, batch: CandidateBatch, query_task_type: str) -> ScoreArray:
+        """Heuristic value function estimating downstream utility, per row.
 
         Combines task-type relevance and success history into a [0, 1] score.
-        Designed to be replaced by a learned value function once reward signals
-        are available.
+        Designed to be replaced by a learned value function once reward
+        signals are available.
         """
-        metadata = dict(memory.get("metadata", {}))
-
-        # Task-type match bonus
-        mem_task_type = str(metadata.get("task_type", "")).strip().lower()
-        query_lower = query_task_type.strip().lower()
-        task_match = 1.0 if mem_task_type and mem_task_type == query_lower else 0.0
-
-        # Partial match: check if either contains the other
-        if (
-            not task_match
-            and mem_task_type
-            and query_lower
-            and (mem_task_type in query_lower or query_lower in mem_task_type)
-        ):
-            task_match = 0.5
-
-        # Success signal
-        success = self._success_score(metadata)
-
-        # Weighted combination — task match is primary
-        return 0.6 * task_match + 0.4 * success
-
-    def _recency_score(self, created_at: Any) -> float:
-        """Exponential decay based on age.  Returns [0, 1]."""
-        if created_at is None:
-            return 0.5  # unknown age gets neutral score
-        try:
-            age_seconds = max(0.0, time.time() - float(created_at))
-        except (TypeError, ValueError):
-            return 0.5
+        task_match = _task_match_matrix(batch.task_types, [query_task_type])[0]
+        value: ScoreArray = 0.6 * task_match + 0.4 * batch.success
+        return value
+
+    def _recency_vector(self, created_at: ScoreArray) -> ScoreArray:
+        """Exponential decay based on age, in [0, 1]; NaN (unknown) ages score 0.5."""
         halflife_seconds = self.recency_halflife_days * 86400.0
-        return math.exp(-0.693 * age_seconds / halflife_seconds)
+        age = np.maximum(0.0, time.time() - created_at)
+        scores = np.exp(-0.693 * age / halflife_seconds)
+        recency: ScoreArray = np.where(np.isnan(created_at), 0.5, scores)
+        return recency
+
+
+def _success_value(metadata: dict[str, Any]) -> float:
+    success = metadata.get("success")
+    if success is None:
+        return 0.5  # unknown
+    if isinstance(success, bool):
+        return 1.0 if success else 0.0
+    try:
+        return max(0.0, min(1.0, float(success)))
+    except (TypeError, ValueError):
+        return 0.5
+
+
+def _timestamp_or_nan(created_at: Any) -> float:
+    if created_at is None:
+        return math.nan
+    try:
+        return float(created_at)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _task_match(mem_task_type: str, query_lower: str) -> float:
+    """1.0 for an exact task-type match, 0.5 when one contains the other."""
+    if not mem_task_type:
+        return 0.0
+    if mem_task_type == query_lower:
+        return 1.0
+    if query_lower and (mem_task_type in query_lower or query_lower in mem_task_type):
+        return 0.5
+    return 0.0
 
-    def _diversity_penalty(self, embedding: list[float], selected: list[list[float]]) -> float:
-        """Max cosine similarity to already-selected embeddings.
 
-        Returns a value in [0, 1] where higher means more redundant.
-        """
-        if not selected or not embedding:
-            return 0.0
-
-        max_sim = 0.0
-        for sel in selected:
-            sim = _cosine_sim(embedding, sel)
-            if sim > max_sim:
-                max_sim = sim
-        return max(0.0, min(1.0, max_sim))
-
-    def _success_score(self, metadata: dict[str, Any]) -> float:
-        """Score based on historical success.  Returns [0, 1]."""
-        success = metadata.get("success")
-        if success is None:
-            return 0.5  # unknown
-        if isinstance(success, bool):
-            return 1.0 if success else 0.0
-        try:
-            return max(0.0, min(1.0, float(success)))
-        except (TypeError, ValueError):
-            return 0.5
-
-
-def _extract_embedding(candidate: dict[str, Any] | None) -> list[float]:
-    """Extract embedding from a candidate dict, returning [] if absent."""
-    if candidate is None:
-        return []
-    raw = candidate.get("embedding")
-    if isinstance(raw, list):
-        return [float(v) for v in raw]
-    return []
-
-
-def _cosine_sim(a: list[float], b: list[float]) -> float:
-    """Cosine similarity between two float lists."""
-    if len(a) != len(b) or not a:
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b, strict=False))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a < 1e-9 or norm_b < 1e-9:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _task_match_matrix(task_types: Sequence[str], queries: Sequence[str]) -> ScoreArray:
+    """``(len(queries), len(task_types))`` task-match scores.
+
+    Only distinct task types are compared in Python; rows are then gathered
+    with an index array.
+    """
+    unique, inverse = np.unique(np.asarray(task_types, dtype=object), return_inverse=True)
+    table = np.array(
+        [[_task_match(str(t), q.strip().lower()) for t in unique] for q in queries],
+        dtype=np.float64,
+    ).reshape(len(queries), len(unique))
+    return table[:, inverse.reshape(-1)]
+
+
+def _embedding_array(raw: Any) -> FloatArray:
+    if isinstance(raw, np.ndarray | list | tuple):
+        return np.asarray(raw, dtype=np.float32).reshape(-1)
+    return np.empty(0, dtype=np.float32)
 
 
 __all__ = [
+    "CandidateBatch",
     "QRAGRetriever",
     "ScoredMemory",
 ]
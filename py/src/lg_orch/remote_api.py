@@ -20,6 +20,7 @@ All heavy logic lives in ``lg_orch.api.*``.  This module:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import subprocess
@@ -36,8 +37,18 @@ from lg_orch.api.admin import register_admin_routes
 from lg_orch.api.approvals import (
     approval_token_for_challenge as _approval_token_for_challenge,
 )
-from lg_orch.api.metrics import LULA_RUNS_TOTAL  # noqa: F401
+from lg_orch.api.async_server import (
+    AsyncRemoteAPIServer,
+    HTTPRequest,
+    HTTPResponse,
+    ServerLimits,
+)
+from lg_orch.api.metrics import (
+    LULA_HTTP_REQUESTS_IN_FLIGHT,
+    LULA_RUNS_TOTAL,  # noqa: F401
+)
 from lg_orch.api.metrics import handle_metrics as _handle_metrics
+from lg_orch.api.run_pool import RunWorkerPool
 from lg_orch.api.service import (  # noqa: F401
     RemoteAPIService,
     RunRecord,
@@ -70,6 +81,7 @@ from lg_orch.auth import (
     jwt_settings_from_config,
 )
 from lg_orch.rate_limit import RateLimiter as _PerClientRateLimiter
+from lg_orch.run_store import RUN_SUMMARY_FIELDS, utc_run_timestamp
 
 _JSON_CONTENT_TYPE = "application/json; charset=utf-8"
 _REQUEST_ID_HEADER = "X-Request-ID"
@@ -288,6 +300,66 @@ def _hdl_healthz(
     return _json_response(200, {"ok": True})
 
 
+_RUNS_PAGE_DEFAULT = 100
+_RUNS_PAGE_MAX = 1000
+
+
+def _query_list(qs: dict[str, list[str]], name: str) -> list[str] | None:
+    """Comma-separated and repeated values of *name*, or ``None`` when absent."""
+    if name not in qs:
+        return None
+    return [part.strip() for value in qs[name] for part in value.split(",") if part.strip()]
+
+
+def _list_runs_response(service: RemoteAPIService, request_path: str) -> tuple[int, str, bytes]:
+    """``GET /v1/runs``: runs newest first, one keyset page at a time.
+
+    Query parameters: ``limit`` (default 100, at most 1000), ``cursor`` (the
+    ``next_cursor`` of the previous page), ``status`` (comma-separated),
+    ``created_after`` / ``created_before`` (ISO-8601, half-open range, naive
+    means UTC) and ``fields`` (comma-separated columns; ``final`` only when
+    asked for).  Without ``limit`` and ``cursor`` every matching run is
+    returned, as before paging, with ``next_cursor`` null.
+    """
+    qs = parse_qs(urlsplit(request_path).query, keep_blank_values=False)
+
+    def first(name: str) -> str | None:
+        values = qs.get(name)
+        return (values[0].strip() or None) if values else None
+
+    try:
+        limit = max(1, min(_RUNS_PAGE_MAX, int(first("limit") or _RUNS_PAGE_DEFAULT)))
+    except ValueError:
+        return _json_response(400, {"error": "invalid_limit"})
+    bounds: dict[str, str | None] = {}
+    for name in ("created_after", "created_before"):
+        value = first(name)
+        try:
+            bounds[name] = utc_run_timestamp(value) if value is not None else None
+        except ValueError:
+            return _json_response(400, {"error": f"invalid_{name}"})
+    cursor = first("cursor")
+    unpaged = first("limit") is None and cursor is None
+    runs: list[dict[str, Any]] = []
+    try:
+        while True:
+            page = service.list_runs_page(
+                limit=_RUNS_PAGE_MAX if unpaged else limit,
+                cursor=cursor,
+                status=_query_list(qs, "status"),
+                created_after=bounds["created_after"],
+                created_before=bounds["created_before"],
+                fields=_query_list(qs, "fields"),
+            )
+            runs.extend(page.runs)
+            cursor = page.next_cursor
+            if not unpaged or cursor is None:
+                break
+    except ValueError as exc:
+        return _json_response(400, {"error": str(exc)})
+    return _json_response(200, {"runs": runs, "next_cursor": cursor})
+
+
 def _hdl_v1_runs(
     service: RemoteAPIService,
     method: str,
@@ -299,7 +371,7 @@ def _hdl_v1_runs(
     client_ip: str,
 ) -> tuple[int, str, bytes]:
     if method == "GET":
-        return _json_response(200, {"runs": service.list_runs()})
+        return _list_runs_response(service, request_path)
     if method != "POST":
         return _json_response(405, {"error": "method_not_allowed"})
     try:
@@ -337,7 +409,7 @@ def _hdl_runs_list(
 ) -> tuple[int, str, bytes]:
     if method != "GET":
         return _json_response(405, {"error": "method_not_allowed"})
-    return _json_response(200, {"runs": service.list_runs()})
+    return _list_runs_response(service, request_path)
 
 
 def _hdl_runs_search(
@@ -362,7 +434,12 @@ def _hdl_runs_search(
         limit = max(1, min(200, int(limit_raw)))
     except ValueError:
         limit = 50
-    results = service.search_runs(q, limit=limit)
+    try:
+        results = service.search_runs(
+            q, limit=limit, fields=_query_list(qs, "fields") or RUN_SUMMARY_FIELDS
+        )
+    except ValueError as exc:
+        return _json_response(400, {"error": str(exc)})
     return _json_response(200, {"results": results, "total": len(results)})
 
 
@@ -891,17 +968,90 @@ def serve_remote_api(*, repo_root: Path, host: str, port: int) -> int:
     procedure_cache: ProcedureCache | None = None
     if remote_api_cfg.procedure_cache_path:
         procedure_cache = ProcedureCache(db_path=Path(remote_api_cfg.procedure_cache_path))
+    run_pool: RunWorkerPool | None = None
+    if remote_api_cfg.run_pool_size > 0:
+        run_pool = RunWorkerPool(
+            size=remote_api_cfg.run_pool_size,
+            max_runs_per_worker=remote_api_cfg.run_pool_max_runs,
+            max_rss_mb=remote_api_cfg.run_pool_max_rss_mb,
+        )
     service = RemoteAPIService(
         repo_root=repo_root,
         run_store=run_store,
         rate_limiter=rate_limiter,
         procedure_cache=procedure_cache,
         namespace=_namespace,
+        run_pool=run_pool,
     )
     _jwt_settings = jwt_settings_from_config(
         jwt_secret=remote_api_cfg.jwt_secret, jwks_url=remote_api_cfg.jwks_url
     )
 
+    def _dispatch(
+        *,
+        method: str,
+        request_path: str,
+        get_header: Callable[[str], str | None],
+        read_body: Callable[[], bytes | None],
+        client_address: tuple[str, int] | None,
+    ) -> tuple[int, str, bytes, str]:
+        """Authenticate, route and access-log one request for either server mode.
+
+        Returns ``(status, content_type, body, request_id)``; SSE responses
+        keep the ``-1``/``-2`` sentinel statuses and are not access-logged.
+        """
+        request_id = _request_id_from_value(get_header(_REQUEST_ID_HEADER))
+        route = urlsplit(request_path).path.rstrip("/") or "/"
+        client_ip = _request_client_ip(
+            client_address=client_address,
+            forwarded_for=_non_empty_str(get_header("X-Forwarded-For")),
+            trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
+        )
+        scheme = _request_scheme(
+            forwarded_proto=_non_empty_str(get_header("X-Forwarded-Proto")),
+            trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
+        )
+        started_at = time.perf_counter()
+        try:
+            status, content_type, body = _api_http_response(
+                service,
+                method=method,
+                request_path=request_path,
+                request_body=read_body(),
+                request_id=request_id,
+                client_ip=client_ip,
+                auth_mode=remote_api_cfg.auth_mode,
+                expected_bearer_token=remote_api_cfg.bearer_token,
+                authorization_header=get_header("Authorization"),
+                allow_unauthenticated_healthz=remote_api_cfg.allow_unauthenticated_healthz,
+                jwt_settings=_jwt_settings,
+            )
+        except Exception as exc:
+            log.error(
+                "remote_api_request_failed",
+                request_id=request_id,
+                method=method,
+                route=route,
+                client_ip=client_ip,
+                error=str(exc),
+            )
+            status, content_type, body = _json_response(500, {"error": "internal_server_error"})
+
+        if status >= 0 and remote_api_cfg.access_log_enabled:
+            duration_ms = int((time.perf_counter() - started_at) * 1000)
+            log.info(
+                "remote_api_access",
+                request_id=request_id,
+                method=method,
+                route=route,
+                status=status,
+                duration_ms=duration_ms,
+                client_ip=client_ip,
+                scheme=scheme,
+                authenticated=bool(status < 400 and remote_api_cfg.auth_mode != "off"),
+            )
+        return status, content_type, body, request_id
+
     class RemoteAPIRequestHandler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:
             self._handle_request(method="GET")
@@ -909,48 +1059,28 @@ def serve_remote_api(*, repo_root: Path, host: str, port: int) -> int:
         def do_POST(self) -> None:
             self._handle_request(method="POST")
 
-        def _handle_request(self, *, method: str) -> None:
-            request_id = _request_id_from_value(self.headers.get(_REQUEST_ID_HEADER))
-            route = urlsplit(self.path).path.rstrip("/") or "/"
-            client_ip = _request_client_ip(
-                client_address=self.client_address,
-                forwarded_for=_non_empty_str(self.headers.get("X-Forwarded-For")),
-                trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
-            )
-            scheme = _request_scheme(
-                forwarded_proto=_non_empty_str(self.headers.get("X-Forwarded-Proto")),
-                trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
-            )
-            started_at = time.perf_counter()
+        def _read_body(self) -> bytes | None:
             try:
                 content_length = int(self.headers.get("Content-Length", "0"))
             except ValueError:
                 content_length = 0
+            return self.rfile.read(content_length) if content_length > 0 else None
+
+        def _handle_request(self, *, method: str) -> None:
+            LULA_HTTP_REQUESTS_IN_FLIGHT.inc()
             try:
-                request_body = self.rfile.read(content_length) if content_length > 0 else None
-                status, content_type, body = _api_http_response(
-                    service,
-                    method=method,
-                    request_path=self.path,
-                    request_body=request_body,
-                    request_id=request_id,
-                    client_ip=client_ip,
-                    auth_mode=remote_api_cfg.auth_mode,
-                    expected_bearer_token=remote_api_cfg.bearer_token,
-                    authorization_header=self.headers.get("Authorization"),
-                    allow_unauthenticated_healthz=remote_api_cfg.allow_unauthenticated_healthz,
-                    jwt_settings=_jwt_settings,
-                )
-            except Exception as exc:
-                log.error(
-                    "remote_api_request_failed",
-                    request_id=request_id,
-                    method=method,
-                    route=route,
-                    client_ip=client_ip,
-                    error=str(exc),
-                )
-                status, content_type, body = _json_response(500, {"error": "internal_server_error"})
+                self._respond(method=method)
+            finally:
+                LULA_HTTP_REQUESTS_IN_FLIGHT.dec()
+
+        def _respond(self, *, method: str) -> None:
+            status, content_type, body, request_id = _dispatch(
+                method=method,
+                request_path=self.path,
+                get_header=self.headers.get,
+                read_body=self._read_body,
+                client_address=self.client_address,
+            )
 
             if status == -1 and content_type == "sse":
                 sse_run_id = body.decode("utf-8")
@@ -982,46 +1112,74 @@ def serve_remote_api(*, repo_root: Path, host: str, port: int) -> int:
             self.send_header("Cache-Control", "no-store")
             self.end_headers()
             self.wfile.write(body)
-            if remote_api_cfg.access_log_enabled:
-                duration_ms = int((time.perf_counter() - started_at) * 1000)
-                log.info(
-                    "remote_api_access",
-                    request_id=request_id,
-                    method=method,
-                    route=route,
-                    status=status,
-                    duration_ms=duration_ms,
-                    client_ip=client_ip,
-                    scheme=scheme,
-                    authenticated=bool(status < 400 and remote_api_cfg.auth_mode != "off"),
-                )
 
         def log_message(self, format: str, *args: object) -> None:
             return
 
+    def _handle_async_request(request: HTTPRequest) -> HTTPResponse:
+        status, content_type, body, request_id = _dispatch(
+            method=request.method,
+            request_path=request.target,
+            get_header=lambda name: request.headers.get(name.lower()),
+            read_body=lambda: request.body,
+            client_address=request.client_address,
+        )
+        return HTTPResponse(
+            status=status,
+            content_type=content_type,
+            body=body,
+            headers=[(_REQUEST_ID_HEADER, request_id)],
+        )
+
+    def _log_listening() -> None:
+        log.info(
+            "remote_api_listening",
+            host=host,
+            port=port,
+            repo_root=str(repo_root),
+            auth_mode=remote_api_cfg.auth_mode,
+            trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
+            server_mode=remote_api_cfg.server_mode,
+        )
+        print(f"Remote API listening on http://{host}:{port}")
+
+    async def _serve_asyncio() -> None:
+        server = AsyncRemoteAPIServer(
+            service,
+            _handle_async_request,
+            limits=ServerLimits(
+                max_connections=remote_api_cfg.max_connections,
+                max_sse_subscribers=remote_api_cfg.max_sse_subscribers,
+                worker_threads=remote_api_cfg.worker_threads,
+            ),
+        )
+        await server.start(host, port)
+        _log_listening()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
     global _audit_logger
     audit_cfg = cfg.audit
     _audit_sink = build_sink(audit_cfg)
     _audit_logger = AuditLogger(log_path=Path(audit_cfg.log_path), sink=_audit_sink)
 
     try:
-        with ThreadingHTTPServer((host, port), RemoteAPIRequestHandler) as server:
-            log.info(
-                "remote_api_listening",
-                host=host,
-                port=port,
-                repo_root=str(repo_root),
-                auth_mode=remote_api_cfg.auth_mode,
-                trust_forwarded_headers=remote_api_cfg.trust_forwarded_headers,
-            )
-            print(f"Remote API listening on http://{host}:{port}")
-            server.serve_forever()
+        if remote_api_cfg.server_mode == "asyncio":
+            asyncio.run(_serve_asyncio())
+        else:
+            with ThreadingHTTPServer((host, port), RemoteAPIRequestHandler) as server:
+                _log_listening()
+                server.serve_forever()
     except OSError as exc:
         log.error("remote_api_bind_failed", host=host, port=port, error=str(exc))
         return 2
     except KeyboardInterrupt:
         return 0
     finally:
+        if run_pool is not None:
+            run_pool.close()
         if _audit_logger is not None:
             _audit_logger.close()
             _audit_logger = None
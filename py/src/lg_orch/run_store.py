@@ -2,16 +2,21 @@
 # Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
 from __future__ import annotations
 
+import base64
 import contextlib
 import json
 import logging
 import os
+import re
 import sqlite3
 import threading
 import time
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
+
+from lg_orch.sqlite_registry import ensure_initialised, read_only_connection
 
 _log = logging.getLogger(__name__)
 
@@ -36,6 +41,10 @@ _COLUMNS = (
     "final",
 )
 
+# Columns a run listing returns unless asked for others; ``final`` can hold
+# a whole report.
+RUN_SUMMARY_FIELDS = tuple(c for c in _COLUMNS if c != "final")
+
 _CREATE_TABLE = """\
 CREATE TABLE IF NOT EXISTS runs (
     run_id       TEXT PRIMARY KEY,
@@ -78,6 +87,13 @@ CREATE TABLE IF NOT EXISTS recovery_facts (
 """
 
 _CREATE_INDEX_RUNS_NAMESPACE = "CREATE INDEX IF NOT EXISTS idx_runs_namespace ON runs(namespace)"
+_CREATE_INDEX_RUNS_PAGE = (
+    "CREATE INDEX IF NOT EXISTS idx_runs_page ON runs(namespace, created_at DESC, run_id DESC)"
+)
+_CREATE_INDEX_RUNS_STATUS_PAGE = (
+    "CREATE INDEX IF NOT EXISTS idx_runs_status_page "
+    "ON runs(namespace, status, created_at DESC, run_id DESC)"
+)
 _CREATE_INDEX_RECOVERY_FACTS_NAMESPACE = (
     "CREATE INDEX IF NOT EXISTS idx_recovery_facts_namespace ON recovery_facts(namespace)"
 )
@@ -159,6 +175,84 @@ _RECOVERY_FACT_COLUMNS = (
 )
 
 
+# ---------------------------------------------------------------------------
+# Paged listing, shared by both stores
+# ---------------------------------------------------------------------------
+
+
+class RunPage(NamedTuple):
+    runs: list[dict[str, Any]]
+    # Pass back to fetch the following page; None after the last one.
+    next_cursor: str | None
+
+
+def encode_run_cursor(created_at: str, run_id: str) -> str:
+    """Opaque keyset cursor naming the last run of a page."""
+    raw = json.dumps([created_at, run_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_run_cursor(cursor: str) -> tuple[str, str]:
+    """``(created_at, run_id)`` of *cursor*; ``ValueError("invalid_cursor")`` if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, run_id = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("invalid_cursor") from None
+    if not isinstance(created_at, str) or not isinstance(run_id, str):
+        raise ValueError("invalid_cursor")
+    return created_at, run_id
+
+
+def _parse_utc(value: Any) -> datetime:
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def utc_run_timestamp(value: str) -> str:
+    """*value* (ISO-8601, naive read as UTC) in the UTC ``...Z`` form of ``created_at``.
+
+    Microseconds are always written so that bounds compare with stored
+    ``created_at`` strings in time order.  Raises ``ValueError`` when *value*
+    does not parse.
+    """
+    parsed = _parse_utc(value).astimezone(UTC)
+    return parsed.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+def page_fields(fields: Iterable[str] | None) -> tuple[str, ...]:
+    """Columns to return for *fields*: the summary by default, always with the keyset.
+
+    Raises ``ValueError("invalid_fields")`` for names that are not run columns.
+    """
+    if fields is None:
+        return RUN_SUMMARY_FIELDS
+    wanted = [f for f in dict.fromkeys(fields) if f]
+    if any(f not in _COLUMNS for f in wanted):
+        raise ValueError("invalid_fields")
+    return tuple(dict.fromkeys(["run_id", "created_at", *wanted]))
+
+
+def _statuses(status: str | Iterable[str] | None) -> tuple[str, ...]:
+    if status is None:
+        return ()
+    if isinstance(status, str):
+        return (status,)
+    return tuple(dict.fromkeys(status))
+
+
+def _run_sort_key(run: dict[str, Any]) -> tuple[str, str]:
+    return str(run.get("created_at") or ""), str(run.get("run_id") or "")
+
+
+def to_page(rows: list[dict[str, Any]], limit: int) -> RunPage:
+    """Cut *rows*, fetched ``limit + 1`` deep in page order, into a :class:`RunPage`."""
+    if len(rows) <= limit:
+        return RunPage(rows, None)
+    rows = rows[:limit]
+    return RunPage(rows, encode_run_cursor(*_run_sort_key(rows[-1])))
+
+
 class RunStore:
     def __init__(self, *, db_path: Path, namespace: str = "") -> None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -174,6 +268,7 @@ class RunStore:
         self._namespace = namespace.strip()
         self._fts_enabled = False
         self._runs_fts_enabled = False
+        self._shared = False
         with self._lock:
             self._conn.execute(_CREATE_TABLE)
             self._conn.execute(_CREATE_RECOVERY_FACTS_TABLE)
@@ -186,7 +281,33 @@ class RunStore:
         self._ensure_semantic_fts()
         self._ensure_runs_fts()
 
+    @classmethod
+    def open_reader(cls, *, db_path: Path, namespace: str = "") -> RunStore:
+        """Return a lookup-only store on the process-wide read-only connection.
+
+        The schema and migrations run once per process per path; later calls
+        only wrap the shared connection.  Writes through a reader fail, and
+        :meth:`close` leaves the shared connection open.
+        """
+        ensure_initialised(db_path, "run_store", lambda: cls(db_path=db_path).close())
+        shared = read_only_connection(db_path)
+        store = cls.__new__(cls)
+        store._conn = shared.conn
+        store._lock = shared.lock
+        store._namespace = namespace.strip()
+        store._fts_enabled = shared.has_table("semantic_memories_fts")
+        store._runs_fts_enabled = shared.has_table("runs_fts")
+        store._shared = True
+        return store
+
     def _migrate(self) -> None:
+        self._migrate_columns()
+        with self._lock:
+            self._conn.execute(_CREATE_INDEX_RUNS_PAGE)
+            self._conn.execute(_CREATE_INDEX_RUNS_STATUS_PAGE)
+            self._conn.commit()
+
+    def _migrate_columns(self) -> None:
         run_columns = (
             ("namespace", "TEXT NOT NULL DEFAULT ''"),
             ("thread_id", "TEXT NOT NULL DEFAULT ''"),
@@ -256,6 +377,7 @@ class RunStore:
         query: str,
         limit: int = 50,
         namespace: str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search runs using FTS5 full-text search (BM25 ranking).
 
@@ -271,17 +393,22 @@ class RunStore:
         namespace:
             Optional namespace override. Defaults to the store's configured
             namespace when ``None``.
+        fields:
+            Columns to return (see :func:`page_fields`); every column when
+            ``None``.
         """
         ns = namespace if namespace is not None else self._namespace
         query_text = query.strip()
         if not query_text:
             return []
         limit = max(1, limit)
+        columns = page_fields(fields) if fields is not None else _COLUMNS
         if self._runs_fts_enabled:
+            select = ", ".join(f"r.{c}" for c in columns)
             try:
                 with self._lock:
                     cursor = self._conn.execute(
-                        "SELECT r.* FROM runs_fts "
+                        f"SELECT {select} FROM runs_fts "
                         "JOIN runs r ON r.rowid = runs_fts.rowid "
                         "WHERE runs_fts MATCH ? AND r.namespace = ? "
                         "ORDER BY rank LIMIT ?",
@@ -298,7 +425,7 @@ class RunStore:
         like = f"%{query_text}%"
         with self._lock:
             cursor = self._conn.execute(
-                "SELECT * FROM runs WHERE namespace = ? "
+                f"SELECT {', '.join(columns)} FROM runs WHERE namespace = ? "
                 "AND (run_id LIKE ? OR request LIKE ? OR status LIKE ? "
                 "OR pending_approval_summary LIKE ?) "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -336,6 +463,65 @@ class RunStore:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_runs_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        namespace: str | None = None,
+        status: str | Iterable[str] | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> RunPage:
+        """Return one page of runs, ordered by ``(created_at, run_id)`` DESC.
+
+        Parameters
+        ----------
+        limit:
+            Maximum number of runs in the page.
+        cursor:
+            ``next_cursor`` of the previous page, or ``None`` for the first.
+            Keyset-based, so runs added meanwhile never shift later pages.
+        namespace:
+            Optional namespace override. Defaults to the store's configured
+            namespace when ``None``.
+        status:
+            Only runs with this status, or any of these statuses.
+        created_after, created_before:
+            Only runs with ``created_after <= created_at < created_before``,
+            as ISO-8601 UTC timestamps like the ones the service writes.
+        fields:
+            Columns to return (see :func:`page_fields`); the summary
+            columns, without ``final``, when ``None``.
+        """
+        ns = namespace if namespace is not None else self._namespace
+        limit = max(1, limit)
+        columns = page_fields(fields)
+        where = ["namespace = ?"]
+        params: list[Any] = [ns]
+        statuses = _statuses(status)
+        if statuses:
+            where.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if created_after is not None:
+            where.append("created_at >= ?")
+            params.append(created_after)
+        if created_before is not None:
+            where.append("created_at < ?")
+            params.append(created_before)
+        if cursor:
+            where.append("(created_at, run_id) < (?, ?)")
+            params.extend(decode_run_cursor(cursor))
+        sql = (
+            f"SELECT {', '.join(columns)} FROM runs WHERE {' AND '.join(where)} "
+            "ORDER BY created_at DESC, run_id DESC LIMIT ?"
+        )
+        params.append(limit + 1)
+        with self._lock:
+            rows = [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+        return to_page(rows, limit)
+
     def get_run(self, run_id: str, namespace: str | None = None) -> dict[str, Any] | None:
         """Fetch a single run by ID within a namespace.
 
@@ -532,6 +718,8 @@ class RunStore:
             return [dict(row) for row in cursor.fetchall()]
 
     def close(self) -> None:
+        if self._shared:
+            return
         with self._lock:
             self._conn.close()
 
@@ -546,7 +734,29 @@ _RECOVERY_KEY_PREFIX = "lula:recovery:"
 _RECOVERY_INDEX_KEY = "lula:recovery:index"
 _SEMANTIC_KEY_PREFIX = "lula:semantic:"
 _SEMANTIC_INDEX_KEY = "lula:semantic:index"
+_SEARCH_KEY_PREFIX = "lula:runsearch:"
+_SEARCH_INDEX_NAME = "lula:runs:ft"
 _DEFAULT_TTL_SECONDS = 86400  # 24 hours
+# Index members fetched per MGET when scanning.
+_SCAN_BATCH = 500
+_SEARCH_FIELDS = ("run_id", "request", "status", "pending_approval_summary")
+
+
+def _score(created_at: Any) -> float:
+    try:
+        return _parse_utc(created_at).timestamp()
+    except (ValueError, TypeError):
+        return time.time()
+
+
+def _ft_query(query_text: str) -> str:
+    """RediSearch query matching every word of *query_text* as a prefix.
+
+    Words are split the way RediSearch tokenises, so no query syntax gets
+    through; single characters are dropped (RediSearch needs two for a
+    prefix).  Empty when nothing is left to search for.
+    """
+    return " ".join(f"{word}*" for word in re.split(r"\W+", query_text) if len(word) >= 2)
 
 
 class RedisRunStore:
@@ -558,6 +768,15 @@ class RedisRunStore:
 
     Falls back to in-memory storage if Redis is unavailable at construction
     time (see :func:`create_run_store`).
+
+    Writes go out as one pipeline per call and reads fetch run bodies with
+    ``MGET``.  :meth:`search_runs` scans for substrings unless
+    *search_index* is true.  It then uses RediSearch when the server has the
+    search module.  The index matches words by prefix, so infix queries
+    (``"uth"`` for ``"auth"``) find nothing, which is why it is opt-in.  With
+    the index each run also keeps a small hash of its searchable fields; the
+    replica that creates the index backfills hashes for the runs already
+    stored.
     """
 
     def __init__(
@@ -568,11 +787,15 @@ class RedisRunStore:
         connect_timeout: float = 5.0,
         socket_timeout: float = 10.0,
         ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        search_index: bool = False,
     ) -> None:
         import redis as redis_lib
 
         self._namespace = namespace.strip()
         self._ttl = ttl_seconds
+        # None: requested but not yet probed.
+        self._search_index: bool | None = None if search_index else False
+        self._search_ready: set[str] = set()
         self._client: Any = redis_lib.from_url(
             redis_url,
             socket_connect_timeout=connect_timeout,
@@ -608,6 +831,81 @@ class RedisRunStore:
     # Runs
     # ------------------------------------------------------------------
 
+    def _search_key(self, run_id: str, namespace: str | None = None) -> str:
+        ns = namespace if namespace is not None else self._namespace
+        return f"{_SEARCH_KEY_PREFIX}{ns}:{run_id}"
+
+    def _search_index_name(self, namespace: str | None = None) -> str:
+        ns = namespace if namespace is not None else self._namespace
+        return f"{_SEARCH_INDEX_NAME}:{ns}"
+
+    # ------------------------------------------------------------------
+    # Search index (RediSearch, optional)
+    # ------------------------------------------------------------------
+
+    def _search_enabled(self) -> bool:
+        """Whether the RediSearch path is on, probing the server once."""
+        if self._search_index is None:
+            try:
+                self._client.execute_command("FT._LIST")
+            except Exception:
+                self._search_index = False
+                _log.info("run_store_search_index=unavailable")
+            else:
+                self._search_index = True
+        return bool(self._search_index)
+
+    def _write_search_hash(self, pipe: Any, data: dict[str, Any], score: float) -> None:
+        search_key = self._search_key(str(data["run_id"]))
+        fields: dict[str, Any] = {f: str(data.get(f) or "") for f in _SEARCH_FIELDS}
+        pipe.hset(search_key, mapping={**fields, "created": score})
+        pipe.expire(search_key, self._ttl)
+
+    def _ensure_search_index(self) -> None:
+        """Create this namespace's index once, backfilling existing runs."""
+        import redis as redis_lib
+
+        name = self._search_index_name()
+        if name in self._search_ready:
+            return
+        try:
+            self._client.execute_command("FT.INFO", name)
+        except redis_lib.ResponseError:
+            try:
+                self._client.execute_command(
+                    "FT.CREATE", name,
+                    "ON", "HASH",
+                    "PREFIX", "1", self._search_key(""),
+                    "STOPWORDS", "0",
+                    "SCHEMA",
+                    "run_id", "TEXT",
+                    "request", "TEXT",
+                    "status", "TEXT",
+                    "pending_approval_summary", "TEXT",
+                    "created", "NUMERIC", "SORTABLE",
+                )  # fmt: skip
+            except redis_lib.ResponseError:
+                pass  # another replica created it first and backfills
+            else:
+                self._backfill_search_hashes()
+        self._search_ready.add(name)
+
+    def _backfill_search_hashes(self) -> None:
+        idx_key = self._run_index_key()
+        start = 0
+        while run_ids := self._client.zrevrange(idx_key, start, start + _SCAN_BATCH - 1):
+            runs = self._load_runs(self._namespace, run_ids)
+            start += len(runs)
+            pipe = self._client.pipeline(transaction=False)
+            for run in runs:
+                self._write_search_hash(pipe, run, _score(run.get("created_at")))
+            pipe.execute()
+        _log.info("run_store_search_index_backfilled runs=%d", start)
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
     def upsert(self, record: dict[str, Any]) -> None:
         data = {k: record[k] for k in _COLUMNS if k in record}
         data["namespace"] = self._namespace
@@ -616,15 +914,18 @@ class RedisRunStore:
         run_id = data.get("run_id", "")
         if not run_id:
             return
-        created_at = str(data.get("created_at", ""))
-        try:
-            score = datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
-        except (ValueError, TypeError):
-            score = time.time()
-        key = self._run_key(run_id)
-        self._client.setex(key, self._ttl, json.dumps(data, default=str))
-        self._client.zadd(self._run_index_key(), {run_id: score})
-        self._client.expire(self._run_index_key(), self._ttl)
+        score = _score(data.get("created_at", ""))
+        index_key = self._run_index_key()
+        pipe = self._client.pipeline(transaction=False)
+        pipe.set(self._run_key(run_id), json.dumps(data, default=str), ex=self._ttl)
+        pipe.zadd(index_key, {run_id: score})
+        pipe.expire(index_key, self._ttl)
+        search = self._search_enabled()
+        if search:
+            self._write_search_hash(pipe, data, score)
+        pipe.execute()
+        if search:
+            self._ensure_search_index()
 
     def get_run(self, run_id: str, namespace: str | None = None) -> dict[str, Any] | None:
         ns = namespace if namespace is not None else self._namespace
@@ -634,46 +935,175 @@ class RedisRunStore:
             return None
         return cast(dict[str, Any], json.loads(raw))
 
+    def _load_runs(self, ns: str, run_ids: list[str]) -> list[dict[str, Any]]:
+        """MGET *run_ids* in order; ids whose run has expired leave the index."""
+        if not run_ids:
+            return []
+        raws = self._client.mget([f"{_RUN_KEY_PREFIX}{ns}:{rid}" for rid in run_ids])
+        runs: list[dict[str, Any]] = []
+        stale: list[str] = []
+        for rid, raw in zip(run_ids, raws, strict=True):
+            if raw is None:
+                stale.append(rid)
+            else:
+                runs.append(json.loads(raw))
+        if stale:
+            self._client.zrem(f"{_RUN_INDEX_KEY}:{ns}", *stale)
+        return runs
+
     def list_runs(self, namespace: str | None = None) -> list[dict[str, Any]]:
         ns = namespace if namespace is not None else self._namespace
-        idx_key = f"{_RUN_INDEX_KEY}:{ns}"
-        run_ids: list[str] = self._client.zrevrange(idx_key, 0, -1)
+        run_ids: list[str] = self._client.zrevrange(f"{_RUN_INDEX_KEY}:{ns}", 0, -1)
         runs: list[dict[str, Any]] = []
-        for rid in run_ids:
-            raw = self._client.get(f"{_RUN_KEY_PREFIX}{ns}:{rid}")
-            if raw is not None:
-                runs.append(json.loads(raw))
+        for i in range(0, len(run_ids), _SCAN_BATCH):
+            runs.extend(self._load_runs(ns, run_ids[i : i + _SCAN_BATCH]))
         return runs
 
+    def list_runs_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        namespace: str | None = None,
+        status: str | Iterable[str] | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> RunPage:
+        """Return one page of runs, exactly as :meth:`RunStore.list_runs_page` does.
+
+        Order, cursors and filters are shared with the SQLite store.  The
+        cursor and the time range bound the read of the run index, whose
+        scores are the ``created_at`` timestamps.  Status is checked on the
+        loaded runs, so a page of a rare status may read far down the index.
+        """
+        ns = namespace if namespace is not None else self._namespace
+        limit = max(1, limit)
+        columns = page_fields(fields)
+        statuses = set(_statuses(status))
+        idx_key = f"{_RUN_INDEX_KEY}:{ns}"
+        low: float | str = "-inf"
+        if created_after is not None:
+            low = _parse_utc(created_after).timestamp()
+        high = _parse_utc(created_before).timestamp() if created_before is not None else None
+        after: tuple[float, str] | None = None
+        if cursor:
+            cursor_at, cursor_id = decode_run_cursor(cursor)
+            after = (_score(cursor_at), cursor_id)
+        rows: list[dict[str, Any]] = []
+        while len(rows) <= limit:
+            count = _SCAN_BATCH if statuses else limit + 1 - len(rows)
+            batch = self._index_after(idx_key, after, count, low=low, high=high)
+            if not batch:
+                break
+            loaded = {run["run_id"]: run for run in self._load_runs(ns, [rid for rid, _ in batch])}
+            for rid, _ in batch:
+                run = loaded.get(rid)
+                if run is not None and (not statuses or run.get("status") in statuses):
+                    rows.append({c: run.get(c) for c in columns})
+            after = (float(batch[-1][1]), batch[-1][0])
+            if len(batch) < count:
+                break
+        return to_page(rows[: limit + 1], limit)
+
+    def _index_after(
+        self,
+        idx_key: str,
+        after: tuple[float, str] | None,
+        count: int,
+        *,
+        low: float | str = "-inf",
+        high: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """The next *count* ``(run_id, score)`` index entries after *after*, newest first.
+
+        Entries are limited to ``low <= score < high``.
+        """
+        skip = 0
+        top: float | str = f"({high!r}" if high is not None else "+inf"
+        if after is not None and (high is None or after[0] < high):
+            score, run_id = after
+            top = score
+            # Members sharing a score come in reverse member order, so the
+            # ones at or before the cursor are exactly the ties >= its run_id.
+            ties: list[str] = self._client.zrevrangebyscore(idx_key, score, score)
+            skip = sum(1 for rid in ties if rid >= run_id)
+        return cast(
+            list[tuple[str, float]],
+            self._client.zrevrangebyscore(
+                idx_key, top, low, start=skip, num=count, withscores=True
+            ),
+        )
+
     def search_runs(
         self,
         query: str,
         limit: int = 50,
         namespace: str | None = None,
+        fields: Iterable[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Brute-force search over all runs (no FTS in Redis).
-
-        Scans the index and filters by substring match on run_id, request,
-        status, or pending_approval_summary.  Adequate for the typical
-        run-store size (hundreds, not millions).
+        """Substring search over run_id, request, status and approval summary.
+
+        With the opt-in RediSearch index (see the class docstring) each word
+        is a prefix query against the run's search hash, newest first, and
+        hits are checked against the substring rule.  Otherwise, or when the
+        search query fails, the index is scanned newest first in ``MGET``
+        batches until *limit* matches are found.  *fields* projects the results as
+        in :meth:`RunStore.search_runs`.
         """
         ns = namespace if namespace is not None else self._namespace
         query_text = query.strip().lower()
         if not query_text:
             return []
         limit = max(1, limit)
-        all_runs = self.list_runs(namespace=ns)
+        columns = page_fields(fields) if fields is not None else None
+        results: list[dict[str, Any]] | None = None
+        if self._search_enabled() and _ft_query(query_text):
+            try:
+                results = self._search_runs_ft(ns, query_text, limit)
+            except Exception as exc:
+                _log.warning("search_runs_ft_error query=%s error=%s", query_text, exc)
+        if results is None:
+            results = self._search_runs_scan(ns, query_text, limit)
+        if columns is None:
+            return results
+        return [{c: run.get(c) for c in columns} for run in results]
+
+    @staticmethod
+    def _matches(run: dict[str, Any], query_text: str) -> bool:
+        haystack = " ".join(str(run.get(f, "")) for f in _SEARCH_FIELDS).lower()
+        return query_text in haystack
+
+    def _search_runs_ft(self, ns: str, query_text: str, limit: int) -> list[dict[str, Any]]:
+        prefix = self._search_key("", ns)
         results: list[dict[str, Any]] = []
-        for run in all_runs:
-            haystack = " ".join(
-                str(run.get(f, ""))
-                for f in ("run_id", "request", "status", "pending_approval_summary")
-            ).lower()
-            if query_text in haystack:
-                results.append(run)
-                if len(results) >= limit:
-                    break
-        return results
+        offset = 0
+        while len(results) < limit:
+            reply = self._client.execute_command(
+                "FT.SEARCH", self._search_index_name(ns), _ft_query(query_text),
+                "NOCONTENT", "SORTBY", "created", "DESC", "LIMIT", str(offset), str(limit),
+            )  # fmt: skip
+            keys = reply[1:]
+            offset += len(keys)
+            run_ids = [str(key)[len(prefix) :] for key in keys]
+            results.extend(r for r in self._load_runs(ns, run_ids) if self._matches(r, query_text))
+            if offset >= int(reply[0]) or not keys:
+                break
+        return results[:limit]
+
+    def _search_runs_scan(self, ns: str, query_text: str, limit: int) -> list[dict[str, Any]]:
+        idx_key = f"{_RUN_INDEX_KEY}:{ns}"
+        results: list[dict[str, Any]] = []
+        start = 0
+        while len(results) < limit:
+            run_ids: list[str] = self._client.zrevrange(idx_key, start, start + _SCAN_BATCH - 1)
+            if not run_ids:
+                break
+            runs = self._load_runs(ns, run_ids)
+            # Expired ids just left the index, so the next batch starts sooner.
+            start += len(runs)
+            results.extend(run for run in runs if self._matches(run, query_text))
+        return results[:limit]
 
     # ------------------------------------------------------------------
     # Recovery facts
@@ -682,6 +1112,8 @@ class RedisRunStore:
     def upsert_recovery_facts(self, run_id: str, facts: list[dict[str, Any]]) -> None:
         now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
         idx_key = self._recovery_index_key()
+        pipe = self._client.pipeline(transaction=False)
+        members: dict[str, int] = {}
         for fact in facts:
             fingerprint = str(fact.get("failure_fingerprint", "")).strip()
             if not fingerprint:
@@ -710,9 +1142,13 @@ class RedisRunStore:
                 "namespace": self._namespace,
             }
             key = self._recovery_key(fingerprint, run_id)
-            self._client.setex(key, self._ttl, json.dumps(data, default=str))
-            self._client.zadd(idx_key, {f"{fingerprint}:{run_id}": salience})
-            self._client.expire(idx_key, self._ttl)
+            pipe.set(key, json.dumps(data, default=str), ex=self._ttl)
+            members[f"{fingerprint}:{run_id}"] = salience
+        if not members:
+            return
+        pipe.zadd(idx_key, members)
+        pipe.expire(idx_key, self._ttl)
+        pipe.execute()
 
     def get_recent_recovery_facts(
         self,
@@ -725,10 +1161,12 @@ class RedisRunStore:
         idx_key = self._recovery_index_key()
         members: list[str] = self._client.zrevrange(idx_key, 0, -1)
         all_facts: list[dict[str, Any]] = []
-        for member in members:
-            raw = self._client.get(f"{_RECOVERY_KEY_PREFIX}{self._namespace}:{member}")
-            if raw is not None:
-                all_facts.append(json.loads(raw))
+        for i in range(0, len(members), _SCAN_BATCH):
+            keys = [
+                f"{_RECOVERY_KEY_PREFIX}{self._namespace}:{member}"
+                for member in members[i : i + _SCAN_BATCH]
+            ]
+            all_facts.extend(json.loads(raw) for raw in self._client.mget(keys) if raw is not None)
 
         if fingerprint:
             matched = [f for f in all_facts if f.get("fingerprint") == fingerprint]
@@ -764,6 +1202,8 @@ class RedisRunStore:
     def upsert_semantic_memories(self, run_id: str, memories: list[dict[str, Any]]) -> None:
         now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
         idx_key = self._semantic_index_key()
+        pipe = self._client.pipeline(transaction=False)
+        members: dict[str, float] = {}
         for memory in memories:
             summary = str(memory.get("summary", "")).strip()
             if not summary:
@@ -785,9 +1225,13 @@ class RedisRunStore:
                 "namespace": self._namespace,
             }
             key = self._semantic_key(memory_key, run_id)
-            self._client.setex(key, self._ttl, json.dumps(data, default=str))
-            self._client.zadd(idx_key, {f"{memory_key}:{run_id}": time.time()})
-            self._client.expire(idx_key, self._ttl)
+            pipe.set(key, json.dumps(data, default=str), ex=self._ttl)
+            members[f"{memory_key}:{run_id}"] = time.time()
+        if not members:
+            return
+        pipe.zadd(idx_key, members)
+        pipe.expire(idx_key, self._ttl)
+        pipe.execute()
 
     def search_semantic_memories(
         self,
@@ -801,21 +1245,24 @@ class RedisRunStore:
         limit = max(1, limit)
         idx_key = self._semantic_index_key()
         members: list[str] = self._client.zrevrange(idx_key, 0, -1)
+        keys = [
+            self._semantic_key(*parts)
+            for parts in (member.split(":", 1) for member in members)
+            if len(parts) == 2
+        ]
         results: list[dict[str, Any]] = []
-        for member in members:
-            parts = member.split(":", 1)
-            if len(parts) != 2:
-                continue
-            mem_key, rid = parts
-            raw = self._client.get(self._semantic_key(mem_key, rid))
-            if raw is None:
-                continue
-            data = json.loads(raw)
-            haystack = " ".join(str(data.get(f, "")) for f in ("summary", "source", "kind")).lower()
-            if query_text in haystack:
-                results.append(data)
-                if len(results) >= limit:
-                    break
+        for i in range(0, len(keys), _SCAN_BATCH):
+            for raw in self._client.mget(keys[i : i + _SCAN_BATCH]):
+                if raw is None:
+                    continue
+                data = json.loads(raw)
+                haystack = " ".join(
+                    str(data.get(f, "")) for f in ("summary", "source", "kind")
+                ).lower()
+                if query_text in haystack:
+                    results.append(data)
+                    if len(results) >= limit:
+                        return results
         return results
 
     def close(self) -> None:
@@ -840,7 +1287,8 @@ def create_run_store(
 
     1. If *redis_url* is provided (or ``LG_CHECKPOINT_REDIS_URL`` is set),
        attempt to connect to Redis/Valkey.  On success return a
-       :class:`RedisRunStore`.
+       :class:`RedisRunStore`, with the RediSearch index when
+       ``LG_RUN_STORE_SEARCH_INDEX`` is true.
     2. Fall back to the SQLite-backed :class:`RunStore`.
 
     This mirrors the checkpoint-saver fallback pattern used elsewhere in the
@@ -849,7 +1297,10 @@ def create_run_store(
     url = redis_url or os.environ.get("LG_CHECKPOINT_REDIS_URL", "")
     if url:
         try:
-            store = RedisRunStore(url, namespace=namespace)
+            search_index = os.environ.get("LG_RUN_STORE_SEARCH_INDEX", "").strip().lower()
+            store = RedisRunStore(
+                url, namespace=namespace, search_index=search_index in {"1", "true", "yes"}
+            )
             _log.info("run_store_backend=redis")
             return store
         except Exception as exc:
@@ -27,23 +27,53 @@ Sidecar JSON format
         ]
     }
 
+Lookups go through hash tables (name, file, referenced name) built when the
+index is created, so queries do not scan every symbol.  :func:`load_scip_index`
+keeps a compact binary copy of the parsed sidecar in the orchestrator's cache
+directory (``$LG_SCIP_CACHE_DIR``, default ``$XDG_CACHE_HOME/lg_orch/scip``),
+never in the target repository, and reuses it while the sidecar's mtime and
+size are unchanged.  After ``apply_patch``, :meth:`ScipIndex.reindex_files` refreshes
+only the touched files instead of leaving the whole index stale.
+
+:func:`get_scip_index` additionally keeps loaded indexes in memory for the
+life of the process, keyed by the sidecar fingerprint, and each index
+memoises its summary and cross-repo edge tables per *generation* (bumped on
+every change).
+
 Exported public names:
-    ScipSymbol, ScipIndex, load_scip_index
+    ScipSymbol, ScipIndex, clear_scip_index_cache, get_scip_index, load_scip_index
 """
 
 from __future__ import annotations
 
+import ast
+import contextlib
+import hashlib
 import json
+import marshal
 import os
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from typing import Any
 
 __all__ = [
     "ScipIndex",
     "ScipSymbol",
+    "clear_scip_index_cache",
+    "get_scip_index",
     "load_scip_index",
 ]
 
 _SIDECAR_FILENAME = "scip_index.json"
+_CACHE_VERSION = 1
+
+# Indexes from get_scip_index() are shared by every run and thread in the
+# process.  Every read and change of the lookup tables holds this lock; it is
+# process-wide rather than per index so cross-repo lookups, which touch two
+# indexes, cannot deadlock.  Critical sections are short and in memory.
+_INDEX_LOCK = threading.RLock()
 
 
 @dataclass
@@ -51,12 +81,19 @@ class ScipSymbol:
     """A single symbol entry from a SCIP index."""
 
     name: str
-    kind: str  # "function", "class", "variable", "type"
+    kind: str  # "function", "class", "method", "variable", "type"
     file_path: str  # relative to repo root
     start_line: int
     end_line: int
     references: list[str]  # "other/path.py:symbol_name" strings
 
+    def referenced_names(self) -> list[str]:
+        """Names referenced by this symbol, without the path prefix, deduplicated."""
+        seen: dict[str, None] = {}
+        for ref in self.references:
+            seen.setdefault(ref.rsplit(":", 1)[-1], None)
+        return list(seen)
+
 
 @dataclass
 class ScipIndex:
@@ -65,16 +102,79 @@ class ScipIndex:
     repo_root: str
     symbols: list[ScipSymbol] = field(default_factory=list)
     _stale: bool = field(default=False, repr=False)
+    _by_name: dict[str, list[ScipSymbol]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_file: dict[str, list[ScipSymbol]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _referrers: dict[str, list[ScipSymbol]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (list identity, length) of ``symbols`` when the tables were built; a
+    # caller that replaces or appends to ``symbols`` triggers a rebuild.
+    _indexed: tuple[int, int] = field(default=(0, -1), init=False, repr=False, compare=False)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+    _memo: dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rebuild()
 
     @property
     def is_stale(self) -> bool:
         """True if the index may be out of date due to file changes."""
         return self._stale
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the symbol set changes; memoised views key on it."""
+        with _INDEX_LOCK:
+            self._tables()
+            return self._generation
+
     def mark_stale(self) -> None:
-        """Mark the index as stale. Called after apply_patch operations."""
+        """Mark the index as stale, e.g. when changed files cannot be reindexed."""
         self._stale = True
 
+    # ------------------------------------------------------------------
+    # Lookup tables
+    # ------------------------------------------------------------------
+
+    def _rebuild(self) -> None:
+        self._by_name = {}
+        self._by_file = {}
+        self._referrers = {}
+        for sym in self.symbols:
+            self._add(sym)
+        self._indexed = (id(self.symbols), len(self.symbols))
+        self._changed()
+
+    def _changed(self) -> None:
+        self._generation += 1
+        self._memo.clear()
+
+    def _tables(self) -> None:
+        if self._indexed != (id(self.symbols), len(self.symbols)):
+            self._rebuild()
+
+    def _add(self, sym: ScipSymbol) -> None:
+        self._by_name.setdefault(sym.name, []).append(sym)
+        self._by_file.setdefault(sym.file_path, []).append(sym)
+        for ref_name in sym.referenced_names():
+            self._referrers.setdefault(ref_name, []).append(sym)
+
+    def _discard(self, sym: ScipSymbol) -> None:
+        for table, key in [(self._by_name, sym.name), (self._by_file, sym.file_path)]:
+            bucket = table.get(key, [])
+            bucket[:] = [s for s in bucket if s is not sym]
+            if not bucket:
+                table.pop(key, None)
+        for ref_name in sym.referenced_names():
+            bucket = self._referrers.get(ref_name, [])
+            bucket[:] = [s for s in bucket if s is not sym]
+            if not bucket:
+                self._referrers.pop(ref_name, None)
+
     # ------------------------------------------------------------------
     # Query methods
     # ------------------------------------------------------------------
@@ -85,7 +185,9 @@ class ScipIndex:
             import logging
 
             logging.debug("ScipIndex.find_symbol called on stale index; results may be outdated")
-        return [s for s in self.symbols if s.name == name]
+        with _INDEX_LOCK:
+            self._tables()
+            return list(self._by_name.get(name, ()))
 
     def find_references(self, symbol_name: str) -> list[ScipSymbol]:
         """Return all symbols that reference *symbol_name* in their ``references`` list.
@@ -93,18 +195,57 @@ class ScipIndex:
         A reference entry has the form ``"path/to/file.py:symbol_name"``.
         The match is performed against the suffix after the last ``:``.
         """
-        results: list[ScipSymbol] = []
-        for sym in self.symbols:
-            for ref in sym.references:
-                ref_sym_name = ref.rsplit(":", 1)[-1] if ":" in ref else ref
-                if ref_sym_name == symbol_name:
-                    results.append(sym)
-                    break
-        return results
+        with _INDEX_LOCK:
+            self._tables()
+            return list(self._referrers.get(symbol_name, ()))
 
     def symbols_in_file(self, relative_path: str) -> list[ScipSymbol]:
         """Return all symbols whose ``file_path`` equals *relative_path*."""
-        return [s for s in self.symbols if s.file_path == relative_path]
+        with _INDEX_LOCK:
+            self._tables()
+            return list(self._by_file.get(relative_path, ()))
+
+    def top_symbols(self, limit: int) -> list[ScipSymbol]:
+        """The first *limit* symbols ordered by name, memoised per generation."""
+        with _INDEX_LOCK:
+            self._tables()
+            key = ("top", limit)
+            top = self._memo.get(key)
+            if top is None:
+                top = self._memo[key] = sorted(self.symbols, key=lambda s: s.name)[:limit]
+            return list(top)
+
+    def _cross_repo_table(
+        self, other: ScipIndex
+    ) -> tuple[list[tuple[ScipSymbol, ScipSymbol]], dict[str, list[tuple[ScipSymbol, ScipSymbol]]]]:
+        with _INDEX_LOCK:
+            self._tables()
+            other._tables()
+            key = ("edges", id(other))
+            cached = self._memo.get(key)
+            if cached is not None:
+                ref, other_generation, table = cached
+                if ref() is other and other_generation == other._generation:
+                    return table  # type: ignore[no-any-return]
+            pairs: list[tuple[ScipSymbol, ScipSymbol]] = []
+            edges: dict[str, list[tuple[ScipSymbol, ScipSymbol]]] = {}
+            for local_sym in self.symbols:
+                for ref_str in local_sym.references:
+                    ref_name = ref_str.rsplit(":", 1)[-1]
+                    for remote_sym in other._by_name.get(ref_name, ()):
+                        pairs.append((local_sym, remote_sym))
+                        edges.setdefault(ref_name, []).append((local_sym, remote_sym))
+            self._memo[key] = (weakref.ref(other), other._generation, (pairs, edges))
+            return pairs, edges
+
+    def cross_repo_edges(self, other: ScipIndex) -> dict[str, list[tuple[ScipSymbol, ScipSymbol]]]:
+        """:meth:`cross_repo_deps` grouped by the referenced symbol name.
+
+        The table is built once per pair of index generations and reused, so
+        looking up the edges for one shared symbol is a dict access.  The
+        returned mapping is shared; do not mutate it.
+        """
+        return self._cross_repo_table(other)[1]
 
     def cross_repo_deps(self, other: ScipIndex) -> list[tuple[ScipSymbol, ScipSymbol]]:
         """Return pairs ``(local_symbol, remote_symbol)`` where ``local_symbol``
@@ -114,17 +255,243 @@ class ScipIndex:
         symbol resolves to a name that appears in ``other.symbols``, each such
         remote symbol is paired with the local symbol.
         """
-        other_by_name: dict[str, list[ScipSymbol]] = {}
-        for sym in other.symbols:
-            other_by_name.setdefault(sym.name, []).append(sym)
+        return list(self._cross_repo_table(other)[0])
 
-        pairs: list[tuple[ScipSymbol, ScipSymbol]] = []
-        for local_sym in self.symbols:
-            for ref in local_sym.references:
-                ref_name = ref.rsplit(":", 1)[-1] if ":" in ref else ref
-                for remote_sym in other_by_name.get(ref_name, []):
-                    pairs.append((local_sym, remote_sym))
-        return pairs
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def replace_file(self, relative_path: str, symbols: Iterable[ScipSymbol]) -> None:
+        """Swap the symbols of one file for *symbols*, updating the lookup tables in place."""
+        new = list(symbols)
+        with _INDEX_LOCK:
+            self._tables()
+            old = self._by_file.get(relative_path, [])
+            if old:
+                old_ids = {id(s) for s in old}
+                for sym in list(old):
+                    self._discard(sym)
+                self.symbols[:] = [s for s in self.symbols if id(s) not in old_ids]
+            for sym in new:
+                self.symbols.append(sym)
+                self._add(sym)
+            self._indexed = (id(self.symbols), len(self.symbols))
+            self._changed()
+
+    def reindex_files(self, relative_paths: Iterable[str]) -> list[str]:
+        """Re-extract symbols for the given files from the working tree.
+
+        Python sources are re-parsed with :mod:`ast`; files that no longer
+        exist lose their symbols.  Other languages cannot be indexed here, so
+        their old entries are kept and the index is marked stale.  Files are
+        read and parsed outside the index lock; each file's swap is atomic
+        for concurrent readers.
+
+        Returns:
+            The paths whose symbols were refreshed.
+        """
+        refreshed: list[str] = []
+        for rel in dict.fromkeys(p.strip().replace("\\", "/") for p in relative_paths):
+            if not rel:
+                continue
+            abs_path = os.path.join(self.repo_root, rel)
+            if not os.path.exists(abs_path):
+                self.replace_file(rel, ())
+                refreshed.append(rel)
+                continue
+            if not rel.endswith(".py"):
+                self.mark_stale()
+                continue
+            try:
+                with open(abs_path, encoding="utf-8") as fh:
+                    source = fh.read()
+                symbols = _python_symbols(source, rel)
+            except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+                self.mark_stale()
+                continue
+            self.replace_file(rel, symbols)
+            refreshed.append(rel)
+        return refreshed
+
+
+# ---------------------------------------------------------------------------
+# Python source extraction (incremental reindexing)
+# ---------------------------------------------------------------------------
+
+
+def _module_file(module: str | None, level: int, relative_path: str) -> str:
+    """Best-effort path of the module an import names, relative to the repo root.
+
+    Absolute imports map ``a.b`` to ``a/b.py``; relative ones resolve against
+    *relative_path*'s package.  A bare ``from . import x`` names the package's
+    ``__init__.py``.
+    """
+    parts: list[str] = []
+    if level:
+        package = relative_path.split("/")[:-1]
+        parts = package[: max(0, len(package) - (level - 1))]
+    if not module:
+        return "/".join([*parts, "__init__.py"])
+    return "/".join([*parts, *module.split(".")]) + ".py"
+
+
+def _module_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Module-level statements, including those under ``if``/``try``/``with``."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.If, ast.With, ast.AsyncWith)):
+            yield from _module_statements(node.body)
+            yield from _module_statements(getattr(node, "orelse", []))
+        elif isinstance(node, ast.Try):
+            yield from _module_statements(node.body)
+            for handler in node.handlers:
+                yield from _module_statements(handler.body)
+            yield from _module_statements(node.orelse)
+            yield from _module_statements(node.finalbody)
+
+
+def _dotted(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return None if base is None else f"{base}.{node.attr}"
+    return None
+
+
+def _bound_names(nodes: Iterable[ast.AST]) -> set[str]:
+    """Names the given subtrees bind: parameters, stores, defs, imports, handlers."""
+    names: set[str] = set()
+    declared_global: set[str] = set()
+    for node in nodes:
+        for sub in ast.walk(node):
+            if isinstance(sub, ast.Name) and isinstance(sub.ctx, (ast.Store, ast.Del)):
+                names.add(sub.id)
+            elif isinstance(sub, ast.arg):
+                names.add(sub.arg)
+            elif isinstance(sub, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                if sub is not node:
+                    names.add(sub.name)
+            elif isinstance(sub, (ast.Import, ast.ImportFrom)):
+                names.update((a.asname or a.name).split(".")[0] for a in sub.names)
+            elif isinstance(sub, ast.ExceptHandler) and sub.name:
+                names.add(sub.name)
+            elif isinstance(sub, ast.Global):
+                declared_global.update(sub.names)
+    return names - declared_global
+
+
+def _python_symbols(source: str, relative_path: str) -> list[ScipSymbol]:
+    """Classes, functions, methods and assignments of one Python module.
+
+    Top-level classes, functions and assignments are ``class``/``function``/
+    ``variable`` symbols and each class's methods are ``method`` symbols.
+    References are ``"<path>:<name>"`` strings, in first-use order, for
+    names that resolve to this module's top-level definitions (with this
+    file's path) or to imports (with the imported module's path, see
+    :func:`_module_file`).  Parameters, other locals, builtins and
+    attributes of anything but an imported module are not references.
+    """
+    tree = ast.parse(source, filename=relative_path)
+    statements = list(_module_statements(tree.body))
+    # Bound name -> reference string, and imported-module expression -> module.
+    targets: dict[str, str] = {}
+    modules: dict[str, str] = {}
+    for node in statements:
+        if isinstance(node, ast.ImportFrom):
+            path = _module_file(node.module, node.level, relative_path)
+            for alias in node.names:
+                if alias.name != "*":
+                    targets[alias.asname or alias.name] = f"{path}:{alias.name}"
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    modules[alias.asname] = alias.name
+                else:
+                    dotted = alias.name.split(".")
+                    for end in range(1, len(dotted) + 1):
+                        prefix = ".".join(dotted[:end])
+                        modules[prefix] = prefix
+    for node in statements:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            targets[node.name] = f"{relative_path}:{node.name}"
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            assigned = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in assigned:
+                for sub in ast.walk(target):
+                    if isinstance(sub, ast.Name):
+                        targets[sub.id] = f"{relative_path}:{sub.id}"
+
+    def refs_of(nodes: Iterable[ast.AST], own: str, local: set[str]) -> list[str]:
+        found: list[tuple[int, int, str]] = []
+        for node in nodes:
+            for sub in ast.walk(node):
+                ref: str | None = None
+                if not isinstance(sub, (ast.Name, ast.Attribute)):
+                    continue
+                if isinstance(sub, ast.Name) and isinstance(sub.ctx, ast.Load):
+                    if sub.id not in local:
+                        ref = targets.get(sub.id)
+                elif isinstance(sub, ast.Attribute) and isinstance(sub.ctx, ast.Load):
+                    base = _dotted(sub.value)
+                    if (
+                        base is not None
+                        and base.split(".")[0] not in local
+                        and f"{base}.{sub.attr}" not in modules
+                    ):
+                        module = modules.get(base)
+                        if module is not None:
+                            ref = f"{_module_file(module, 0, relative_path)}:{sub.attr}"
+                if ref is not None and ref != own:
+                    found.append((sub.lineno, sub.col_offset, ref))
+        return list(dict.fromkeys(ref for _, _, ref in sorted(found)))
+
+    def symbol(name: str, kind: str, node: ast.stmt, refs: list[str]) -> ScipSymbol:
+        return ScipSymbol(
+            name=name,
+            kind=kind,
+            file_path=relative_path,
+            start_line=node.lineno,
+            end_line=node.end_lineno or node.lineno,
+            references=refs,
+        )
+
+    symbols: list[ScipSymbol] = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            own = f"{relative_path}:{node.name}"
+            symbols.append(
+                symbol(node.name, "function", node, refs_of([node], own, _bound_names([node])))
+            )
+        elif isinstance(node, ast.ClassDef):
+            own = f"{relative_path}:{node.name}"
+            methods = [
+                n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ]
+            # The class symbol covers its bases, decorators and class-level
+            # statements; each method gets a symbol of its own.
+            header: list[ast.AST] = [*node.bases, *node.keywords, *node.decorator_list]
+            body = [n for n in node.body if n not in methods]
+            symbols.append(
+                symbol(node.name, "class", node, refs_of([*header, *body], own, _bound_names(body)))
+            )
+            for method in methods:
+                symbols.append(
+                    symbol(
+                        method.name,
+                        "method",
+                        method,
+                        refs_of([method], own, _bound_names([method])),
+                    )
+                )
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            assigned = node.targets if isinstance(node, ast.Assign) else [node.target]
+            value = [node.value] if node.value is not None else []
+            for target in assigned:
+                if isinstance(target, ast.Name):
+                    own = f"{relative_path}:{target.id}"
+                    symbols.append(symbol(target.id, "variable", node, refs_of(value, own, set())))
+    return symbols
 
 
 # ---------------------------------------------------------------------------
@@ -183,7 +550,67 @@ def _parse_sidecar(data: object, repo_root: str) -> ScipIndex:
     return ScipIndex(repo_root=repo_root, symbols=symbols)
 
 
-def load_scip_index(repo_root: str) -> ScipIndex:
+def _default_cache_dir() -> str:
+    configured = os.environ.get("LG_SCIP_CACHE_DIR", "").strip()
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME", "").strip() or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "lg_orch", "scip")
+
+
+def _cache_path(repo_root: str, cache_dir: str | None) -> str:
+    digest = hashlib.sha256(os.path.realpath(repo_root).encode()).hexdigest()[:32]
+    return os.path.join(cache_dir or _default_cache_dir(), f"{digest}.cache")
+
+
+def _read_cache(cache_path: str, key: tuple[int, int]) -> list[ScipSymbol] | None:
+    try:
+        with open(cache_path, "rb") as fh:
+            payload = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not (isinstance(payload, tuple) and len(payload) == 3):
+        return None
+    version, cached_key, rows = payload
+    if version != _CACHE_VERSION or cached_key != key or not isinstance(rows, tuple):
+        return None
+    try:
+        return [
+            ScipSymbol(
+                name=name,
+                kind=kind,
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                references=list(references),
+            )
+            for name, kind, file_path, start_line, end_line, references in rows
+        ]
+    except (TypeError, ValueError):
+        return None
+
+
+def _write_cache(cache_path: str, key: tuple[int, int], symbols: list[ScipSymbol]) -> None:
+    rows = tuple(
+        (s.name, s.kind, s.file_path, s.start_line, s.end_line, tuple(s.references))
+        for s in symbols
+    )
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as fh:
+            marshal.dump((_CACHE_VERSION, key, rows), fh)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def load_scip_index(
+    repo_root: str, *, use_cache: bool = True, cache_dir: str | None = None
+) -> ScipIndex:
     """Load a SCIP index from ``<repo_root>/scip_index.json``.
 
     Returns an empty :class:`ScipIndex` if the sidecar file is absent or
@@ -191,15 +618,79 @@ def load_scip_index(repo_root: str) -> ScipIndex:
 
     Args:
         repo_root: Absolute or relative path to the repository root directory.
+        use_cache: Read and refresh a binary copy of the parsed sidecar
+            that is reused while the sidecar's mtime and size are unchanged.
+        cache_dir: Directory holding those copies, one per repository;
+            defaults to ``$LG_SCIP_CACHE_DIR`` or
+            ``$XDG_CACHE_HOME/lg_orch/scip``.
 
     Returns:
         A populated :class:`ScipIndex` on success, or an empty one on failure.
     """
     sidecar_path = os.path.join(repo_root, _SIDECAR_FILENAME)
+    cache_path = _cache_path(repo_root, cache_dir)
+    try:
+        st = os.stat(sidecar_path)
+    except OSError:
+        return ScipIndex(repo_root=repo_root)
+    key = (st.st_mtime_ns, st.st_size)
+
+    if use_cache:
+        cached = _read_cache(cache_path, key)
+        if cached is not None:
+            return ScipIndex(repo_root=repo_root, symbols=cached)
+
     try:
         with open(sidecar_path, encoding="utf-8") as fh:
             data = json.load(fh)
     except (FileNotFoundError, OSError, json.JSONDecodeError):
         return ScipIndex(repo_root=repo_root)
 
-    return _parse_sidecar(data, repo_root)
+    index = _parse_sidecar(data, repo_root)
+    if use_cache:
+        _write_cache(cache_path, key, index.symbols)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Process-level cache
+# ---------------------------------------------------------------------------
+
+_index_cache: dict[str, tuple[tuple[int, int] | None, ScipIndex]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def _sidecar_fingerprint(repo_root: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(os.path.join(repo_root, _SIDECAR_FILENAME))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_scip_index(repo_root: str) -> ScipIndex:
+    """Return the in-memory index for *repo_root*, loading it only when needed.
+
+    The same :class:`ScipIndex` object is returned for as long as the
+    sidecar's mtime and size stay the same, so reindexed files and memoised
+    tables carry over between runs.  Safe to call from several threads.
+    """
+    key = os.path.realpath(repo_root)
+    fingerprint = _sidecar_fingerprint(repo_root)
+    with _index_cache_lock:
+        cached = _index_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    index = load_scip_index(repo_root)
+    with _index_cache_lock:
+        current = _index_cache.get(key)
+        if current is not None and current[0] == fingerprint:
+            return current[1]  # another thread finished loading first
+        _index_cache[key] = (fingerprint, index)
+    return index
+
+
+def clear_scip_index_cache() -> None:
+    """Forget every index held by :func:`get_scip_index` (for tests)."""
+    with _index_cache_lock:
+        _index_cache.clear()
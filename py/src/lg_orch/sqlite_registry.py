@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""
+Process-wide registry of SQLite schema state and read-only connections.
+
+Hot read paths (the context builder runs on every loop of every run) should
+not pay for opening a database, setting pragmas and replaying ``CREATE
+TABLE`` / migration statements per lookup.  This module keys two things by
+resolved database path:
+
+  - schema initialisation, run at most once per process per store kind;
+  - one shared read-only connection (``mode=ro`` URI) guarded by a lock,
+    reused by every reader of that path.
+
+Writers keep their own connections; the read-only connections see every
+committed write because each ``SELECT`` runs in its own implicit
+transaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_registry_lock = threading.Lock()
+_initialised: set[tuple[str, str]] = set()
+_readers: dict[str, SharedConnection] = {}
+
+
+@dataclass
+class SharedConnection:
+    """A read-only connection shared by all readers of one database path.
+
+    Callers must hold :attr:`lock` while using :attr:`conn`.
+    """
+
+    path: str
+    conn: sqlite3.Connection
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def has_table(self, name: str) -> bool:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ? LIMIT 1", (name,)
+            ).fetchone()
+        return row is not None
+
+
+def _key(db_path: Path) -> str:
+    return str(db_path.resolve())
+
+
+def ensure_initialised(db_path: Path, kind: str, init: Callable[[], None]) -> None:
+    """Run *init* once per process for the (*kind*, *db_path*) pair.
+
+    *init* runs outside the registry lock so slow migrations on one database
+    do not block lookups on another; two threads racing on the same first
+    call may both run it, which the idempotent ``CREATE ... IF NOT EXISTS``
+    schemas tolerate.
+    """
+    key = (kind, _key(db_path))
+    with _registry_lock:
+        if key in _initialised:
+            return
+    init()
+    with _registry_lock:
+        _initialised.add(key)
+
+
+def read_only_connection(db_path: Path) -> SharedConnection:
+    """Return the shared read-only connection for *db_path*, opening it on first use."""
+    key = _key(db_path)
+    with _registry_lock:
+        shared = _readers.get(key)
+        if shared is None:
+            conn = sqlite3.connect(
+                f"{Path(key).as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            shared = SharedConnection(path=key, conn=conn)
+            _readers[key] = shared
+        return shared
+
+
+def discard(db_path: Path) -> None:
+    """Forget *db_path*: close its reader and re-run initialisation on next use.
+
+    Callers use this after a database error so a deleted or replaced file is
+    reopened instead of failing for the rest of the process.
+    """
+    key = _key(db_path)
+    with _registry_lock:
+        shared = _readers.pop(key, None)
+        _initialised.difference_update({k for k in _initialised if k[1] == key})
+    if shared is not None:
+        with shared.lock:
+            shared.conn.close()
+
+
+def reset_registry() -> None:
+    """Close every shared connection and clear initialisation state."""
+    with _registry_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+        _initialised.clear()
+    for shared in readers:
+        with shared.lock:
+            shared.conn.close()
+
+
+__all__ = [
+    "SharedConnection",
+    "discard",
+    "ensure_initialised",
+    "read_only_connection",
+    "reset_registry",
+]
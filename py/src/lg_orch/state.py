@@ -198,6 +198,9 @@ class OrchStateDict(TypedDict, total=False):
     _approval_context: dict[str, Any]
     _runner_enabled: bool
     _trace_events: list[dict[str, Any]]
+    # Executor -> MultiRepoScheduler: files to reindex after apply_patch.
+    _scip_index_stale: bool
+    _scip_dirty_paths: list[str]
 
 
 class OrchState(BaseModel):
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import contextlib
+import importlib.util
 import json
 import threading
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Coroutine
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -21,15 +23,23 @@ from lg_orch.model_routing import SlaRoutingPolicy
 # tests that do not set up the full app (prometheus_client not registered).
 # ---------------------------------------------------------------------------
 try:
+    from lg_orch.api.metrics import (
+        LULA_LLM_CALL_OVERHEAD_SECONDS as _LLM_CALL_OVERHEAD_SECONDS,
+    )
     from lg_orch.api.metrics import (
         LULA_LLM_DURATION_SECONDS as _LLM_DURATION_SECONDS,
     )
     from lg_orch.api.metrics import (
         LULA_LLM_REQUESTS_TOTAL as _LLM_REQUESTS_TOTAL,
     )
+    from lg_orch.api.metrics import (
+        LULA_LLM_TTFT_SECONDS as _LLM_TTFT_SECONDS,
+    )
 except ImportError:
     _LLM_REQUESTS_TOTAL = None  # type: ignore[assignment]
     _LLM_DURATION_SECONDS = None  # type: ignore[assignment]
+    _LLM_TTFT_SECONDS = None  # type: ignore[assignment]
+    _LLM_CALL_OVERHEAD_SECONDS = None  # type: ignore[assignment]
 
 # Process-level default SLA policy. Inject via InferenceClient(sla_policy=...) for test isolation.
 _DEFAULT_SLA_POLICY: SlaRoutingPolicy | None = None
@@ -139,6 +149,132 @@ def _get_breaker(base_url: str) -> _CircuitBreaker:
         return _breakers[base_url]
 
 
+# ---------------------------------------------------------------------------
+# Shared background event loop + pooled httpx.AsyncClient for streaming
+# ---------------------------------------------------------------------------
+
+# HTTP/2 needs the optional ``h2`` package (``pip install lg-orch[http2]``).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _BackgroundLoop:
+    """One daemon thread running the event loop used by every sync streaming call.
+
+    Sync graph nodes used to spin up a thread, ``asyncio.run`` and a fresh
+    ``httpx.AsyncClient`` per call.  Submitting to a long-lived loop instead
+    lets the pooled clients below keep their connections (and TLS sessions)
+    warm between calls.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def get(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run, args=(loop, ready), name="lg-orch-llm-loop", daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def is_current(self) -> bool:
+        """True when called from a coroutine running on the shared loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return running is self._loop
+
+    def shutdown(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        with contextlib.suppress(Exception):
+            asyncio.run_coroutine_threadsafe(_close_async_clients(), loop).result(5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5.0)
+
+
+_shared_loop = _BackgroundLoop()
+
+# Touched only from the shared loop's thread, so no lock.
+_async_client_cache: dict[tuple[str, str, int], httpx.AsyncClient] = {}
+
+
+def _shared_async_client(base_url: str, api_key: str, timeout_s: int) -> httpx.AsyncClient:
+    """Return the pooled AsyncClient for this endpoint; call only on the shared loop."""
+    key = (base_url, api_key, timeout_s)
+    client = _async_client_cache.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(float(timeout_s)),
+            http2=_HTTP2_AVAILABLE,
+        )
+        _async_client_cache[key] = client
+    return client
+
+
+async def _close_async_clients() -> None:
+    clients = list(_async_client_cache.values())
+    _async_client_cache.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            await client.aclose()
+
+
+def run_on_shared_loop[T](coro: Coroutine[Any, Any, T], *, timeout: float | None = None) -> T:
+    """Run *coro* on the shared streaming loop and block until it finishes.
+
+    This is the bridge for sync graph nodes.  It is safe from any thread,
+    including one whose own event loop is running, except the shared loop's
+    thread itself, where blocking would deadlock.
+    """
+    if _shared_loop.is_current():
+        coro.close()
+        raise RuntimeError("run_on_shared_loop called from the shared loop")
+    submitted = time.perf_counter()
+
+    async def _timed() -> T:
+        _observe_overhead("dispatch", time.perf_counter() - submitted)
+        return await coro
+
+    future = asyncio.run_coroutine_threadsafe(_timed(), _shared_loop.get())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def shutdown_shared_loop() -> None:
+    """Close the pooled AsyncClients and stop the shared loop (tests, shutdown)."""
+    _shared_loop.shutdown()
+
+
+def _observe_overhead(stage: str, seconds: float) -> None:
+    if _LLM_CALL_OVERHEAD_SECONDS is not None:
+        _LLM_CALL_OVERHEAD_SECONDS.labels(stage=stage).observe(seconds)
+
+
 # ---------------------------------------------------------------------------
 # Function-calling dataclasses
 # ---------------------------------------------------------------------------
@@ -451,11 +587,9 @@ class InferenceClient:
             return "".join(tokens)
 
         try:
-            # Run in a fresh event loop on a background thread to avoid
-            # "event loop already running" issues inside LangGraph.
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                future = pool.submit(asyncio.run, _run())
-                text = future.result()
+            # The shared loop runs on its own thread, so this is safe even
+            # when the calling thread already has a running loop (LangGraph).
+            text = run_on_shared_loop(_run())
             breaker.record_success()
             _stream_elapsed = time.monotonic() - started
             if _LLM_REQUESTS_TOTAL is not None:
@@ -516,14 +650,24 @@ class InferenceClient:
             "content-type": "application/json",
         }
 
-        client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(float(self.timeout_s)),
+        call_started = time.perf_counter()
+        # On the shared loop, reuse its pooled client; any other loop (direct
+        # async callers, tests) gets a client scoped to this call.
+        shared = _shared_loop.is_current()
+        client = (
+            _shared_async_client(self.base_url, self.api_key, self.timeout_s)
+            if shared
+            else httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(float(self.timeout_s)),
+            )
         )
+        resp: httpx.Response | None = None
         try:
             req = client.build_request(
                 "POST", "/chat/completions", json=payload, headers=req_headers
             )
+            _observe_overhead("setup", time.perf_counter() - call_started)
 
             @retry(
                 reraise=True,
@@ -542,6 +686,7 @@ class InferenceClient:
                 raise
 
             _stream_started = time.perf_counter()
+            first_token = True
             try:
                 async for line in resp.aiter_lines():
                     if not line.startswith("data: "):
@@ -552,6 +697,12 @@ class InferenceClient:
                     chunk = json.loads(data)
                     delta = chunk["choices"][0]["delta"].get("content", "")
                     if isinstance(delta, str) and delta:
+                        if first_token:
+                            first_token = False
+                            if _LLM_TTFT_SECONDS is not None:
+                                _LLM_TTFT_SECONDS.labels(model=effective_model).observe(
+                                    time.perf_counter() - call_started
+                                )
                         yield delta
                 _stream_elapsed_s = time.perf_counter() - _stream_started
                 breaker.record_success()
@@ -571,7 +722,11 @@ class InferenceClient:
                     ).inc()
                 raise
         finally:
-            await client.aclose()
+            if not shared:
+                await client.aclose()
+            elif resp is not None:
+                # Return the connection to the shared client's pool.
+                await resp.aclose()
 
 
 async def collect_stream(gen: AsyncGenerator[str, None]) -> str:
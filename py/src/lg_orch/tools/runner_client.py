@@ -2,8 +2,14 @@
 # Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
 from __future__ import annotations
 
+import contextlib
+import importlib.util
 import json
-from dataclasses import dataclass
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
@@ -15,47 +21,155 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 # tests that do not set up the full app (prometheus_client not registered).
 # ---------------------------------------------------------------------------
 try:
+    from lg_orch.api.metrics import LULA_RUNNER_CONNECTIONS_TOTAL as _RUNNER_CONNECTIONS_TOTAL
+    from lg_orch.api.metrics import LULA_RUNNER_POOL_WAIT_SECONDS as _RUNNER_POOL_WAIT_SECONDS
     from lg_orch.api.metrics import LULA_TOOL_CALLS_TOTAL as _TOOL_CALLS_TOTAL
 except ImportError:
     _TOOL_CALLS_TOTAL = None  # type: ignore[assignment]
+    _RUNNER_CONNECTIONS_TOTAL = None  # type: ignore[assignment]
+    _RUNNER_POOL_WAIT_SECONDS = None  # type: ignore[assignment]
 
 _W3C_PROPAGATOR = TraceContextTextMapPropagator()
 
 
 def _traceparent_headers() -> dict[str, str]:
     """Return a ``traceparent`` carrier dict for the active span, or empty dict."""
-    import contextlib
-
     carrier: dict[str, str] = {}
     with contextlib.suppress(Exception):
         _W3C_PROPAGATOR.inject(carrier)
     return carrier
 
 
+# ---------------------------------------------------------------------------
+# httpx.Client registry — one keep-alive pool per (base_url, api_key)
+# ---------------------------------------------------------------------------
+
+_DEFAULT_POOL_SIZE = 20
+_KEEPALIVE_EXPIRY_S = 30.0
+_TIMEOUT_S = 60.0
+
+# HTTP/2 needs the optional ``h2`` package (``pip install lg-orch[http2]``).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client_cache: dict[tuple[str, str], httpx.Client] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _pool_size() -> int:
+    """Connections kept per runner endpoint, from ``LG_RUNNER_POOL_SIZE``."""
+    raw = os.environ.get("LG_RUNNER_POOL_SIZE", "").strip()
+    try:
+        size = int(raw) if raw else _DEFAULT_POOL_SIZE
+    except ValueError:
+        size = _DEFAULT_POOL_SIZE
+    return max(1, size)
+
+
+def _get_or_create_client(base_url: str, api_key: str | None) -> httpx.Client:
+    """Return the shared client for this runner endpoint, creating it on first use.
+
+    Only credentials live on the client; the request id and trace context are
+    sent per request, so one pool serves every node and every run.
+    """
+    key = (base_url, api_key or "")
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None or client.is_closed:
+            headers: dict[str, str] = {}
+            if api_key:
+                headers["authorization"] = f"Bearer {api_key}"
+            size = _pool_size()
+            client = httpx.Client(
+                base_url=base_url,
+                timeout=_TIMEOUT_S,
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=size,
+                    max_keepalive_connections=size,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+                ),
+                http2=_HTTP2_AVAILABLE,
+            )
+            _client_cache[key] = client
+        return client
+
+
+def clear_client_cache() -> None:
+    """Close and remove all cached runner clients (for tests and shutdown)."""
+    with _client_cache_lock:
+        for client in _client_cache.values():
+            client.close()
+        _client_cache.clear()
+        _stream_unsupported.clear()
+
+
+# Runner base URLs that answered the streaming batch endpoint with "not there".
+_stream_unsupported: set[str] = set()
+_STREAM_UNSUPPORTED_STATUS = frozenset({404, 405, 501})
+
+
+class _StreamUnsupported(Exception):
+    """The runner does not implement ``/v1/tools/batch_execute_stream``."""
+
+
+class _PoolTrace:
+    """httpcore trace hook recording connection reuse and pool wait time.
+
+    The first connection-level event of a request is either ``connect_tcp``
+    (a new connection was opened) or ``send_request_headers`` (a pooled
+    connection was picked up); the time until then is the pool wait.
+    """
+
+    __slots__ = ("_seen", "_started")
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._seen = False
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if self._seen:
+            return
+        if event_name == "connection.connect_tcp.started":
+            outcome = "new"
+        elif event_name.endswith(".send_request_headers.started"):
+            outcome = "reused"
+        else:
+            return
+        self._seen = True
+        if _RUNNER_POOL_WAIT_SECONDS is not None:
+            _RUNNER_POOL_WAIT_SECONDS.observe(time.perf_counter() - self._started)
+        if _RUNNER_CONNECTIONS_TOTAL is not None:
+            _RUNNER_CONNECTIONS_TOTAL.labels(outcome=outcome).inc()
+
+
 @dataclass(frozen=True)
 class RunnerClient:
     base_url: str
     api_key: str | None = None
     request_id: str | None = None
     _client: httpx.Client | None = None
+    _shared: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self._client is None:
-            headers: dict[str, str] = {}
-            if self.api_key:
-                headers["authorization"] = f"Bearer {self.api_key}"
-            if self.request_id and self.request_id.strip():
-                headers["x-request-id"] = self.request_id.strip()
-            object.__setattr__(
-                self,
-                "_client",
-                httpx.Client(base_url=self.base_url, timeout=60.0, headers=headers),
-            )
+            object.__setattr__(self, "_client", _get_or_create_client(self.base_url, self.api_key))
+            object.__setattr__(self, "_shared", True)
 
     def close(self) -> None:
-        if self._client is not None:
+        # Registry clients outlive this handle; use clear_client_cache() to close them.
+        if self._client is not None and not self._shared:
             self._client.close()
 
+    def _post(self, path: str, payload: dict[str, Any]) -> httpx.Response:
+        if self._client is None:
+            raise RuntimeError("client not initialized")
+        headers = _traceparent_headers()
+        if self.request_id and self.request_id.strip():
+            headers["x-request-id"] = self.request_id.strip()
+        return self._client.post(
+            path, json=payload, headers=headers, extensions={"trace": _PoolTrace()}
+        )
+
     @staticmethod
     def _checkpoint_payload(input_payload: dict[str, Any]) -> dict[str, Any] | None:
         raw = input_payload.get("_checkpoint")
@@ -97,8 +211,6 @@ class RunnerClient:
             retry=retry_if_exception_type(httpx.TransportError),
         )
         def _do() -> dict[str, Any]:
-            if self._client is None:
-                raise RuntimeError("client not initialized")
             payload: dict[str, Any] = {"tool": tool, "input": input}
             checkpoint_payload = self._checkpoint_payload(input)
             if checkpoint_payload is not None:
@@ -106,9 +218,7 @@ class RunnerClient:
             route_payload = self._route_payload(input)
             if route_payload is not None:
                 payload["route"] = route_payload
-            resp = self._client.post(
-                "/v1/tools/execute", json=payload, headers=_traceparent_headers()
-            )
+            resp = self._post("/v1/tools/execute", payload)
             resp.raise_for_status()
             return dict(resp.json())
 
@@ -214,6 +324,23 @@ class RunnerClient:
             return []
         return [row for row in parsed if isinstance(row, dict)]
 
+    def _batch_payload(self, calls: list[dict[str, Any]]) -> dict[str, Any]:
+        calls_payload: list[dict[str, Any]] = []
+        for call in calls:
+            input_payload = call.get("input", {})
+            request_call: dict[str, Any] = {
+                "tool": str(call.get("tool", "")),
+                "input": dict(input_payload) if isinstance(input_payload, dict) else {},
+            }
+            checkpoint_payload = self._checkpoint_payload(request_call["input"])
+            if checkpoint_payload is not None:
+                request_call["checkpoint"] = checkpoint_payload
+            route_payload = self._route_payload(request_call["input"])
+            if route_payload is not None:
+                request_call["route"] = route_payload
+            calls_payload.append(request_call)
+        return {"calls": calls_payload}
+
     def batch_execute_tools(self, *, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
         @retry(
             reraise=True,
@@ -222,28 +349,7 @@ class RunnerClient:
             retry=retry_if_exception_type(httpx.TransportError),
         )
         def _do() -> list[dict[str, Any]]:
-            if self._client is None:
-                raise RuntimeError("client not initialized")
-            calls_payload: list[dict[str, Any]] = []
-            for call in calls:
-                input_payload = call.get("input", {})
-                request_call: dict[str, Any] = {
-                    "tool": str(call.get("tool", "")),
-                    "input": dict(input_payload) if isinstance(input_payload, dict) else {},
-                }
-                checkpoint_payload = self._checkpoint_payload(request_call["input"])
-                if checkpoint_payload is not None:
-                    request_call["checkpoint"] = checkpoint_payload
-                route_payload = self._route_payload(request_call["input"])
-                if route_payload is not None:
-                    request_call["route"] = route_payload
-                calls_payload.append(request_call)
-
-            resp = self._client.post(
-                "/v1/tools/batch_execute",
-                json={"calls": calls_payload},
-                headers=_traceparent_headers(),
-            )
+            resp = self._post("/v1/tools/batch_execute", self._batch_payload(calls))
             resp.raise_for_status()
             data = dict(resp.json())
             results = data.get("results")
@@ -316,3 +422,115 @@ class RunnerClient:
                 }
                 for c in calls
             ]
+
+    def stream_batch_execute_tools(
+        self,
+        *,
+        calls: list[dict[str, Any]],
+        on_stdout: Callable[[int, str], None] | None = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Run *calls* as one batch, yielding ``(index, envelope)`` as each call finishes.
+
+        Uses the runner's NDJSON endpoint ``/v1/tools/batch_execute_stream``.
+        Each response line is one frame, either ``{"idx": i, "stdout": chunk}``
+        while call *i* runs or ``{"idx": i, "result": envelope}`` when it
+        ends.  Stdout chunks go to *on_stdout* as they arrive.  Results come in
+        completion order, not call order.
+
+        A runner without the endpoint (404/405/501) is remembered, and this
+        call and later ones fall back to :meth:`batch_execute_tools`.  So does
+        a stream that breaks before any frame arrives.  Once any frame has
+        arrived a call may have started, and re-sending could run a
+        non-idempotent tool twice, so a break leaves the unfinished calls
+        with ``runner_unavailable`` envelopes instead.
+        """
+        if not calls:
+            return
+        if self.base_url in _stream_unsupported:
+            yield from enumerate(self.batch_execute_tools(calls=calls))
+            return
+
+        pending = set(range(len(calls)))
+        started: set[int] = set()
+        try:
+            for idx, envelope in self._stream_frames(calls, on_stdout, started):
+                if idx not in pending:
+                    continue
+                pending.discard(idx)
+                if _TOOL_CALLS_TOTAL is not None:
+                    _TOOL_CALLS_TOTAL.labels(
+                        tool_name=str(calls[idx].get("tool", "")), status="ok"
+                    ).inc()
+                yield idx, envelope
+        except _StreamUnsupported:
+            _stream_unsupported.add(self.base_url)
+            yield from enumerate(self.batch_execute_tools(calls=calls))
+            return
+        except (httpx.HTTPError, ValueError) as e:
+            if not started:
+                # Nothing ran as far as we know; the blocking endpoint retries
+                # transport errors and builds the usual error envelopes.
+                yield from enumerate(self.batch_execute_tools(calls=calls))
+                return
+            error = str(e)
+        else:
+            error = "runner stream ended before every call reported a result"
+        for idx in sorted(pending):
+            if _TOOL_CALLS_TOTAL is not None:
+                _TOOL_CALLS_TOTAL.labels(
+                    tool_name=str(calls[idx].get("tool", "")), status="error"
+                ).inc()
+            route_payload = self._route_payload(calls[idx].get("input", {}))
+            yield (
+                idx,
+                {
+                    "tool": str(calls[idx].get("tool", "")),
+                    "ok": False,
+                    "exit_code": 1,
+                    "stdout": "",
+                    "stderr": error,
+                    "diagnostics": [],
+                    "timing_ms": 0,
+                    "artifacts": {"error": "runner_unavailable"},
+                    **({"route": route_payload} if route_payload is not None else {}),
+                },
+            )
+
+    def _stream_frames(
+        self,
+        calls: list[dict[str, Any]],
+        on_stdout: Callable[[int, str], None] | None,
+        started: set[int],
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(idx, envelope)`` result frames, adding every index seen to *started*."""
+        if self._client is None:
+            raise RuntimeError("client not initialized")
+        headers = _traceparent_headers()
+        if self.request_id and self.request_id.strip():
+            headers["x-request-id"] = self.request_id.strip()
+        with self._client.stream(
+            "POST",
+            "/v1/tools/batch_execute_stream",
+            json=self._batch_payload(calls),
+            headers=headers,
+            extensions={"trace": _PoolTrace()},
+        ) as resp:
+            if resp.status_code in _STREAM_UNSUPPORTED_STATUS:
+                raise _StreamUnsupported
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line.strip():
+                    continue
+                frame = json.loads(line)
+                idx = frame.get("idx") if isinstance(frame, dict) else None
+                if not isinstance(idx, int) or not 0 <= idx < len(calls):
+                    continue
+                started.add(idx)
+                chunk = frame.get("stdout")
+                if isinstance(chunk, str):
+                    if on_stdout is not None and chunk:
+                        on_stdout(idx, chunk)
+                    continue
+                result = frame.get("result")
+                if isinstance(result, dict):
+                    yield idx, result
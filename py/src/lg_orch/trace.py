@@ -2,11 +2,25 @@
 # Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
 from __future__ import annotations
 
+import itertools
 import json
+import os
+import threading
 import time
 import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
+
+TRACE_JOURNAL_VERSION = 1
+TRACE_FORMATS = ("json", "journal")
+# Printed as its own stdout line by ``lg-orch run --trace-notify`` after every
+# journal append; the API's output capture swallows it and republishes the trace.
+TRACE_APPEND_MARKER = "\x00lg-orch-trace-append\x00"
+
+# How far from the end of a journal to look for the footer index.
+_FOOTER_TAIL_BYTES = 64 * 1024
 
 
 def now_ms() -> int:
@@ -70,6 +84,103 @@ def ensure_run_id(state: Any) -> dict[str, Any]:
     return {"_run_id": uuid.uuid4().hex}
 
 
+class TraceEventLog(Sequence[dict[str, Any]]):
+    """Append-only trace event sequence with structural sharing.
+
+    A log is the events a node received (``base``, never copied or mutated)
+    followed by the first ``n`` entries of a tail buffer shared with the
+    versions derived from it, so :meth:`append` is amortised O(1) instead of
+    copying every earlier event.  Appending to a version that is no longer
+    the newest (a fork) copies only its tail, which keeps earlier versions
+    unchanged.
+
+    Logs stay inside a node: :func:`seal_trace_events` turns the node's
+    result back into a plain list so LangGraph channels, checkpoint savers
+    and JSON serialisation never see this type.
+    """
+
+    __slots__ = ("_base", "_tail", "_tail_len")
+
+    def __init__(self, events: Iterable[dict[str, Any]] = ()) -> None:
+        self._base: list[dict[str, Any]] = events if isinstance(events, list) else list(events)
+        self._tail: list[dict[str, Any]] = []
+        self._tail_len = 0
+
+    def append(self, event: dict[str, Any]) -> TraceEventLog:
+        """Return a new version with *event* appended; ``self`` is unchanged."""
+        with _EVENT_LOG_LOCK:
+            tail = self._tail
+            if len(tail) != self._tail_len:
+                tail = tail[: self._tail_len]
+            tail.append(event)
+        log = TraceEventLog.__new__(TraceEventLog)
+        log._base = self._base
+        log._tail = tail
+        log._tail_len = self._tail_len + 1
+        return log
+
+    def to_list(self) -> list[dict[str, Any]]:
+        return self._base + self._tail[: self._tail_len]
+
+    def _range(self, start: int, stop: int) -> list[dict[str, Any]]:
+        base_len = len(self._base)
+        if start >= base_len:
+            return self._tail[start - base_len : stop - base_len]
+        return self._base[start:stop] + self._tail[: max(0, stop - base_len)]
+
+    def __len__(self) -> int:
+        return len(self._base) + self._tail_len
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            if index.step is not None:
+                return self.to_list()[index]
+            start, stop, _ = index.indices(len(self))
+            return self._range(start, max(start, stop))
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("trace event index out of range")
+        base_len = len(self._base)
+        return self._base[index] if index < base_len else self._tail[index - base_len]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return itertools.chain(self._base, itertools.islice(self._tail, self._tail_len))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TraceEventLog | list):
+            return len(other) == len(self) and self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TraceEventLog({self.to_list()!r})"
+
+
+_EVENT_LOG_LOCK = threading.Lock()
+
+
+def seal_trace_events(update: Any) -> Any:
+    """Return a node result with its :class:`TraceEventLog` turned into a list.
+
+    Called once per node by the graph wrapper, so a node that appends *k*
+    events pays one O(n) copy instead of *k*.
+    """
+    if isinstance(update, dict):
+        events = update.get("_trace_events")
+        if isinstance(events, TraceEventLog):
+            return {**update, "_trace_events": events.to_list()}
+    return update
+
+
 def append_event(state: Any, *, kind: str, data: dict[str, Any]) -> dict[str, Any]:
     """Append a trace event and return the **full** state dict with the event
     appended to ``_trace_events``.
@@ -84,20 +195,293 @@ def append_event(state: Any, *, kind: str, data: dict[str, Any]) -> dict[str, An
     function returned a partial dict.  Returning the complete state is safe for
     both patterns: LangGraph-level merges work on the full dict, and
     call-site reassignments keep the full state intact.
+
+    ``_trace_events`` in the result is a :class:`TraceEventLog`, so repeated
+    calls within a node append in O(1) rather than copying the event list.
     """
     existing = _state_get(state, "_trace_events", []) or []
-    events = list(existing)
-    events.append({"ts_ms": now_ms(), "kind": kind, "data": data})
+    events = existing if isinstance(existing, TraceEventLog) else TraceEventLog(existing)
+    # The state copy stays: callers keep earlier states and must not see
+    # later changes.  It is shallow for dicts, O(keys) rather than O(events),
+    # and a Pydantic state is dumped only on a node's first append, since
+    # later calls receive the dict returned here.
     full = _state_as_dict(state)
-    full["_trace_events"] = events
+    full["_trace_events"] = events.append({"ts_ms": now_ms(), "kind": kind, "data": data})
     return full
 
 
-def write_run_trace(*, repo_root: Path, out_dir: Path, state: Any) -> Path:
-    """Serialise the current run trace to a JSON file under *out_dir*.
+def trace_journal_path(trace_path: Path) -> Path:
+    """Return the NDJSON journal path that sits next to ``run-<id>.json``."""
+    return trace_path.with_suffix(".ndjson")
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _read_tail_footer(path: Path) -> tuple[dict[str, Any], int] | None:
+    """Return ``(footer, file_size)`` when the journal's last line is a footer."""
+    with path.open("rb") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        start = max(0, size - _FOOTER_TAIL_BYTES)
+        fh.seek(start)
+        tail = fh.read()
+    if not tail.endswith(b"\n"):
+        return None
+    line_start = tail.rfind(b"\n", 0, len(tail) - 1) + 1
+    if line_start == 0 and start > 0:
+        return None
+    try:
+        record = json.loads(tail[line_start:])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict) or record.get("type") != "footer":
+        return None
+    return record, size
+
+
+@dataclass(frozen=True, slots=True)
+class TraceJournalChunk:
+    """Records read by :func:`read_trace_journal` starting at some byte offset.
+
+    ``offset`` is the position just past the last complete line consumed; pass
+    it back to resume tailing without re-reading earlier bytes.
+    """
+
+    offset: int
+    events: list[dict[str, Any]] = field(default_factory=list)
+    sections: dict[str, Any] = field(default_factory=dict)
+    header: dict[str, Any] | None = None
+    footer: dict[str, Any] | None = None
+
+
+def read_trace_journal(path: Path, *, offset: int = 0) -> TraceJournalChunk:
+    """Read complete journal lines from *offset* onward.
+
+    A trailing partial line (a writer mid-append) is left for the next call.
+    Lines that fail to parse are skipped.
+    """
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        data = fh.read()
+    end = data.rfind(b"\n") + 1
+    events: list[dict[str, Any]] = []
+    sections: dict[str, Any] = {}
+    header: dict[str, Any] | None = None
+    footer: dict[str, Any] | None = None
+    for raw in data[:end].splitlines():
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        kind = record.get("type")
+        if kind == "event" and isinstance(record.get("event"), dict):
+            events.append(record["event"])
+        elif kind == "section":
+            sections[str(record.get("name", ""))] = record.get("value")
+        elif kind == "header":
+            header = record
+        elif kind == "footer":
+            footer = record
+    return TraceJournalChunk(
+        offset=offset + end, events=events, sections=sections, header=header, footer=footer
+    )
+
+
+class TraceJournalTail:
+    """Follows a growing journal, keeping the payload :func:`export_trace_json` would build.
+
+    Each :meth:`read` consumes only the bytes appended since the previous one.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._offset = 0
+        self._run_id: Any = None
+        self._sections: dict[str, Any] = {}
+        self._events: list[dict[str, Any]] = []
+
+    def read(self) -> dict[str, Any] | None:
+        """The trace payload so far, or ``None`` while the journal does not exist.
+
+        The result is a fresh dict (sharing event objects) that later reads
+        leave alone.
+        """
+        if not self.path.is_file():
+            return None
+        chunk = read_trace_journal(self.path, offset=self._offset)
+        self._offset = chunk.offset
+        if chunk.header is not None:
+            self._run_id = chunk.header.get("run_id")
+        self._sections.update(chunk.sections)
+        self._events.extend(chunk.events)
+        return {"run_id": self._run_id, **self._sections, "events": list(self._events)}
+
+
+class TraceJournal:
+    """Append-only NDJSON run trace.
+
+    Layout: one ``header`` line, then ``event`` lines as the run progresses,
+    then ``section`` lines (request, route, tool_results, ...) each followed by
+    a small ``footer`` index giving the event count and the byte offset of the
+    latest copy of every section.  Updating a section appends a new copy and a
+    new footer; nothing already written is rewritten.
+    """
+
+    def __init__(self, path: Path, *, run_id: str) -> None:
+        self.path = path
+        self.run_id = run_id
+        self._event_count = 0
+        self._sections: dict[str, list[int]] = {}
+        self._size = 0
+        if path.is_file() and path.stat().st_size > 0:
+            self._recover()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write(
+                _encode_record(
+                    {
+                        "type": "header",
+                        "version": TRACE_JOURNAL_VERSION,
+                        "run_id": run_id,
+                        "created_ms": now_ms(),
+                    }
+                )
+            )
+
+    @property
+    def event_count(self) -> int:
+        return self._event_count
+
+    def _recover(self) -> None:
+        tail = _read_tail_footer(self.path)
+        if tail is not None:
+            footer, self._size = tail
+            self._event_count = int(footer.get("event_count", 0))
+            sections_raw = footer.get("sections", {})
+            if isinstance(sections_raw, dict):
+                self._sections = {str(k): list(v) for k, v in sections_raw.items()}
+            return
+        # No footer at the tail (run still in progress or interrupted): rescan,
+        # dropping any torn final line so new appends start on a line boundary.
+        position = 0
+        with self.path.open("rb") as fh:
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict):
+                    if record.get("type") == "event":
+                        self._event_count += 1
+                    elif record.get("type") == "section":
+                        self._sections[str(record.get("name", ""))] = [position, len(raw)]
+                position += len(raw)
+        os.truncate(self.path, position)
+        self._size = position
+
+    def _write(self, data: bytes) -> None:
+        with self.path.open("ab") as fh:
+            fh.write(data)
+        self._size += len(data)
+
+    def append_events(self, events: Sequence[dict[str, Any]]) -> int:
+        """Append the events in *events* beyond those already journaled.
+
+        *events* is the run's full event list; only the unseen suffix is
+        written.  Returns the number of events appended.
+        """
+        new = events[self._event_count :]
+        if not new:
+            return 0
+        self._write(b"".join(_encode_record({"type": "event", "event": ev}) for ev in new))
+        self._event_count += len(new)
+        return len(new)
+
+    def write_sections(self, sections: dict[str, Any]) -> None:
+        """Append *sections* and a footer index pointing at their latest copies."""
+        chunks: list[bytes] = []
+        position = self._size
+        for name, value in sections.items():
+            line = _encode_record({"type": "section", "name": name, "value": value})
+            self._sections[name] = [position, len(line)]
+            position += len(line)
+            chunks.append(line)
+        chunks.append(
+            _encode_record(
+                {
+                    "type": "footer",
+                    "event_count": self._event_count,
+                    "sections": self._sections,
+                }
+            )
+        )
+        self._write(b"".join(chunks))
+
+    def read_section(self, name: str) -> Any:
+        """Return the latest value of section *name* via the footer index."""
+        entry = self._sections.get(name)
+        if entry is None:
+            return None
+        with self.path.open("rb") as fh:
+            fh.seek(entry[0])
+            record = json.loads(fh.read(entry[1]))
+        return record.get("value") if isinstance(record, dict) else None
+
+
+def export_trace_json(journal_path: Path, out_path: Path | None = None) -> dict[str, Any]:
+    """Rebuild the monolithic ``run-<id>.json`` payload from a journal.
+
+    When *out_path* is given the payload is also written there in the same
+    indented format :func:`write_run_trace` produces.
+    """
+    chunk = read_trace_journal(journal_path)
+    payload: dict[str, Any] = {}
+    if chunk.header is not None:
+        payload["run_id"] = chunk.header.get("run_id")
+    payload.update(chunk.sections)
+    payload["events"] = chunk.events
+    if out_path is not None:
+        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return payload
+
+
+def load_trace_payload(trace_path: Path) -> Any:
+    """Load a run trace from ``.json`` or, failing that, its NDJSON journal.
+
+    Accepts either a ``run-<id>.json`` path (falling back to the sibling
+    ``.ndjson`` journal when the JSON file does not exist) or a journal path.
+    Raises :class:`OSError` or :class:`json.JSONDecodeError` like
+    ``json.loads(path.read_text())`` would.
+    """
+    if trace_path.suffix == ".ndjson":
+        return export_trace_json(trace_path)
+    journal = trace_journal_path(trace_path)
+    if not trace_path.exists() and journal.is_file():
+        return export_trace_json(journal)
+    return json.loads(trace_path.read_text(encoding="utf-8"))
+
+
+def iter_trace_files(trace_dir: Path) -> Iterator[Path]:
+    """Yield ``run-*.json`` traces plus journals that have no JSON export, newest name first."""
+    paths = set(trace_dir.glob("run-*.json"))
+    paths.update(p for p in trace_dir.glob("run-*.ndjson") if not p.with_suffix(".json").exists())
+    yield from sorted(paths, key=lambda p: p.stem, reverse=True)
+
+
+def write_run_trace(*, repo_root: Path, out_dir: Path, state: Any, journal: bool = False) -> Path:
+    """Serialise the current run trace to a file under *out_dir*.
 
     Accepts both :class:`~lg_orch.state.OrchState` Pydantic models and plain
     dicts so it can be called from any context in the graph.
+
+    With ``journal=True`` the trace goes to ``run-<id>.ndjson`` instead: only
+    events not already journaled are appended, followed by the non-event
+    sections and a footer index (see :class:`TraceJournal`).
     """
     run_id = str(_state_get(state, "_run_id") or uuid.uuid4().hex)
 
@@ -137,6 +521,8 @@ def write_run_trace(*, repo_root: Path, out_dir: Path, state: Any) -> Path:
         raise OSError(f"failed to create trace dir: {out_dir_abs}") from exc
 
     out_path = out_dir_abs / f"run-{run_id}.json"
+    if journal:
+        out_path = trace_journal_path(out_path)
 
     trace_events_raw = _state_get(state, "_trace_events", []) or []
     tool_results_raw = _state_get(state, "tool_results", []) or []
@@ -165,7 +551,12 @@ def write_run_trace(*, repo_root: Path, out_dir: Path, state: Any) -> Path:
         "provenance": list(provenance_raw),
     }
     try:
-        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        if journal:
+            trace_journal = TraceJournal(out_path, run_id=run_id)
+            trace_journal.append_events(payload.pop("events"))
+            trace_journal.write_sections(payload)
+        else:
+            out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     except OSError as exc:
         raise OSError(f"failed to write trace: {out_path}") from exc
     return out_path
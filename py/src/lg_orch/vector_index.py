@@ -0,0 +1,672 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""
+Vector indexes behind :meth:`LongTermMemoryStore.search_semantic`.
+
+Two interchangeable implementations of :class:`VectorIndex`:
+
+  - ``flat``: :class:`EmbeddingMatrix`, an exact matrix-vector scan over a
+                memory-mapped float32 matrix.
+  - ``ivf``:  :class:`IVFFlatIndex`, an inverted-file index.  A spherical
+                k-means coarse quantizer splits the rows into ``n_lists``
+                clusters; a query scans only the ``n_probes`` clusters whose
+                centroids are closest, trading recall for latency.
+
+Both persist next to the SQLite database (``<db>.emb.*`` and ``<db>.ivf.*``)
+and accept incremental inserts.  Several stores may share one database: file
+writes happen under an advisory lock (``<db>.emb.lock``, POSIX only), and a
+writer first catches up on rows other processes appended, so every row id is
+written to the files once.  Vectors are compared by inner product, which
+is cosine similarity for the unit-norm embeddings the store writes.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Literal, Protocol
+
+import numpy as np
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # Windows: no advisory locks, one writer per database
+    _fcntl = None  # type: ignore[assignment]
+
+FloatArray = np.ndarray[Any, np.dtype[np.float32]]
+IdArray = np.ndarray[Any, np.dtype[np.int64]]
+ListArray = np.ndarray[Any, np.dtype[np.int32]]
+
+IndexKind = Literal["flat", "ivf"]
+
+# Rows required before the IVF quantizer is trained; below this the index
+# answers with an exact scan, which is both faster and exact at that size.
+_IVF_MIN_TRAIN_ROWS = 1024
+# Retrain the quantizer once the index has grown this many times over.
+_IVF_RETRAIN_GROWTH = 4
+_IVF_MAX_LISTS = 65536
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK = 16384
+
+
+class VectorIndex(Protocol):
+    """Row-id keyed vector index kept in step with ``semantic_memories``.
+
+    Rows are appended in ascending id order; :meth:`matches` lets the owner
+    detect an index that has drifted from the database and :meth:`reset` it.
+    """
+
+    def __len__(self) -> int: ...
+
+    @property
+    def last_id(self) -> int: ...
+
+    def load(self) -> None: ...
+
+    def matches(self, row_count: int, max_id: int) -> bool: ...
+
+    def reset(self) -> None: ...
+
+    def extend(self, rows: list[tuple[int, bytes]]) -> None: ...
+
+    def top_k(self, query_vec: FloatArray, top_k: int) -> list[tuple[int, float]]: ...
+
+
+def _select_top_k(sims: np.ndarray[Any, Any], k: int) -> np.ndarray[Any, np.dtype[np.intp]]:
+    """Indices of the *k* largest *sims*, best first, ties in index order."""
+    n = sims.shape[0]
+    k = min(k, n)
+    if k < n:
+        kth = np.partition(sims, n - k)[n - k]
+        above = np.flatnonzero(sims > kth)
+        ties = np.flatnonzero(sims == kth)[: k - above.shape[0]]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    order: np.ndarray[Any, np.dtype[np.intp]] = candidates[
+        np.lexsort((candidates, -sims[candidates]))
+    ]
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Flat (exact) index
+# ---------------------------------------------------------------------------
+
+
+class EmbeddingMatrix:
+    """Float32 embedding matrix with a parallel row-id array.
+
+    For a file-backed database the matrix lives next to it as
+    ``<db>.emb.f32`` (``n x dim`` float32, row-major) and ``<db>.emb.ids``
+    (an int64 ``dim`` header followed by ``n`` row ids) and is searched
+    through :class:`numpy.memmap`, so a restart maps the existing files
+    instead of re-reading every blob from SQLite.  ``:memory:`` databases
+    keep the matrix in RAM.  Rows whose blob does not have ``dim`` floats
+    are stored as zeros, matching the old per-row cosine that scored them 0.
+
+    The files may be shared by several processes: :meth:`load`,
+    :meth:`reset` and :meth:`extend` hold :meth:`file_lock`, and
+    :meth:`extend` first maps rows appended by others, then writes only ids
+    beyond the last one on disk.
+
+    Not thread-safe; :class:`LongTermMemoryStore` calls it under its lock.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        file_backed = bool(db_path) and db_path != ":memory:"
+        self.path_prefix = db_path if file_backed else None
+        self._vec_path = f"{db_path}.emb.f32" if file_backed else None
+        self._ids_path = f"{db_path}.emb.ids" if file_backed else None
+        self._lock_path = f"{db_path}.emb.lock" if file_backed else None
+        self._lock_depth = 0
+        self.dim = 0
+        self._count = 0
+        self._last_id = 0
+        self._vectors: FloatArray = np.empty((0, 0), np.float32)
+        self._ids: IdArray = np.empty(0, np.int64)
+        self._mapped = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    # -- persistence --
+
+    @contextmanager
+    def file_lock(self) -> Iterator[None]:
+        """Hold the cross-process lock on the matrix files (re-entrant)."""
+        if self._lock_path is None or _fcntl is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        with open(self._lock_path, "ab") as fh:
+            _fcntl.flock(fh.fileno(), _fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                _fcntl.flock(fh.fileno(), _fcntl.LOCK_UN)
+
+    def load(self) -> None:
+        """Map the on-disk matrix, dropping a trailing partially written row."""
+        with self.file_lock():
+            self._load()
+
+    def _load(self) -> None:
+        self._count = 0
+        self._last_id = 0
+        self._mapped = False
+        if self._vec_path is None or self._ids_path is None:
+            return
+        try:
+            ids_size = os.path.getsize(self._ids_path)
+            vec_size = os.path.getsize(self._vec_path)
+        except OSError:
+            return
+        if ids_size < 8:
+            return
+        with open(self._ids_path, "rb") as fh:
+            self.dim = int(np.frombuffer(fh.read(8), dtype=np.int64)[0])
+        count = (ids_size - 8) // 8
+        expected = count * self.dim * 4
+        if self.dim <= 0 or vec_size < expected:
+            return
+        if vec_size > expected:
+            os.truncate(self._vec_path, expected)
+        if ids_size != 8 + count * 8:
+            os.truncate(self._ids_path, 8 + count * 8)
+        self._count = count
+        self._remap()
+
+    def _remap(self) -> None:
+        if self._vec_path is None or self._ids_path is None:
+            return
+        if self._count == 0:
+            self._vectors = np.empty((0, self.dim), np.float32)
+            self._ids = np.empty(0, np.int64)
+        else:
+            self._vectors = np.memmap(
+                self._vec_path, dtype=np.float32, mode="r", shape=(self._count, self.dim)
+            )
+            self._ids = np.memmap(
+                self._ids_path, dtype=np.int64, mode="r", offset=8, shape=(self._count,)
+            )
+            self._last_id = int(self._ids[-1])
+        self._mapped = True
+
+    def matches(self, row_count: int, max_id: int) -> bool:
+        """Whether the matrix covers exactly the rows SQLite reports."""
+        return self._count == row_count and (row_count == 0 or self._last_id == max_id)
+
+    def reset(self) -> None:
+        """Drop every row (files are truncated, not deleted)."""
+        with self.file_lock():
+            self._reset()
+
+    def _reset(self) -> None:
+        self.dim = 0
+        self._count = 0
+        self._last_id = 0
+        self._vectors = np.empty((0, 0), np.float32)
+        self._ids = np.empty(0, np.int64)
+        self._mapped = True
+        if self._vec_path is not None and self._ids_path is not None:
+            with open(self._vec_path, "wb"), open(self._ids_path, "wb"):
+                pass
+
+    # -- writes --
+
+    def extend(self, rows: list[tuple[int, bytes]]) -> None:
+        """Append ``(row_id, float32 blob)`` pairs in ascending id order.
+
+        For file-backed matrices, rows another process already wrote are
+        mapped from disk rather than appended again.
+        """
+        if not rows:
+            return
+        if self._ids_path is None:
+            self._append(rows)
+            return
+        with self.file_lock():
+            self._catch_up()
+            self._append([row for row in rows if row[0] > self._last_id])
+
+    def _disk_count(self) -> int:
+        assert self._ids_path is not None
+        try:
+            return max(0, (os.path.getsize(self._ids_path) - 8) // 8)
+        except OSError:
+            return 0
+
+    def _catch_up(self) -> None:
+        """Map rows other processes appended since this matrix last wrote."""
+        on_disk = self._disk_count()
+        if on_disk == self._count:
+            return
+        if on_disk < self._count:
+            # Another store reset the files; the caller rebuilds in memory.
+            raise OSError("embedding matrix files shrank underneath this store")
+        self._load()
+
+    def _append(self, rows: list[tuple[int, bytes]]) -> None:
+        if not rows:
+            return
+        if self.dim == 0:
+            self.dim = len(rows[0][1]) // 4
+            if self.dim == 0:
+                return
+            if self._ids_path is not None:
+                with open(self._ids_path, "wb") as fh:
+                    fh.write(np.int64(self.dim).tobytes())
+        block = np.zeros((len(rows), self.dim), dtype=np.float32)
+        for i, (_, blob) in enumerate(rows):
+            if len(blob) == self.dim * 4:
+                block[i] = np.frombuffer(blob, dtype=np.float32)
+        ids = np.fromiter((row_id for row_id, _ in rows), dtype=np.int64, count=len(rows))
+        if self._vec_path is not None and self._ids_path is not None:
+            # Vectors first: load() trusts the id file and trims extra vector bytes.
+            with open(self._vec_path, "ab") as fh:
+                fh.write(block.tobytes())
+            with open(self._ids_path, "ab") as fh:
+                fh.write(ids.tobytes())
+            self._mapped = False
+        else:
+            self._vectors = np.concatenate([self._vectors.reshape(-1, self.dim), block])
+            self._ids = np.concatenate([self._ids, ids])
+        self._count += len(rows)
+        self._last_id = int(ids[-1])
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    # -- reads --
+
+    @property
+    def vectors(self) -> FloatArray:
+        """The ``n x dim`` matrix (a read-only memmap when file-backed)."""
+        if not self._mapped:
+            self._remap()
+        return self._vectors
+
+    @property
+    def ids(self) -> IdArray:
+        """Row ids parallel to :attr:`vectors`."""
+        if not self._mapped:
+            self._remap()
+        return self._ids
+
+    # -- search --
+
+    def top_k(self, query_vec: FloatArray, top_k: int) -> list[tuple[int, float]]:
+        """Return ``(row_id, similarity)`` for the *top_k* best rows, best first.
+
+        One matrix-vector product plus a partial sort (:func:`numpy.partition`);
+        ties keep insertion order.
+        """
+        if self._count == 0:
+            return []
+        vectors, ids = self.vectors, self.ids
+        if query_vec.shape[0] == self.dim:
+            sims = vectors @ query_vec.astype(np.float32, copy=False)
+        else:
+            sims = np.zeros(self._count, dtype=np.float32)
+        order = _select_top_k(sims, top_k)
+        return [(int(ids[i]), float(sims[i])) for i in order]
+
+
+# ---------------------------------------------------------------------------
+# IVF-flat (approximate) index
+# ---------------------------------------------------------------------------
+
+
+def _nearest_centroid(vectors: FloatArray, centroids: FloatArray) -> ListArray:
+    """Index of the most similar centroid for every row, in bounded chunks."""
+    labels = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], _ASSIGN_CHUNK):
+        block = np.asarray(vectors[start : start + _ASSIGN_CHUNK], dtype=np.float32)
+        labels[start : start + block.shape[0]] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def _normalise_rows(matrix: FloatArray) -> FloatArray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    out: FloatArray = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return out
+
+
+def _group_rows(labels: ListArray, n_lists: int, offset: int = 0) -> list[ListArray]:
+    """Split row positions ``offset + i`` into one ascending array per label."""
+    order = np.argsort(labels, kind="stable").astype(np.int32) + np.int32(offset)
+    counts = np.bincount(labels, minlength=n_lists)
+    return list(np.split(order, np.cumsum(counts)[:-1]))
+
+
+def spherical_kmeans(
+    data: FloatArray, n_clusters: int, *, iterations: int = _KMEANS_ITERATIONS, seed: int = 0
+) -> FloatArray:
+    """Unit-norm k-means centroids of *data* under inner-product similarity.
+
+    Lloyd iterations seeded from distinct random rows; a cluster that empties
+    is re-seeded from a random row so every centroid stays usable.
+    """
+    rng = np.random.default_rng(seed)
+    n = data.shape[0]
+    n_clusters = max(1, min(n_clusters, n))
+    centroids = _normalise_rows(data[rng.choice(n, n_clusters, replace=False)].copy())
+    for _ in range(iterations):
+        labels = _nearest_centroid(data, centroids)
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.zeros_like(centroids)
+        present = np.flatnonzero(counts)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[present]
+        sums[present] = np.add.reduceat(data[order], starts, axis=0)
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            sums[empty] = data[rng.choice(n, empty.size, replace=False)]
+        centroids = _normalise_rows(sums)
+    return centroids
+
+
+class IVFFlatIndex:
+    """Inverted-file index with flat (uncompressed) lists.
+
+    Wraps an :class:`EmbeddingMatrix`, which still owns the vectors; this
+    class adds the coarse quantizer and the per-cluster row lists.  For a
+    file-backed database the quantizer is ``<db>.ivf.npy`` (the centroids)
+    and ``<db>.ivf.assign`` (a CRC32 of the centroids followed by one int32
+    cluster per matrix row).  A checksum or length mismatch after a crash is
+    repaired on :meth:`load` by re-assigning rows against the saved centroids.
+
+    Until the matrix holds ``min_train_rows`` rows the index answers with the
+    matrix's exact scan.  The quantizer is trained on the first insert that
+    reaches that size and retrained whenever the row count has grown by
+    ``_IVF_RETRAIN_GROWTH`` since, so insert cost stays amortised O(1) per
+    row; other inserts are assigned to their nearest existing centroid.
+
+    Parameters
+    ----------
+    matrix:
+        The row store to index.
+    n_lists:
+        Number of clusters; ``None`` picks ``sqrt(n)`` at training time.
+    n_probes:
+        Clusters scanned per query.  Higher is slower and more accurate;
+        ``n_probes >= n_lists`` is an exact search.
+    min_train_rows:
+        Row count below which no quantizer is trained.
+    seed:
+        Seed for the k-means initialisation and training sample.
+
+    Not thread-safe; :class:`LongTermMemoryStore` calls it under its lock.
+    """
+
+    def __init__(
+        self,
+        matrix: EmbeddingMatrix,
+        *,
+        n_lists: int | None = None,
+        n_probes: int = 8,
+        min_train_rows: int = _IVF_MIN_TRAIN_ROWS,
+        seed: int = 0,
+    ) -> None:
+        if n_probes < 1:
+            raise ValueError("n_probes must be >= 1")
+        if n_lists is not None and n_lists < 1:
+            raise ValueError("n_lists must be >= 1")
+        self._matrix = matrix
+        self._n_lists = n_lists
+        self.n_probes = n_probes
+        self._min_train_rows = max(1, min_train_rows)
+        self._seed = seed
+        prefix = matrix.path_prefix
+        self._centroids_path = f"{prefix}.ivf.npy" if prefix else None
+        self._assign_path = f"{prefix}.ivf.assign" if prefix else None
+        self._centroids: FloatArray | None = None
+        self._lists: list[ListArray] = []
+        self._trained_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._matrix)
+
+    @property
+    def last_id(self) -> int:
+        return self._matrix.last_id
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def n_lists(self) -> int:
+        return 0 if self._centroids is None else int(self._centroids.shape[0])
+
+    # -- persistence --
+
+    def load(self) -> None:
+        """Load the matrix and the saved quantizer, repairing stale assignments."""
+        with self._matrix.file_lock():
+            self._load()
+
+    def _load(self) -> None:
+        self._matrix.load()
+        self._centroids = None
+        self._lists = []
+        centroids = self._read_centroids()
+        if centroids is not None and centroids.shape[1] == self._matrix.dim:
+            self._centroids = centroids
+            self._trained_rows = len(self._matrix)
+            labels = self._read_assignments(centroids)
+            if labels is None:
+                labels = _nearest_centroid(self._matrix.vectors, centroids)
+                self._write_assignments(labels, append=False)
+            elif labels.shape[0] < len(self._matrix):
+                tail = _nearest_centroid(self._matrix.vectors[labels.shape[0] :], centroids)
+                self._write_assignments(tail, append=True)
+                labels = np.concatenate([labels, tail])
+            self._lists = _group_rows(labels, centroids.shape[0])
+        self._maybe_train()
+
+    def _read_centroids(self) -> FloatArray | None:
+        if self._centroids_path is None:
+            return None
+        try:
+            centroids = np.load(self._centroids_path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        if centroids.ndim != 2 or centroids.dtype != np.float32:
+            return None
+        out: FloatArray = centroids
+        return out
+
+    def _read_assignments(self, centroids: FloatArray) -> ListArray | None:
+        """Saved labels for the matrix rows, or ``None`` when they are unusable."""
+        if self._assign_path is None:
+            return None
+        try:
+            raw = np.fromfile(self._assign_path, dtype=np.int32)
+        except (OSError, ValueError):
+            return None
+        if raw.shape[0] < 2 or raw[:2].view(np.int64)[0] != _checksum(centroids):
+            return None
+        labels = raw[2 : 2 + len(self._matrix)]
+        if labels.size and (labels.min() < 0 or labels.max() >= centroids.shape[0]):
+            return None
+        if raw.shape[0] > 2 + len(self._matrix):
+            os.truncate(self._assign_path, (2 + len(self._matrix)) * 4)
+        out: ListArray = labels
+        return out
+
+    def _write_assignments(self, labels: ListArray, *, append: bool) -> None:
+        if self._assign_path is None or self._centroids is None:
+            return
+        with open(self._assign_path, "ab" if append else "wb") as fh:
+            if not append:
+                fh.write(np.int64(_checksum(self._centroids)).tobytes())
+            fh.write(labels.astype(np.int32).tobytes())
+
+    def _append_assignments(self, labels: ListArray, start: int) -> None:
+        """Append the labels of rows ``start..`` that the file does not hold yet.
+
+        Skipped when another process retrained (the checksum differs) or the
+        file is short; :meth:`load` repairs both against the saved centroids.
+        """
+        if self._assign_path is None or self._centroids is None:
+            return
+        try:
+            with open(self._assign_path, "rb") as fh:
+                head = fh.read(8)
+            held = os.path.getsize(self._assign_path) // 4 - 2
+        except OSError:
+            return
+        if len(head) < 8 or int(np.frombuffer(head, np.int64)[0]) != _checksum(self._centroids):
+            return
+        if start <= held < start + labels.shape[0]:
+            self._write_assignments(labels[held - start :], append=True)
+
+    def matches(self, row_count: int, max_id: int) -> bool:
+        return self._matrix.matches(row_count, max_id)
+
+    def reset(self) -> None:
+        """Drop every row and the quantizer."""
+        with self._matrix.file_lock():
+            self._reset()
+
+    def _reset(self) -> None:
+        self._matrix.reset()
+        self._centroids = None
+        self._lists = []
+        self._trained_rows = 0
+        for path in (self._centroids_path, self._assign_path):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    # -- writes --
+
+    def extend(self, rows: list[tuple[int, bytes]]) -> None:
+        """Append rows to the matrix and file them under their nearest centroid."""
+        with self._matrix.file_lock():
+            self._extend(rows)
+
+    def _extend(self, rows: list[tuple[int, bytes]]) -> None:
+        start = len(self._matrix)
+        self._matrix.extend(rows)
+        if len(self._matrix) == start:
+            return
+        if self._maybe_train():
+            return
+        if self._centroids is None:
+            return
+        labels = _nearest_centroid(self._matrix.vectors[start:], self._centroids)
+        self._append_assignments(labels, start)
+        for label, positions in enumerate(_group_rows(labels, self.n_lists, offset=start)):
+            if positions.size:
+                self._lists[label] = np.concatenate([self._lists[label], positions])
+
+    def _maybe_train(self) -> bool:
+        count = len(self._matrix)
+        if count < self._min_train_rows:
+            return False
+        if self._centroids is not None and count < self._trained_rows * _IVF_RETRAIN_GROWTH:
+            return False
+        self.train()
+        return True
+
+    def train(self) -> None:
+        """(Re)build the quantizer from the current rows and re-file every row."""
+        vectors = self._matrix.vectors
+        count = vectors.shape[0]
+        if count == 0:
+            return
+        n_lists = self._n_lists or int(math.sqrt(count))
+        n_lists = max(1, min(n_lists, count, _IVF_MAX_LISTS))
+        rng = np.random.default_rng(self._seed)
+        sample_size = min(count, n_lists * _KMEANS_SAMPLE_PER_LIST)
+        sample_rows = np.sort(rng.choice(count, sample_size, replace=False))
+        sample = np.asarray(vectors[sample_rows], dtype=np.float32)
+        self._centroids = spherical_kmeans(sample, n_lists, seed=self._seed)
+        labels = _nearest_centroid(vectors, self._centroids)
+        self._lists = _group_rows(labels, self._centroids.shape[0])
+        self._trained_rows = count
+        if self._centroids_path is not None:
+            tmp_path = f"{self._centroids_path}.tmp"
+            with open(tmp_path, "wb") as fh:
+                np.save(fh, self._centroids, allow_pickle=False)
+            os.replace(tmp_path, self._centroids_path)
+        self._write_assignments(labels, append=False)
+
+    # -- search --
+
+    def top_k(self, query_vec: FloatArray, top_k: int) -> list[tuple[int, float]]:
+        """Return ``(row_id, similarity)`` for the best rows in the probed lists.
+
+        Scores are exact for every scanned row; only rows filed under
+        clusters outside the ``n_probes`` nearest can be missed.
+        """
+        centroids = self._centroids
+        if centroids is None or query_vec.shape[0] != self._matrix.dim:
+            return self._matrix.top_k(query_vec, top_k)
+        query = query_vec.astype(np.float32, copy=False)
+        n_probes = min(self.n_probes, centroids.shape[0])
+        centroid_sims = centroids @ query
+        probed = np.argpartition(-centroid_sims, n_probes - 1)[:n_probes]
+        positions = np.sort(np.concatenate([self._lists[i] for i in probed]))
+        if positions.size == 0:
+            return []
+        sims = self._matrix.vectors[positions] @ query
+        ids = self._matrix.ids
+        order = _select_top_k(sims, top_k)
+        return [(int(ids[positions[i]]), float(sims[i])) for i in order]
+
+
+def _checksum(centroids: FloatArray) -> int:
+    return zlib.crc32(np.ascontiguousarray(centroids).tobytes())
+
+
+def make_vector_index(
+    kind: str,
+    db_path: str,
+    *,
+    n_lists: int | None = None,
+    n_probes: int = 8,
+) -> VectorIndex:
+    """Build the index named by *kind* (``"flat"`` or ``"ivf"``) for *db_path*."""
+    matrix = EmbeddingMatrix(db_path)
+    if kind == "flat":
+        return matrix
+    if kind == "ivf":
+        return IVFFlatIndex(matrix, n_lists=n_lists, n_probes=n_probes)
+    raise ValueError(f"unknown vector index kind: {kind!r} (expected 'flat' or 'ivf')")
+
+
+def recall_at_k(approx: list[list[int]], exact: list[list[int]], k: int) -> float:
+    """Mean fraction of each query's exact top-*k* ids found in its approximate top-*k*."""
+    if not exact:
+        return 1.0
+    hits = 0
+    total = 0
+    for got, want in zip(approx, exact, strict=True):
+        truth = set(want[:k])
+        hits += len(truth.intersection(got[:k]))
+        total += len(truth)
+    return hits / total if total else 1.0
+
+
+__all__ = [
+    "EmbeddingMatrix",
+    "IVFFlatIndex",
+    "IndexKind",
+    "VectorIndex",
+    "make_vector_index",
+    "recall_at_k",
+    "spherical_kmeans",
+]
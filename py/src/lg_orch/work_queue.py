@@ -0,0 +1,519 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Christian Meurer — https://github.com/christianmeurer/Lula
+"""Redis-streams work queue that runs meta-graph sub-agents on other processes or nodes.
+
+:class:`RedisWorkQueue` is a drop-in ``run_graph`` for
+:class:`~lg_orch.meta_graph.MetaGraphScheduler`: each call ships the task's
+``input_state`` to a shared stream and awaits the final state posted back by
+whichever :class:`RedisTaskWorker` picked it up.  The scheduler keeps doing
+all DAG bookkeeping, so ``fail_fast`` (cancellation) and ``dynamic_rewiring``
+(``DependencyPatch`` results) behave exactly as with in-process coroutines::
+
+    queue = RedisWorkQueue("redis://redis:6379/0")
+    result = await run_meta_graph(tasks, queue, max_parallel=64)
+
+Workers run anywhere that can reach Redis::
+
+    python -m lg_orch.work_queue --redis-url redis://redis:6379/0 \\
+        --graph mypkg.graphs:run_subagent --concurrency 4
+
+Delivery
+--------
+Jobs live in the ``<namespace>:tasks`` stream, read through the ``workers``
+consumer group.  A worker holding a job heartbeats by re-claiming it (which
+resets its idle time) every third of ``lease_s``.  A job idle for longer than
+``lease_s`` belonged to a worker that died; the next worker with spare
+capacity takes it over (``XPENDING`` + ``XCLAIM``).  After ``max_attempts``
+deliveries the job is failed instead of retried again.  Results go to a
+per-coordinator stream, and a cancelled call sets a cancel marker that
+workers check before starting and on every heartbeat.
+
+Requires the ``redis`` optional dependency group (``pip install lg-orch[redis]``).
+
+Exported public names:
+    RedisWorkQueue, RedisTaskWorker, LocalWorkerPool, run_worker
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from lg_orch.meta_graph import DependencyPatch
+
+__all__ = [
+    "LocalWorkerPool",
+    "RedisTaskWorker",
+    "RedisWorkQueue",
+    "run_worker",
+]
+
+log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+RunGraph = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+_DEFAULT_NAMESPACE = "lula:metaq"
+_GROUP = "workers"
+_CANCEL_TTL_S = 3600
+
+
+def _async_client(redis_url: str) -> Any:
+    import redis.asyncio as redis_async
+
+    return redis_async.from_url(redis_url, decode_responses=True)
+
+
+async def _ensure_group(client: Any, stream: str) -> None:
+    if await client.exists(stream) and any(
+        g.get("name") == _GROUP for g in await client.xinfo_groups(stream)
+    ):
+        return
+    try:
+        await client.xgroup_create(stream, _GROUP, id="0", mkstream=True)
+    except Exception as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+def _json_default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _encode(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=_json_default)
+
+
+def _decode_result(raw: str) -> dict[str, Any]:
+    result = json.loads(raw)
+    if not isinstance(result, dict):
+        raise ValueError("worker result is not a JSON object")
+    patch = result.get("dependency_patch")
+    if isinstance(patch, dict):
+        result["dependency_patch"] = DependencyPatch(
+            add_edges=[(str(a), str(b)) for a, b in patch.get("add_edges", [])],
+            remove_edges=[(str(a), str(b)) for a, b in patch.get("remove_edges", [])],
+        )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Coordinator side
+# ---------------------------------------------------------------------------
+
+
+class RedisWorkQueue:
+    """``run_graph`` callable that executes each call on a remote worker.
+
+    Args:
+        redis_url: Redis/Valkey URL; ignored when *client* is given.
+        client: A ``redis.asyncio`` client (``decode_responses=True``).
+        namespace: Key prefix shared with the workers.
+        result_timeout_s: Give up on a job after this long (``None`` waits
+            for as long as workers keep it alive).
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        *,
+        client: Any = None,
+        namespace: str = _DEFAULT_NAMESPACE,
+        result_timeout_s: float | None = None,
+        block_ms: int = 500,
+    ) -> None:
+        if client is None:
+            if not redis_url:
+                raise ValueError("redis_url or client is required")
+            client = _async_client(redis_url)
+        self._client: Any = client
+        self._ns = namespace
+        self._tasks_key = f"{namespace}:tasks"
+        self._results_key = f"{namespace}:results:{uuid.uuid4().hex}"
+        self._result_timeout_s = result_timeout_s
+        self._block_ms = block_ms
+        self._waiters: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._collector: asyncio.Task[None] | None = None
+        self._group_ready = False
+        self._group_lock = asyncio.Lock()
+
+    async def __call__(self, state: dict[str, Any]) -> dict[str, Any]:
+        if not self._group_ready:
+            async with self._group_lock:
+                if not self._group_ready:
+                    await _ensure_group(self._client, self._tasks_key)
+                    self._group_ready = True
+        job_id = uuid.uuid4().hex
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._waiters[job_id] = future
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect(), name="work_queue_collector")
+        try:
+            await self._client.xadd(
+                self._tasks_key,
+                {"job_id": job_id, "reply_to": self._results_key, "state": _encode(state)},
+            )
+            log.debug("work_queue.submitted", job_id=job_id, task_id=state.get("task_id"))
+            return await asyncio.wait_for(asyncio.shield(future), self._result_timeout_s)
+        except (asyncio.CancelledError, TimeoutError):
+            # Workers skip or abort cancelled jobs at their next check.
+            with contextlib.suppress(Exception):
+                await self._client.set(f"{self._ns}:cancel:{job_id}", "1", ex=_CANCEL_TTL_S)
+            raise
+        finally:
+            self._waiters.pop(job_id, None)
+
+    async def _collect(self) -> None:
+        """Route result stream entries to waiting calls; exits when none are waiting."""
+        last_id = "0-0"
+        while self._waiters:
+            try:
+                reply = await self._client.xread(
+                    {self._results_key: last_id}, count=100, block=self._block_ms
+                )
+            except Exception as exc:
+                log.warning("work_queue.collect_failed", error=str(exc))
+                await asyncio.sleep(self._block_ms / 1000.0)
+                continue
+            if not reply:
+                await asyncio.sleep(0)
+            for _stream, entries in reply or []:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    self._resolve(fields)
+                    await self._client.xdel(self._results_key, entry_id)
+
+    def _resolve(self, fields: dict[str, str]) -> None:
+        future = self._waiters.get(fields.get("job_id", ""))
+        if future is None or future.done():
+            return  # duplicate from a retried job, or the caller gave up
+        if fields.get("ok") == "1":
+            try:
+                future.set_result(_decode_result(fields.get("result", "{}")))
+            except ValueError as exc:
+                future.set_exception(RuntimeError(f"undecodable worker result: {exc}"))
+        else:
+            future.set_exception(RuntimeError(fields.get("error", "worker failed")))
+
+    async def close(self) -> None:
+        if self._collector is not None:
+            self._collector.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._collector
+        with contextlib.suppress(Exception):
+            await self._client.delete(self._results_key)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+class RedisTaskWorker:
+    """Consumes jobs from the work queue and runs them with *run_graph*.
+
+    Args:
+        run_graph: Async callable (initial-state dict → final-state dict).
+        redis_url: Redis/Valkey URL; ignored when *client* is given.
+        client: A ``redis.asyncio`` client (``decode_responses=True``).
+        namespace: Key prefix shared with the coordinator.
+        consumer: Consumer name; defaults to ``<hostname>:<pid>:<random>``.
+        concurrency: Jobs run at once by this worker.
+        lease_s: Idle time after which another worker may take a job over.
+        max_attempts: Deliveries before a job is failed rather than retried.
+    """
+
+    def __init__(
+        self,
+        run_graph: RunGraph,
+        redis_url: str | None = None,
+        *,
+        client: Any = None,
+        namespace: str = _DEFAULT_NAMESPACE,
+        consumer: str | None = None,
+        concurrency: int = 1,
+        lease_s: float = 30.0,
+        max_attempts: int = 3,
+        block_ms: int = 500,
+    ) -> None:
+        if client is None:
+            if not redis_url:
+                raise ValueError("redis_url or client is required")
+            client = _async_client(redis_url)
+        self._client: Any = client
+        self._run_graph = run_graph
+        self._ns = namespace
+        self._tasks_key = f"{namespace}:tasks"
+        self.consumer = consumer or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._concurrency = max(1, concurrency)
+        self._lease_ms = max(1, int(lease_s * 1000))
+        self._max_attempts = max(1, max_attempts)
+        self._block_ms = block_ms
+        self._active: set[asyncio.Task[None]] = set()
+
+    async def run(self, *, stop: asyncio.Event | None = None, max_jobs: int | None = None) -> int:
+        """Process jobs until *stop* is set or *max_jobs* have been taken; returns the count."""
+        await _ensure_group(self._client, self._tasks_key)
+        taken = 0
+        try:
+            while (stop is None or not stop.is_set()) and (max_jobs is None or taken < max_jobs):
+                free = self._concurrency - len(self._active)
+                if max_jobs is not None:
+                    free = min(free, max_jobs - taken)
+                if free <= 0:
+                    await asyncio.wait(self._active, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                try:
+                    messages = await self._next_messages(free)
+                except Exception as exc:
+                    log.warning("work_queue.poll_failed", consumer=self.consumer, error=str(exc))
+                    await asyncio.sleep(self._block_ms / 1000.0)
+                    continue
+                if not messages:
+                    # Yield even when the client returns without blocking.
+                    await asyncio.sleep(0)
+                for msg_id, fields in messages:
+                    taken += 1
+                    job = asyncio.create_task(self._handle(msg_id, fields))
+                    self._active.add(job)
+                    job.add_done_callback(self._active.discard)
+        finally:
+            if self._active:
+                await asyncio.wait(self._active)
+        return taken
+
+    async def _next_messages(self, count: int) -> list[tuple[str, dict[str, str]]]:
+        # Jobs orphaned by dead workers first, then new ones.
+        stale = await self._client.xpending_range(
+            self._tasks_key, _GROUP, min="-", max="+", count=count, idle=self._lease_ms
+        )
+        orphans: list[tuple[str, dict[str, str]]] = []
+        if stale:
+            claimed = await self._client.xclaim(
+                self._tasks_key,
+                _GROUP,
+                self.consumer,
+                self._lease_ms,
+                [entry["message_id"] for entry in stale],
+            )
+            orphans = [(msg_id, fields) for msg_id, fields in claimed if fields]
+        if orphans:
+            log.info("work_queue.reclaimed", consumer=self.consumer, count=len(orphans))
+            return orphans
+        reply = await self._client.xreadgroup(
+            _GROUP, self.consumer, {self._tasks_key: ">"}, count=count, block=self._block_ms
+        )
+        return [(msg_id, fields) for _stream, entries in reply or [] for msg_id, fields in entries]
+
+    async def _cancelled(self, job_id: str) -> bool:
+        return bool(await self._client.exists(f"{self._ns}:cancel:{job_id}"))
+
+    async def _deliveries(self, msg_id: str) -> int:
+        pending = await self._client.xpending_range(
+            self._tasks_key, _GROUP, min=msg_id, max=msg_id, count=1
+        )
+        return int(pending[0]["times_delivered"]) if pending else 1
+
+    async def _finish(self, msg_id: str, reply_to: str, fields: dict[str, str]) -> None:
+        if reply_to:
+            await self._client.xadd(reply_to, fields)
+        await self._client.xack(self._tasks_key, _GROUP, msg_id)
+        await self._client.xdel(self._tasks_key, msg_id)
+
+    async def _handle(self, msg_id: str, fields: dict[str, str]) -> None:
+        job_id = fields.get("job_id", "")
+        reply_to = fields.get("reply_to", "")
+        if await self._cancelled(job_id):
+            await self._finish(msg_id, "", {})
+            return
+        attempts = await self._deliveries(msg_id)
+        if attempts > self._max_attempts:
+            log.warning("work_queue.job_abandoned", job_id=job_id, attempts=attempts)
+            await self._finish(
+                msg_id,
+                reply_to,
+                {
+                    "job_id": job_id,
+                    "ok": "0",
+                    "error": f"job lost its worker {attempts - 1} times; giving up",
+                },
+            )
+            return
+
+        run = asyncio.create_task(self._run(fields))
+        beat = asyncio.create_task(self._heartbeat(msg_id, job_id, run))
+        try:
+            outcome = await run
+        except asyncio.CancelledError:
+            log.info("work_queue.job_cancelled", job_id=job_id, consumer=self.consumer)
+            await self._finish(msg_id, "", {})
+            return
+        finally:
+            beat.cancel()
+            # The heartbeat never decides the job's outcome.
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await beat
+        await self._finish(msg_id, reply_to, {"job_id": job_id, **outcome})
+
+    async def _run(self, fields: dict[str, str]) -> dict[str, str]:
+        try:
+            state = json.loads(fields.get("state", "{}"))
+            result = await self._run_graph(state)
+            return {"ok": "1", "result": _encode(result)}
+        except Exception as exc:
+            return {"ok": "0", "error": str(exc) or type(exc).__name__}
+
+    async def _heartbeat(self, msg_id: str, job_id: str, run: asyncio.Task[Any]) -> None:
+        """Renew the lease every third of it until cancelled.
+
+        A failed renewal is logged and retried on the next beat; the job
+        keeps running either way.
+        """
+        interval = self._lease_ms / 3000.0
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Re-claiming our own entry resets its idle time without
+                # counting as another delivery.
+                await self._client.xclaim(
+                    self._tasks_key, _GROUP, self.consumer, 0, [msg_id], justid=True
+                )
+                cancelled = await self._cancelled(job_id)
+            except Exception as exc:
+                log.warning("work_queue.heartbeat_failed", job_id=job_id, error=str(exc))
+                continue
+            if cancelled:
+                run.cancel()
+                return
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+
+def _resolve_graph(path: str) -> RunGraph:
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"graph must look like 'package.module:function', got {path!r}")
+    target = getattr(importlib.import_module(module_name), attr)
+    if not callable(target):
+        raise ValueError(f"{path!r} is not callable")
+    return target  # type: ignore[no-any-return]
+
+
+def run_worker(
+    redis_url: str,
+    graph: str,
+    *,
+    namespace: str = _DEFAULT_NAMESPACE,
+    concurrency: int = 1,
+    lease_s: float = 30.0,
+    max_attempts: int = 3,
+) -> None:
+    """Blocking worker entry point; *graph* is a ``module:function`` path."""
+    worker = RedisTaskWorker(
+        _resolve_graph(graph),
+        redis_url,
+        namespace=namespace,
+        concurrency=concurrency,
+        lease_s=lease_s,
+        max_attempts=max_attempts,
+    )
+    log.info("work_queue.worker_started", consumer=worker.consumer, graph=graph)
+    asyncio.run(worker.run())
+
+
+class LocalWorkerPool:
+    """Runs *processes* :func:`run_worker` processes on this machine.
+
+    Handy for a single large pod and for tests; on a cluster run the
+    ``python -m lg_orch.work_queue`` entry point on each node instead.
+    """
+
+    def __init__(self, redis_url: str, graph: str, *, processes: int = 2, **worker_kwargs: Any):
+        self._redis_url = redis_url
+        self._graph = graph
+        self._processes = max(1, processes)
+        self._worker_kwargs = worker_kwargs
+        self._ctx = multiprocessing.get_context("spawn")
+        self.procs: list[Any] = []
+
+    def start(self) -> LocalWorkerPool:
+        for _ in range(self._processes):
+            proc = self._ctx.Process(
+                target=run_worker,
+                args=(self._redis_url, self._graph),
+                kwargs=self._worker_kwargs,
+                daemon=True,
+            )
+            proc.start()
+            self.procs.append(proc)
+        return self
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        for proc in self.procs:
+            if proc.is_alive():
+                proc.terminate()
+        for proc in self.procs:
+            proc.join(timeout_s)
+        self.procs.clear()
+
+    def __enter__(self) -> LocalWorkerPool:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run meta-graph sub-agent workers.")
+    parser.add_argument("--redis-url", default=os.environ.get("LG_CHECKPOINT_REDIS_URL", ""))
+    parser.add_argument("--graph", required=True, help="module:function of the run_graph")
+    parser.add_argument("--namespace", default=_DEFAULT_NAMESPACE)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--lease-s", type=float, default=30.0)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    args = parser.parse_args(argv)
+    if not args.redis_url:
+        parser.error("--redis-url or LG_CHECKPOINT_REDIS_URL is required")
+    kwargs: dict[str, Any] = {
+        "namespace": args.namespace,
+        "concurrency": args.concurrency,
+        "lease_s": args.lease_s,
+        "max_attempts": args.max_attempts,
+    }
+    if args.processes <= 1:
+        run_worker(args.redis_url, args.graph, **kwargs)
+        return 0
+    pool = LocalWorkerPool(args.redis_url, args.graph, processes=args.processes, **kwargs)
+    pool.start()
+    try:
+        for proc in pool.procs:
+            proc.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
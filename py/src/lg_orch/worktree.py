@@ -3,7 +3,7 @@
 """Git-worktree-based branch isolation for parallel agents (Wave 8).
 
 Public surface:
-    WorktreeContext, WorktreeError, WorktreeLease,
+    WorktreeContext, WorktreeError, WorktreeLease, WorktreePool,
     create_worktree, remove_worktree, merge_worktree,
     cleanup_orphaned_worktrees
 """
@@ -11,10 +11,13 @@ Public surface:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import dataclasses
 import logging
 import os
 import subprocess
+import time
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING
@@ -28,6 +31,7 @@ __all__ = [
     "WorktreeContext",
     "WorktreeError",
     "WorktreeLease",
+    "WorktreePool",
     "cleanup_orphaned_worktrees",
     "create_worktree",
     "merge_worktree",
@@ -36,6 +40,13 @@ __all__ = [
 
 _log = structlog.get_logger(__name__)
 
+try:
+    from lg_orch.api.metrics import LULA_WORKTREE_POOL_LEASES_TOTAL as _POOL_LEASES_TOTAL
+    from lg_orch.api.metrics import LULA_WORKTREE_POOL_WAIT_SECONDS as _POOL_WAIT_SECONDS
+except ImportError:
+    _POOL_LEASES_TOTAL = None  # type: ignore[assignment]
+    _POOL_WAIT_SECONDS = None  # type: ignore[assignment]
+
 
 class WorktreeError(Exception):
     """Raised when a git worktree operation fails."""
@@ -268,6 +279,293 @@ class WorktreeLease:
         await remove_worktree(self._ctx)
 
 
+# ---------------------------------------------------------------------------
+# Worktree pool
+# ---------------------------------------------------------------------------
+
+
+@dataclasses.dataclass
+class _PoolSlot:
+    """One pooled worktree and the checkout state it was left in."""
+
+    index: int
+    branch: str  # "lg-orch/pool-{index}"
+    path: str
+    sparse: tuple[str, ...] = ()  # () means a full checkout
+    clean: bool = False  # reset to the base branch since its last use
+
+
+class WorktreePool:
+    """Pre-created git worktrees handed out by lease and recycled after use.
+
+    :func:`create_worktree` checks out the whole tree for every sub-agent,
+    which dominates short tasks on large repositories.  The pool keeps up to
+    *max_size* worktrees under ``<base_path>/.lg_orch_worktrees/pool-<n>``,
+    each on its own ``lg-orch/pool-<n>`` branch.  :meth:`lease` borrows an
+    idle one (a *hit*), creates one while the pool is below *max_size* (a
+    *miss*), or waits for a release.
+
+    Releasing behaves like :class:`WorktreeLease`: on a clean exit the branch
+    is merged into the base branch (merges are serialised).  The worktree is
+    then reset to the base branch with ``git reset --hard`` and
+    ``git clean -fdx`` and returned to the pool.  A worktree that cannot be
+    reset is removed instead.
+
+    A lease may name the *paths* its task needs; the worktree is then
+    switched to a (non-cone) sparse checkout of just those paths.  The
+    pattern set stays in place until a lease asks for a different one.
+
+    Use as an async context manager, or call :meth:`start` and :meth:`close`::
+
+        async with WorktreePool(repo, size=4) as pool:
+            async with pool.lease("task-1", paths=["src/auth"]) as ctx:
+                ...
+
+    Args:
+        base_path: Root of the git repository checkout.
+        size:      Worktrees created up front by :meth:`start`.
+        max_size:  Upper bound on worktrees; defaults to *size*.
+    """
+
+    def __init__(self, base_path: str, size: int = 4, *, max_size: int | None = None) -> None:
+        self._base_path = os.path.abspath(base_path)
+        self._root = os.path.join(self._base_path, ".lg_orch_worktrees")
+        self.size = max(0, size)
+        self.max_size = max(1, self.size, max_size or 0)
+        self._slots: dict[int, _PoolSlot] = {}
+        self._idle: asyncio.Queue[_PoolSlot] = asyncio.Queue()
+        self._next_index = 0
+        self._base_branch = "main"
+        self._base_ref: str | None = None
+        self._init_lock = asyncio.Lock()
+        self._merge_lock = asyncio.Lock()
+        # git does not support concurrent worktree add/remove on one repo.
+        self._admin_lock = asyncio.Lock()
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.wait_s = 0.0
+
+    async def __aenter__(self) -> WorktreePool:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self) -> None:
+        """Create worktrees until the pool holds *size* of them.
+
+        Creation is serialised (see :meth:`_create`), so this costs *size*
+        sequential ``git worktree add`` calls; each skips the checkout.
+        """
+        await self._resolve_base()
+        slots = [self._reserve_slot() for _ in range(self.size - len(self._slots))]
+        results = await asyncio.gather(
+            *(self._create(slot) for slot in slots), return_exceptions=True
+        )
+        for slot, outcome in zip(slots, results, strict=True):
+            if isinstance(outcome, BaseException):
+                self._slots.pop(slot.index, None)
+                _log.warning("worktree.pool_warm_failed", path=slot.path, error=str(outcome))
+                continue
+            self._idle.put_nowait(slot)
+        _log.info("worktree.pool_started", size=len(self._slots), base_branch=self._base_branch)
+
+    async def close(self) -> None:
+        """Remove every idle worktree; leased ones are removed on release."""
+        self._closed = True
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+
+    def stats(self) -> dict[str, float | int]:
+        """Pool size and the hit/miss/wait counters since creation."""
+        return {
+            "size": len(self._slots),
+            "idle": self._idle.qsize(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "wait_s": round(self.wait_s, 6),
+        }
+
+    # -- leasing ------------------------------------------------------------
+
+    @contextlib.asynccontextmanager
+    async def lease(
+        self,
+        run_id: str,
+        *,
+        paths: Iterable[str] | None = None,
+        merge: bool = True,
+    ) -> AsyncIterator[WorktreeContext]:
+        """Borrow a worktree for *run_id*; see the class docstring for release."""
+        slot = await self._acquire(tuple(sorted(set(paths or ()))))
+        ctx = WorktreeContext(
+            run_id=run_id,
+            branch=slot.branch,
+            worktree_path=slot.path,
+            base_branch=self._base_branch,
+        )
+        succeeded = False
+        try:
+            yield ctx
+            succeeded = True
+        finally:
+            # Shielded so a cancelled task still returns its worktree.
+            await asyncio.shield(self._release(slot, ctx, merge=merge and succeeded))
+
+    async def _acquire(self, paths: tuple[str, ...]) -> _PoolSlot:
+        if self._closed:
+            raise WorktreeError("worktree pool is closed")
+        await self._resolve_base()
+        started = time.monotonic()
+        outcome = "hit"
+        if not self._idle.empty():
+            slot = self._idle.get_nowait()
+        elif len(self._slots) < self.max_size:
+            outcome = "miss"
+            slot = self._reserve_slot()
+            try:
+                await self._create(slot)
+            except BaseException:
+                self._slots.pop(slot.index, None)
+                raise
+        else:
+            slot = await self._idle.get()
+        try:
+            await self._prepare(slot, paths)
+        except BaseException:
+            await self._discard(slot)
+            raise
+        waited = time.monotonic() - started
+        if outcome == "hit":
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.wait_s += waited
+        if _POOL_LEASES_TOTAL is not None:
+            _POOL_LEASES_TOTAL.labels(outcome=outcome).inc()
+        if _POOL_WAIT_SECONDS is not None:
+            _POOL_WAIT_SECONDS.observe(waited)
+        _log.debug("worktree.pool_lease", path=slot.path, outcome=outcome, wait_s=round(waited, 4))
+        return slot
+
+    async def _release(self, slot: _PoolSlot, ctx: WorktreeContext, *, merge: bool) -> None:
+        if merge:
+            async with self._merge_lock:
+                try:
+                    await merge_worktree(ctx)
+                except WorktreeError:
+                    _log.warning("worktree.merge_failed", run_id=ctx.run_id, exc_info=True)
+        if self._closed:
+            await self._discard(slot)
+            return
+        try:
+            await self._reset(slot)
+        except WorktreeError:
+            _log.warning("worktree.pool_reset_failed", path=slot.path, exc_info=True)
+            await self._discard(slot)
+            return
+        self._idle.put_nowait(slot)
+
+    # -- git plumbing -----------------------------------------------------
+
+    async def _resolve_base(self) -> None:
+        async with self._init_lock:
+            if self._base_ref is not None:
+                return
+            rc, branch, err = await _run_git(
+                "rev-parse", "--abbrev-ref", "HEAD", cwd=self._base_path
+            )
+            if rc != 0:
+                raise WorktreeError(f"git rev-parse --abbrev-ref HEAD failed (rc={rc}): {err}")
+            if branch == "HEAD":
+                # Detached: pin the pool to the commit itself.
+                rc, branch, err = await _run_git("rev-parse", "HEAD", cwd=self._base_path)
+                if rc != 0:
+                    raise WorktreeError(f"git rev-parse HEAD failed (rc={rc}): {err}")
+            self._base_branch = branch or "main"
+            # Forget worktrees whose directories vanished, so their pool
+            # branches can be checked out again.
+            await _run_git("worktree", "prune", cwd=self._base_path)
+            self._base_ref = self._base_branch
+
+    def _reserve_slot(self) -> _PoolSlot:
+        index = self._next_index
+        self._next_index += 1
+        slot = _PoolSlot(
+            index=index,
+            branch=f"lg-orch/pool-{index}",
+            path=os.path.join(self._root, f"pool-{index}"),
+        )
+        self._slots[index] = slot
+        return slot
+
+    async def _create(self, slot: _PoolSlot) -> None:
+        """Register the worktree without populating it; :meth:`_reset` does that."""
+        async with self._admin_lock:
+            await self._add_worktree(slot)
+
+    async def _add_worktree(self, slot: _PoolSlot) -> None:
+        assert self._base_ref is not None
+        if os.path.exists(slot.path):
+            # Left behind by an earlier process.
+            await _run_git("worktree", "remove", "--force", slot.path, cwd=self._base_path)
+        rc, _, err = await _run_git(
+            "worktree",
+            "add",
+            "--no-checkout",
+            "-B",
+            slot.branch,
+            slot.path,
+            self._base_ref,
+            cwd=self._base_path,
+        )
+        if rc != 0:
+            raise WorktreeError(f"git worktree add failed for {slot.path!r} (rc={rc}): {err}")
+        slot.clean = False
+        _log.debug("worktree.pool_created", branch=slot.branch, path=slot.path)
+
+    async def _prepare(self, slot: _PoolSlot, paths: tuple[str, ...]) -> None:
+        if paths != slot.sparse:
+            args = ("set", "--no-cone", *paths) if paths else ("disable",)
+            rc, _, err = await _run_git("sparse-checkout", *args, cwd=slot.path)
+            if rc != 0:
+                raise WorktreeError(f"git sparse-checkout {args[0]} failed (rc={rc}): {err}")
+            slot.sparse = paths
+            slot.clean = False
+        if not slot.clean:
+            await self._reset(slot)
+        slot.clean = False
+
+    async def _reset(self, slot: _PoolSlot) -> None:
+        assert self._base_ref is not None
+        for args in (("reset", "--hard", "-q", self._base_ref), ("clean", "-fdxq")):
+            rc, _, err = await _run_git(*args, cwd=slot.path)
+            if rc != 0:
+                raise WorktreeError(f"git {args[0]} failed in {slot.path!r} (rc={rc}): {err}")
+        slot.clean = True
+
+    async def _discard(self, slot: _PoolSlot) -> None:
+        self._slots.pop(slot.index, None)
+        async with self._admin_lock:
+            await remove_worktree(
+                WorktreeContext(
+                    run_id=f"pool-{slot.index}",
+                    branch=slot.branch,
+                    worktree_path=slot.path,
+                    base_branch=self._base_branch,
+                )
+            )
+
+
 # ---------------------------------------------------------------------------
 # Orphan recovery (startup cleanup)
 # ---------------------------------------------------------------------------
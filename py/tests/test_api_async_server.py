@@ -0,0 +1,210 @@
+"""Tests for lg_orch.api.async_server (remote_api.server_mode = "asyncio")."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from lg_orch.api.async_server import (
+    AsyncRemoteAPIServer,
+    HTTPRequest,
+    HTTPResponse,
+    ServerLimits,
+)
+from lg_orch.api.broadcast import BroadcastBatch, RunBroadcast, Subscription
+from lg_orch.api.metrics import handle_metrics
+
+
+class _FakeService:
+    """Just the stream hooks AsyncRemoteAPIServer calls for ``-1`` SSE responses."""
+
+    def __init__(self) -> None:
+        self.broadcast = RunBroadcast("run-1")
+
+    def open_run_stream(
+        self, run_id: str
+    ) -> tuple[dict[str, Any], list[str], Subscription | None] | None:
+        if run_id != "run-1":
+            return None
+        return {"run_id": run_id, "finished_at": None}, ["boot"], self.broadcast.subscribe()
+
+    def apply_stream_batch(
+        self, run_id: str, state: dict[str, Any], batch: BroadcastBatch
+    ) -> tuple[dict[str, Any], list[str]]:
+        lines: list[str] = []
+        for item in batch.frames:
+            if item.get("kind") == "log":
+                lines.extend(item["lines"])
+            elif item.get("kind") == "state":
+                state = item["payload"]
+        return state, lines
+
+
+def _handler(request: HTTPRequest) -> HTTPResponse:
+    if request.target.startswith("/v1/runs/") and request.target.endswith("/stream"):
+        run_id = request.target.split("/")[3]
+        return HTTPResponse(status=-1, content_type="sse", body=run_id.encode())
+    if request.target == "/slow":
+        threading.Event().wait(0.3)
+    payload = {
+        "method": request.method,
+        "target": request.target,
+        "body": (request.body or b"").decode(),
+        "request_id": request.headers.get("x-request-id"),
+    }
+    return HTTPResponse(
+        status=200,
+        content_type="application/json",
+        body=json.dumps(payload).encode(),
+        headers=[("X-Request-ID", "rid")],
+    )
+
+
+@pytest.fixture
+async def server_factory() -> AsyncIterator[Any]:
+    servers: list[AsyncRemoteAPIServer] = []
+
+    async def _make(
+        limits: ServerLimits | None = None, service: Any = None
+    ) -> tuple[AsyncRemoteAPIServer, int]:
+        server = AsyncRemoteAPIServer(service or _FakeService(), _handler, limits=limits)
+        _, port = await server.start("127.0.0.1", 0)
+        servers.append(server)
+        return server, port
+
+    yield _make
+    for server in servers:
+        await server.close()
+
+
+async def _request(port: int, raw: bytes) -> tuple[int, dict[str, str], bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    data = await asyncio.wait_for(reader.read(), 5)
+    writer.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(lines[0].split()[1]), headers, body
+
+
+async def test_get_and_post_round_trip(server_factory: Any) -> None:
+    _, port = await server_factory()
+    status, headers, body = await _request(
+        port, b"GET /healthz HTTP/1.1\r\nHost: x\r\nX-Request-ID: abc\r\n\r\n"
+    )
+    assert status == 200
+    assert headers["x-request-id"] == "rid"
+    assert headers["connection"] == "close"
+    assert json.loads(body) == {
+        "method": "GET",
+        "target": "/healthz",
+        "body": "",
+        "request_id": "abc",
+    }
+
+    status, _, body = await _request(
+        port, b'POST /v1/runs HTTP/1.1\r\nContent-Length: 7\r\n\r\n{"a":1}'
+    )
+    assert status == 200
+    assert json.loads(body)["body"] == '{"a":1}'
+
+
+async def test_malformed_and_unsupported_requests(server_factory: Any) -> None:
+    _, port = await server_factory(ServerLimits(max_body_bytes=4))
+    assert (await _request(port, b"garbage\r\n\r\n"))[0] == 400
+    assert (await _request(port, b"DELETE / HTTP/1.1\r\n\r\n"))[0] == 501
+    assert (await _request(port, b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\n"))[0] == 413
+
+
+async def test_connection_limit_returns_503_with_retry_after(server_factory: Any) -> None:
+    server, port = await server_factory(ServerLimits(max_connections=1, retry_after_secs=7))
+    # An idle connection that never finishes its headers holds the only slot.
+    _, idle = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(50):
+        if server.connections == 1:
+            break
+        await asyncio.sleep(0.01)
+    status, headers, body = await _request(port, b"GET /healthz HTTP/1.1\r\n\r\n")
+    assert status == 503
+    assert headers["retry-after"] == "7"
+    assert json.loads(body) == {"error": "overloaded", "reason": "connections"}
+    idle.close()
+
+
+async def test_worker_queue_limit_returns_503(server_factory: Any) -> None:
+    _, port = await server_factory(ServerLimits(worker_threads=1, max_queued_requests=0))
+    slow = asyncio.create_task(_request(port, b"GET /slow HTTP/1.1\r\n\r\n"))
+    await asyncio.sleep(0.1)
+    status, headers, _ = await _request(port, b"GET /healthz HTTP/1.1\r\n\r\n")
+    assert status == 503 and "retry-after" in headers
+    assert (await slow)[0] == 200
+
+
+async def test_in_flight_gauge_is_exported(server_factory: Any) -> None:
+    server, port = await server_factory()
+    slow = asyncio.create_task(_request(port, b"GET /slow HTTP/1.1\r\n\r\n"))
+    await asyncio.sleep(0.1)
+    assert server.in_flight == 1
+    _, _, metrics = handle_metrics("GET")
+    assert b"lula_http_requests_in_flight" in metrics
+    await slow
+    assert server.in_flight == 0
+
+
+async def test_sse_stream_is_served_on_the_event_loop(server_factory: Any) -> None:
+    service = _FakeService()
+    server, port = await server_factory(service=service)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /v1/runs/run-1/stream HTTP/1.1\r\n\r\n")
+    await writer.drain()
+    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+    assert b"text/event-stream" in head
+    first = json.loads((await asyncio.wait_for(reader.readuntil(b"\n\n"), 5))[6:])
+    assert first["new_log_lines"] == ["boot"] and first["log_lines"] == 1
+    assert server.sse_streams == 1
+
+    service.broadcast.publish({"kind": "log", "lines": ["step"]})
+    second = json.loads((await asyncio.wait_for(reader.readuntil(b"\n\n"), 5))[6:])
+    assert second["new_log_lines"] == ["step"] and second["log_lines"] == 2
+
+    service.broadcast.publish(
+        {"kind": "state", "payload": {"run_id": "run-1", "status": "succeeded", "finished_at": "t"}}
+    )
+    rest = await asyncio.wait_for(reader.read(), 5)
+    assert rest.endswith(b"event: done\ndata: {}\n\n")
+    writer.close()
+    for _ in range(50):
+        if server.sse_streams == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert server.sse_streams == 0
+
+
+async def test_sse_unknown_run_and_subscriber_limit(server_factory: Any) -> None:
+    service = _FakeService()
+    server, port = await server_factory(ServerLimits(max_sse_subscribers=1), service)
+    _, _, body = await _request(port, b"GET /v1/runs/nope/stream HTTP/1.1\r\n\r\n")
+    assert json.loads(body[6:]) == {"error": "not_found", "run_id": "nope"}
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /v1/runs/run-1/stream HTTP/1.1\r\n\r\n")
+    await writer.drain()
+    await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+    await asyncio.wait_for(reader.readuntil(b"\n\n"), 5)
+    assert server.sse_streams == 1
+
+    status, headers, body = await _request(port, b"GET /v1/runs/run-1/stream HTTP/1.1\r\n\r\n")
+    assert status == 503 and headers["retry-after"] == "1"
+    assert json.loads(body)["reason"] == "sse_subscribers"
+    service.broadcast.close()
+    writer.close()
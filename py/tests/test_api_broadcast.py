@@ -0,0 +1,313 @@
+"""Tests for lg_orch.api.broadcast and the broadcast-backed stream_run_sse."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import lg_orch.api.service as service_module
+import lg_orch.remote_api as remote_api
+from lg_orch.api.broadcast import BroadcastHub, RunBroadcast
+from lg_orch.api.metrics import handle_metrics
+from lg_orch.api.service import RemoteAPIService
+from lg_orch.trace import (
+    TRACE_APPEND_MARKER,
+    TraceJournal,
+    TraceJournalTail,
+    trace_journal_path,
+)
+
+# ---------------------------------------------------------------------------
+# RunBroadcast / BroadcastHub
+# ---------------------------------------------------------------------------
+
+
+def test_subscription_reads_frames_published_after_subscribe() -> None:
+    broadcast = RunBroadcast("r1")
+    broadcast.publish({"n": 0})
+    sub = broadcast.subscribe()
+    broadcast.publish({"n": 1})
+    broadcast.publish({"n": 2})
+    batch = sub.read(timeout=0)
+    assert [f["n"] for f in batch.frames] == [1, 2]
+    assert batch.dropped == 0
+    assert not batch.closed
+    assert sub.read(timeout=0).frames == []
+
+
+def test_each_subscriber_has_independent_cursor() -> None:
+    broadcast = RunBroadcast("r1")
+    a = broadcast.subscribe()
+    b = broadcast.subscribe()
+    broadcast.publish({"n": 1})
+    assert len(a.read(timeout=0).frames) == 1
+    broadcast.publish({"n": 2})
+    assert [f["n"] for f in b.read(timeout=0).frames] == [1, 2]
+    assert broadcast.subscriber_count() == 2
+    a.close()
+    assert broadcast.subscriber_count() == 1
+
+
+def test_lagging_subscriber_reports_dropped_frames() -> None:
+    broadcast = RunBroadcast("r1", capacity=3)
+    sub = broadcast.subscribe()
+    for n in range(5):
+        broadcast.publish({"n": n})
+    assert broadcast.max_lag() == 5
+    batch = sub.read(timeout=0)
+    assert [f["n"] for f in batch.frames] == [2, 3, 4]
+    assert batch.dropped == 2
+    assert broadcast.max_lag() == 0
+
+
+def test_read_blocks_until_publish() -> None:
+    broadcast = RunBroadcast("r1")
+    sub = broadcast.subscribe()
+    got: list[Any] = []
+
+    def _reader() -> None:
+        got.append(sub.read(timeout=5))
+
+    t = threading.Thread(target=_reader)
+    t.start()
+    time.sleep(0.05)
+    broadcast.publish({"n": 1})
+    t.join(timeout=5)
+    assert got and got[0].frames == [{"n": 1}]
+
+
+async def test_read_async_wakes_on_publish_from_another_thread() -> None:
+    broadcast = RunBroadcast("r1")
+    sub = broadcast.subscribe()
+    timer = threading.Timer(0.05, broadcast.publish, args=({"n": 1},))
+    timer.start()
+    batch = await sub.read_async(timeout=5)
+    timer.join()
+    assert batch.frames == [{"n": 1}]
+    assert (await sub.read_async(timeout=0.01)).frames == []
+    broadcast.close()
+    assert (await sub.read_async(timeout=5)).closed
+
+
+def test_close_wakes_subscribers_and_rejects_publish() -> None:
+    broadcast = RunBroadcast("r1")
+    with broadcast.subscribe() as sub:
+        broadcast.close()
+        batch = sub.read(timeout=5)
+        assert batch.closed
+        assert broadcast.publish({"n": 1}) == -1
+    assert broadcast.subscriber_count() == 0
+
+
+def test_invalid_capacity_rejected() -> None:
+    with pytest.raises(ValueError):
+        RunBroadcast("r1", capacity=0)
+
+
+def test_hub_open_close_and_metrics() -> None:
+    hub = BroadcastHub(capacity=2)
+    broadcast = hub.open("r1")
+    assert hub.open("r1") is broadcast
+    sub = broadcast.subscribe()
+    for n in range(4):
+        hub.publish("r1", {"n": n})
+    hub.publish("missing", {"n": 0})
+    m = hub.metrics()
+    assert m == {"active_runs": 1, "subscribers": 1, "max_lag": 4, "dropped_frames": 0}
+    assert sub.read(timeout=0).dropped == 2
+    hub.close("r1")
+    assert hub.get("r1") is None
+    assert sub.read(timeout=0).closed
+    assert hub.metrics()["dropped_frames"] == 2
+    assert hub.open("r1") is not broadcast
+
+
+def test_metrics_route_exposes_broadcast_gauges() -> None:
+    status, _, body = handle_metrics("GET")
+    assert status == 200
+    text = body.decode("utf-8")
+    assert "lula_sse_subscribers " in text
+    assert "lula_sse_subscriber_lag_max " in text
+
+
+# ---------------------------------------------------------------------------
+# RemoteAPIService.stream_run_sse
+# ---------------------------------------------------------------------------
+
+
+class _Process:
+    def __init__(self) -> None:
+        self.stdout = io.StringIO("")
+        self.returncode = 0
+        self._running = True
+
+    def poll(self) -> int | None:
+        return None if self._running else self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        self._running = False
+        return self.returncode
+
+    def terminate(self) -> None:
+        self._running = False
+
+
+def _frames(raw: bytes) -> list[dict[str, Any]]:
+    return [
+        json.loads(line[len("data: ") :])
+        for line in raw.decode("utf-8").splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def _start_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, run_id: str
+) -> tuple[RemoteAPIService, _Process]:
+    process = _Process()
+    monkeypatch.setattr(remote_api, "_spawn_run_subprocess", lambda *, argv, cwd, env=None: process)
+    monkeypatch.setattr(remote_api, "_start_daemon_thread", lambda *, target, name: None)
+    service = RemoteAPIService(repo_root=tmp_path, broadcast_hub=BroadcastHub())
+    service.create_run({"request": "stream me", "run_id": run_id})
+    return service, process
+
+
+def test_stream_run_sse_unknown_run(tmp_path: Path) -> None:
+    service = RemoteAPIService(repo_root=tmp_path, broadcast_hub=BroadcastHub())
+    wfile = io.BytesIO()
+    service.stream_run_sse("nope", wfile)
+    assert _frames(wfile.getvalue()) == [{"error": "not_found", "run_id": "nope"}]
+
+
+def test_stream_run_sse_forwards_logs_and_finishes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, process = _start_run(tmp_path, monkeypatch, "bc-live-1")
+    service._append_log("bc-live-1", "before subscribe")
+    wfile = io.BytesIO()
+    t = threading.Thread(target=service.stream_run_sse, args=("bc-live-1", wfile))
+    t.start()
+    for _ in range(200):
+        broadcast = service._broadcasts.get("bc-live-1")
+        if broadcast is not None and broadcast.subscriber_count() == 1:
+            break
+        time.sleep(0.01)
+
+    service._append_log("bc-live-1", "line one")
+    service._append_log("bc-live-1", "line two")
+    process.wait()
+    service._mark_finished("bc-live-1", 0)
+    t.join(timeout=5)
+    assert not t.is_alive()
+
+    frames = _frames(wfile.getvalue())
+    assert frames[0]["new_log_lines"] == ["before subscribe"]
+    assert frames[0]["finished_at"] is None
+    streamed = [line for f in frames[1:-1] for line in f.get("new_log_lines", [])]
+    assert streamed == ["line one", "line two"]
+    final = frames[-2]
+    assert final["status"] == "succeeded"
+    assert final["log_lines"] == 3
+    assert frames[-1] == {}
+    assert service._broadcasts.get("bc-live-1") is None
+
+
+def test_stream_run_sse_finished_run_sends_single_frame(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, process = _start_run(tmp_path, monkeypatch, "bc-done-1")
+    process.wait()
+    wfile = io.BytesIO()
+    service.stream_run_sse("bc-done-1", wfile)
+    raw = wfile.getvalue()
+    assert raw.endswith(b"event: done\ndata: {}\n\n")
+    assert _frames(raw)[0]["status"] == "succeeded"
+
+
+def test_cancel_publishes_state_to_subscribers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _process = _start_run(tmp_path, monkeypatch, "bc-cancel-1")
+    sub = service._broadcasts.open("bc-cancel-1").subscribe()
+    service.cancel_run("bc-cancel-1")
+    states = [f["payload"] for f in sub.read(timeout=0).frames if f["kind"] == "state"]
+    assert states[0]["status"] == "cancelling"
+
+
+def test_trace_appends_reach_subscribers_while_the_run_is_live(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, process = _start_run(tmp_path, monkeypatch, "bc-trace-1")
+    record = service._runs["bc-trace-1"]
+    assert "--trace-notify" in record.argv
+    journal = TraceJournal(trace_journal_path(record.trace_path), run_id="bc-trace-1")
+    journal.append_events([{"ts_ms": 1, "kind": "node", "data": {"name": "ingest"}}])
+    process.stdout = io.StringIO(f"[Node: ingest]\n{TRACE_APPEND_MARKER}\n")
+    sub = service._broadcasts.open("bc-trace-1").subscribe()
+    reads_under_lock: list[bool] = []
+    real_read = TraceJournalTail.read
+
+    def _read(tail: TraceJournalTail) -> dict[str, Any] | None:
+        reads_under_lock.append(service._lock.locked())
+        return real_read(tail)
+
+    monkeypatch.setattr(TraceJournalTail, "read", _read)
+    service._capture_process_output("bc-trace-1")
+
+    frames = sub.read(timeout=0).frames
+    assert frames[0] == {"kind": "log", "lines": ["[Node: ingest]"]}
+    live = frames[1]["payload"]
+    assert live["status"] == "running"
+    assert [e["kind"] for e in live["trace"]["events"]] == ["node"]
+    assert frames[-1]["payload"]["status"] == "succeeded"
+    assert reads_under_lock == [False]
+    assert service.get_logs("bc-trace-1")["logs"] == ["[Node: ingest]"]
+
+
+def test_stream_run_sse_sends_done_only_for_terminal_status(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _process = _start_run(tmp_path, monkeypatch, "bc-shutdown-1")
+    wfile = io.BytesIO()
+    t = threading.Thread(target=service.stream_run_sse, args=("bc-shutdown-1", wfile))
+    t.start()
+    for _ in range(200):
+        broadcast = service._broadcasts.get("bc-shutdown-1")
+        if broadcast is not None and broadcast.subscriber_count() == 1:
+            break
+        time.sleep(0.01)
+    # The broadcast goes away while the run is still going (e.g. shutdown).
+    service._broadcasts.close("bc-shutdown-1")
+    t.join(timeout=5)
+    assert not t.is_alive()
+    assert b"event: done" not in wfile.getvalue()
+    assert _frames(wfile.getvalue())[-1]["status"] == "running"
+
+
+def test_stream_run_sse_checks_the_deadline_while_frames_arrive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service, _process = _start_run(tmp_path, monkeypatch, "bc-busy-1")
+    monkeypatch.setattr(service_module, "_SSE_MAX_STREAM_SECS", 0.2)
+    stop = threading.Event()
+
+    def _chatter() -> None:
+        while not stop.is_set():
+            service._append_log("bc-busy-1", "tick")
+            time.sleep(0.005)
+
+    chatter = threading.Thread(target=_chatter)
+    chatter.start()
+    wfile = io.BytesIO()
+    t = threading.Thread(target=service.stream_run_sse, args=("bc-busy-1", wfile))
+    t.start()
+    t.join(timeout=5)
+    stop.set()
+    chatter.join()
+    assert not t.is_alive()
+    assert b"event: done" not in wfile.getvalue()
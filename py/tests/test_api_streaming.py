@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 from lg_orch.api.streaming import (
@@ -12,7 +13,9 @@ from lg_orch.api.streaming import (
     _run_streams_lock,
     _send_final_output,
     push_run_event,
+    stream_new_sse,
 )
+from lg_orch.trace import TraceJournal, trace_journal_path
 
 # ---------------------------------------------------------------------------
 # push_run_event
@@ -148,3 +151,55 @@ def test_send_final_output_noop_when_trace_is_not_dict() -> None:
     wfile = _FakeWfile()
     _send_final_output({"trace": "not_a_dict"}, wfile)
     assert wfile.getvalue() == b""
+
+
+# ---------------------------------------------------------------------------
+# stream_new_sse — NDJSON journal replay and tailing
+# ---------------------------------------------------------------------------
+
+
+class _JournalService:
+    def __init__(self, trace_path: Path, finish_after: int) -> None:
+        self.trace_path = trace_path
+        self.calls = 0
+        self.finish_after = finish_after
+
+    def get_run(self, run_id: str) -> dict[str, Any]:
+        self.calls += 1
+        finished = "2026-01-01T00:00:00Z" if self.calls > self.finish_after else None
+        return {"run_id": run_id, "trace_path": str(self.trace_path), "finished_at": finished}
+
+
+def _event_kinds(raw: bytes) -> list[str]:
+    frames = [
+        json.loads(line[len("data: ") :])
+        for line in raw.decode("utf-8").splitlines()
+        if line.startswith("data: ")
+    ]
+    return [str(f.get("kind", f.get("type", ""))) for f in frames]
+
+
+def test_stream_new_sse_replays_journal_for_finished_run(tmp_path: Path) -> None:
+    trace_path = tmp_path / "run-j.json"
+    journal = TraceJournal(trace_journal_path(trace_path), run_id="j")
+    journal.append_events([{"kind": "node_start"}, {"kind": "node_end"}])
+    wfile = _FakeWfile()
+    stream_new_sse(_JournalService(trace_path, finish_after=0), "j", wfile)
+    assert _event_kinds(wfile.getvalue()) == ["node_start", "node_end", "done"]
+
+
+def test_stream_new_sse_tails_journal_while_run_active(tmp_path: Path) -> None:
+    trace_path = tmp_path / "run-k.json"
+    journal = TraceJournal(trace_journal_path(trace_path), run_id="k")
+    journal.append_events([{"kind": "node_start"}])
+    service = _JournalService(trace_path, finish_after=2)
+
+    class _AppendingWfile(_FakeWfile):
+        def flush(self) -> None:
+            # Simulate the run subprocess appending once the replay is flushed.
+            journal.append_events([{"kind": "node_start"}, {"kind": "tool_result"}])
+
+    wfile = _AppendingWfile()
+    stream_new_sse(service, "k", wfile)
+    kinds = _event_kinds(wfile.getvalue())
+    assert kinds == ["node_start", "tool_result", "done"]
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import os
+import sqlite3
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from lg_orch.backends.delta import load_delta
 from lg_orch.checkpointing import (
+    DeltaCodec,
     PostgresCheckpointSaver,
     RedisCheckpointSaver,
     SqliteCheckpointSaver,
@@ -122,6 +126,315 @@ def test_sqlite_checkpoint_persists_and_resume_from_latest(tmp_path: Path) -> No
     assert "final" in resumed_out
 
 
+# ---------------------------------------------------------------------------
+# SQLite: connection reuse, blob dedup, retention
+# ---------------------------------------------------------------------------
+
+
+def _sqlite_put(
+    saver: SqliteCheckpointSaver,
+    thread_id: str,
+    checkpoint_id: str,
+    values: dict[str, Any],
+    versions: dict[str, Any],
+    new_versions: dict[str, Any],
+) -> None:
+    checkpoint = _make_fake_checkpoint(checkpoint_id)
+    checkpoint["channel_values"] = values
+    checkpoint["channel_versions"] = versions
+    saver.put(_make_fake_config(thread_id), checkpoint, {}, new_versions)  # type: ignore[arg-type]
+
+
+def _sqlite_count(saver: SqliteCheckpointSaver, table: str) -> int:
+    return int(saver._connect().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+def test_sqlite_reuses_one_connection_per_thread(tmp_path: Path) -> None:
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite")
+    conn = saver._connect()
+    assert saver._connect() is conn
+
+    other: list[object] = []
+    thread = threading.Thread(target=lambda: other.append(saver._connect()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    saver.close()
+    assert saver._connect() is not conn
+    per_call = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite", reuse_connections=False)
+    assert per_call._connect() is not per_call._connect()
+
+
+def test_sqlite_per_call_connections_are_closed(tmp_path: Path) -> None:
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite", reuse_connections=False)
+    opened: list[sqlite3.Connection] = []
+    real_open = saver._open
+
+    def tracking_open() -> sqlite3.Connection:
+        opened.append(real_open())
+        return opened[-1]
+
+    saver._open = tracking_open  # type: ignore[method-assign]
+    _sqlite_put(saver, "t1", "c1", {"a": 1}, {"a": 1}, {"a": 1})
+    saver.compact(keep_last=1, vacuum=True)
+    assert len(opened) == 3
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_sqlite_dedups_large_channel_values(tmp_path: Path) -> None:
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite", dedup_min_bytes=64)
+    repo_context = {"files": ["x" * 200]}
+    for thread_id in ("t1", "t2"):
+        _sqlite_put(
+            saver,
+            thread_id,
+            "c1",
+            {"repo_context": repo_context, "intent": "fix"},
+            {"repo_context": "1", "intent": "1"},
+            {"repo_context": "1", "intent": "1"},
+        )
+
+    assert _sqlite_count(saver, "blob_store") == 1
+    for thread_id in ("t1", "t2"):
+        got = saver.get_tuple(_make_fake_config(thread_id))
+        assert got is not None
+        assert got.checkpoint["channel_values"] == {"repo_context": repo_context, "intent": "fix"}
+
+    saver.delete_thread("t1")
+    assert _sqlite_count(saver, "blob_store") == 1
+    saver.delete_thread("t2")
+    assert _sqlite_count(saver, "blob_store") == 0
+
+
+def test_sqlite_reads_database_written_before_dedup(tmp_path: Path) -> None:
+    import sqlite3
+
+    db_path = tmp_path / "old.sqlite"
+    legacy = SqliteCheckpointSaver(db_path=db_path, dedup_min_bytes=10**9)
+    _sqlite_put(legacy, "t", "c1", {"a": "x" * 5000}, {"a": "1"}, {"a": "1"})
+    legacy.close()
+    # Drop the column as an older release would not have had it.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP INDEX idx_checkpoint_blobs_hash")
+        conn.execute("ALTER TABLE checkpoint_blobs DROP COLUMN blob_hash")
+
+    saver = SqliteCheckpointSaver(db_path=db_path)
+    got = saver.get_tuple(_make_fake_config("t"))
+    assert got is not None
+    assert got.checkpoint["channel_values"] == {"a": "x" * 5000}
+
+
+def test_sqlite_put_writes_keeps_first_regular_write(tmp_path: Path) -> None:
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite")
+    _sqlite_put(saver, "t", "c1", {}, {}, {})
+    config = _make_fake_config("t", "c1")
+    saver.put_writes(config, [("a", 1), ("b", 2)], task_id="task")  # type: ignore[arg-type]
+    saver.put_writes(config, [("a", 10), ("__error__", "boom")], task_id="task")  # type: ignore[arg-type]
+    saver.put_writes(config, [("__error__", "again")], task_id="task")  # type: ignore[arg-type]
+
+    got = saver.get_tuple(config)  # type: ignore[arg-type]
+    assert got is not None
+    assert sorted(got.pending_writes) == [
+        ("task", "__error__", "again"),
+        ("task", "a", 1),
+        ("task", "b", 2),
+    ]
+
+
+def test_sqlite_compact_keeps_values_of_retained_checkpoints(tmp_path: Path) -> None:
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite", dedup_min_bytes=64)
+    big = "r" * 500
+    # repo_context is written once (c1) and still referenced by c3.
+    _sqlite_put(
+        saver, "t", "c1", {"ctx": big, "n": 1}, {"ctx": "1", "n": "1"}, {"ctx": "1", "n": "1"}
+    )
+    _sqlite_put(saver, "t", "c2", {"ctx": big, "n": 2}, {"ctx": "1", "n": "2"}, {"n": "2"})
+    _sqlite_put(saver, "t", "c3", {"ctx": big, "n": 3}, {"ctx": "1", "n": "3"}, {"n": "3"})
+    saver.put_writes(_make_fake_config("t", "c1"), [("n", 9)], task_id="x")  # type: ignore[arg-type]
+    _sqlite_put(saver, "other", "c1", {"n": 1}, {"n": "1"}, {"n": "1"})
+
+    counts = saver.compact(keep_last=1, thread_ids=["t"], vacuum=True)
+
+    assert counts == {"checkpoints": 2, "writes": 1, "channel_values": 2, "blobs": 0}
+    assert [
+        t.config["configurable"]["checkpoint_id"] for t in saver.list(_make_fake_config("t"))
+    ] == ["c3"]
+    got = saver.get_tuple(_make_fake_config("t"))
+    assert got is not None
+    assert got.checkpoint["channel_values"] == {"ctx": big, "n": 3}
+    assert saver.get_tuple(_make_fake_config("other")) is not None
+
+    saver.prune(["t"], strategy="delete")
+    assert _sqlite_count(saver, "blob_store") == 0
+    with pytest.raises(ValueError):
+        saver.compact(keep_last=0)
+
+
+def test_checkpoint_prune_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    import json
+
+    from lg_orch.commands.checkpoint import checkpoint_prune_command
+    from lg_orch.main import _build_parser
+
+    db_path = tmp_path / "c.sqlite"
+    saver = SqliteCheckpointSaver(db_path=db_path)
+    for checkpoint_id in ("c1", "c2", "c3"):
+        _sqlite_put(
+            saver,
+            "t",
+            checkpoint_id,
+            {"n": checkpoint_id},
+            {"n": checkpoint_id},
+            {"n": checkpoint_id},
+        )
+    saver.close()
+
+    args = _build_parser().parse_args(
+        ["checkpoint-prune", "--db-path", str(db_path), "--keep-last", "2"]
+    )
+    rc = checkpoint_prune_command(args, repo_root=tmp_path)
+
+    assert rc == 0
+    out = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert out["deleted"]["checkpoints"] == 1
+    assert len(list(SqliteCheckpointSaver(db_path=db_path).list(None))) == 2
+
+
+# ---------------------------------------------------------------------------
+# Delta-encoded channels
+# ---------------------------------------------------------------------------
+
+
+def test_delta_codec_appends_patches_and_snapshots() -> None:
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    serde = JsonPlusSerializer()
+    codec = DeltaCodec(snapshot_every=3)
+    scope = {"thread_id": "t", "checkpoint_ns": ""}
+
+    log = [codec.encode(serde, channel="log", version=1, ref=1, value=[1, 2], **scope)]
+    for step in (2, 3, 4):
+        value = list(range(1, step + 2))
+        log.append(codec.encode(serde, channel="log", version=step, ref=step, value=value, **scope))
+    assert [e.base for e in log] == [None, 1, 2, None]
+    assert log[2].chain == (2, 1)
+    delta = load_delta(serde, log[1].type_tag, log[1].payload)
+    assert delta.apply([1, 2]) == [1, 2, 3]
+
+    rewritten = codec.encode(serde, channel="log", version=5, ref=5, value=[9], **scope)
+    assert rewritten.base is None
+
+    ctx = {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
+    codec.encode(serde, channel="ctx", version=1, ref=1, value=ctx, **scope)
+    patched = {"a": 1, "b": 20, "c": 3, "d": 4, "e": 5, "f": 6}
+    patch = codec.encode(serde, channel="ctx", version=2, ref=2, value=patched, **scope)
+    assert load_delta(serde, patch.type_tag, patch.payload).apply(ctx) == patched
+    # Rewriting most keys is cheaper as a snapshot.
+    rewrite = codec.encode(serde, channel="ctx", version=3, ref=3, value={"z": 0}, **scope)
+    assert rewrite.base is None
+    # Non-container values and channels outside the allow-list are left alone.
+    assert not codec.handles("n", 3)
+    assert not DeltaCodec(channels=["log"]).handles("ctx", ctx)
+
+
+def _delta_history(steps: int) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    history: list[dict[str, Any]] = []
+    for step in range(1, steps + 1):
+        history = [*history, {"step": step, "stdout": "x" * 200}]
+        out.append(
+            {
+                "tool_results": history,
+                "repo_context": {"tree": "t" * 400, "summary": "s" * 400, "step": step},
+                "loop": step,
+            }
+        )
+    return out
+
+
+def _blob_bytes(saver: SqliteCheckpointSaver) -> int:
+    return int(
+        saver._connect().execute("SELECT SUM(LENGTH(payload)) FROM checkpoint_blobs").fetchone()[0]
+    )
+
+
+def test_sqlite_delta_channels_round_trip(tmp_path: Path) -> None:
+    plain = SqliteCheckpointSaver(db_path=tmp_path / "plain.sqlite", dedup_min_bytes=10**9)
+    delta = SqliteCheckpointSaver(
+        db_path=tmp_path / "delta.sqlite",
+        dedup_min_bytes=10**9,
+        delta_codec=DeltaCodec(snapshot_every=4),
+    )
+    states = _delta_history(10)
+    for step, values in enumerate(states, start=1):
+        versions = dict.fromkeys(values, step)
+        for saver in (plain, delta):
+            _sqlite_put(saver, "t", f"c{step:02d}", values, versions, versions)
+
+    assert _blob_bytes(delta) * 2 < _blob_bytes(plain)
+    # Readers need no codec to follow the chain.
+    reader = SqliteCheckpointSaver(db_path=tmp_path / "delta.sqlite")
+    for step, values in enumerate(states, start=1):
+        got = reader.get_tuple(_make_fake_config("t", f"c{step:02d}"))
+        assert got is not None
+        assert got.checkpoint["channel_values"] == values
+    assert [t.checkpoint["channel_values"]["loop"] for t in reader.list(None)] == list(
+        range(10, 0, -1)
+    )
+
+
+def test_sqlite_compact_keeps_delta_bases(tmp_path: Path) -> None:
+    codec = DeltaCodec(snapshot_every=8)
+    saver = SqliteCheckpointSaver(db_path=tmp_path / "c.sqlite", delta_codec=codec)
+    states = _delta_history(6)
+    for step, values in enumerate(states, start=1):
+        versions = dict.fromkeys(values, step)
+        _sqlite_put(saver, "t", f"c{step:02d}", values, versions, versions)
+
+    saver.compact(keep_last=1)
+    got = saver.get_tuple(_make_fake_config("t"))
+    assert got is not None
+    assert got.checkpoint["channel_values"] == states[-1]
+
+    # The codec forgot the thread, so the next write starts a new snapshot.
+    values = _delta_history(7)[-1]
+    _sqlite_put(saver, "t", "c07", values, dict.fromkeys(values, 7), dict.fromkeys(values, 7))
+    base = saver._connect().execute(
+        "SELECT delta_base FROM checkpoint_blobs WHERE channel = 'tool_results' AND version = '7'"
+    )
+    assert base.fetchone()[0] is None
+    got = saver.get_tuple(_make_fake_config("t"))
+    assert got is not None
+    assert got.checkpoint["channel_values"] == values
+
+
+def test_sqlite_failed_put_does_not_orphan_later_deltas(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    saver = SqliteCheckpointSaver(
+        db_path=tmp_path / "c.sqlite", delta_codec=DeltaCodec(snapshot_every=8)
+    )
+    states = _delta_history(3)
+    versions = [dict.fromkeys(values, step) for step, values in enumerate(states, start=1)]
+    _sqlite_put(saver, "t", "c01", states[0], versions[0], versions[0])
+
+    def locked() -> Any:
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(saver, "_connect", locked)
+        with pytest.raises(sqlite3.OperationalError):
+            _sqlite_put(saver, "t", "c02", states[1], versions[1], versions[1])
+    _sqlite_put(saver, "t", "c03", states[2], versions[2], versions[2])
+
+    got = saver.get_tuple(_make_fake_config("t", "c03"))
+    assert got is not None
+    assert got.checkpoint["channel_values"] == states[2]
+
+
 # ---------------------------------------------------------------------------
 # Factory tests
 # ---------------------------------------------------------------------------
@@ -254,6 +567,62 @@ async def test_redis_checkpoint_saver_ttl() -> None:
     assert ttl_idx > 0, f"Expected positive TTL on index key, got {ttl_idx}"
 
 
+@pytest.mark.asyncio
+async def test_redis_delta_channels_round_trip() -> None:
+    """Deltas written through the async client resolve through both clients."""
+    try:
+        import fakeredis
+    except ImportError:
+        pytest.skip("fakeredis not installed")
+
+    saver = create_checkpoint_saver(
+        "redis",
+        redis_url="redis://localhost:6379/15",
+        ttl_seconds=60,
+        delta_codec=DeltaCodec(snapshot_every=4),
+    )
+    assert isinstance(saver, RedisCheckpointSaver)
+    server = fakeredis.FakeServer()
+    saver._client = fakeredis.aioredis.FakeRedis(server=server)
+    saver._sync_client = fakeredis.FakeRedis(server=server)
+
+    ids = [f"00000000-0000-0000-0000-{step:012d}" for step in range(1, 7)]
+    metadata: dict[str, Any] = {"source": "loop", "step": 0, "writes": {}, "parents": {}}
+    states: list[dict[str, Any]] = []
+    history: list[dict[str, Any]] = []
+    ctx: dict[str, Any] = {"tree": "t" * 400, "summary": "s" * 400, "step": 1}
+    ctx_version = 1
+    for step, ckpt_id in enumerate(ids, start=1):
+        history = [*history, {"step": step, "stdout": "x" * 1000}]
+        new_versions = {"tool_results": step, "loop": step}
+        # repo_context is rewritten on even steps and carried over otherwise.
+        if step == 1 or step % 2 == 0:
+            ctx = {**ctx, "step": step}
+            ctx_version = step
+            new_versions["repo_context"] = step
+        states.append({"tool_results": history, "repo_context": ctx, "loop": step})
+        checkpoint = _make_fake_checkpoint(ckpt_id)
+        checkpoint["channel_values"] = states[-1]
+        checkpoint["channel_versions"] = {**new_versions, "repo_context": ctx_version}
+        await saver.aput(_make_fake_config("t"), checkpoint, metadata, new_versions)  # type: ignore[arg-type]
+
+    sizes = [len(await saver._client.get(saver._ckpt_key("t", "main", i))) for i in ids]
+    # Steps 1 and 5 are full snapshots; the deltas between them stay small.
+    assert max(sizes[1:4]) * 3 < sizes[4]
+    # Delta bases outlive the checkpoints built on them.
+    assert await saver._client.ttl(saver._ckpt_key("t", "main", ids[0])) > 60
+
+    for ckpt_id, values in zip(ids, states, strict=True):
+        got = await saver.aget_tuple(_make_fake_config("t", ckpt_id))
+        assert got is not None
+        assert got.checkpoint["channel_values"] == values
+        sync_got = saver.get_tuple(_make_fake_config("t", ckpt_id))  # type: ignore[arg-type]
+        assert sync_got is not None
+        assert sync_got.checkpoint["channel_values"] == values
+    listed = [t.checkpoint["channel_values"] async for t in saver.alist(_make_fake_config("t"))]
+    assert listed == states[::-1]
+
+
 # ---------------------------------------------------------------------------
 # Postgres test (real Postgres, skipped unless POSTGRES_TEST_DSN is set)
 # ---------------------------------------------------------------------------
@@ -150,6 +150,26 @@ def test_load_config_parses_trace(monkeypatch: pytest.MonkeyPatch) -> None:
         cfg = load_config(repo_root=root)
         assert cfg.trace.enabled is True
         assert cfg.trace.output_dir == "out/traces"
+        assert cfg.trace.format == "json"
+
+
+def test_load_config_trace_format_journal(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LG_PROFILE", "dev")
+    content = _VALID_TOML.replace(
+        'output_dir = "out/traces"', 'output_dir = "out/traces"\nformat = "journal"'
+    )
+    with tempfile.TemporaryDirectory() as td:
+        cfg = load_config(repo_root=_write_config(td, content=content))
+        assert cfg.trace.format == "journal"
+
+
+def test_load_config_trace_format_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LG_PROFILE", "dev")
+    content = _VALID_TOML.replace(
+        'output_dir = "out/traces"', 'output_dir = "out/traces"\nformat = "xml"'
+    )
+    with tempfile.TemporaryDirectory() as td, pytest.raises(ValueError, match=r"trace\.format"):
+        load_config(repo_root=_write_config(td, content=content))
 
 
 def test_load_config_parses_remote_api(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -164,6 +184,26 @@ def test_load_config_parses_remote_api(monkeypatch: pytest.MonkeyPatch) -> None:
         assert cfg.remote_api.access_log_enabled is True
 
 
+def test_load_config_remote_api_server_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LG_PROFILE", "dev")
+    monkeypatch.setenv("LG_REMOTE_API_SERVER_MODE", "asyncio")
+    monkeypatch.setenv("LG_REMOTE_API_MAX_SSE_SUBSCRIBERS", "4")
+    with tempfile.TemporaryDirectory() as td:
+        cfg = load_config(repo_root=_write_config(td))
+        assert cfg.remote_api.server_mode == "asyncio"
+        assert cfg.remote_api.max_sse_subscribers == 4
+        assert cfg.remote_api.max_connections == 256
+
+    monkeypatch.setenv("LG_REMOTE_API_SERVER_MODE", "gevent")
+    with tempfile.TemporaryDirectory() as td, pytest.raises(ValueError, match="server_mode"):
+        load_config(repo_root=_write_config(td))
+
+    monkeypatch.setenv("LG_REMOTE_API_SERVER_MODE", "threaded")
+    monkeypatch.setenv("LG_REMOTE_API_WORKER_THREADS", "0")
+    with tempfile.TemporaryDirectory() as td, pytest.raises(ValueError, match="worker_threads"):
+        load_config(repo_root=_write_config(td))
+
+
 def test_load_config_parses_checkpoint(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("LG_PROFILE", "dev")
     with tempfile.TemporaryDirectory() as td:
@@ -545,3 +545,33 @@ def test_context_builder_mcp_hash_mismatch_tools_excluded_from_mcp_tools(
         mcp_tools = out.get("mcp_tools", [])
         assert len(mcp_tools) == 1
         assert mcp_tools[0]["name"] == "good_tool"
+
+
+def test_context_builder_reuses_memory_connections_and_times_lookups(tmp_path: Path) -> None:
+    from lg_orch.run_store import RunStore
+
+    db_path = tmp_path / "runs.sqlite"
+    state = _base_state(
+        request="flaky network",
+        _run_store_path=str(db_path),
+        _procedure_cache_path=str(tmp_path / "procedures.sqlite"),
+    )
+    with tempfile.TemporaryDirectory() as td:
+        state["_repo_root"] = td
+        with patch.object(
+            RunStore, "_migrate", autospec=True, side_effect=RunStore._migrate
+        ) as mig:
+            context_builder(state)
+            writer = RunStore(db_path=db_path)
+            writer.upsert_semantic_memories("run-1", [{"kind": "note", "summary": "flaky network"}])
+            writer.close()
+            out = context_builder(state)
+    # Schema setup ran once for the shared reader plus once for the explicit writer.
+    assert mig.call_count == 2
+    assert out["repo_context"]["semantic_memories"][0]["run_id"] == "run-1"
+    end = [e for e in out["_trace_events"] if e["data"].get("phase") == "end"][-1]
+    assert set(end["data"]["memory_lookup_ms"]) == {
+        "episodic_facts",
+        "semantic_memories",
+        "cached_procedures",
+    }
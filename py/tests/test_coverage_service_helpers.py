@@ -193,6 +193,28 @@ def test_write_trace_approval_state_clears_details(tmp_path: Path) -> None:
     assert updated["approval"]["summary"] == ""
 
 
+def test_write_trace_approval_state_appends_to_journal(tmp_path: Path) -> None:
+    from lg_orch.trace import load_trace_payload, write_run_trace
+
+    journal_path = write_run_trace(
+        repo_root=tmp_path,
+        out_dir=Path("."),
+        state={"_run_id": "jr", "_approval_context": {"history": [{"decision": "asked"}]}},
+        journal=True,
+    )
+    _write_trace_approval_state(
+        trace_path=journal_path.with_suffix(".json"),
+        pending=True,
+        pending_details={"challenge_id": "ch1", "operation_class": "apply_patch"},
+        history=[{"decision": "asked"}],
+        last_decision=None,
+    )
+
+    payload = load_trace_payload(journal_path)
+    assert payload["approval"]["pending"] is True
+    assert payload["approval"]["pending_details"]["challenge_id"] == "ch1"
+
+
 def test_write_trace_approval_state_missing_file(tmp_path: Path) -> None:
     trace_path = tmp_path / "nonexistent.json"
     # Should not raise
@@ -269,6 +269,7 @@ def test_executor_scip_stale_on_apply_patch_success(mock_cls: MagicMock) -> None
     }
     out = executor(state)
     assert out.get("_scip_index_stale") is True
+    assert out.get("_scip_dirty_paths") == ["py/x.py"]
 
 
 @patch("lg_orch.nodes.executor.RunnerClient")
@@ -480,12 +481,24 @@ def test_summarize_tool_results_large_set() -> None:
 
 
 def test_runner_client_close() -> None:
+    mock_instance = MagicMock()
+    client = RunnerClient(base_url="http://localhost:8088", _client=mock_instance)
+    client.close()
+    mock_instance.close.assert_called_once()
+
+
+def test_runner_client_close_keeps_pooled_client_open() -> None:
+    from lg_orch.tools.runner_client import clear_client_cache
+
+    clear_client_cache()
     with patch("lg_orch.tools.runner_client.httpx.Client") as mock_client:
         mock_instance = MagicMock()
+        mock_instance.is_closed = False
         mock_client.return_value = mock_instance
         client = RunnerClient(base_url="http://localhost:8088")
         client.close()
-        mock_instance.close.assert_called_once()
+        mock_instance.close.assert_not_called()
+    clear_client_cache()
 
 
 def test_runner_client_close_no_client() -> None:
@@ -869,3 +882,22 @@ def test_diagnostics_telemetry_entries() -> None:
     assert entries[0]["tool"] == "exec"
     assert entries[0]["failure_class"] == "verification_failed"
     assert entries[0]["diagnostic_count"] == 1
+
+
+def test_trace_export_command_writes_monolithic_json(tmp_path: Path) -> None:
+    from lg_orch.commands.trace import trace_export_command
+    from lg_orch.trace import write_run_trace
+
+    journal_path = write_run_trace(
+        repo_root=tmp_path,
+        out_dir=Path("traces"),
+        state={"_run_id": "ex1", "final": "done", "_trace_events": [{"kind": "node"}]},
+        journal=True,
+    )
+    assert trace_export_command(Namespace(journal_path=str(journal_path), output=None)) == 0
+    exported = json.loads(journal_path.with_suffix(".json").read_text(encoding="utf-8"))
+    assert exported["final"] == "done"
+    assert exported["events"] == [{"kind": "node"}]
+
+    missing = Namespace(journal_path=str(tmp_path / "nope.ndjson"), output=None)
+    assert trace_export_command(missing) == 2
@@ -608,7 +608,10 @@ def test_router_model_output_interactive_stream() -> None:
 
 
 def test_runner_client_init_with_headers() -> None:
-    """RunnerClient should set auth and request-id headers."""
+    """RunnerClient's pooled client carries auth; the request id is sent per request."""
+    from lg_orch.tools.runner_client import clear_client_cache
+
+    clear_client_cache()
     with patch("lg_orch.tools.runner_client.httpx.Client") as mock_client:
         RunnerClient(
             base_url="http://localhost:8088",
@@ -617,7 +620,7 @@ def test_runner_client_init_with_headers() -> None:
         )
         call_kwargs = mock_client.call_args.kwargs
         assert call_kwargs["headers"]["authorization"] == "Bearer test-key"
-        assert call_kwargs["headers"]["x-request-id"] == "req-123"
+        assert "x-request-id" not in call_kwargs["headers"]
 
 
 def test_runner_client_search_not_ok() -> None:
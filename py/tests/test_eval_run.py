@@ -3,6 +3,7 @@ from __future__ import annotations
 import importlib.util
 import json
 import sys
+import time
 from pathlib import Path
 
 
@@ -530,3 +531,114 @@ def test_dry_run_does_not_invoke_graph(tmp_path: Path) -> None:
 
     assert rc == 0
     assert called == [], "run_task must not be called during --dry-run"
+
+
+# ---------------------------------------------------------------------------
+# Timing, result cache and --jobs
+# ---------------------------------------------------------------------------
+
+
+class _FakeGraph:
+    """Streams like a compiled graph: initial values, then per-node updates."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def stream(self, state, stream_mode):  # type: ignore[no-untyped-def]
+        assert stream_mode == ["updates", "values"]
+        self.calls += 1
+        yield "values", dict(state)
+        for node in ("ingest", "router", "reporter"):
+            time.sleep(0.002)
+            yield "updates", {node: {}}
+        yield (
+            "values",
+            {
+                "intent": "analysis",
+                "halt_reason": "",
+                "final": state["request"],
+                "tool_results": [],
+                "verification": {"acceptance_ok": True, "ok": True},
+                "route": {"lane": "fast"},
+                "telemetry": {"compression_summary": {"total_events": 1}},
+            },
+        )
+
+
+def _write_tasks(tmp_path: Path, count: int) -> Path:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    for i in range(count):
+        (tasks_dir / f"t{i}.json").write_text(
+            json.dumps({"id": f"t{i}", "request": f"summarize {i}", "expected_intent": "analysis"}),
+            encoding="utf-8",
+        )
+    return tasks_dir
+
+
+def test_run_task_reuses_compiled_graph_and_times_nodes(monkeypatch) -> None:
+    module = _load_eval_run_module()
+    graph = _FakeGraph()
+    monkeypatch.setattr(module, "_GRAPH", graph)
+    task = module.EvalTask(id="a", request="summarize repo", expected_intent="analysis")
+
+    report = module.evaluate_tasks([task, task], repo_root=Path("."))
+
+    assert graph.calls == 2
+    result = report["results"][0]
+    assert result["passed"] is True
+    assert set(result["node_ms"]) == {"ingest", "router", "reporter"}
+    assert all(ms > 0 for ms in result["node_ms"].values())
+    assert result["wall_ms"] >= sum(result["node_ms"].values()) - 1
+    assert report["summary"]["node_ms"]["router"] > 0
+    assert report["summary"]["cached_results"] == 0
+
+
+def test_cache_dir_skips_unchanged_tasks(tmp_path: Path, monkeypatch, capsys) -> None:
+    module = _load_eval_run_module()
+    graph = _FakeGraph()
+    monkeypatch.setattr(module, "_GRAPH", graph)
+    tasks_dir = _write_tasks(tmp_path, 2)
+    argv = ["--tasks-dir", str(tasks_dir), "--format", "json", "--cache-dir", str(tmp_path / "c")]
+
+    assert module.main(argv) == 0
+    assert graph.calls == 2
+    capsys.readouterr()
+
+    assert module.main(argv) == 0
+    assert graph.calls == 2
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["summary"]["cached_results"] == 2
+    assert payload["summary"]["passed_tasks"] == 2
+    assert all(r["cached"] for r in payload["results"])
+
+    # A different temperature is a different cache key.
+    assert module.main([*argv, "--temperature", "0.5"]) == 0
+    assert graph.calls == 4
+
+
+def test_jobs_runs_samples_in_worker_processes(monkeypatch) -> None:
+    # Spawned workers re-import the harness by module name and compile the
+    # real graph, so load it from a path they can import it from.
+    eval_dir = Path(__file__).resolve().parents[2] / "eval"
+    monkeypatch.syspath_prepend(str(eval_dir))
+    spec = importlib.util.spec_from_file_location("run", eval_dir / "run.py")
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "run", module)
+    spec.loader.exec_module(module)
+    tasks = [
+        module.EvalTask(id=f"t{i}", request=f"summarize {i}", expected_intent="analysis")
+        for i in range(3)
+    ]
+
+    samples = module.run_samples(tasks, samples=2, repo_root=Path("."), jobs=2)
+
+    assert [[r["id"] for r in runs] for runs in samples] == [
+        ["t0", "t0"],
+        ["t1", "t1"],
+        ["t2", "t2"],
+    ]
+    assert all(r["passed"] and r["node_ms"] for runs in samples for r in runs)
+    assert all("peak_rss_mb" not in r for runs in samples for r in runs)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lg_orch.nodes.executor import (
+    _absorb_result,
     _apply_patch_changed_paths,
     _approval_for_tool,
     _as_int,
@@ -157,6 +160,227 @@ def test_executor_handles_step_with_no_tools(mock_cls: MagicMock) -> None:
     assert out.get("tool_results", []) == []
 
 
+class _RecordingRunner:
+    """Fake RunnerClient that tracks how many batches run at the same time."""
+
+    def __init__(
+        self,
+        *,
+        delay: float = 0.05,
+        fail_path: str | None = None,
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.delay = delay
+        self.fail_path = fail_path
+        self.barrier = barrier
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.order: list[str] = []
+
+    def batch_execute_tools(self, *, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        path = str(calls[0]["input"].get("path", ""))
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.order.append(f"start:{path}")
+        if self.barrier is not None:
+            # Breaks (and fails the call) unless every party runs at once.
+            self.barrier.wait(timeout=10)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.order.append(f"end:{path}")
+        if path == self.fail_path:
+            raise RuntimeError("runner exploded")
+        return [{"tool": str(c["tool"]), "ok": True, "stdout": path} for c in calls]
+
+
+def _steps_state(*steps: tuple[str, str]) -> dict[str, Any]:
+    return _base_state(
+        plan={
+            "steps": [
+                {"id": f"s{i}", "tools": [{"tool": tool, "input": {"path": path}}]}
+                for i, (tool, path) in enumerate(steps)
+            ],
+            "verification": [],
+            "rollback": "none",
+        }
+    )
+
+
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_overlaps_read_only_steps_in_order(mock_cls: MagicMock) -> None:
+    runner = _RecordingRunner(delay=0.0, barrier=threading.Barrier(3))
+    mock_cls.return_value = runner
+    state = _steps_state(("read_file", "a"), ("list_files", "b"), ("read_file", "c"))
+    out = executor(state)
+    assert runner.max_active == 3
+    assert [r["stdout"] for r in out["tool_results"]] == ["a", "b", "c"]
+    assert out["budgets"]["tool_calls_used"] == 3
+    assert len([e for e in out["_trace_events"] if e["kind"] == "tools"]) == 3
+
+
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_write_step_waits_for_in_flight_reads(mock_cls: MagicMock) -> None:
+    runner = _RecordingRunner()
+    mock_cls.return_value = runner
+    state = _steps_state(("read_file", "a"), ("read_file", "b"), ("exec", "w"), ("read_file", "c"))
+    out = executor(state)
+    assert runner.order.index("start:w") > max(
+        runner.order.index("end:a"), runner.order.index("end:b")
+    )
+    assert runner.order.index("start:c") > runner.order.index("end:w")
+    assert [r["stdout"] for r in out["tool_results"]] == ["a", "b", "w", "c"]
+
+
+@patch("lg_orch.nodes.executor.get_logger")
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_in_flight_failure_drops_later_steps(
+    mock_cls: MagicMock, mock_logger: MagicMock
+) -> None:
+    runner = _RecordingRunner(fail_path="b")
+    mock_cls.return_value = runner
+    state = _steps_state(("read_file", "a"), ("read_file", "b"), ("read_file", "c"))
+    out = executor(state)
+    results = out["tool_results"]
+    assert [r.get("stdout") for r in results[:1]] == ["a"]
+    assert results[1]["artifacts"] == {"error": "executor_failed"}
+    assert len(results) == 2
+    assert out["budgets"]["tool_calls_used"] == 1
+    mock_logger.return_value.error.assert_called_once()
+
+
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_inflight_window_of_one_is_sequential(
+    mock_cls: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("LG_EXECUTOR_MAX_INFLIGHT_STEPS", "1")
+    runner = _RecordingRunner(delay=0.01)
+    mock_cls.return_value = runner
+    out = executor(_steps_state(("read_file", "a"), ("read_file", "b")))
+    assert runner.max_active == 1
+    assert [r["stdout"] for r in out["tool_results"]] == ["a", "b"]
+
+
+class _StreamingRunner:
+    """Fake RunnerClient whose streaming batch finishes calls in reverse order."""
+
+    def __init__(self) -> None:
+        self.batch_calls = 0
+
+    def batch_execute_tools(self, *, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.batch_calls += 1
+        return []
+
+    def stream_batch_execute_tools(
+        self, *, calls: list[dict[str, Any]], on_stdout: Any = None
+    ) -> Any:
+        for idx in reversed(range(len(calls))):
+            on_stdout(idx, f"out-{idx} part")
+            on_stdout(idx, "ial\nno newline")
+            yield idx, {"tool": calls[idx]["tool"], "ok": True, "stdout": f"out-{idx}"}
+
+
+@patch("lg_orch.nodes.executor.push_run_event")
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_streams_tool_output_for_live_runs(
+    mock_cls: MagicMock, mock_push: MagicMock
+) -> None:
+    runner = _StreamingRunner()
+    mock_cls.return_value = runner
+    state = _base_state(
+        _run_id="run-9",
+        plan={
+            "steps": [
+                {
+                    "id": "s0",
+                    "tools": [
+                        {"tool": "exec", "input": {"cmd": "pytest"}},
+                        {"tool": "exec", "input": {"cmd": "cargo"}},
+                    ],
+                }
+            ],
+            "verification": [],
+            "rollback": "none",
+        },
+    )
+    out = executor(state)
+    assert runner.batch_calls == 0
+    assert [r["stdout"] for r in out["tool_results"]] == ["out-0", "out-1"]
+    events = [c.args[1] for c in mock_push.call_args_list if c.args[0] == "run-9"]
+    assert events[:3] == [
+        {"type": "tool_stdout", "tool": "exec", "line": "out-1 partial"},
+        {"type": "tool_stdout", "tool": "exec", "line": "no newline"},
+        {"type": "tool_result", "tool": "exec", "ok": True, "exit_code": None, "timing_ms": None},
+    ]
+    assert len(events) == 6
+
+
+@patch("lg_orch.nodes.executor.push_run_event")
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_post_processes_each_streamed_result_on_arrival(
+    mock_cls: MagicMock, mock_push: MagicMock
+) -> None:
+    order: list[str] = []
+
+    class _Runner(_StreamingRunner):
+        def stream_batch_execute_tools(
+            self, *, calls: list[dict[str, Any]], on_stdout: Any = None
+        ) -> Any:
+            for idx in reversed(range(len(calls))):
+                order.append(f"finished {idx}")
+                yield (
+                    idx,
+                    {
+                        "tool": "exec",
+                        "ok": True,
+                        "snapshot": {"checkpoint": {"checkpoint_id": f"cp-{idx}"}},
+                    },
+                )
+
+    mock_cls.return_value = _Runner()
+    state = _base_state(
+        _run_id="run-9",
+        plan={
+            "steps": [
+                {
+                    "id": "s0",
+                    "tools": [
+                        {"tool": "exec", "input": {"cmd": "pytest"}},
+                        {"tool": "exec", "input": {"cmd": "cargo"}},
+                    ],
+                }
+            ],
+            "verification": [],
+            "rollback": "none",
+        },
+    )
+
+    def _absorb(*args: Any, **kwargs: Any) -> None:
+        _absorb_result(*args, **kwargs)
+        order.append(f"absorbed {kwargs['checkpoint_state']['latest_checkpoint_id']}")
+
+    with patch("lg_orch.nodes.executor._absorb_result", _absorb):
+        out = executor(state)
+    assert order == ["finished 1", "absorbed cp-1", "finished 0", "absorbed cp-0"]
+    assert out["_checkpoint"]["latest_checkpoint_id"] == "cp-0"
+    assert [e["kind"] for e in out["_trace_events"]].count("tools") == 1
+
+
+@patch("lg_orch.nodes.executor.RunnerClient")
+def test_executor_budget_counts_in_flight_steps(mock_cls: MagicMock) -> None:
+    runner = _RecordingRunner()
+    mock_cls.return_value = runner
+    state = _steps_state(("read_file", "a"), ("read_file", "b"), ("read_file", "c"))
+    state["_budget_max_tool_calls_per_loop"] = 2
+    out = executor(state)
+    results = out["tool_results"]
+    assert [r.get("stdout") for r in results[:2]] == ["a", "b"]
+    assert results[2]["artifacts"]["error"] == "tool_call_budget_exceeded"
+    assert len(runner.order) == 4
+
+
 @patch("lg_orch.nodes.executor.RunnerClient")
 def test_executor_pre_verification_prunes_tool_result_window(mock_cls: MagicMock) -> None:
     mock_instance = MagicMock()
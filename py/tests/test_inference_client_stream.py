@@ -190,3 +190,67 @@ def test_empty_delta_content_not_yielded() -> None:
         return tokens
 
     assert _run(_go()) == ["ok"]
+
+
+# ---------------------------------------------------------------------------
+# Test: shared streaming loop and pooled AsyncClient
+# ---------------------------------------------------------------------------
+
+
+def test_run_on_shared_loop_reuses_one_loop_thread() -> None:
+    import threading
+
+    from lg_orch.tools.inference_client import run_on_shared_loop
+
+    async def _thread_name() -> str:
+        return threading.current_thread().name
+
+    async def _from_running_loop() -> str:
+        # Blocking bridge is usable even while this thread's own loop runs.
+        return run_on_shared_loop(_thread_name())
+
+    assert run_on_shared_loop(_thread_name()) == "lg-orch-llm-loop"
+    assert _run(_from_running_loop()) == "lg-orch-llm-loop"
+
+    async def _nested() -> None:
+        run_on_shared_loop(_thread_name())
+
+    with pytest.raises(RuntimeError, match="shared loop"):
+        run_on_shared_loop(_nested())
+
+
+def test_stream_sync_reuses_pooled_async_client_and_records_ttft() -> None:
+    from lg_orch.api.metrics import LULA_LLM_TTFT_SECONDS
+    from lg_orch.tools import inference_client
+
+    _clear_breaker("http://test.local")
+    inference_client.shutdown_shared_loop()
+    client = _make_client()
+    ttft = LULA_LLM_TTFT_SECONDS.labels(model="gpt-4o")
+    before = ttft._sum.get()  # type: ignore[attr-defined]
+    used: list[object] = []
+
+    async def _send(self: object, request: object, stream: bool = False) -> MagicMock:
+        used.append(self)
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        resp.aclose = AsyncMock()
+
+        async def _aiter_lines():  # type: ignore[no-untyped-def]
+            for line in _sse_lines("a", "b"):
+                yield line
+
+        resp.aiter_lines = _aiter_lines
+        return resp
+
+    with patch("httpx.AsyncClient.send", _send):
+        for _ in range(2):
+            response = client.chat_completion_stream_sync(
+                model="gpt-4o", system_prompt="sys", user_prompt="hi", temperature=0.0
+            )
+            assert response.text == "ab"
+    assert len(used) == 2 and used[0] is used[1]
+    assert len(inference_client._async_client_cache) == 1
+    assert ttft._sum.get() > before  # type: ignore[attr-defined]
+    inference_client.shutdown_shared_loop()
+    assert inference_client._async_client_cache == {}
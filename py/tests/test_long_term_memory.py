@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import sqlite3
 import time
 from unittest.mock import patch
 
@@ -378,3 +379,272 @@ def test_make_embedder_uses_env_var():
     with patch.dict("os.environ", {"LG_EMBED_PROVIDER": "ollama"}):
         embedder = make_embedder()
         assert isinstance(embedder, OllamaEmbedder)
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped embedding matrix (numpy fallback)
+# ---------------------------------------------------------------------------
+
+
+def _axis_embedder(text: str) -> np.ndarray[object, np.dtype[np.float32]]:
+    v = np.zeros(8, dtype=np.float32)
+    v[int(text.split()[-1]) % 8] = 1.0
+    return v
+
+
+def _numpy_store(db_path: str) -> LongTermMemoryStore:
+    with patch.dict("sys.modules", {"sqlite_vec": None}):
+        return LongTermMemoryStore(db_path=db_path, embedder=_axis_embedder)
+
+
+def test_embedding_matrix_persists_across_reopen(tmp_path: pytest.TempPathFactory) -> None:
+    db_path = str(tmp_path / "mm.db")
+    store = _numpy_store(db_path)
+    for i in range(5):
+        store.store_semantic(f"fact {i}", {"i": i})
+    store.close()
+    assert os.path.getsize(db_path + ".emb.ids") == 8 + 5 * 8
+    assert os.path.getsize(db_path + ".emb.f32") == 5 * 8 * 4
+
+    with patch("lg_orch.long_term_memory._log") as log:
+        reopened = _numpy_store(db_path)
+    rebuilt = [c for c in log.info.call_args_list if "rebuilt" in str(c)]
+    assert rebuilt == []
+    results = reopened.search_semantic("query 3", top_k=2)
+    assert results[0].content == "fact 3"
+    assert results[0].metadata == {"i": 3}
+    assert results[0].embedding is not None
+    reopened.close()
+
+
+def test_embedding_matrix_rebuilt_when_stale(tmp_path: pytest.TempPathFactory) -> None:
+    db_path = str(tmp_path / "stale.db")
+    store = _numpy_store(db_path)
+    store.store_semantic("fact 1")
+    store.close()
+    # Simulate a torn append plus rows written while the matrix was not open.
+    with open(db_path + ".emb.f32", "ab") as fh:
+        fh.write(b"\0" * 12)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO semantic_memories (content, metadata, embedding, created_at) "
+        "VALUES (?, '{}', ?, 0)",
+        ("fact 2", _axis_embedder("fact 2").tobytes()),
+    )
+    conn.commit()
+    conn.close()
+
+    reopened = _numpy_store(db_path)
+    assert [r.content for r in reopened.search_semantic("query 2", top_k=1)] == ["fact 2"]
+    assert os.path.getsize(db_path + ".emb.f32") == 2 * 8 * 4
+    reopened.close()
+
+
+def test_embedding_matrix_shared_by_two_stores(tmp_path: pytest.TempPathFactory) -> None:
+    db_path = str(tmp_path / "shared.db")
+    first = _numpy_store(db_path)
+    second = _numpy_store(db_path)
+    first.store_semantic("alpha 1")
+    second.store_semantic("beta 2")
+    first.store_semantic("gamma 3")
+
+    for store in (first, second):
+        assert [r.content for r in store.search_semantic("query 2", top_k=3)][:1] == ["beta 2"]
+        assert sorted(r.content for r in store.search_semantic("query 2", top_k=5)) == [
+            "alpha 1",
+            "beta 2",
+            "gamma 3",
+        ]
+    ids = np.fromfile(db_path + ".emb.ids", dtype=np.int64)[1:]
+    assert ids.tolist() == [1, 2, 3]
+    first.close()
+    second.close()
+
+
+def test_embedding_matrix_top_k_ordering_and_ties(tmp_path: pytest.TempPathFactory) -> None:
+    store = _numpy_store(str(tmp_path / "ties.db"))
+    for content in ["a 1", "b 2", "c 1", "d 1", "e 3"]:
+        store.store_semantic(content)
+    # Rows inserted behind the store's back are picked up on the next search.
+    with store._lock:
+        store._conn.execute(
+            "INSERT INTO semantic_memories (content, metadata, embedding, created_at) "
+            "VALUES ('short', '{}', ?, 0)",
+            (np.ones(3, dtype=np.float32).tobytes(),),
+        )
+        store._conn.commit()
+    results = store.search_semantic("query 1", top_k=2)
+    assert [r.content for r in results] == ["a 1", "c 1"]
+    assert len(store.search_semantic("query 1", top_k=10)) == 6
+    store.close()
+
+
+# ---------------------------------------------------------------------------
+# Batched embedding and embedding cache
+# ---------------------------------------------------------------------------
+
+
+def test_ollama_embed_many_batches_requests() -> None:
+    from lg_orch.long_term_memory import OllamaEmbedder
+
+    embedder = OllamaEmbedder(batch_size=2, max_concurrency=2)
+    embedder._available = True
+    calls: list[list[str]] = []
+
+    def _post(path: str, body: dict[str, object]) -> dict[str, object]:
+        assert path == "/api/embed"
+        texts = list(body["input"])  # type: ignore[call-overload]
+        calls.append(texts)
+        return {"embeddings": [[float(len(t))] for t in texts]}
+
+    with patch.object(embedder, "_post", side_effect=_post):
+        result = embedder.embed_many(["a", "bb", "ccc", "dddd", "eeeee"])
+    assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_ollama_embed_many_falls_back_per_text() -> None:
+    from lg_orch.long_term_memory import OllamaEmbedder
+
+    embedder = OllamaEmbedder()
+    embedder._available = True
+
+    def _post(path: str, body: dict[str, object]) -> dict[str, object]:
+        if path == "/api/embed":
+            raise OSError("404")
+        return {"embedding": [float(len(str(body["prompt"])))]}
+
+    with patch.object(embedder, "_post", side_effect=_post):
+        assert embedder.embed_many(["ab", "c"]) == [[2.0], [1.0]]
+
+
+def test_embedding_cache_lru_eviction_and_key(tmp_path: pytest.TempPathFactory) -> None:
+    from lg_orch.long_term_memory import EmbeddingCache
+
+    db_path = str(tmp_path / "cache.db")
+    cache = EmbeddingCache(db_path, model="m", dim=2, max_entries=2)
+    vec = np.array([1.0, 0.0], dtype=np.float32)
+    cache.put_many(["a", "b", "wrong-dim"], [vec, vec, np.ones(3, dtype=np.float32)])
+    assert len(cache) == 2
+    time.sleep(0.01)
+    assert cache.get_many(["a"])[0] is not None  # "a" is now most recently used
+    cache.put_many(["c"], [vec])
+    assert [v is not None for v in cache.get_many(["a", "b", "c"])] == [True, False, True]
+    other = EmbeddingCache(db_path, model="m", dim=3)
+    assert cache.key("a") != other.key("a")
+    assert other.get_many(["a"]) == [None]
+    cache.close()
+    other.close()
+
+
+def test_store_reuses_cached_embeddings(tmp_path: pytest.TempPathFactory) -> None:
+    calls: list[str] = []
+
+    def _embedder(text: str) -> np.ndarray[object, np.dtype[np.float32]]:
+        calls.append(text)
+        return np.full(128, 1.0 / np.sqrt(128), dtype=np.float32)
+
+    store = LongTermMemoryStore(db_path=str(tmp_path / "c.db"), embedder=_embedder)
+    store.store_semantic("fact")
+    store.search_semantic("fact")
+    store.search_semantic("fact")
+    assert calls == ["fact"]
+    store.close()
+
+    uncached = LongTermMemoryStore(
+        db_path=str(tmp_path / "u.db"), embedder=_embedder, embedding_cache_size=0
+    )
+    uncached.search_semantic("fact")
+    assert calls == ["fact", "fact"]
+    uncached.close()
+
+
+def test_store_semantic_many_single_batch(tmp_path: pytest.TempPathFactory) -> None:
+    class _BatchEmbedder:
+        model = "axis"
+
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def __call__(self, text: str) -> np.ndarray[object, np.dtype[np.float32]]:
+            raise AssertionError("expected embed_many")
+
+        def embed_many(self, texts: list[str]) -> list[np.ndarray[object, np.dtype[np.float32]]]:
+            self.batches.append(list(texts))
+            return [_axis_embedder(t) for t in texts]
+
+    embedder = _BatchEmbedder()
+    store = LongTermMemoryStore(db_path=str(tmp_path / "bulk.db"), embedder=embedder)
+    ids = store.store_semantic_many(["fact 1", "fact 2", "fact 3"], [{"n": 1}, None, {"n": 3}])
+    assert ids == sorted(ids) and len(ids) == 3
+    assert embedder.batches == [["fact 1", "fact 2", "fact 3"]]
+    assert store.store_semantic_many([]) == []
+    with pytest.raises(ValueError, match="one entry per content"):
+        store.store_semantic_many(["x"], [])
+    assert [r.content for r in store.search_semantic("query 2", top_k=1)] == ["fact 2"]
+    store.close()
+
+
+# ---------------------------------------------------------------------------
+# IVF-flat ANN index
+# ---------------------------------------------------------------------------
+
+
+def test_store_ivf_index_from_env(tmp_path: pytest.TempPathFactory) -> None:
+    from lg_orch.vector_index import IVFFlatIndex
+
+    db_path = str(tmp_path / "ivf.db")
+    env = {"LG_MEMORY_ANN_INDEX": "ivf", "LG_MEMORY_ANN_PROBES": "2"}
+    with patch.dict(os.environ, env), patch.dict("sys.modules", {"sqlite_vec": None}):
+        store = LongTermMemoryStore(db_path=db_path, embedder=_axis_embedder)
+    assert isinstance(store._matrix, IVFFlatIndex)
+    assert store._matrix.n_probes == 2
+    store.store_semantic_many([f"fact {i}" for i in range(8)])
+    assert [r.content for r in store.search_semantic("query 5", top_k=1)] == ["fact 5"]
+    store.close()
+
+
+def test_store_rejects_unknown_ann_index(tmp_path: pytest.TempPathFactory) -> None:
+    with pytest.raises(ValueError, match="ann_index"):
+        LongTermMemoryStore(
+            db_path=str(tmp_path / "bad.db"), embedder=_axis_embedder, ann_index="lsh"
+        )
+
+
+def test_store_caches_provider_dim_but_not_fallback_vectors(
+    tmp_path: pytest.TempPathFactory,
+) -> None:
+    from lg_orch.long_term_memory import OllamaEmbedder
+
+    embedder = OllamaEmbedder()
+    embedder._available = True
+    up = {"value": False}
+    posts: list[str] = []
+
+    def _post(path: str, body: dict[str, object]) -> dict[str, object]:
+        posts.append(path)
+        if not up["value"]:
+            raise OSError("connection refused")
+        return {"embeddings": [[1.0] + [0.0] * 767 for _ in body["input"]]}  # type: ignore[attr-defined]
+
+    db_path = str(tmp_path / "dims.db")
+    with patch.object(embedder, "_post", side_effect=_post):
+        store = LongTermMemoryStore(db_path=db_path, embedder=embedder)
+        store.search_semantic("fact")  # Ollama down: stub vector, not cached
+        assert store._embedding_cache is not None
+        assert len(store._embedding_cache) == 0
+        up["value"] = True
+        store.search_semantic("fact")
+        assert len(store._embedding_cache) == 1
+        calls = len(posts)
+        store.search_semantic("fact")
+        assert len(posts) == calls
+        store.close()
+
+        # The learned 768 dim survives a restart.
+        reopened = LongTermMemoryStore(db_path=db_path, embedder=embedder)
+        assert reopened._embedding_cache is not None
+        assert reopened._embedding_cache.dim == 768
+        reopened.search_semantic("fact")
+        assert len(posts) == calls
+        reopened.close()
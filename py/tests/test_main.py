@@ -250,13 +250,7 @@ def test_cli_serve_api_dispatches_to_serve_command(tmp_path: Path) -> None:
     mock_cmd.assert_called_once()
 
 
-def test_cli_run_dispatches_to_run_command(tmp_path: Path) -> None:
-    """cli() must delegate run to commands.run.run_command."""
-    # Provide a minimal config so load_config does not fail.
-    cfg_dir = tmp_path / "configs"
-    cfg_dir.mkdir()
-    (cfg_dir / "runtime.dev.toml").write_text(
-        """\
+_MINIMAL_CONFIG = """\
 [models.router]
 provider = "local"
 model = "deterministic"
@@ -283,9 +277,19 @@ root_dir = "."
 
 [mcp]
 enabled = false
-""",
-        encoding="utf-8",
-    )
+"""
+
+
+def _write_minimal_config(root: Path, profile: str = "dev") -> None:
+    cfg_dir = root / "configs"
+    cfg_dir.mkdir(exist_ok=True)
+    (cfg_dir / f"runtime.{profile}.toml").write_text(_MINIMAL_CONFIG, encoding="utf-8")
+
+
+def test_cli_run_dispatches_to_run_command(tmp_path: Path) -> None:
+    """cli() must delegate run to commands.run.run_command."""
+    # Provide a minimal config so load_config does not fail.
+    _write_minimal_config(tmp_path)
 
     with patch("lg_orch.commands.run.run_command", return_value=0) as mock_cmd:
         rc = cli(["run", "hello world", "--repo-root", str(tmp_path)])
@@ -293,6 +297,32 @@ enabled = false
     mock_cmd.assert_called_once()
 
 
+def test_pool_main_reuses_graph_and_config_and_passes_env(tmp_path: Path) -> None:
+    """pool_main() compiles once per worker and hands the run its env, not os.environ."""
+    from lg_orch.main import _pooled_config, pool_main, warm_up
+
+    _write_minimal_config(tmp_path, profile="ci")
+    env = {"LG_PROFILE": "ci", "LG_REQUEST_ID": "req-1"}
+    argv = ["lg_orch.main", "run", "hello", "--repo-root", str(tmp_path)]
+    warm_up.cache_clear()
+    _pooled_config.cache_clear()
+    with (
+        patch("lg_orch.graph.build_graph", return_value="compiled") as build,
+        patch("lg_orch.commands.run.run_command", return_value=0) as run_cmd,
+    ):
+        assert pool_main(argv, cwd=tmp_path, env=env) == 0
+        assert pool_main(argv, cwd=tmp_path, env=env) == 0
+    warm_up.cache_clear()
+    build.assert_called_once_with()
+    assert _pooled_config.cache_info().misses == 1
+    kwargs = run_cmd.call_args.kwargs
+    assert (kwargs["graph"], kwargs["env"], kwargs["repo_root"]) == ("compiled", env, tmp_path)
+    assert run_cmd.call_args_list[0].kwargs["cfg"] is kwargs["cfg"]
+    assert pool_main(["lg_orch.main", "export-graph"], cwd=tmp_path, env=env) == 2
+    warm_up.cache_clear()
+    _pooled_config.cache_clear()
+
+
 def test_run_command_callable_directly(tmp_path: Path) -> None:
     """run_command() must be importable and callable as a standalone function."""
     from lg_orch.commands.run import run_command
@@ -666,3 +666,153 @@ def test_scheduler_discards_cyclic_patch() -> None:
     # B still ran after A (linear chain intact).
     assert result.all_succeeded is True
     assert ran.index("a") < ran.index("b")
+
+
+# ---------------------------------------------------------------------------
+# 16. Incremental cycle checks and graph queries
+# ---------------------------------------------------------------------------
+
+
+class TestDependencyGraphIncremental:
+    def test_add_edge_rejects_transitive_and_self_cycles(self) -> None:
+        tasks = [_task("a"), _task("b", deps=["a"]), _task("c", deps=["b"])]
+        dag = DependencyGraph(tasks)
+        with pytest.raises(ValueError, match="Cycle detected"):
+            dag.add_edge("c", "a")
+        with pytest.raises(ValueError, match="Cycle detected"):
+            dag.add_edge("b", "b")
+        assert dag.dependents("a") == {"b"}
+        assert dag.dependencies("a") == []
+
+    def test_remove_then_add_reverses_edge(self) -> None:
+        dag = DependencyGraph([_task("a"), _task("b", deps=["a"])])
+        dag.remove_edge("a", "b")
+        dag.add_edge("b", "a")
+        assert dag.topological_order() == ["b", "a"]
+        assert dag.dependents("a") == set()
+
+    def test_clone_has_independent_reverse_edges(self) -> None:
+        dag = DependencyGraph([_task("a"), _task("b")])
+        clone = dag.clone()
+        clone.add_edge("a", "b")
+        assert clone.dependents("a") == {"b"}
+        assert dag.dependents("a") == set()
+
+
+# ---------------------------------------------------------------------------
+# 17. Scheduling policies, priorities and resource caps
+# ---------------------------------------------------------------------------
+
+
+def _recording_graph(order: list[str]) -> Any:
+    async def run(state: dict[str, Any]) -> dict[str, Any]:
+        order.append(state["task_id"])
+        await asyncio.sleep(0)
+        return {}
+
+    return run
+
+
+def test_fifo_policy_keeps_list_order() -> None:
+    order: list[str] = []
+    tasks = [_task("x"), _task("y"), _task("z")]
+    asyncio.run(run_meta_graph(tasks, _recording_graph(order), max_parallel=1))
+    assert order == ["x", "y", "z"]
+
+
+def test_priority_runs_first() -> None:
+    order: list[str] = []
+    tasks = [_task("x"), _task("y"), _task("z")]
+    tasks[2].priority = 5
+    asyncio.run(run_meta_graph(tasks, _recording_graph(order), max_parallel=1))
+    assert order == ["z", "x", "y"]
+
+
+def test_critical_path_policy_starts_longest_chain_first() -> None:
+    from lg_orch.meta_graph import CriticalPathPolicy
+
+    # "short" is first in list order, but "head" gates a three-task chain.
+    tasks = [
+        _task("short"),
+        _task("head"),
+        _task("mid", deps=["head"]),
+        _task("tail", deps=["mid"]),
+    ]
+    policy = CriticalPathPolicy(durations={"short": 2.0}, default_duration_s=1.0)
+    order: list[str] = []
+    asyncio.run(run_meta_graph(tasks, _recording_graph(order), max_parallel=1, policy=policy))
+    assert order[0] == "head"
+    assert policy.rank("head") == pytest.approx(3.0)
+
+
+def test_duration_history_feeds_critical_path() -> None:
+    from lg_orch.meta_graph import CriticalPathPolicy, TaskDurationHistory
+
+    history = TaskDurationHistory(default_s=0.0)
+
+    async def timed(state: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0.05 if state["task_id"] == "slow" else 0)
+        return {}
+
+    asyncio.run(run_meta_graph([_task("fast"), _task("slow")], timed, duration_history=history))
+    assert history.estimate("slow") > history.estimate("fast")
+
+    order: list[str] = []
+    asyncio.run(
+        run_meta_graph(
+            [_task("fast"), _task("slow")],
+            _recording_graph(order),
+            max_parallel=1,
+            policy=CriticalPathPolicy(history),
+        )
+    )
+    assert order == ["slow", "fast"]
+
+
+def test_resource_limits_cap_concurrency_per_kind() -> None:
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def tracked(state: dict[str, Any]) -> dict[str, Any]:
+        repo = state["repo"]
+        active[repo] = active.get(repo, 0) + 1
+        peak[repo] = max(peak.get(repo, 0), active[repo])
+        await asyncio.sleep(0.01)
+        active[repo] -= 1
+        return {}
+
+    tasks = []
+    for i in range(6):
+        repo = "a" if i < 4 else "b"
+        t = _task(f"t{i}", extra={"repo": repo})
+        t.resources = [f"repo:{repo}"]
+        tasks.append(t)
+
+    result = asyncio.run(
+        run_meta_graph(
+            tasks,
+            tracked,
+            max_parallel=6,
+            resource_limits={"repo": 2, "repo:b": 1},
+        )
+    )
+    assert result.all_succeeded is True
+    assert peak == {"a": 2, "b": 1}
+
+
+def test_rewiring_blocks_ready_task_until_new_dependency_finishes() -> None:
+    order: list[str] = []
+
+    async def patching(state: dict[str, Any]) -> dict[str, Any]:
+        tid = state["task_id"]
+        order.append(tid)
+        await asyncio.sleep(0)
+        if tid == "a":
+            return {"dependency_patch": DependencyPatch(add_edges=[("b", "c")])}
+        return {}
+
+    tasks = [_task("a"), _task("b", deps=["a"]), _task("c")]
+    result = asyncio.run(run_meta_graph(tasks, patching, dynamic_rewiring=True, max_parallel=1))
+    assert result.all_succeeded is True
+    # c was ready from the start but, after the patch, waits for b.
+    assert order == ["a", "b", "c"]
@@ -216,3 +216,202 @@ def test_multi_repo_scheduler_scip_summary_truncated() -> None:
     # All entries must be the first 20 alphabetically.
     assert names[0] == "sym_000"
     assert names[-1] == "sym_019"
+
+
+# ---------------------------------------------------------------------------
+# Files patched by a task are reindexed after the run
+# ---------------------------------------------------------------------------
+
+
+def test_multi_repo_scheduler_reindexes_patched_files(tmp_path: Any) -> None:
+    from lg_orch.scip_index import ScipSymbol
+
+    (tmp_path / "svc.py").write_text("def handler():\n    return 1\n", encoding="utf-8")
+    index = ScipIndex(
+        repo_root=str(tmp_path),
+        symbols=[
+            ScipSymbol(
+                name="stale_handler",
+                kind="function",
+                file_path="svc.py",
+                start_line=1,
+                end_line=2,
+                references=[],
+            )
+        ],
+    )
+    repo = _repo(name="svc", root=str(tmp_path), scip_index=index)
+    task = _make_task("task-a")
+    scheduler = MultiRepoScheduler(repos=[repo], task_repo_map={"task-a": "svc"})
+
+    result = _empty_result([task])
+    task.result = {"_scip_dirty_paths": ["svc.py"]}
+    with patch(
+        "lg_orch.multi_repo.MetaGraphScheduler.run",
+        new_callable=AsyncMock,
+        return_value=result,
+    ):
+        asyncio.run(scheduler.run([task]))
+
+    assert index.find_symbol("stale_handler") == []
+    assert [s.name for s in index.find_symbol("handler")] == ["handler"]
+
+
+def test_multi_repo_scheduler_skips_reindex_for_worktree_runs(tmp_path: Any) -> None:
+    (tmp_path / "svc.py").write_text("def stale_on_disk():\n    return 1\n", encoding="utf-8")
+    index = ScipIndex(repo_root=str(tmp_path), symbols=[])
+    repo = _repo(name="svc", root=str(tmp_path), scip_index=index)
+    task = _make_task("task-a")
+    scheduler = MultiRepoScheduler(
+        repos=[repo], task_repo_map={"task-a": "svc"}, worktree_isolation=True
+    )
+
+    result = _empty_result([task])
+    task.result = {"_scip_dirty_paths": ["svc.py"]}
+    with patch(
+        "lg_orch.multi_repo.MetaGraphScheduler.run",
+        new_callable=AsyncMock,
+        return_value=result,
+    ):
+        asyncio.run(scheduler.run([task]))
+
+    assert index.find_symbol("stale_on_disk") == []
+    assert index.is_stale
+
+
+def test_graph_final_state_carries_scip_dirty_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The executor's dirty paths survive LangGraph's state schema."""
+    from unittest.mock import MagicMock
+
+    import lg_orch.graph as graph_mod
+
+    def passthrough(state: dict[str, Any]) -> dict[str, Any]:
+        return state
+
+    for name in ("ingest", "policy_gate", "context_builder", "router", "planner", "coder"):
+        monkeypatch.setattr(graph_mod, name, passthrough)
+    monkeypatch.setattr(graph_mod, "verifier", lambda state: {"verification": {"ok": True}})
+    monkeypatch.setattr(graph_mod, "reporter", lambda state: {"final": "done"})
+    runner = MagicMock()
+    runner.batch_execute_tools.return_value = [
+        {"tool": "apply_patch", "ok": True, "exit_code": 0, "stdout": "", "stderr": ""}
+    ]
+    graph = graph_mod.build_graph()
+
+    with patch("lg_orch.nodes.executor.RunnerClient", return_value=runner):
+        out = graph.invoke(
+            {
+                "request": "patch svc",
+                "_runner_enabled": True,
+                "_runner_base_url": "http://127.0.0.1:8088",
+                "plan": {
+                    "steps": [
+                        {
+                            "id": "step-1",
+                            "tools": [
+                                {
+                                    "tool": "apply_patch",
+                                    "input": {
+                                        "changes": [
+                                            {"path": "svc.py", "op": "update", "content": "x"}
+                                        ]
+                                    },
+                                }
+                            ],
+                        }
+                    ]
+                },
+                "tool_results": [],
+            }
+        )
+
+    assert runner.batch_execute_tools.called
+    assert out["_scip_index_stale"] is True
+    assert out["_scip_dirty_paths"] == ["svc.py"]
+
+
+# ---------------------------------------------------------------------------
+# Indexes load concurrently; handoffs carry cross-repo symbol edges
+# ---------------------------------------------------------------------------
+
+
+def test_multi_repo_scheduler_loads_indexes_and_injects_symbol_edges(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    monkeypatch.setenv("LG_SCIP_CACHE_DIR", str(tmp_path / "scip-cache"))
+
+    from lg_orch.scip_index import clear_scip_index_cache
+
+    gateway = tmp_path / "gateway"
+    auth = tmp_path / "auth"
+    gateway.mkdir()
+    auth.mkdir()
+    (gateway / "scip_index.json").write_text(
+        json.dumps(
+            {
+                "documents": [
+                    {
+                        "relative_path": "routes.py",
+                        "symbols": [
+                            {"name": "login_route", "references": ["auth.py:validate_token"]}
+                        ],
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    (auth / "scip_index.json").write_text(
+        json.dumps(
+            {"documents": [{"relative_path": "tokens.py", "symbols": [{"name": "validate_token"}]}]}
+        ),
+        encoding="utf-8",
+    )
+    clear_scip_index_cache()
+    repo_gw = _repo(name="gateway", root=str(gateway))
+    repo_auth = _repo(name="auth", root=str(auth))
+    task = _make_task("task-auth")
+    scheduler = MultiRepoScheduler(repos=[repo_gw, repo_auth], task_repo_map={"task-auth": "auth"})
+    handoff = CrossRepoHandoff(
+        source_repo="gateway",
+        target_repo="auth",
+        shared_symbols=["validate_token", "unknown"],
+        objective="Harden token checks",
+    )
+
+    with patch(
+        "lg_orch.multi_repo.MetaGraphScheduler.run",
+        new_callable=AsyncMock,
+        return_value=_empty_result([task]),
+    ):
+        asyncio.run(scheduler.run([task], handoffs=[handoff]))
+
+    # The source repo has no task of its own but is loaded for the edge table.
+    assert repo_gw.scip_index is not None
+    assert repo_auth.scip_index is not None
+    assert task.input_state["active_handoff"]["symbol_edges"] == [
+        {
+            "symbol": "validate_token",
+            "used_by": ["routes.py:login_route"],
+            "defined_in": ["tokens.py"],
+        }
+    ]
+    clear_scip_index_cache()
+
+
+def test_multi_repo_scheduler_tags_tasks_with_repo_and_runner_resources() -> None:
+    repo = _repo(name="auth", root="/repos/auth", runner="http://auth-runner:9000")
+    repo.scip_index = ScipIndex(repo_root="/repos/auth")
+    task = _make_task("task-a")
+    scheduler = MultiRepoScheduler(
+        repos=[repo], task_repo_map={"task-a": "auth"}, resource_limits={"repo": 2}
+    )
+    with patch(
+        "lg_orch.multi_repo.MetaGraphScheduler.run",
+        new_callable=AsyncMock,
+        return_value=_empty_result([task]),
+    ):
+        asyncio.run(scheduler.run([task]))
+    assert task.resources == ["repo:auth", "runner:http://auth-runner:9000"]
@@ -187,6 +187,64 @@ class TestPgVectorMemoryStoreMocked:
             results = store.search_semantic("hello")
         assert results[0].distance is None
 
+    def test_hnsw_index_created_with_params_and_ef_search(self) -> None:
+        mock_module, _mock_conn, mock_cursor = _make_mock_psycopg()
+        with patch.dict(sys.modules, {"psycopg": mock_module}):
+            PgVectorMemoryStore(
+                dsn="postgresql://test@localhost/db",
+                embedder=_stub_embedder,
+                embedding_dim=4,
+                index_type="hnsw",
+                index_params={"m": 32},
+                search_breadth=80,
+            )
+        sql_texts = [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        index_sql = next(s for s in sql_texts if "CREATE INDEX" in s)
+        assert "USING hnsw (embedding vector_cosine_ops)" in index_sql
+        assert "WITH (m = 32, ef_construction = 64)" in index_sql
+        assert "SET hnsw.ef_search = 80" in sql_texts
+
+    def test_ivfflat_index_sets_probes(self) -> None:
+        mock_module, _mock_conn, mock_cursor = _make_mock_psycopg()
+        with patch.dict(sys.modules, {"psycopg": mock_module}):
+            PgVectorMemoryStore(
+                dsn="postgresql://test@localhost/db",
+                embedder=_stub_embedder,
+                index_type="ivfflat",
+                search_breadth=10,
+            )
+        sql_texts = [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        assert any("USING ivfflat" in s and "WITH (lists = 100)" in s for s in sql_texts)
+        assert "SET ivfflat.probes = 10" in sql_texts
+
+    def test_no_index_by_default(self) -> None:
+        mock_module, _mock_conn, mock_cursor = _make_mock_psycopg()
+        with patch.dict(sys.modules, {"psycopg": mock_module}):
+            PgVectorMemoryStore(dsn="postgresql://test@localhost/db", embedder=_stub_embedder)
+        sql_texts = [str(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        assert not any("CREATE INDEX" in s for s in sql_texts)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"index_type": "diskann"}, "index_type"),
+            ({"index_type": "hnsw", "index_params": {"lists": 5}}, "unknown hnsw"),
+            ({"search_breadth": 10}, "require index_type"),
+        ],
+    )
+    def test_invalid_index_options_rejected(self, kwargs: dict[str, object], match: str) -> None:
+        mock_module, _mock_conn, _mock_cursor = _make_mock_psycopg()
+        with (
+            patch.dict(sys.modules, {"psycopg": mock_module}),
+            pytest.raises(ValueError, match=match),
+        ):
+            PgVectorMemoryStore(
+                dsn="postgresql://test@localhost/db",
+                embedder=_stub_embedder,
+                **kwargs,  # type: ignore[arg-type]
+            )
+        mock_module.connect.assert_not_called()
+
 
 class TestPgMemoryRecord:
     def test_fields(self) -> None:
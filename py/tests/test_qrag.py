@@ -5,7 +5,13 @@ from __future__ import annotations
 import time
 from typing import Any
 
-from lg_orch.qrag import QRAGRetriever, ScoredMemory, _cosine_sim, _extract_embedding
+import numpy as np
+
+from lg_orch.qrag import (
+    CandidateBatch,
+    QRAGRetriever,
+    ScoredMemory,
+)
 
 
 def _cand(
@@ -101,107 +107,167 @@ class TestQRAGRetriever:
                 similarity_weight=0, recency_weight=0, diversity_weight=0, success_weight=0
             )
 
+    def test_mmr_prefers_diverse_candidate_over_near_duplicate(self) -> None:
+        r = QRAGRetriever(diversity_weight=0.5)
+        emb = [1.0, 0.0, 0.0]
+        c1 = _cand("first", similarity=0.9, embedding=emb)
+        c2 = _cand("second", similarity=0.85, embedding=emb)
+        c3 = _cand("diverse", similarity=0.8, embedding=[0.0, 1.0, 0.0])
+        result = r.retrieve([c1, c2, c3], "code_change", top_k=2)
+        assert [m.content for m in result] == ["first", "diverse"]
+
+    def test_duplicate_content_uses_own_embedding(self) -> None:
+        r = QRAGRetriever(diversity_weight=0.5)
+        c1 = _cand("same", similarity=0.9, embedding=[1.0, 0.0])
+        c2 = _cand("same", similarity=0.85, embedding=[0.0, 1.0])
+        result = r.retrieve([c1, c2], "code_change", top_k=2)
+        assert result[1].combined_score < result[0].combined_score
+        assert result[0].similarity == 0.9
+        # Orthogonal embeddings: the second pick carries no diversity penalty.
+        solo = r.retrieve([c2], "code_change", top_k=1)
+        assert abs(result[1].combined_score - solo[0].combined_score) < 1e-9
+
+    def test_accepts_ndarray_embeddings(self) -> None:
+        r = QRAGRetriever()
+        cand = _cand("np", similarity=0.5)
+        cand["embedding"] = np.array([0.6, 0.8], dtype=np.float32)
+        assert r.retrieve([cand], "debug")[0].content == "np"
+
+
+class TestCandidateBatch:
+    def test_rerank_matches_retrieve(self) -> None:
+        r = QRAGRetriever()
+        now = time.time()
+        candidates = [
+            _cand(
+                f"m{i}",
+                similarity=0.4 + 0.05 * i,
+                task_type=("debug", "analysis", "")[i % 3],
+                success=(True, False, None)[i % 3],
+                created_at=now - 3600 * i,
+                embedding=[float(i % 2), float((i + 1) % 2), 0.1 * i],
+            )
+            for i in range(9)
+        ]
+        scored = r.retrieve(candidates, "debug", top_k=4)
+        indices, scores = r.rerank(CandidateBatch.from_candidates(candidates), "debug", top_k=4)
+        assert [m.content for m in scored] == [f"m{i}" for i in indices.tolist()]
+        assert np.allclose([m.combined_score for m in scored], scores)
+
+    def test_from_arrays_normalises_and_zeroes_missing_rows(self) -> None:
+        batch = CandidateBatch.from_arrays(
+            np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32), similarity=[0.1, 0.2]
+        )
+        assert np.allclose(batch.embeddings, [[0.6, 0.8], [0.0, 0.0]])
+        assert batch.success.tolist() == [0.5, 0.5]
+        assert np.isnan(batch.created_at).all()
+
+    def test_rerank_batch_scores_each_query(self) -> None:
+        r = QRAGRetriever()
+        batch = CandidateBatch.from_arrays(
+            np.eye(3, dtype=np.float32),
+            similarity=[0.5, 0.5, 0.5],
+            task_types=["debug", "analysis", "refactor"],
+        )
+        results = r.rerank_batch(
+            batch,
+            ["debug", "analysis", "refactor"],
+            similarities=[[0.5, 0.5, 0.5], [0.5, 0.5, 0.5], [0.0, 0.0, 1.0]],
+            top_k=1,
+        )
+        assert [int(idx[0]) for idx, _ in results] == [0, 1, 2]
+        assert r.rerank_batch(batch, []) == []
+
+    def test_rerank_1k_by_768_returns_distinct_top_k(self) -> None:
+        rng = np.random.default_rng(7)
+        embeddings = rng.standard_normal((1000, 768)).astype(np.float32)
+        kwargs: dict[str, Any] = {
+            "similarity": rng.random(1000),
+            "created_at": time.time() - rng.random(1000) * 86400 * 30,
+            "success": rng.random(1000),
+            "task_types": rng.choice(["debug", "analysis", "code_change"], 1000).tolist(),
+        }
+        # Timing lives in eval/bench_qrag_rerank.py.
+        indices, scores = QRAGRetriever().rerank(
+            CandidateBatch.from_arrays(embeddings, **kwargs), "debug", top_k=10
+        )
+        assert len(set(indices.tolist())) == 10
+        assert (np.diff(scores) <= 0).all()
+
 
-class TestComputeValue:
+def _batch(*metadata: dict[str, Any]) -> CandidateBatch:
+    return CandidateBatch.from_candidates([{"content": "m", "metadata": m} for m in metadata])
+
+
+class TestValueVector:
     def test_exact_task_match(self) -> None:
         r = QRAGRetriever()
-        val = r._compute_value({"metadata": {"task_type": "debug", "success": True}}, "debug")
-        assert val > 0.5
+        val = r._value_vector(_batch({"task_type": "debug", "success": True}), "debug")
+        assert val[0] > 0.5
 
     def test_partial_task_match(self) -> None:
         r = QRAGRetriever()
-        val = r._compute_value({"metadata": {"task_type": "code", "success": True}}, "code_change")
+        val = r._value_vector(_batch({"task_type": "code", "success": True}), "code_change")
         # Partial match — code in code_change
-        assert val > 0.0
+        assert val[0] > 0.0
 
     def test_no_task_match(self) -> None:
         r = QRAGRetriever()
-        val = r._compute_value({"metadata": {"task_type": "analysis"}}, "debug")
-        assert val < 0.5
+        val = r._value_vector(_batch({"task_type": "analysis"}), "debug")
+        assert val[0] < 0.5
 
     def test_empty_metadata(self) -> None:
         r = QRAGRetriever()
-        val = r._compute_value({"metadata": {}}, "debug")
-        assert isinstance(val, float)
+        val = r._value_vector(_batch({}), "debug")
+        assert val.tolist() == [0.2]
 
 
-class TestRecencyScore:
+class TestRecencyVector:
     def test_recent_memory_high_score(self) -> None:
         r = QRAGRetriever()
-        score = r._recency_score(time.time() - 60)
-        assert score > 0.9
+        assert r._recency_vector(np.array([time.time() - 60]))[0] > 0.9
 
     def test_old_memory_low_score(self) -> None:
         r = QRAGRetriever(recency_halflife_days=1.0)
-        score = r._recency_score(time.time() - 86400 * 10)
-        assert score < 0.01
+        assert r._recency_vector(np.array([time.time() - 86400 * 10]))[0] < 0.01
 
     def test_none_returns_neutral(self) -> None:
-        r = QRAGRetriever()
-        assert r._recency_score(None) == 0.5
+        created_at = _batch({"created_at": None}).created_at
+        assert QRAGRetriever()._recency_vector(created_at).tolist() == [0.5]
 
     def test_invalid_returns_neutral(self) -> None:
-        r = QRAGRetriever()
-        assert r._recency_score("not-a-number") == 0.5
+        created_at = _batch({"created_at": "not-a-number"}).created_at
+        assert QRAGRetriever()._recency_vector(created_at).tolist() == [0.5]
 
 
 class TestDiversityPenalty:
-    def test_no_selected_returns_zero(self) -> None:
-        r = QRAGRetriever()
-        assert r._diversity_penalty([1.0, 0.0], []) == 0.0
-
-    def test_identical_returns_one(self) -> None:
-        r = QRAGRetriever()
-        emb = [1.0, 0.0, 0.0]
-        penalty = r._diversity_penalty(emb, [emb])
-        assert abs(penalty - 1.0) < 0.01
-
-    def test_orthogonal_returns_zero(self) -> None:
-        r = QRAGRetriever()
-        penalty = r._diversity_penalty([1.0, 0.0], [[0.0, 1.0]])
-        assert abs(penalty) < 0.01
-
-    def test_empty_embedding(self) -> None:
-        r = QRAGRetriever()
-        assert r._diversity_penalty([], [[1.0, 0.0]]) == 0.0
-
-
-class TestSuccessScore:
-    def test_true(self) -> None:
-        r = QRAGRetriever()
-        assert r._success_score({"success": True}) == 1.0
+    """``_mmr`` lowers a pick by ``diversity_weight`` times its max cosine similarity."""
 
-    def test_false(self) -> None:
-        r = QRAGRetriever()
-        assert r._success_score({"success": False}) == 0.0
+    _RETRIEVER = QRAGRetriever(diversity_weight=0.5)
 
-    def test_none(self) -> None:
-        r = QRAGRetriever()
-        assert r._success_score({}) == 0.5
-
-    def test_numeric(self) -> None:
-        r = QRAGRetriever()
-        assert r._success_score({"success": 0.7}) == 0.7
-
-
-class TestHelpers:
-    def test_cosine_sim_identical(self) -> None:
-        assert abs(_cosine_sim([1.0, 0.0], [1.0, 0.0]) - 1.0) < 1e-6
+    def _penalties(self, embeddings: list[list[float] | None]) -> list[float]:
+        batch = CandidateBatch.from_candidates(
+            [_cand(f"m{i}", embedding=emb) for i, emb in enumerate(embeddings)]
+        )
+        combined = np.array([1.0, 0.9][: len(embeddings)])
+        indices, scores = self._RETRIEVER._mmr(combined, batch.embeddings, len(embeddings))
+        return (scores - combined[indices]).tolist()
 
-    def test_cosine_sim_orthogonal(self) -> None:
-        assert abs(_cosine_sim([1.0, 0.0], [0.0, 1.0])) < 1e-6
+    def test_first_pick_is_unpenalised(self) -> None:
+        assert self._penalties([[1.0, 0.0]]) == [0.0]
 
-    def test_cosine_sim_different_lengths(self) -> None:
-        assert _cosine_sim([1.0], [1.0, 0.0]) == 0.0
+    def test_identical_costs_full_weight(self) -> None:
+        penalty = self._penalties([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])[1]
+        assert abs(penalty + self._RETRIEVER.diversity_weight) < 1e-6
 
-    def test_cosine_sim_empty(self) -> None:
-        assert _cosine_sim([], []) == 0.0
+    def test_orthogonal_is_unpenalised(self) -> None:
+        assert abs(self._penalties([[1.0, 0.0], [0.0, 1.0]])[1]) < 1e-6
 
-    def test_extract_embedding_present(self) -> None:
-        assert _extract_embedding({"embedding": [1.0, 2.0]}) == [1.0, 2.0]
+    def test_missing_embedding_is_unpenalised(self) -> None:
+        assert abs(self._penalties([[1.0, 0.0], None])[1]) < 1e-6
 
-    def test_extract_embedding_missing(self) -> None:
-        assert _extract_embedding({"content": "x"}) == []
 
-    def test_extract_embedding_none(self) -> None:
-        assert _extract_embedding(None) == []
+class TestSuccessColumn:
+    def test_values(self) -> None:
+        batch = _batch({"success": True}, {"success": False}, {}, {"success": 0.7})
+        assert batch.success.tolist() == [1.0, 0.0, 0.5, 0.7]
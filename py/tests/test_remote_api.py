@@ -1849,3 +1849,133 @@ def test_api_404_for_unknown_route(tmp_path: Path) -> None:
         request_body=None,
     )
     assert status == 404
+
+
+# ---------------------------------------------------------------------------
+# GET /v1/runs pagination
+# ---------------------------------------------------------------------------
+
+
+def test_v1_runs_pages_merge_live_records_with_the_store(tmp_path: Path) -> None:
+    from lg_orch.api.service import RunRecord
+    from lg_orch.run_store import RunStore
+
+    store = RunStore(db_path=tmp_path / "runs.sqlite")
+    for i in range(5):
+        store.upsert(
+            {
+                "run_id": f"p{i}",
+                "request": f"persisted {i}",
+                "status": "succeeded",
+                "created_at": f"2026-01-01T00:00:0{i * 2}Z",
+                "started_at": f"2026-01-01T00:00:0{i * 2}Z",
+                "trace_out_dir": "artifacts/runs",
+                "trace_path": f"artifacts/runs/run-p{i}.json",
+                "final": "report",
+            }
+        )
+    service = RemoteAPIService(repo_root=tmp_path, run_store=store)
+    # A live run between p2 and p3, and a live update of p1.
+    for run_id, created_at, status in [
+        ("live", "2026-01-01T00:00:05Z", "running"),
+        ("p1", "2026-01-01T00:00:02Z", "running"),
+    ]:
+        service._runs[run_id] = RunRecord(
+            run_id=run_id,
+            request="live",
+            argv=[],
+            trace_out_dir=tmp_path,
+            trace_path=tmp_path / f"run-{run_id}.json",
+            process=None,
+            created_at=created_at,
+            started_at=created_at,
+            status=status,
+        )
+
+    seen: list[tuple[str, str]] = []
+    cursor = ""
+    while True:
+        status, _, body = _api_http_response(
+            service,
+            method="GET",
+            request_path=f"/v1/runs?limit=2&cursor={cursor}",
+            request_body=None,
+        )
+        assert status == 200
+        payload = json.loads(body.decode("utf-8"))
+        assert all("final" not in run for run in payload["runs"])
+        seen.extend((run["run_id"], run["status"]) for run in payload["runs"])
+        if payload["next_cursor"] is None:
+            break
+        cursor = payload["next_cursor"]
+    assert seen == [
+        ("p4", "succeeded"),
+        ("p3", "succeeded"),
+        ("live", "running"),
+        ("p2", "succeeded"),
+        ("p1", "running"),
+        ("p0", "succeeded"),
+    ]
+
+    status, _, body = _api_http_response(
+        service,
+        method="GET",
+        request_path="/v1/runs?status=running&fields=request",
+        request_body=None,
+    )
+    payload = json.loads(body.decode("utf-8"))
+    assert [(r["run_id"], sorted(r)) for r in payload["runs"]] == [
+        ("live", ["created_at", "request", "run_id"]),
+        ("p1", ["created_at", "request", "run_id"]),
+    ]
+
+    status, _, body = _api_http_response(
+        service, method="GET", request_path="/v1/runs?cursor=%%%", request_body=None
+    )
+    assert status == 400
+    assert json.loads(body.decode("utf-8")) == {"error": "invalid_cursor"}
+    store.close()
+
+
+def test_v1_runs_without_limit_or_cursor_returns_every_run(tmp_path: Path) -> None:
+    from lg_orch.run_store import RunStore
+
+    store = RunStore(db_path=tmp_path / "runs.sqlite")
+    for i in range(250):
+        store.upsert(
+            {
+                "run_id": f"p{i:03d}",
+                "request": "persisted",
+                "status": "succeeded",
+                "created_at": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+                "started_at": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+                "trace_out_dir": "artifacts/runs",
+                "trace_path": f"artifacts/runs/run-p{i:03d}.json",
+            }
+        )
+    service = RemoteAPIService(repo_root=tmp_path, run_store=store)
+
+    def get(path: str) -> tuple[int, dict[str, Any]]:
+        status, _, body = _api_http_response(
+            service, method="GET", request_path=path, request_body=None
+        )
+        return status, json.loads(body.decode("utf-8"))
+
+    status, payload = get("/v1/runs")
+    assert status == 200
+    assert len(payload["runs"]) == 250
+    assert payload["next_cursor"] is None
+
+    status, payload = get("/v1/runs?limit=100")
+    assert (len(payload["runs"]), payload["next_cursor"] is not None) == (100, True)
+
+    # A naive bound is UTC; an offset bound is converted.
+    status, payload = get("/v1/runs?created_after=2026-01-01T00:04:00")
+    assert [r["run_id"] for r in payload["runs"]] == [f"p{i:03d}" for i in range(249, 239, -1)]
+    status, payload = get("/v1/runs?created_before=2026-01-01T01:00:02%2B01:00")
+    assert [r["run_id"] for r in payload["runs"]] == ["p001", "p000"]
+
+    for name in ("created_after", "created_before"):
+        status, payload = get(f"/v1/runs?{name}=not-a-time")
+        assert (status, payload) == (400, {"error": f"invalid_{name}"})
+    store.close()
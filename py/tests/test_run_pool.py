@@ -0,0 +1,142 @@
+"""Tests for lg_orch.api.run_pool.
+
+Pool workers run ``python -m test_run_pool <cmd>`` through :func:`pool_main`
+below, so the tests exercise real worker processes without the graph.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lg_orch.api.run_pool import PooledRun, RunWorkerPool
+from lg_orch.api.service import RemoteAPIService
+
+
+def pool_main(argv: list[str], *, cwd: Path, env: Mapping[str, str]) -> int:
+    cmd = argv[1]
+    if cmd == "echo":
+        print("hello")
+        print("to stderr", file=sys.stderr)
+        return int(argv[2])
+    if cmd == "env":
+        print(f"{env.get('LG_POOL_TEST', '')}|{cwd}")
+        print(f"{os.environ.get('LG_POOL_TEST', '')}|{os.getcwd()}")
+        return 0
+    if cmd == "children":
+        ctx = multiprocessing.get_context("spawn")
+        child = ctx.Process(target=time.sleep, args=(0,))
+        child.start()
+        child.join()
+        print(child.exitcode)
+        return 0
+    if cmd == "pid":
+        print(os.getpid())
+        return 0
+    if cmd == "sleep":
+        print("sleeping", flush=True)
+        time.sleep(30)
+    raise SystemExit(3)
+
+
+def _argv(*args: str) -> list[str]:
+    return [sys.executable, "-m", __name__, *args]
+
+
+@pytest.fixture
+def pool() -> Iterator[RunWorkerPool]:
+    pool = RunWorkerPool(size=1, max_runs_per_worker=3, warm=False)
+    yield pool
+    pool.close()
+
+
+def _run(
+    pool: RunWorkerPool, *args: str, env: dict[str, str] | None = None
+) -> tuple[int, list[str]]:
+    run = pool.try_spawn(argv=_argv(*args), cwd=Path.cwd(), env=env)
+    assert isinstance(run, PooledRun)
+    lines = [line.rstrip("\n") for line in run.stdout]
+    return run.wait(timeout=30), lines
+
+
+def test_run_output_and_exit_code(pool: RunWorkerPool) -> None:
+    code, lines = _run(pool, "echo", "4")
+    assert code == 4
+    assert lines == ["hello", "to stderr"]
+    assert _run(pool, "unknown")[0] == 3
+
+
+def test_run_gets_its_env_and_cwd_as_arguments(pool: RunWorkerPool, tmp_path: Path) -> None:
+    run = pool.try_spawn(argv=_argv("env"), cwd=tmp_path, env={**os.environ, "LG_POOL_TEST": "v1"})
+    assert run is not None
+    # The worker's own environment and working directory are never touched.
+    assert [line.rstrip("\n") for line in run.stdout] == [f"v1|{tmp_path}", f"|{Path.cwd()}"]
+
+
+def test_runs_can_start_multiprocessing_children(pool: RunWorkerPool) -> None:
+    assert _run(pool, "children") == (0, ["0"])
+
+
+def test_worker_is_reused_then_recycled(pool: RunWorkerPool) -> None:
+    pids = [_run(pool, "pid")[1][0] for _ in range(4)]
+    assert pids[0] == pids[1] == pids[2]
+    assert pids[3] != pids[0]
+    assert pool.stats()["recycled"] == 1
+
+
+def test_busy_pool_and_non_module_argv_fall_back(pool: RunWorkerPool) -> None:
+    assert pool.try_spawn(argv=[sys.executable, "script.py"], cwd=Path.cwd()) is None
+    # Modules without a pool_main only run as subprocesses.
+    assert pool.try_spawn(argv=[sys.executable, "-m", "json.tool"], cwd=Path.cwd()) is None
+    run = pool.try_spawn(argv=_argv("sleep"), cwd=Path.cwd())
+    assert run is not None
+    assert pool.try_spawn(argv=_argv("pid"), cwd=Path.cwd()) is None
+    run.terminate()
+    list(run.stdout)
+    assert run.wait(timeout=10) < 0
+
+
+def test_terminate_cancels_run_and_pool_replaces_worker(pool: RunWorkerPool) -> None:
+    run = pool.try_spawn(argv=_argv("sleep"), cwd=Path.cwd())
+    assert run is not None
+    output = iter(run.stdout)
+    assert next(output) == "sleeping\n"
+    assert run.poll() is None
+    with pytest.raises(Exception, match="timed out"):
+        run.wait(timeout=0.1)
+    run.terminate()
+    assert list(output) == []
+    assert run.returncode == -15
+    assert _run(pool, "echo", "0")[0] == 0
+
+
+def test_service_prefers_pool_and_falls_back_to_subprocess(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import lg_orch.remote_api as remote_api
+
+    class _FullPool:
+        def __init__(self) -> None:
+            self.calls: list[list[str]] = []
+
+        def try_spawn(self, *, argv: list[str], cwd: Path, env: Any = None) -> None:
+            self.calls.append(argv)
+            return None
+
+    spawned: list[list[str]] = []
+    monkeypatch.setattr(
+        remote_api,
+        "_spawn_run_subprocess",
+        lambda *, argv, cwd, env=None: spawned.append(argv) or "proc",
+    )
+    full_pool = _FullPool()
+    service = RemoteAPIService(repo_root=tmp_path, run_pool=full_pool)  # type: ignore[arg-type]
+    assert service._spawn_run_process(["python", "-m", "lg_orch.main"], None) == "proc"
+    assert full_pool.calls == spawned == [["python", "-m", "lg_orch.main"]]
@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import fakeredis
+import pytest
 
-from lg_orch.run_store import RedisRunStore, RunStore, create_run_store
+from lg_orch.run_store import (
+    RUN_SUMMARY_FIELDS,
+    RedisRunStore,
+    RunStore,
+    create_run_store,
+    decode_run_cursor,
+    utc_run_timestamp,
+)
 
 
 def _make_record(run_id: str = "run1", status: str = "running") -> dict:
@@ -359,15 +368,21 @@ def test_search_runs_limit_respected(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _make_redis_store(namespace: str = "") -> RedisRunStore:
+def _make_redis_store(
+    namespace: str = "",
+    server: fakeredis.FakeServer | None = None,
+    *,
+    search_index: bool = False,
+) -> RedisRunStore:
     """Create a RedisRunStore backed by fakeredis (in-process, no real Redis)."""
-    server = fakeredis.FakeServer()
     store = object.__new__(RedisRunStore)
     store._namespace = namespace
     store._ttl = 86400
-    import fakeredis as _fr
-
-    store._client = _fr.FakeRedis(server=server, decode_responses=True)
+    store._search_index = None if search_index else False
+    store._search_ready = set()
+    store._client = fakeredis.FakeRedis(
+        server=server or fakeredis.FakeServer(), decode_responses=True
+    )
     return store
 
 
@@ -443,15 +458,8 @@ def test_redis_search_runs_empty_query() -> None:
 
 def test_redis_namespace_isolation() -> None:
     server = fakeredis.FakeServer()
-    store_a = object.__new__(RedisRunStore)
-    store_a._namespace = "a"
-    store_a._ttl = 86400
-    store_a._client = fakeredis.FakeRedis(server=server, decode_responses=True)
-
-    store_b = object.__new__(RedisRunStore)
-    store_b._namespace = "b"
-    store_b._ttl = 86400
-    store_b._client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    store_a = _make_redis_store("a", server)
+    store_b = _make_redis_store("b", server)
 
     store_a.upsert(_make_record("ns-run-1"))
     assert len(store_a.list_runs()) == 1
@@ -460,6 +468,92 @@ def test_redis_namespace_isolation() -> None:
     store_b.close()
 
 
+def _timed_record(run_id: str, second: int) -> dict:
+    record = _make_record(run_id)
+    record["created_at"] = f"2026-01-01T00:00:{second:02d}Z"
+    return record
+
+
+def test_redis_list_runs_page_walks_index_with_cursor() -> None:
+    store = _make_redis_store()
+    # r3..r5 share a timestamp, so the cursor has to break ties by run_id.
+    for run_id, second in [("r0", 0), ("r1", 1), ("r2", 2), ("r3", 3), ("r4", 3), ("r5", 3)]:
+        store.upsert(_timed_record(run_id, second))
+
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        rows, cursor = store.list_runs_page(limit=2, cursor=cursor)
+        pages.append([r["run_id"] for r in rows])
+        if cursor is None:
+            break
+    assert pages == [["r5", "r4"], ["r3", "r2"], ["r1", "r0"]]
+    assert [r["run_id"] for r in store.list_runs()] == ["r5", "r4", "r3", "r2", "r1", "r0"]
+
+    # A run inserted after the first page does not shift the second one.
+    first, cursor = store.list_runs_page(limit=3)
+    store.upsert(_timed_record("late", 59))
+    rest, end = store.list_runs_page(limit=10, cursor=cursor)
+    assert [r["run_id"] for r in first + rest] == ["r5", "r4", "r3", "r2", "r1", "r0"]
+    assert end is None
+    store.close()
+
+
+def test_redis_expired_runs_leave_the_index() -> None:
+    store = _make_redis_store()
+    for i in range(5):
+        store.upsert(_timed_record(f"r{i}", i))
+    store._client.delete(store._run_key("r3"), store._run_key("r1"))
+
+    rows, cursor = store.list_runs_page(limit=3)
+    assert [r["run_id"] for r in rows] == ["r4", "r2", "r0"]
+    assert cursor is None
+    assert store._client.zrevrange(store._run_index_key(), 0, -1) == ["r4", "r2", "r0"]
+    store.close()
+
+
+def test_redis_search_runs_scan_stops_at_limit_in_recency_order() -> None:
+    store = _make_redis_store()
+    for i in range(7):
+        record = _timed_record(f"r{i}", i)
+        record["request"] = "deploy service" if i % 2 else "lint only"
+        store.upsert(record)
+    results = store.search_runs("DEPLOY", limit=2)
+    assert [r["run_id"] for r in results] == ["r5", "r3"]
+    store.close()
+
+
+def test_redis_search_index_is_probed_and_skipped_without_redisearch() -> None:
+    store = _make_redis_store(search_index=True)
+    store.upsert(_make_record("plain"))
+    assert store._search_index is False
+    assert store._client.keys("lula:runsearch:*") == []
+    assert [r["run_id"] for r in store.search_runs("something")] == ["plain"]
+    store.close()
+
+
+def test_redis_search_defaults_to_substring_scan() -> None:
+    store = _make_redis_store()
+    real_execute = store._client.execute_command
+
+    def no_search_module(*args: Any, **kwargs: Any) -> Any:
+        assert not str(args[0]).upper().startswith("FT."), "RediSearch must be opt-in"
+        return real_execute(*args, **kwargs)
+
+    store._client.execute_command = no_search_module
+    store.upsert({**_make_record("run-oauth-7"), "request": "rotate oauth tokens"})
+    assert [r["run_id"] for r in store.search_runs("uth tok")] == ["run-oauth-7"]
+    assert [r["run_id"] for r in store.search_runs("oauth-7")] == ["run-oauth-7"]
+    store.close()
+
+
+def test_redis_ft_query_splits_like_the_tokenizer() -> None:
+    from lg_orch.run_store import _ft_query
+
+    assert _ft_query("fix run-42 (a) @mention") == "fix* run* 42* mention*"
+    assert _ft_query("a - ") == ""
+
+
 def test_redis_recovery_facts() -> None:
     store = _make_redis_store()
     facts = [_make_fact("fp1"), _make_fact("fp2", failure_class="typecheck")]
@@ -539,3 +633,112 @@ def test_create_run_store_falls_back_on_redis_error(tmp_path: Path) -> None:
         # Should not raise — should fall back to SQLite
         assert isinstance(store, RunStore)
         store.close()
+
+
+# ---------------------------------------------------------------------------
+# Paged listing — identical across backends
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def paged_store(request: pytest.FixtureRequest, tmp_path: Path) -> RunStore | RedisRunStore:
+    store: RunStore | RedisRunStore
+    if request.param == "sqlite":
+        store = RunStore(db_path=tmp_path / "runs.sqlite")
+    else:
+        store = _make_redis_store()
+    # Ten runs over ten seconds; r6..r8 share a timestamp.
+    seconds = [0, 1, 2, 3, 4, 5, 7, 7, 7, 9]
+    for i, second in enumerate(seconds):
+        record = _timed_record(f"r{i}", second)
+        record["status"] = "failed" if i % 3 == 0 else "succeeded"
+        record["final"] = "a long report " * 50
+        store.upsert(record)
+    request.addfinalizer(store.close)
+    return store
+
+
+def _walk(store: RunStore | RedisRunStore, **kwargs: object) -> tuple[list[list[str]], list[str]]:
+    pages: list[list[str]] = []
+    cursors: list[str] = []
+    cursor = None
+    while True:
+        page = store.list_runs_page(cursor=cursor, **kwargs)  # type: ignore[arg-type]
+        pages.append([r["run_id"] for r in page.runs])
+        if page.next_cursor is None:
+            return pages, cursors
+        cursors.append(page.next_cursor)
+        cursor = page.next_cursor
+
+
+def test_list_runs_page_orders_by_created_at_then_run_id(
+    paged_store: RunStore | RedisRunStore,
+) -> None:
+    pages, cursors = _walk(paged_store, limit=4)
+    assert pages == [["r9", "r8", "r7", "r6"], ["r5", "r4", "r3", "r2"], ["r1", "r0"]]
+    assert [decode_run_cursor(c) for c in cursors] == [
+        ("2026-01-01T00:00:07Z", "r6"),
+        ("2026-01-01T00:00:02Z", "r2"),
+    ]
+
+
+def test_list_runs_page_filters_status_and_time_range(
+    paged_store: RunStore | RedisRunStore,
+) -> None:
+    pages, _ = _walk(paged_store, limit=2, status="failed")
+    assert pages == [["r9", "r6"], ["r3", "r0"]]
+    pages, _ = _walk(
+        paged_store,
+        limit=3,
+        status=["failed", "succeeded"],
+        created_after="2026-01-01T00:00:02Z",
+        created_before="2026-01-01T00:00:09Z",
+    )
+    assert pages == [["r8", "r7", "r6"], ["r5", "r4", "r3"], ["r2"]]
+
+
+def test_list_runs_page_time_range_is_utc_on_both_backends(
+    paged_store: RunStore | RedisRunStore,
+) -> None:
+    # The same instants: an offset, a naive (read as UTC) and a fractional bound.
+    pages, _ = _walk(
+        paged_store,
+        limit=10,
+        created_after=utc_run_timestamp("2026-01-01T01:00:02+01:00"),
+        created_before=utc_run_timestamp("2026-01-01T00:00:08.5"),
+    )
+    assert pages == [["r8", "r7", "r6", "r5", "r4", "r3", "r2"]]
+
+
+def test_utc_run_timestamp_normalises_to_utc() -> None:
+    assert utc_run_timestamp("2026-01-01T00:00:02Z") == "2026-01-01T00:00:02.000000Z"
+    assert utc_run_timestamp("2026-01-01T00:00:02") == "2026-01-01T00:00:02.000000Z"
+    assert utc_run_timestamp("2025-12-31T19:00:02.5-05:00") == "2026-01-01T00:00:02.500000Z"
+    with pytest.raises(ValueError):
+        utc_run_timestamp("yesterday")
+
+
+def test_score_reads_naive_timestamps_as_utc() -> None:
+    from lg_orch.run_store import _score
+
+    assert _score("2026-01-01T00:00:02") == _score("2026-01-01T00:00:02Z")
+
+
+def test_list_runs_page_projects_columns(paged_store: RunStore | RedisRunStore) -> None:
+    page = paged_store.list_runs_page(limit=1)
+    assert set(page.runs[0]) == set(RUN_SUMMARY_FIELDS)
+    page = paged_store.list_runs_page(limit=1, fields=["status", "final"])
+    assert page.runs == [
+        {
+            "run_id": "r9",
+            "created_at": "2026-01-01T00:00:09Z",
+            "status": "failed",
+            "final": "a long report " * 50,
+        }
+    ]
+    with pytest.raises(ValueError, match="invalid_fields"):
+        paged_store.list_runs_page(fields=["nope"])
+    with pytest.raises(ValueError, match="invalid_cursor"):
+        paged_store.list_runs_page(cursor="not-a-cursor")
+    hits = paged_store.search_runs("something", limit=2, fields=["request"])
+    assert [set(h) for h in hits] == [{"run_id", "created_at", "request"}] * 2
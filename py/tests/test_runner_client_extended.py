@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 import lg_orch.tools.runner_client as rc_mod
-from lg_orch.tools.runner_client import RunnerClient
+from lg_orch.tools.runner_client import RunnerClient, clear_client_cache
 
 
 def test_single_execute_when_runner_unavailable() -> None:
@@ -49,13 +53,48 @@ def test_client_close_is_idempotent() -> None:
 
 
 def test_client_sets_request_id_header() -> None:
-    client = RunnerClient(base_url="http://127.0.0.1:8088", api_key="token", request_id="req-1")
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"tool": "exec", "ok": True}
+    mock_http = MagicMock()
+    mock_http.post.return_value = mock_resp
+    client = RunnerClient(base_url="http://127.0.0.1:8088", request_id=" req-1 ", _client=mock_http)
+    client.execute_tool(tool="exec", input={})
+    assert mock_http.post.call_args.kwargs["headers"]["x-request-id"] == "req-1"
+
+
+def test_clients_share_pooled_connection_per_endpoint() -> None:
+    clear_client_cache()
     try:
-        assert client._client is not None
-        assert client._client.headers["x-request-id"] == "req-1"
-        assert client._client.headers["authorization"] == "Bearer token"
+        a = RunnerClient(base_url="http://127.0.0.1:8088", api_key="token", request_id="req-1")
+        b = RunnerClient(base_url="http://127.0.0.1:8088", api_key="token", request_id="req-2")
+        other = RunnerClient(base_url="http://127.0.0.1:8088", api_key="other")
+        assert a._client is b._client
+        assert a._client is not other._client
+        assert a._client is not None
+        assert a._client.headers["authorization"] == "Bearer token"
+        assert "x-request-id" not in a._client.headers
+        a.close()
+        assert not b._client.is_closed
     finally:
-        client.close()
+        clear_client_cache()
+
+
+def test_pool_trace_records_reuse_and_wait() -> None:
+    from lg_orch.api.metrics import LULA_RUNNER_CONNECTIONS_TOTAL
+    from lg_orch.tools.runner_client import _PoolTrace
+
+    reused = LULA_RUNNER_CONNECTIONS_TOTAL.labels(outcome="reused")
+    new = LULA_RUNNER_CONNECTIONS_TOTAL.labels(outcome="new")
+    reused_before, new_before = reused._value.get(), new._value.get()
+
+    trace = _PoolTrace()
+    trace("connection.connect_tcp.started", {})
+    trace("http11.send_request_headers.started", {})
+    trace = _PoolTrace()
+    trace("http11.send_request_headers.started", {})
+
+    assert new._value.get() == new_before + 1
+    assert reused._value.get() == reused_before + 1
 
 
 def test_batch_envelope_keys() -> None:
@@ -315,3 +354,127 @@ def test_execute_tool_forwards_route_payload() -> None:
     call_kwargs = mock_http.post.call_args.kwargs
     payload = call_kwargs["json"]
     assert payload["route"] == {"lane": "recovery"}
+
+
+# ---------------------------------------------------------------------------
+# Streaming batch endpoint
+# ---------------------------------------------------------------------------
+
+
+def _streaming_client(handler: Any, base_url: str = "http://runner.test") -> RunnerClient:
+    http = httpx.Client(base_url=base_url, transport=httpx.MockTransport(handler))
+    return RunnerClient(base_url=base_url, request_id="rid-1", _client=http)
+
+
+def _ndjson(*frames: dict[str, Any]) -> bytes:
+    return b"".join(json.dumps(f).encode() + b"\n" for f in frames)
+
+
+def test_stream_batch_yields_results_as_calls_finish() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = _ndjson(
+            {"idx": 1, "stdout": "line one\nline "},
+            {"idx": 1, "stdout": "two\n"},
+            {"idx": 1, "result": {"tool": "exec", "ok": True, "stdout": "line one\nline two\n"}},
+            {"idx": 0, "result": {"tool": "read_file", "ok": True}},
+        )
+        return httpx.Response(200, content=body)
+
+    chunks: list[tuple[int, str]] = []
+    client = _streaming_client(handler)
+    out = list(
+        client.stream_batch_execute_tools(
+            calls=[
+                {"tool": "read_file", "input": {"path": "a"}},
+                {"tool": "exec", "input": {"cmd": "pytest"}},
+            ],
+            on_stdout=lambda idx, chunk: chunks.append((idx, chunk)),
+        )
+    )
+    assert [idx for idx, _ in out] == [1, 0]
+    assert chunks == [(1, "line one\nline "), (1, "two\n")]
+    assert seen[0].url.path == "/v1/tools/batch_execute_stream"
+    assert seen[0].headers["x-request-id"] == "rid-1"
+    assert json.loads(seen[0].content)["calls"][1]["tool"] == "exec"
+
+
+def test_stream_batch_falls_back_when_runner_lacks_endpoint() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("_stream"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"results": [{"tool": "exec", "ok": True}]})
+
+    clear_client_cache()
+    client = _streaming_client(handler, base_url="http://old-runner.test")
+    calls = [{"tool": "exec", "input": {}}]
+    assert list(client.stream_batch_execute_tools(calls=calls)) == [
+        (0, {"tool": "exec", "ok": True})
+    ]
+    list(client.stream_batch_execute_tools(calls=calls))
+    assert paths == [
+        "/v1/tools/batch_execute_stream",
+        "/v1/tools/batch_execute",
+        "/v1/tools/batch_execute",
+    ]
+    clear_client_cache()
+
+
+def test_stream_batch_reports_calls_missing_from_truncated_stream() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_ndjson({"idx": 0, "result": {"tool": "a", "ok": True}}))
+
+    client = _streaming_client(handler)
+    out = dict(
+        client.stream_batch_execute_tools(
+            calls=[{"tool": "a", "input": {}}, {"tool": "b", "input": {"_route": {"lane": "x"}}}]
+        )
+    )
+    assert out[0]["ok"] is True
+    assert out[1]["ok"] is False
+    assert out[1]["artifacts"] == {"error": "runner_unavailable"}
+    assert out[1]["route"] == {"lane": "x"}
+
+
+def test_stream_batch_does_not_resend_calls_that_started() -> None:
+    paths: list[str] = []
+
+    def body() -> Iterator[bytes]:
+        yield _ndjson({"idx": 0, "stdout": "applying\n"})
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("_stream"):
+            return httpx.Response(200, content=body())
+        return httpx.Response(200, json={"results": [{"tool": "exec", "ok": True}]})
+
+    client = _streaming_client(handler)
+    out = list(client.stream_batch_execute_tools(calls=[{"tool": "exec", "input": {}}]))
+    assert paths == ["/v1/tools/batch_execute_stream"]
+    assert out[0][1]["artifacts"] == {"error": "runner_unavailable"}
+    assert "connection reset" in out[0][1]["stderr"]
+
+
+def test_stream_batch_resends_when_stream_breaks_before_any_frame() -> None:
+    paths: list[str] = []
+
+    def body() -> Iterator[bytes]:
+        raise httpx.ReadError("connection reset")
+        yield b""  # pragma: no cover
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("_stream"):
+            return httpx.Response(200, content=body())
+        return httpx.Response(200, json={"results": [{"tool": "exec", "ok": True}]})
+
+    client = _streaming_client(handler)
+    out = list(client.stream_batch_execute_tools(calls=[{"tool": "exec", "input": {}}]))
+    assert paths == ["/v1/tools/batch_execute_stream", "/v1/tools/batch_execute"]
+    assert out == [(0, {"tool": "exec", "ok": True})]
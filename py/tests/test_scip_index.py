@@ -5,9 +5,20 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from typing import Any
+
+import pytest
 
 from lg_orch.scip_index import ScipIndex, load_scip_index
 
+
+@pytest.fixture(autouse=True)
+def _scip_cache_dir(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    cache_dir = str(tmp_path / "scip-cache")
+    monkeypatch.setenv("LG_SCIP_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -331,3 +342,228 @@ def test_scip_index_mark_stale() -> None:
     idx = ScipIndex(repo_root="/tmp/test", symbols=[])
     idx.mark_stale()
     assert idx.is_stale
+
+
+# ---------------------------------------------------------------------------
+# Lookup tables stay consistent with ``symbols``
+# ---------------------------------------------------------------------------
+
+
+def test_lookup_tables_follow_appended_symbols() -> None:
+    from lg_orch.scip_index import ScipSymbol
+
+    idx = ScipIndex(repo_root="/tmp/test")
+    assert idx.find_symbol("late") == []
+    idx.symbols.append(
+        ScipSymbol(
+            name="late",
+            kind="function",
+            file_path="a.py",
+            start_line=1,
+            end_line=2,
+            references=["b.py:helper", "c.py:helper"],
+        )
+    )
+    assert [s.name for s in idx.find_symbol("late")] == ["late"]
+    assert [s.name for s in idx.symbols_in_file("a.py")] == ["late"]
+    # A symbol referencing the same name twice is returned once.
+    assert [s.name for s in idx.find_references("helper")] == ["late"]
+
+
+# ---------------------------------------------------------------------------
+# Binary cache keyed by sidecar mtime/size
+# ---------------------------------------------------------------------------
+
+
+def test_load_scip_index_uses_binary_cache_until_sidecar_changes(_scip_cache_dir: str) -> None:
+    from unittest.mock import patch
+
+    data = _minimal_sidecar(
+        symbols=[{"name": "Cached", "kind": "class", "start_line": 1, "end_line": 9}]
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_sidecar(tmpdir, data)
+        first = load_scip_index(tmpdir)
+        # The cache lives outside the repository so worktrees stay clean.
+        assert os.listdir(tmpdir) == ["scip_index.json"]
+        assert len(os.listdir(_scip_cache_dir)) == 1
+
+        with patch("lg_orch.scip_index.json.load", side_effect=AssertionError("parsed")):
+            second = load_scip_index(tmpdir)
+        assert second.symbols == first.symbols
+
+        data["documents"][0]["symbols"].append({"name": "Fresh", "kind": "function"})
+        _write_sidecar(tmpdir, data)
+        third = load_scip_index(tmpdir)
+        assert {s.name for s in third.symbols} == {"Cached", "Fresh"}
+
+
+def test_load_scip_index_ignores_corrupt_cache(tmp_path: Any) -> None:
+    data = _minimal_sidecar(symbols=[{"name": "Ok", "kind": "class"}])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_sidecar(tmpdir, data)
+        load_scip_index(tmpdir, cache_dir=str(tmp_path))
+        (cache_file,) = tmp_path.iterdir()
+        cache_file.write_bytes(b"not marshal data")
+        index = load_scip_index(tmpdir, cache_dir=str(tmp_path))
+    assert [s.name for s in index.symbols] == ["Ok"]
+
+
+# ---------------------------------------------------------------------------
+# Incremental reindexing
+# ---------------------------------------------------------------------------
+
+
+def test_reindex_files_refreshes_only_touched_python_files() -> None:
+    data = {
+        "documents": [
+            {"relative_path": "pkg/a.py", "symbols": [{"name": "old_a", "kind": "function"}]},
+            {"relative_path": "pkg/b.py", "symbols": [{"name": "keep_b", "kind": "function"}]},
+            {"relative_path": "gone.py", "symbols": [{"name": "gone", "kind": "function"}]},
+        ]
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_sidecar(tmpdir, data)
+        os.makedirs(os.path.join(tmpdir, "pkg"))
+        with open(os.path.join(tmpdir, "pkg", "a.py"), "w", encoding="utf-8") as fh:
+            fh.write(
+                "LIMIT = 3\n\n\nclass Widget:\n    pass\n\n\ndef build():\n    return Widget()\n"
+            )
+        index = load_scip_index(tmpdir)
+        refreshed = index.reindex_files(["pkg/a.py", "gone.py"])
+
+    assert refreshed == ["pkg/a.py", "gone.py"]
+    assert not index.is_stale
+    assert index.find_symbol("old_a") == []
+    assert index.find_symbol("gone") == []
+    assert [s.name for s in index.find_symbol("keep_b")] == ["keep_b"]
+    assert {(s.name, s.kind) for s in index.symbols_in_file("pkg/a.py")} == {
+        ("LIMIT", "variable"),
+        ("Widget", "class"),
+        ("build", "function"),
+    }
+    (build,) = index.find_symbol("build")
+    assert (build.start_line, build.end_line) == (8, 9)
+    assert [s.name for s in index.find_references("Widget")] == ["build"]
+
+
+def test_reindex_files_marks_unparseable_files_stale() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, body in [("broken.py", "def (:\n"), ("lib.rs", "fn main() {}\n")]:
+            with open(os.path.join(tmpdir, name), "w", encoding="utf-8") as fh:
+                fh.write(body)
+        index = ScipIndex(repo_root=tmpdir)
+        assert index.reindex_files(["broken.py", "lib.rs"]) == []
+    assert index.is_stale
+
+
+_SAMPLE_MODULE = """\
+import json as js
+import pkg.util
+from .models import Item, Base as B
+
+LIMIT = 3
+
+
+class Store(B):
+    def __init__(self, items, limit=LIMIT):
+        self.items = [i.strip() for i in items]
+        self.size = len(items)
+
+    def dump(self):
+        return js.dumps(str(self.items)) + pkg.util.fmt(Item)
+
+
+def build(items):
+    total = len(items)
+    return Store(items), total
+"""
+
+
+def test_python_symbols_resolve_references_to_their_targets() -> None:
+    from lg_orch.scip_index import _python_symbols
+
+    symbols = {s.name: s for s in _python_symbols(_SAMPLE_MODULE, "app/store.py")}
+    assert {(n, s.kind) for n, s in symbols.items()} == {
+        ("LIMIT", "variable"),
+        ("Store", "class"),
+        ("__init__", "method"),
+        ("dump", "method"),
+        ("build", "function"),
+    }
+    assert symbols["Store"].references == ["app/models.py:Base"]
+    # Parameters, locals, builtins and attribute names are not references.
+    assert symbols["__init__"].references == ["app/store.py:LIMIT"]
+    assert symbols["dump"].references == [
+        "json.py:dumps",
+        "pkg/util.py:fmt",
+        "app/models.py:Item",
+    ]
+    assert symbols["build"].references == ["app/store.py:Store"]
+
+
+def test_replace_file_waits_for_the_index_lock() -> None:
+    import threading
+
+    from lg_orch.scip_index import _INDEX_LOCK
+
+    index = ScipIndex(repo_root="/r")
+    with _INDEX_LOCK:
+        writer = threading.Thread(target=index.reindex_files, args=(["gone.py"],))
+        writer.start()
+        writer.join(timeout=0.2)
+        assert writer.is_alive()
+        assert index.generation == 1
+    writer.join(timeout=10)
+    assert index.generation == 2
+
+
+# ---------------------------------------------------------------------------
+# Process-level cache and per-generation memoisation
+# ---------------------------------------------------------------------------
+
+
+def test_get_scip_index_reuses_index_until_sidecar_changes() -> None:
+    from lg_orch.scip_index import clear_scip_index_cache, get_scip_index
+
+    clear_scip_index_cache()
+    data = _minimal_sidecar(symbols=[{"name": "One", "kind": "class"}])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_sidecar(tmpdir, data)
+        first = get_scip_index(tmpdir)
+        assert get_scip_index(tmpdir) is first
+
+        data["documents"][0]["symbols"].append({"name": "Two", "kind": "class"})
+        _write_sidecar(tmpdir, data)
+        second = get_scip_index(tmpdir)
+    assert second is not first
+    assert {s.name for s in second.symbols} == {"One", "Two"}
+    clear_scip_index_cache()
+
+
+def test_top_symbols_and_edges_refresh_with_generation() -> None:
+    from lg_orch.scip_index import ScipSymbol
+
+    def sym(name: str, path: str, refs: list[str] | None = None) -> ScipSymbol:
+        return ScipSymbol(
+            name=name,
+            kind="function",
+            file_path=path,
+            start_line=1,
+            end_line=1,
+            references=refs or [],
+        )
+
+    local = ScipIndex(repo_root="/l", symbols=[sym("caller", "c.py", ["x.py:target"])])
+    remote = ScipIndex(repo_root="/r", symbols=[sym("zeta", "z.py")])
+    assert [s.name for s in remote.top_symbols(1)] == ["zeta"]
+    assert local.cross_repo_edges(remote) == {}
+
+    generation = remote.generation
+    remote.replace_file("t.py", [sym("target", "t.py")])
+    assert remote.generation > generation
+    assert [s.name for s in remote.top_symbols(1)] == ["target"]
+    edges = local.cross_repo_edges(remote)
+    assert [(a.name, b.file_path) for a, b in edges["target"]] == [("caller", "t.py")]
+    assert local.cross_repo_edges(remote) is edges
+    assert local.cross_repo_deps(remote) == edges["target"]
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import random
 import threading
 from unittest.mock import patch
 
 import pytest
 
 from lg_orch.model_routing import (
+    LatencySketch,
     LatencyWindow,
+    RedisSlaStateStore,
     SlaConfig,
     SlaEntry,
     SlaRoutingPolicy,
     build_sla_policy,
+    create_sla_state_store,
 )
 
 # ---------------------------------------------------------------------------
@@ -42,7 +46,8 @@ def test_latency_window_p95_known_distribution() -> None:
     p95 = w.p95()
     assert p95 is not None
     # The 95th percentile index into 100 sorted samples = 95, which is 1.0
-    assert p95 == pytest.approx(1.0)
+    # (the sketch answers within 1% relative error).
+    assert p95 == pytest.approx(1.0, rel=0.02)
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +69,7 @@ def test_latency_window_circular_eviction() -> None:
     assert p95 is not None
     # Samples now: [1.0, 2.0, 3.0, 4.0, 10.0]
     # sorted: [1.0, 2.0, 3.0, 4.0, 10.0], idx = int(5*0.95)=4 → 10.0
-    assert p95 == pytest.approx(10.0)
+    assert p95 == pytest.approx(10.0, rel=0.02)
 
 
 # ---------------------------------------------------------------------------
@@ -183,6 +188,267 @@ def test_latency_window_thread_safety() -> None:
     assert w.sample_count() == 200
 
 
+# ---------------------------------------------------------------------------
+# LatencySketch — quantiles within relative accuracy, add/remove, merge
+# ---------------------------------------------------------------------------
+
+
+def test_latency_sketch_quantiles_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-1.0, 1.0) for _ in range(5000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for v in samples:
+        sketch.add(v)
+    ordered = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+        est = sketch.quantile(q)
+        assert est is not None
+        assert est == pytest.approx(exact, rel=0.011)
+
+
+def test_latency_sketch_remove_and_zero_bucket() -> None:
+    sketch = LatencySketch()
+    assert sketch.quantile(0.5) is None
+    sketch.add(0.0)
+    sketch.add(2.0)
+    assert sketch.quantile(0.0) == 0.0
+    sketch.remove_key(sketch.key(2.0))
+    sketch.remove_key(sketch.key(2.0))  # absent: no-op
+    assert sketch.count() == 1
+    assert sketch.quantile(0.99) == 0.0
+
+
+def test_latency_sketch_merge_and_round_trip() -> None:
+    a = LatencySketch()
+    b = LatencySketch()
+    for _ in range(90):
+        a.add(0.1)
+    for _ in range(10):
+        b.add(5.0)
+    a.merge(LatencySketch.from_dict(b.to_dict()))
+    assert a.count() == 100
+    assert a.quantile(0.95) == pytest.approx(5.0, rel=0.02)
+    assert a.quantile(0.5) == pytest.approx(0.1, rel=0.02)
+    with pytest.raises(ValueError):
+        a.merge(LatencySketch(relative_accuracy=0.05))
+
+
+# ---------------------------------------------------------------------------
+# LatencyWindow — time decay, p50/p99, remote sketches
+# ---------------------------------------------------------------------------
+
+
+def test_latency_window_time_decay() -> None:
+    now = [0.0]
+    w = LatencyWindow("gpt-4o", max_age_s=60.0, clock=lambda: now[0])
+    for _ in range(10):
+        w.record(5.0)
+    now[0] = 30.0
+    for _ in range(10):
+        w.record(0.2)
+    p99 = w.p99()
+    assert p99 is not None and p99 == pytest.approx(5.0, rel=0.02)
+
+    now[0] = 61.0  # the slow samples age out
+    assert w.sample_count() == 10
+    assert w.p99() == pytest.approx(0.2, rel=0.02)
+    assert w.p50() == pytest.approx(0.2, rel=0.02)
+
+    now[0] = 200.0
+    assert w.sample_count() == 0
+    assert w.p95() is None
+
+
+def test_latency_window_remote_sketch_counts_toward_quantiles() -> None:
+    w = LatencyWindow("gpt-4o")
+    for _ in range(3):
+        w.record(0.1)
+    assert w.p95() is None
+
+    remote = LatencySketch()
+    for _ in range(20):
+        remote.add(3.0)
+    w.set_remote(remote)
+    assert w.p95() == pytest.approx(3.0, rel=0.02)
+    # Local snapshot and count exclude the remote samples.
+    assert w.sample_count() == 3
+    assert w.snapshot().count() == 3
+
+    w.set_remote(None)
+    assert w.p95() is None
+
+
+# ---------------------------------------------------------------------------
+# RedisSlaStateStore — workers share SLA state
+# ---------------------------------------------------------------------------
+
+
+def _fake_redis() -> object:
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+def test_redis_sla_state_store_merges_other_workers() -> None:
+    client = _fake_redis()
+    a = RedisSlaStateStore(client=client, worker_id="a")
+    b = RedisSlaStateStore(client=client, worker_id="b")
+    c = RedisSlaStateStore(client=client, worker_id="c")
+
+    slow = LatencySketch()
+    for _ in range(10):
+        slow.add(4.0)
+    fast = LatencySketch()
+    for _ in range(30):
+        fast.add(0.1)
+    a.publish({"gpt-4o": slow})
+    b.publish({"gpt-4o": fast})
+
+    seen_by_a = a.fetch(["gpt-4o", "other"])
+    assert set(seen_by_a) == {"gpt-4o"}
+    assert seen_by_a["gpt-4o"].count() == 30  # own entry excluded
+
+    seen_by_c = c.fetch(["gpt-4o"])
+    assert seen_by_c["gpt-4o"].count() == 40
+    assert seen_by_c["gpt-4o"].quantile(0.95) == pytest.approx(4.0, rel=0.02)
+
+
+def test_redis_sla_state_store_ignores_stale_entries() -> None:
+    client = _fake_redis()
+    store = RedisSlaStateStore(client=client, worker_id="reader", ttl_s=30.0)
+    sketch = LatencySketch()
+    sketch.add(1.0)
+    with patch("lg_orch.model_routing.time.time", return_value=1000.0):
+        RedisSlaStateStore(client=client, worker_id="old", ttl_s=30.0).publish({"m": sketch})
+    with patch("lg_orch.model_routing.time.time", return_value=1100.0):
+        assert store.fetch(["m"]) == {}
+
+
+def test_sla_policy_routes_on_fleet_wide_p95() -> None:
+    client = _fake_redis()
+    thresholds = {"gpt-4o": 1.0}
+    fallbacks = {"gpt-4o": "gpt-4o-mini"}
+    busy = SlaRoutingPolicy(
+        thresholds,
+        fallbacks,
+        shared_store=RedisSlaStateStore(client=client, worker_id="busy"),
+        sync_interval_s=3600.0,
+    )
+    idle = SlaRoutingPolicy(
+        thresholds,
+        fallbacks,
+        shared_store=RedisSlaStateStore(client=client, worker_id="idle"),
+        sync_interval_s=3600.0,
+    )
+    for _ in range(10):
+        busy.record_latency("gpt-4o", 3.0)
+    busy.sync()
+
+    # The idle worker has no local samples but sees the busy worker's window.
+    idle.sync()
+    assert idle.select_model("gpt-4o") == "gpt-4o-mini"
+    assert idle.degraded_models() == ["gpt-4o"]
+    busy.close()
+    idle.close()
+
+
+def test_sla_policy_sync_survives_store_errors() -> None:
+    class _BrokenStore:
+        def publish(self, sketches: object) -> None:
+            raise ConnectionError("redis down")
+
+    policy = SlaRoutingPolicy(
+        {"gpt-4o": 1.0},
+        {"gpt-4o": "gpt-4o-mini"},
+        shared_store=_BrokenStore(),  # type: ignore[arg-type]
+        sync_interval_s=3600.0,
+    )
+    for _ in range(10):
+        policy.record_latency("gpt-4o", 3.0)
+    policy.sync()
+    assert policy.select_model("gpt-4o") == "gpt-4o-mini"
+    policy.close()
+
+
+class _RecordingStore:
+    def __init__(self) -> None:
+        self.fetched = threading.Event()
+
+    def publish(self, sketches: object) -> None:
+        pass
+
+    def fetch(self, model_ids: list[str]) -> dict[str, LatencySketch]:
+        self.fetched.set()
+        return {}
+
+
+def test_sla_policy_syncs_off_the_request_path() -> None:
+    store = _RecordingStore()
+    policy = SlaRoutingPolicy(
+        {"gpt-4o": 1.0},
+        {"gpt-4o": "gpt-4o-mini"},
+        shared_store=store,  # type: ignore[arg-type]
+        sync_interval_s=3600.0,
+    )
+    policy.record_latency("gpt-4o", 3.0)
+    policy.select_model("gpt-4o")
+    policy.degraded_models()
+    assert not store.fetched.is_set()
+    policy.close()
+
+    store = _RecordingStore()
+    policy = SlaRoutingPolicy(
+        {"gpt-4o": 1.0},
+        {"gpt-4o": "gpt-4o-mini"},
+        shared_store=store,  # type: ignore[arg-type]
+        sync_interval_s=0.01,
+    )
+    assert store.fetched.wait(timeout=10)
+    policy.close()
+
+
+def test_sla_policy_without_thresholds_never_syncs() -> None:
+    store = _RecordingStore()
+    policy = SlaRoutingPolicy({}, {}, shared_store=store, sync_interval_s=0.01)  # type: ignore[arg-type]
+    assert policy._sync_thread is None
+    policy.record_latency("gpt-4o", 3.0)
+    policy.select_model("gpt-4o")
+    assert not store.fetched.is_set()
+
+
+def test_create_sla_state_store_without_redis_returns_none(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("LG_CHECKPOINT_REDIS_URL", raising=False)
+    assert create_sla_state_store() is None
+    assert create_sla_state_store("redis://127.0.0.1:1/0") is None
+
+
+# ---------------------------------------------------------------------------
+# Degraded-model gauge
+# ---------------------------------------------------------------------------
+
+
+def test_degraded_models_gauge_tracks_state() -> None:
+    from lg_orch.api.metrics import LULA_SLA_DEGRADED_MODELS
+
+    now = [0.0]
+    window = LatencyWindow("gauge-model", max_age_s=60.0, clock=lambda: now[0])
+    policy = SlaRoutingPolicy(
+        {"gauge-model": 1.0},
+        {"gauge-model": "gauge-fallback"},
+        windows={"gauge-model": window},
+    )
+    for _ in range(10):
+        policy.record_latency("gauge-model", 2.0)
+    assert policy.degraded_models() == ["gauge-model"]
+    assert LULA_SLA_DEGRADED_MODELS.labels(model="gauge-model")._value.get() == 1
+
+    now[0] = 120.0
+    assert policy.select_model("gauge-model") == "gauge-model"
+    assert LULA_SLA_DEGRADED_MODELS.labels(model="gauge-model")._value.get() == 0
+
+
 # ---------------------------------------------------------------------------
 # InferenceClient — model substitution occurs before HTTP call
 # ---------------------------------------------------------------------------
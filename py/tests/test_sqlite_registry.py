@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the process-wide SQLite schema/connection registry."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from lg_orch.procedure_cache import ProcedureCache
+from lg_orch.run_store import RunStore
+from lg_orch.sqlite_registry import (
+    discard,
+    ensure_initialised,
+    read_only_connection,
+    reset_registry,
+)
+
+
+def test_ensure_initialised_runs_once_per_kind_and_path(tmp_path: Path) -> None:
+    init = MagicMock()
+    db_path = tmp_path / "a.sqlite"
+    ensure_initialised(db_path, "kind", init)
+    ensure_initialised(tmp_path / "." / "a.sqlite", "kind", init)
+    assert init.call_count == 1
+    ensure_initialised(db_path, "other", init)
+    assert init.call_count == 2
+    discard(db_path)
+    ensure_initialised(db_path, "kind", init)
+    assert init.call_count == 3
+
+
+def test_read_only_connection_is_shared_and_rejects_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "ro.sqlite"
+    sqlite3.connect(db_path).close()
+    first = read_only_connection(db_path)
+    assert read_only_connection(db_path) is first
+    with first.lock, pytest.raises(sqlite3.OperationalError):
+        first.conn.execute("CREATE TABLE t (x)")
+    discard(db_path)
+    assert read_only_connection(db_path) is not first
+    reset_registry()
+
+
+def test_run_store_reader_sees_later_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "runs.sqlite"
+    reader = RunStore.open_reader(db_path=db_path)
+    assert reader.search_semantic_memories(query="flaky") == []
+
+    writer = RunStore(db_path=db_path)
+    writer.upsert_semantic_memories("run-1", [{"kind": "note", "summary": "flaky network test"}])
+    writer.close()
+
+    again = RunStore.open_reader(db_path=db_path)
+    assert again._conn is reader._conn
+    assert again.search_semantic_memories(query="flaky")[0]["run_id"] == "run-1"
+    reader.close()  # no-op for shared readers
+    with pytest.raises(sqlite3.OperationalError):
+        again.upsert({"run_id": "run-2", "request": "r", "status": "running"})
+
+
+def test_procedure_cache_reader_lookup(tmp_path: Path) -> None:
+    db_path = tmp_path / "procedures.sqlite"
+    writer = ProcedureCache(db_path=db_path)
+    writer.store_procedure(
+        canonical_name="run_tests",
+        request="run tests",
+        task_class="testing",
+        steps=[],
+        verification=[],
+        created_at="2026-01-01T00:00:00Z",
+    )
+    writer.close()
+    reader = ProcedureCache.open_reader(db_path=db_path)
+    assert [p["canonical_name"] for p in reader.lookup_procedure(request="Run  tests")] == [
+        "run_tests"
+    ]
+    reader.close()
+    assert ProcedureCache.open_reader(db_path=db_path).lookup_procedure(request="run tests")
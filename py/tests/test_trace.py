@@ -5,7 +5,23 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from lg_orch.trace import append_event, ensure_run_id, now_ms, write_run_trace
+import pytest
+
+from lg_orch.trace import (
+    TraceEventLog,
+    TraceJournal,
+    TraceJournalTail,
+    append_event,
+    ensure_run_id,
+    export_trace_json,
+    iter_trace_files,
+    load_trace_payload,
+    now_ms,
+    read_trace_journal,
+    seal_trace_events,
+    trace_journal_path,
+    write_run_trace,
+)
 
 
 def test_now_ms_returns_positive_int() -> None:
@@ -66,6 +82,57 @@ def test_append_event_does_not_mutate_original() -> None:
     assert len(out["_trace_events"]) == 2
 
 
+def test_append_event_shares_structure_and_forks_safely() -> None:
+    base = [{"ts_ms": 0, "kind": "old", "data": {}}]
+    s1 = append_event({"_trace_events": base}, kind="a", data={})
+    s2 = append_event(s1, kind="b", data={})
+    fork = append_event(s1, kind="c", data={})
+    assert isinstance(s2["_trace_events"], TraceEventLog)
+    assert s2["_trace_events"]._base is base
+    assert [e["kind"] for e in s1["_trace_events"]] == ["old", "a"]
+    assert [e["kind"] for e in s2["_trace_events"]] == ["old", "a", "b"]
+    assert [e["kind"] for e in fork["_trace_events"]] == ["old", "a", "c"]
+    assert len(base) == 1
+
+
+def test_trace_event_log_sequence_protocol() -> None:
+    log = TraceEventLog([{"i": 0}, {"i": 1}])
+    for i in range(2, 5):
+        log = log.append({"i": i})
+    assert [e["i"] for e in log] == [0, 1, 2, 3, 4]
+    assert log[-1] == {"i": 4}
+    assert [e["i"] for e in log[1:4]] == [1, 2, 3]
+    assert [e["i"] for e in log[::2]] == [0, 2, 4]
+    assert log == log.to_list()
+    with pytest.raises(IndexError):
+        log[5]
+
+
+def test_seal_trace_events_returns_plain_list() -> None:
+    out = append_event({"request": "r"}, kind="node", data={})
+    sealed = seal_trace_events(out)
+    assert type(sealed["_trace_events"]) is list
+    assert json.loads(json.dumps(sealed))["_trace_events"][0]["kind"] == "node"
+    assert seal_trace_events({"_trace_events": []}) == {"_trace_events": []}
+
+
+def test_append_event_10k_events_share_one_buffer() -> None:
+    """10k appends reuse one tail buffer instead of copying every earlier event."""
+    base = [{"ts_ms": 0, "kind": "old", "data": {}}]
+    state: dict[str, Any] = {"request": "bench", "_trace_events": base}
+    first = append_event(state, kind="step", data={"i": 0})
+    state = first
+    for i in range(1, 10_000):
+        state = append_event(state, kind="step", data={"i": i})
+
+    events = state["_trace_events"]
+    assert len(events) == 10_001
+    assert events[10_000]["data"] == {"i": 9_999}
+    assert events._base is base
+    assert events._tail is first["_trace_events"]._tail
+    assert len(first["_trace_events"]) == 2
+
+
 def test_write_run_trace_creates_file() -> None:
     with tempfile.TemporaryDirectory() as td:
         state: dict[str, Any] = {
@@ -142,3 +209,128 @@ def test_write_run_trace_auto_generates_run_id() -> None:
         assert path.exists()
         data = json.loads(path.read_text(encoding="utf-8"))
         assert len(data["run_id"]) == 32
+
+
+# ---------------------------------------------------------------------------
+# NDJSON trace journal
+# ---------------------------------------------------------------------------
+
+
+def _events(n: int, start: int = 0) -> list[dict[str, Any]]:
+    return [{"ts_ms": i, "kind": "node", "data": {"i": i}} for i in range(start, start + n)]
+
+
+def test_journal_appends_only_unseen_events(tmp_path: Path) -> None:
+    path = tmp_path / "run-j1.ndjson"
+    journal = TraceJournal(path, run_id="j1")
+    assert journal.append_events(_events(2)) == 2
+    assert journal.append_events(_events(3)) == 1
+    assert journal.append_events(_events(3)) == 0
+    chunk = read_trace_journal(path)
+    assert chunk.header is not None and chunk.header["run_id"] == "j1"
+    assert [e["ts_ms"] for e in chunk.events] == [0, 1, 2]
+
+
+def test_journal_reader_resumes_from_offset(tmp_path: Path) -> None:
+    path = tmp_path / "run-j2.ndjson"
+    journal = TraceJournal(path, run_id="j2")
+    journal.append_events(_events(2))
+    first = read_trace_journal(path)
+    journal.append_events(_events(4))
+    second = read_trace_journal(path, offset=first.offset)
+    assert [e["ts_ms"] for e in second.events] == [2, 3]
+    assert second.offset == path.stat().st_size
+    assert read_trace_journal(path, offset=second.offset).events == []
+
+
+def test_journal_reader_leaves_partial_line_for_next_read(tmp_path: Path) -> None:
+    path = tmp_path / "run-j3.ndjson"
+    TraceJournal(path, run_id="j3").append_events(_events(1))
+    size = path.stat().st_size
+    with path.open("ab") as fh:
+        fh.write(b'{"type":"event","ev')
+    chunk = read_trace_journal(path)
+    assert len(chunk.events) == 1
+    assert chunk.offset == size
+
+
+def test_journal_tail_builds_the_export_incrementally(tmp_path: Path) -> None:
+    path = tmp_path / "run-j5.ndjson"
+    tail = TraceJournalTail(path)
+    assert tail.read() is None
+    journal = TraceJournal(path, run_id="j5")
+    journal.append_events(_events(2))
+    first = tail.read()
+    assert first == {"run_id": "j5", "events": _events(2)}
+    journal.append_events(_events(3))
+    journal.write_sections({"final": "done"})
+    second = tail.read()
+    assert second == export_trace_json(path)
+    assert first is not None and len(first["events"]) == 2
+
+
+def test_journal_reopen_recovers_from_footer_and_rescan(tmp_path: Path) -> None:
+    path = tmp_path / "run-j4.ndjson"
+    journal = TraceJournal(path, run_id="j4")
+    journal.append_events(_events(2))
+    journal.write_sections({"final": "done", "approval": {"pending": True}})
+
+    reopened = TraceJournal(path, run_id="j4")
+    assert reopened.event_count == 2
+    assert reopened.read_section("approval") == {"pending": True}
+    reopened.append_events(_events(3))
+    with path.open("ab") as fh:
+        fh.write(b'{"torn')
+
+    rescanned = TraceJournal(path, run_id="j4")
+    assert rescanned.event_count == 3
+    assert rescanned.read_section("final") == "done"
+    assert rescanned.read_section("missing") is None
+    assert path.read_bytes().endswith(b"\n")
+
+
+def test_write_run_trace_journal_matches_json_export(tmp_path: Path) -> None:
+    state: dict[str, Any] = {
+        "_run_id": "jx",
+        "request": "hello",
+        "final": "done",
+        "_trace_events": _events(3),
+        "tool_results": [{"tool": "exec", "stdout": "x" * 100}],
+    }
+    json_path = write_run_trace(repo_root=tmp_path, out_dir=Path("out"), state=state)
+    journal_path = write_run_trace(
+        repo_root=tmp_path, out_dir=Path("out"), state=state, journal=True
+    )
+    assert journal_path == trace_journal_path(json_path)
+    expected = json.loads(json_path.read_text(encoding="utf-8"))
+    assert export_trace_json(journal_path) == expected
+
+    # A second write appends nothing new for events already journaled.
+    state["_trace_events"] = _events(4)
+    state["final"] = "changed"
+    write_run_trace(repo_root=tmp_path, out_dir=Path("out"), state=state, journal=True)
+    exported = export_trace_json(journal_path, tmp_path / "export.json")
+    assert [e["ts_ms"] for e in exported["events"]] == [0, 1, 2, 3]
+    assert exported["final"] == "changed"
+    assert json.loads((tmp_path / "export.json").read_text(encoding="utf-8")) == exported
+
+
+def test_load_trace_payload_falls_back_to_journal(tmp_path: Path) -> None:
+    journal_path = write_run_trace(
+        repo_root=tmp_path,
+        out_dir=Path("out"),
+        state={"_run_id": "lf", "final": "ok"},
+        journal=True,
+    )
+    json_path = journal_path.with_suffix(".json")
+    assert load_trace_payload(json_path)["final"] == "ok"
+    assert load_trace_payload(journal_path)["final"] == "ok"
+    json_path.write_text(json.dumps({"final": "json"}), encoding="utf-8")
+    assert load_trace_payload(json_path)["final"] == "json"
+
+
+def test_iter_trace_files_skips_journals_with_json_export(tmp_path: Path) -> None:
+    (tmp_path / "run-a.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "run-a.ndjson").write_text("", encoding="utf-8")
+    (tmp_path / "run-b.ndjson").write_text("", encoding="utf-8")
+    assert [p.name for p in iter_trace_files(tmp_path)] == ["run-b.ndjson", "run-a.json"]
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the flat and IVF-flat vector indexes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lg_orch.vector_index import (
+    EmbeddingMatrix,
+    IVFFlatIndex,
+    make_vector_index,
+    recall_at_k,
+    spherical_kmeans,
+)
+
+
+def _unit_rows(n: int, dim: int = 16, seed: int = 0) -> np.ndarray[object, np.dtype[np.float32]]:
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((8, dim)).astype(np.float32)
+    rows = centres[rng.integers(0, 8, n)] + 0.3 * rng.standard_normal((n, dim)).astype(np.float32)
+    rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+    return rows
+
+
+def _rows(
+    vectors: np.ndarray[object, np.dtype[np.float32]], first_id: int = 1
+) -> list[tuple[int, bytes]]:
+    return [(first_id + i, row.tobytes()) for i, row in enumerate(vectors)]
+
+
+def _ivf(path: str, **kwargs: int) -> IVFFlatIndex:
+    kwargs.setdefault("min_train_rows", 64)
+    kwargs.setdefault("n_lists", 8)
+    return IVFFlatIndex(EmbeddingMatrix(path), **kwargs)
+
+
+def test_spherical_kmeans_returns_unit_centroids() -> None:
+    centroids = spherical_kmeans(_unit_rows(200), 8)
+    assert centroids.shape == (8, 16)
+    assert np.allclose(np.linalg.norm(centroids, axis=1), 1.0, atol=1e-5)
+
+
+def test_ivf_uses_exact_scan_until_trained() -> None:
+    index = _ivf(":memory:")
+    index.extend(_rows(_unit_rows(10)))
+    assert not index.trained
+    query = _unit_rows(10)[3]
+    assert index.top_k(query, 1)[0][0] == 4
+
+
+def test_ivf_probing_every_list_matches_flat_scan() -> None:
+    data = _unit_rows(300)
+    flat = EmbeddingMatrix(":memory:")
+    flat.extend(_rows(data))
+    index = _ivf(":memory:", n_probes=8)
+    index.extend(_rows(data))
+    assert index.trained and index.n_lists == 8
+    for query in _unit_rows(20, seed=1):
+        assert index.top_k(query, 5) == flat.top_k(query, 5)
+
+
+def test_ivf_incremental_insert_is_searchable() -> None:
+    index = _ivf(":memory:", n_probes=1)
+    index.extend(_rows(_unit_rows(100)))
+    extra = _unit_rows(5, seed=7)
+    index.extend(_rows(extra, first_id=101))
+    assert len(index) == 105 and index.last_id == 105
+    for offset, query in enumerate(extra):
+        assert index.top_k(query, 1)[0][0] == 101 + offset
+
+
+def test_ivf_retrains_after_growth() -> None:
+    index = _ivf(":memory:", n_lists=4)
+    index.extend(_rows(_unit_rows(64)))
+    assert index._trained_rows == 64
+    index.extend(_rows(_unit_rows(200, seed=2), first_id=65))
+    assert index._trained_rows == 264
+
+
+def test_ivf_persists_and_repairs_assignments(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "ivf.db")
+    data = _unit_rows(120)
+    index = _ivf(db_path, n_probes=2)
+    index.extend(_rows(data))
+    queries = _unit_rows(10, seed=3)
+    expected = [index.top_k(q, 3) for q in queries]
+    assert os.path.exists(db_path + ".ivf.npy")
+    assert os.path.getsize(db_path + ".ivf.assign") == 8 + 120 * 4
+
+    reopened = _ivf(db_path, n_probes=2)
+    reopened.load()
+    assert reopened.trained and len(reopened) == 120
+    assert [reopened.top_k(q, 3) for q in queries] == expected
+
+    # A torn assignment file is completed against the saved centroids.
+    os.truncate(db_path + ".ivf.assign", 8 + 50 * 4)
+    repaired = _ivf(db_path, n_probes=2)
+    repaired.load()
+    assert os.path.getsize(db_path + ".ivf.assign") == 8 + 120 * 4
+    assert [repaired.top_k(q, 3) for q in queries] == expected
+
+    repaired.reset()
+    assert not os.path.exists(db_path + ".ivf.npy")
+    assert len(repaired) == 0
+
+
+def test_ivf_shared_files_hold_each_row_once(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "shared.db")
+    data = _unit_rows(100)
+    first, second = _ivf(db_path), _ivf(db_path)
+    first.extend(_rows(data[:80]))
+    # The second index was opened earlier; it catches up instead of re-appending.
+    second.extend(_rows(data[:90]))
+    first.extend(_rows(data[80:], first_id=81))
+
+    assert np.fromfile(db_path + ".emb.ids", dtype=np.int64)[1:].tolist() == list(range(1, 101))
+    # The second index trained its own quantizer, so the first stops appending
+    # assignments and load() completes them against the saved centroids.
+    reopened = _ivf(db_path)
+    reopened.load()
+    assert len(reopened) == 100
+    assert os.path.getsize(db_path + ".ivf.assign") == 8 + 100 * 4
+    query = data[95]
+    assert reopened.top_k(query, 1)[0][0] == first.top_k(query, 1)[0][0] == 96
+
+
+def test_make_vector_index_kinds() -> None:
+    assert isinstance(make_vector_index("flat", ":memory:"), EmbeddingMatrix)
+    assert isinstance(make_vector_index("ivf", ":memory:", n_probes=3), IVFFlatIndex)
+    with pytest.raises(ValueError, match="unknown vector index kind"):
+        make_vector_index("hnsw", ":memory:")
+    with pytest.raises(ValueError, match="n_probes"):
+        IVFFlatIndex(EmbeddingMatrix(":memory:"), n_probes=0)
+
+
+def test_recall_at_k() -> None:
+    assert recall_at_k([[1, 2], [3, 9]], [[1, 2], [3, 4]], 2) == 0.75
+    assert recall_at_k([], [], 5) == 1.0
@@ -0,0 +1,254 @@
+"""Tests for lg_orch.work_queue (Redis-streams execution backend).
+
+In-process tests share one fakeredis server between the coordinator and
+workers.  The multi-process test serves fakeredis over TCP and runs
+:class:`LocalWorkerPool` workers that import :func:`_remote_graph` from this
+module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from lg_orch.meta_graph import DependencyPatch, SubAgentTask, run_meta_graph
+from lg_orch.work_queue import LocalWorkerPool, RedisTaskWorker, RedisWorkQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+async def _remote_graph(state: dict[str, Any]) -> dict[str, Any]:
+    await asyncio.sleep(0.01)
+    return {"task_id": state["task_id"], "pid": os.getpid(), "square": state["n"] ** 2}
+
+
+def _task(task_id: str, deps: list[str] | None = None, **extra: Any) -> SubAgentTask:
+    return SubAgentTask(
+        task_id=task_id,
+        description=task_id,
+        depends_on=deps or [],
+        input_state={"task_id": task_id, **extra},
+    )
+
+
+class _Cluster:
+    """A coordinator queue and N in-process workers sharing one fake server."""
+
+    def __init__(self, run_graph: Any, *, workers: int = 2, **worker_kwargs: Any) -> None:
+        self.server = fakeredis.FakeServer()
+        self.queue = RedisWorkQueue(client=self.client(), block_ms=20)
+        self.workers = [
+            RedisTaskWorker(
+                run_graph, client=self.client(), consumer=f"w{i}", block_ms=20, **worker_kwargs
+            )
+            for i in range(workers)
+        ]
+        self.stop = asyncio.Event()
+        self._tasks: list[asyncio.Task[int]] = []
+
+    def client(self) -> Any:
+        return fakeredis.aioredis.FakeRedis(server=self.server, decode_responses=True)
+
+    async def __aenter__(self) -> _Cluster:
+        self._tasks = [asyncio.create_task(w.run(stop=self.stop)) for w in self.workers]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.stop.set()
+        await asyncio.gather(*self._tasks)
+        await self.queue.close()
+
+
+def test_scheduler_runs_tasks_on_workers() -> None:
+    seen: list[str] = []
+
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        seen.append(state["task_id"])
+        await asyncio.sleep(0.01)
+        return {"doubled": state["n"] * 2}
+
+    async def scenario() -> Any:
+        async with _Cluster(graph, workers=2, concurrency=2) as cluster:
+            tasks = [_task(f"t{i}", n=i) for i in range(4)] + [_task("last", ["t0", "t3"], n=9)]
+            return await run_meta_graph(tasks, cluster.queue, max_parallel=8)
+
+    result = asyncio.run(scenario())
+    assert result.all_succeeded is True
+    assert {t.task_id: t.result["doubled"] for t in result.tasks} == {
+        "t0": 0,
+        "t1": 2,
+        "t2": 4,
+        "t3": 6,
+        "last": 18,
+    }
+    assert seen[-1] == "last"
+
+
+def test_graph_error_fails_task_and_fail_fast_cancels_running_job() -> None:
+    cancelled = asyncio.Event()
+
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        if state["task_id"] == "bad":
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {}
+
+    async def scenario() -> Any:
+        async with _Cluster(graph, workers=2, lease_s=0.06) as cluster:
+            result = await run_meta_graph([_task("bad"), _task("slow")], cluster.queue)
+            await asyncio.wait_for(cancelled.wait(), 2)
+            return result
+
+    result = asyncio.run(scenario())
+    statuses = {t.task_id: (t.status, t.error) for t in result.tasks}
+    assert statuses["bad"] == ("failed", "boom")
+    assert statuses["slow"][0] == "skipped"
+    assert cancelled.is_set()
+
+
+def test_dependency_patch_round_trips_for_dynamic_rewiring() -> None:
+    order: list[str] = []
+
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        order.append(state["task_id"])
+        if state["task_id"] == "a":
+            return {"dependency_patch": DependencyPatch(add_edges=[("b", "c")])}
+        return {}
+
+    async def scenario() -> Any:
+        async with _Cluster(graph, workers=1) as cluster:
+            tasks = [_task("a"), _task("b", ["a"]), _task("c")]
+            return await run_meta_graph(tasks, cluster.queue, max_parallel=1, dynamic_rewiring=True)
+
+    result = asyncio.run(scenario())
+    assert result.all_succeeded is True
+    assert isinstance(result.tasks[0].result["dependency_patch"], DependencyPatch)
+    assert order == ["a", "b", "c"]
+
+
+def test_heartbeat_errors_do_not_lose_the_job_result() -> None:
+    runs: list[str] = []
+
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        runs.append(state["task_id"])
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    async def scenario() -> dict[str, Any]:
+        async with _Cluster(graph, workers=1, lease_s=0.03) as cluster:
+            worker = cluster.workers[0]
+            calls = 0
+            real_xclaim = worker._client.xclaim
+
+            async def flaky_xclaim(*args: Any, **kwargs: Any) -> Any:
+                nonlocal calls
+                calls += 1
+                if calls == 1:
+                    raise ConnectionError("redis went away")
+                return await real_xclaim(*args, **kwargs)
+
+            worker._client.xclaim = flaky_xclaim
+            result = await asyncio.wait_for(cluster.queue({"task_id": "x"}), 3)
+            assert calls > 1
+            return result
+
+    assert asyncio.run(scenario()) == {"ok": True}
+    # The finished run was posted and acked, not re-run after its lease lapsed.
+    assert runs == ["x"]
+
+
+def _orphan_one_job(cluster: _Cluster) -> Any:
+    """Simulate a worker that takes the next job and then dies."""
+
+    async def grab() -> None:
+        raw = cluster.client()
+        while not await raw.exists("lula:metaq:tasks"):
+            await asyncio.sleep(0.005)
+        while True:
+            reply = await raw.xreadgroup(
+                "workers", "dead-worker", {"lula:metaq:tasks": ">"}, count=1, block=20
+            )
+            if reply:
+                return
+            await asyncio.sleep(0.005)
+
+    return grab()
+
+
+def test_job_of_dead_worker_is_retried_elsewhere() -> None:
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True}
+
+    async def scenario() -> dict[str, Any]:
+        cluster = _Cluster(graph, workers=1, lease_s=0.05)
+        call = asyncio.create_task(cluster.queue({"task_id": "x"}))
+        await _orphan_one_job(cluster)
+        async with cluster:
+            return await asyncio.wait_for(call, 3)
+
+    assert asyncio.run(scenario()) == {"ok": True}
+
+
+def test_job_is_failed_after_max_attempts() -> None:
+    async def graph(state: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    async def scenario() -> None:
+        cluster = _Cluster(graph, workers=1, lease_s=0.02, max_attempts=1)
+        call = asyncio.create_task(cluster.queue({"task_id": "x"}))
+        await _orphan_one_job(cluster)
+        await asyncio.sleep(0.05)
+        async with cluster:
+            with pytest.raises(RuntimeError, match="giving up"):
+                await asyncio.wait_for(call, 3)
+
+    asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Local multi-process mode
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tcp_redis_url() -> Iterator[str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = fakeredis.TcpFakeServer(("127.0.0.1", port))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_local_worker_pool_runs_tasks_in_other_processes(tcp_redis_url: str) -> None:
+    async def scenario(queue: RedisWorkQueue) -> Any:
+        try:
+            tasks = [_task(f"t{i}", n=i) for i in range(6)]
+            return await run_meta_graph(tasks, queue, max_parallel=6)
+        finally:
+            await queue.close()
+
+    with LocalWorkerPool(
+        tcp_redis_url, "test_work_queue:_remote_graph", processes=2, concurrency=2
+    ):
+        result = asyncio.run(scenario(RedisWorkQueue(tcp_redis_url, result_timeout_s=60)))
+
+    assert result.all_succeeded is True
+    assert sorted(t.result["square"] for t in result.tasks) == [0, 1, 4, 9, 16, 25]
+    assert all(t.result["pid"] != os.getpid() for t in result.tasks)
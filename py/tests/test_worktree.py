@@ -7,6 +7,9 @@ without a real git repository.
 from __future__ import annotations
 
 import asyncio
+import shutil
+import subprocess
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,6 +18,7 @@ from lg_orch.worktree import (
     WorktreeContext,
     WorktreeError,
     WorktreeLease,
+    WorktreePool,
     cleanup_orphaned_worktrees,
     create_worktree,
     merge_worktree,
@@ -373,3 +377,181 @@ class TestCleanupOrphanedWorktrees:
 
         assert result == ["/nonexistent/path"]
         assert mock_run.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# WorktreePool (real git repositories)
+# ---------------------------------------------------------------------------
+
+
+def _git(cwd: Path | str, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Lula Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+    repo = tmp_path / "repo"
+    (repo / "src" / "auth").mkdir(parents=True)
+    (repo / "docs").mkdir()
+    (repo / "src" / "auth" / "login.py").write_text("x = 1\n")
+    (repo / "docs" / "guide.md").write_text("guide\n")
+    (repo / ".gitignore").write_text(".lg_orch_worktrees/\n")
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+class TestWorktreePool:
+    def test_start_prewarms_and_lease_is_a_hit(self, git_repo: Path) -> None:
+        async def scenario() -> tuple[str, bool, dict[str, float | int]]:
+            async with WorktreePool(str(git_repo), size=2) as pool:
+                async with pool.lease("task-1", merge=False) as ctx:
+                    present = (Path(ctx.worktree_path) / "src" / "auth" / "login.py").exists()
+                    path = ctx.worktree_path
+                return path, present, pool.stats()
+
+        path, present, stats = asyncio.run(scenario())
+        assert present is True
+        assert Path(path).parent.name == ".lg_orch_worktrees"
+        assert stats["size"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+        assert not Path(path).exists()  # close() removed the pool
+
+    def test_worktree_admin_commands_never_overlap(self, git_repo: Path) -> None:
+        import lg_orch.worktree as worktree_mod
+
+        real_run_git = worktree_mod._run_git
+        active = 0
+        peak = 0
+
+        async def tracking_run_git(*args: str, cwd: str | None = None) -> tuple[int, str, str]:
+            nonlocal active, peak
+            if args[0] != "worktree":
+                return await real_run_git(*args, cwd=cwd)
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.01)
+                return await real_run_git(*args, cwd=cwd)
+            finally:
+                active -= 1
+
+        async def scenario() -> dict[str, float | int]:
+            async with WorktreePool(str(git_repo), size=3, max_size=5) as pool:
+
+                async def use(name: str) -> None:
+                    async with pool.lease(name, merge=False):
+                        await asyncio.sleep(0.01)
+
+                await asyncio.gather(*(use(f"t{i}") for i in range(5)))
+                return pool.stats()
+
+        with patch.object(worktree_mod, "_run_git", tracking_run_git):
+            stats = asyncio.run(scenario())
+        assert stats["size"] == 5
+        assert peak == 1
+
+    def test_released_worktree_is_reset_and_reused(self, git_repo: Path) -> None:
+        async def scenario() -> tuple[str, str, str, bool]:
+            async with WorktreePool(str(git_repo), size=1) as pool:
+                with pytest.raises(RuntimeError):
+                    async with pool.lease("dirty") as ctx:
+                        first = ctx.worktree_path
+                        (Path(first) / "src" / "auth" / "login.py").write_text("broken\n")
+                        (Path(first) / "scratch.txt").write_text("junk")
+                        raise RuntimeError("agent failed")
+                async with pool.lease("next") as ctx:
+                    second = ctx.worktree_path
+                    content = (Path(second) / "src" / "auth" / "login.py").read_text()
+                    scratch = (Path(second) / "scratch.txt").exists()
+                return first, second, content, scratch
+
+        first, second, content, scratch = asyncio.run(scenario())
+        assert first == second
+        assert content == "x = 1\n"
+        assert scratch is False
+
+    def test_grows_to_max_size_then_waits(self, git_repo: Path) -> None:
+        async def scenario() -> dict[str, float | int]:
+            async with WorktreePool(str(git_repo), size=1, max_size=2) as pool:
+                gate = asyncio.Event()
+                paths: list[str] = []
+
+                async def hold(run_id: str) -> None:
+                    async with pool.lease(run_id, merge=False) as ctx:
+                        paths.append(ctx.worktree_path)
+                        await gate.wait()
+
+                holders = [asyncio.create_task(hold(f"h{i}")) for i in range(2)]
+                waiter = asyncio.create_task(hold("late"))
+                while len(paths) < 2:
+                    await asyncio.sleep(0.01)
+                assert not waiter.done() and len(paths) == 2
+                gate.set()
+                await asyncio.gather(*holders, waiter)
+                assert len(set(paths)) == 2
+                return pool.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["size"] == 2
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    def test_sparse_lease_checks_out_only_requested_paths(self, git_repo: Path) -> None:
+        async def scenario() -> tuple[bool, bool, bool]:
+            async with WorktreePool(str(git_repo), size=1) as pool:
+                async with pool.lease("sparse", paths=["src/auth"], merge=False) as ctx:
+                    root = Path(ctx.worktree_path)
+                    has_src = (root / "src" / "auth" / "login.py").exists()
+                    has_docs = (root / "docs" / "guide.md").exists()
+                async with pool.lease("full", merge=False) as ctx:
+                    full = (Path(ctx.worktree_path) / "docs" / "guide.md").exists()
+                return has_src, has_docs, full
+
+        assert asyncio.run(scenario()) == (True, False, True)
+
+    def test_merged_lease_advances_base_for_next_lease(self, git_repo: Path) -> None:
+        async def scenario() -> str:
+            async with WorktreePool(str(git_repo), size=1) as pool:
+                async with pool.lease("commit") as ctx:
+                    _git(ctx.worktree_path, "commit", "-q", "--allow-empty", "-m", "agent work")
+                async with pool.lease("after", merge=False) as ctx:
+                    return _git(ctx.worktree_path, "rev-parse", "HEAD")
+
+        head = asyncio.run(scenario())
+        assert head == _git(git_repo, "rev-parse", "main")
+        assert _git(git_repo, "log", "-1", "--format=%P").count(" ") == 1  # merge commit
+
+    def test_scheduler_leases_from_pool(self, git_repo: Path) -> None:
+        from lg_orch.meta_graph import SubAgentTask, run_meta_graph
+
+        seen: dict[str, list[str]] = {}
+
+        async def graph(state: dict[str, object]) -> dict[str, object]:
+            root = Path(str(state["worktree_path"]))
+            seen[str(state["name"])] = sorted(p.name for p in root.iterdir() if p.name != ".git")
+            return {}
+
+        tasks = [
+            SubAgentTask("a", "a", [], {"name": "a"}, sparse_paths=["docs"]),
+            SubAgentTask("b", "b", ["a"], {"name": "b"}),
+        ]
+
+        async def scenario() -> bool:
+            async with WorktreePool(str(git_repo), size=1) as pool:
+                result = await run_meta_graph(tasks, graph, worktree_pool=pool)
+                assert pool.stats()["hits"] == 2
+                return result.all_succeeded
+
+        assert asyncio.run(scenario()) is True
+        assert seen["a"] == ["docs"]
+        assert seen["b"] == [".gitignore", "docs", "src"]